@@ -105,6 +105,44 @@ CREATE TABLE test_reports (
     metadata JSONB
 );
 
+-- Create test_metric_rollups table (incremental day/week/month aggregates)
+CREATE TABLE test_metric_rollups (
+    id SERIAL PRIMARY KEY,
+    granularity VARCHAR(10) NOT NULL, -- 'day', 'week', 'month'
+    period_start TIMESTAMP NOT NULL,
+    environment VARCHAR(50) NOT NULL DEFAULT 'all',
+    run_count INTEGER NOT NULL DEFAULT 0,
+    total_tests INTEGER NOT NULL DEFAULT 0,
+    passed_tests INTEGER NOT NULL DEFAULT 0,
+    failed_tests INTEGER NOT NULL DEFAULT 0,
+    skipped_tests INTEGER NOT NULL DEFAULT 0,
+    flaky_tests INTEGER NOT NULL DEFAULT 0,
+    execution_time_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    performance_score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    performance_score_count INTEGER NOT NULL DEFAULT 0,
+    security_score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    security_score_count INTEGER NOT NULL DEFAULT 0,
+    compliance_score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    compliance_score_count INTEGER NOT NULL DEFAULT 0,
+    coverage_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    coverage_count INTEGER NOT NULL DEFAULT 0,
+    event_count INTEGER NOT NULL DEFAULT 0,
+    critical_events INTEGER NOT NULL DEFAULT 0,
+    performance_events INTEGER NOT NULL DEFAULT 0,
+    uptime_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    uptime_count INTEGER NOT NULL DEFAULT 0,
+    recovery_time_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    recovery_time_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_test_metric_rollup_period UNIQUE (granularity, period_start, environment)
+);
+
+-- Create rollup_recorded_sources table (runs/events already folded into rollups)
+CREATE TABLE rollup_recorded_sources (
+    source_key VARCHAR(255) PRIMARY KEY,
+    recorded_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Create indexes for better performance
 CREATE INDEX idx_test_runs_status ON test_runs(status);
 CREATE INDEX idx_test_runs_type ON test_runs(test_type);
@@ -127,6 +165,8 @@ CREATE INDEX idx_test_environments_active ON test_environments(is_active);
 CREATE INDEX idx_test_reports_run_id ON test_reports(test_run_id);
 CREATE INDEX idx_test_reports_type ON test_reports(report_type);
 
+CREATE INDEX idx_test_metric_rollups_period ON test_metric_rollups(period_start);
+
 -- Create triggers for updated_at timestamps
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
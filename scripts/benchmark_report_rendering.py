@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark Report Rendering
+
+Measures HTML render time per report for the functional, security and
+compliance templates in three setups:
+
+  reparse  - templates loaded and compiled on every render, as with an
+             Environment created per call
+  cold     - a fresh environment that loads compiled bytecode from the
+             on-disk cache, as in a new worker process
+  shared   - the process-wide environment with templates already compiled
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+from reporting.functional_reporter import FunctionalReporter
+from reporting.security_reporter import (
+    SecurityReport,
+    SecurityReportType,
+    VulnerabilityCategory,
+    VulnerabilityDetail
+)
+from reporting.compliance_reporter import ComplianceReporter
+from reporting.template_engine import (
+    TEMPLATES_DIR,
+    create_template_environment,
+    get_template_environment,
+    preload_templates
+)
+
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Benchmark report template rendering')
+    parser.add_argument('--runs', type=int, default=200, help='Renders per report and setup')
+    parser.add_argument('--tests', type=int, default=200, help='Test results per functional report')
+    return parser.parse_args()
+
+
+def build_reports(test_count: int):
+    """Build one report per domain from synthetic results"""
+    functional = FunctionalReporter().generate_functional_report(test_results=[
+        {'name': f'test_{index}', 'status': 'failed' if index % 10 == 0 else 'passed',
+         'execution_time': 0.1 + index % 7, 'error': 'Timeout' if index % 10 == 0 else None}
+        for index in range(test_count)
+    ])
+    security = SecurityReport(
+        report_id="benchmark",
+        title="Security Assessment",
+        report_type=SecurityReportType.VULNERABILITY_ASSESSMENT,
+        generated_at=datetime.now(),
+        vulnerabilities=[
+            VulnerabilityDetail(
+                vulnerability_id=f'VULN-{index}', title=f'Issue {index}',
+                description='Reflected input <script>', remediation='Encode output',
+                severity=('critical', 'high', 'medium', 'low')[index % 4],
+                category=VulnerabilityCategory.CROSS_SITE_SCRIPTING
+            )
+            for index in range(40)
+        ]
+    )
+    compliance = ComplianceReporter().generate_compliance_report(SimpleNamespace(all_results=[
+        {'requirement_id': f'REQ-{index}', 'title': f'Requirement {index}', 'standard': 'GDPR',
+         'status': 'non_compliant' if index % 3 == 0 else 'compliant'}
+        for index in range(60)
+    ]))
+    return {
+        'functional_report.html': functional,
+        'security_report.html': security,
+        'compliance_report.html': compliance
+    }
+
+
+def time_renders(env_factory, template_name: str, report, runs: int) -> float:
+    """Average seconds per render"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        env_factory().get_template(template_name).render(report=report)
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    args = parse_arguments()
+    reports = build_reports(args.tests)
+
+    def reparse_environment():
+        env = Environment(
+            loader=FileSystemLoader(str(TEMPLATES_DIR)),
+            autoescape=select_autoescape(['html']),
+            cache_size=0,
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+        env.filters.update(get_template_environment().filters)
+        return env
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Compile into the shared environment and fill the bytecode cache
+        # once, as the first process would
+        preload_templates()
+        warm = create_template_environment(cache_dir=cache_dir)
+        for template_name in reports:
+            warm.get_template(template_name)
+
+        setups = {
+            'reparse': reparse_environment,
+            'cold': lambda: create_template_environment(cache_dir=cache_dir),
+            'shared': get_template_environment
+        }
+
+        print(f"{'template':<26}" + ''.join(f"{name:>12}" for name in setups) + f"{'speedup':>10}")
+        for template_name, report in reports.items():
+            timings = {
+                name: time_renders(factory, template_name, report, args.runs)
+                for name, factory in setups.items()
+            }
+            print(
+                f"{template_name:<26}"
+                + ''.join(f"{timing * 1000:>10.3f}ms" for timing in timings.values())
+                + f"{timings['reparse'] / timings['shared']:>9.1f}x"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -8,12 +8,20 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from enum import Enum
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Callable
 import json
 from datetime import datetime
 
+try:
+    from ..monitoring.metrics_collector import MetricsCollector, get_default_metrics_collector
+    from ..monitoring.profiler import SamplingProfiler
+except ImportError:  # agents imported as a top-level package with src/ on sys.path
+    from monitoring.metrics_collector import MetricsCollector, get_default_metrics_collector
+    from monitoring.profiler import SamplingProfiler
+
 
 class AgentStatus(Enum):
     """Agent execution status"""
@@ -37,6 +45,18 @@ class AgentConfig:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class AttemptSpan:
+    """Timing breakdown of a single execution attempt"""
+    attempt: int
+    queue_wait: float = 0.0  # Scheduled until _execute_impl started running
+    run_time: float = 0.0    # Time spent inside _execute_impl
+    backoff: float = 0.0     # Retry sleep following this attempt
+    outcome: str = "cancelled"  # success, timeout, error, cancelled
+    error: Optional[str] = None
+    profile_path: Optional[str] = None
+
+
 @dataclass
 class AgentResult:
     """Result of agent execution"""
@@ -49,6 +69,7 @@ class AgentResult:
     error: Optional[str] = None
     logs: List[str] = field(default_factory=list)
     artifacts: List[str] = field(default_factory=list)
+    attempts: List[AttemptSpan] = field(default_factory=list)
 
 
 class BaseAgent(ABC):
@@ -64,11 +85,15 @@ class BaseAgent(ABC):
         self.status = AgentStatus.IDLE
         self.logger = self._setup_logger()
         self.result: Optional[AgentResult] = None
+        self.metrics_collector: Optional[MetricsCollector] = None
+        self.profiling_config = config.metadata.get('profiling', {})
         self._callbacks: Dict[str, List[Callable]] = {
             'on_start': [],
             'on_complete': [],
             'on_error': [],
-            'on_cancel': []
+            'on_cancel': [],
+            'on_progress': [],
+            'on_slow_attempt': []
         }
     
     def _setup_logger(self) -> logging.Logger:
@@ -129,12 +154,20 @@ class BaseAgent(ABC):
         last_error = None
         
         while retry_count <= self.config.retry_count:
+            span = AttemptSpan(attempt=retry_count + 1)
+            self.result.attempts.append(span)
+            profiler = self._start_profiler()
+            scheduled = time.perf_counter()
+            started: List[float] = []
+            
             try:
                 # Execute with timeout
                 result_data = await asyncio.wait_for(
-                    self._execute_impl(**kwargs),
+                    self._run_attempt(started, **kwargs),
                     timeout=self.config.timeout
                 )
+                span.outcome = "success"
+                self._finish_attempt(span, scheduled, started, profiler)
                 
                 # Success
                 end_time = datetime.now()
@@ -147,22 +180,36 @@ class BaseAgent(ABC):
                 
                 self.status = AgentStatus.COMPLETED
                 self.logger.info(f"Agent {self.config.name} completed successfully in {duration:.2f}s")
+                self._record_execution_metrics(self.result)
                 self._trigger_callbacks('on_complete', self.result)
                 
                 return self.result
                 
             except asyncio.TimeoutError:
                 last_error = f"Agent timed out after {self.config.timeout} seconds"
+                span.outcome = "timeout"
+                span.error = last_error
+                self._finish_attempt(span, scheduled, started, profiler)
                 self.logger.warning(f"Attempt {retry_count + 1} timed out: {last_error}")
                 
+            except asyncio.CancelledError:
+                self._finish_attempt(span, scheduled, started, profiler)
+                raise
+                
             except Exception as e:
                 last_error = str(e)
+                span.outcome = "error"
+                span.error = last_error
+                self._finish_attempt(span, scheduled, started, profiler)
                 self.logger.warning(f"Attempt {retry_count + 1} failed: {last_error}")
             
             retry_count += 1
             if retry_count <= self.config.retry_count:
                 self.logger.info(f"Retrying in {self.config.retry_delay} seconds...")
+                backoff_start = time.perf_counter()
                 await asyncio.sleep(self.config.retry_delay)
+                span.backoff = time.perf_counter() - backoff_start
+                self._record_metric('observe_histogram', 'backoff_seconds', span.backoff)
         
         # All retries failed
         end_time = datetime.now()
@@ -175,10 +222,96 @@ class BaseAgent(ABC):
         
         self.status = AgentStatus.FAILED
         self.logger.error(f"Agent {self.config.name} failed after {retry_count} attempts: {last_error}")
+        self._record_execution_metrics(self.result)
         self._trigger_callbacks('on_error', self.result)
         
         return self.result
     
+    async def _run_attempt(self, started: List[float], **kwargs) -> Dict[str, Any]:
+        """Run _execute_impl, marking when it actually starts running"""
+        started.append(time.perf_counter())
+        return await self._execute_impl(**kwargs)
+    
+    def _finish_attempt(self, span: AttemptSpan, scheduled: float, started: List[float],
+                        profiler: Optional[SamplingProfiler]):
+        """Close an attempt span, export its timings and keep the profile if it was slow"""
+        finished = time.perf_counter()
+        
+        if started:
+            span.queue_wait = started[0] - scheduled
+            span.run_time = finished - started[0]
+        else:
+            # Timed out or cancelled before _execute_impl was scheduled
+            span.queue_wait = finished - scheduled
+        
+        if profiler is not None:
+            profiler.stop()
+        
+        self._record_metric('observe_histogram', 'queue_wait_seconds', span.queue_wait)
+        self._record_metric('observe_histogram', 'run_seconds', span.run_time)
+        self._record_metric('increment_counter', 'attempts_total', 1)
+        if span.outcome != "success":
+            self._record_metric('increment_counter', f'attempts_{span.outcome}_total', 1)
+        
+        threshold = self.profiling_config.get('slow_threshold')
+        if threshold is not None and span.run_time >= threshold:
+            if profiler is not None and profiler.sample_count:
+                span.profile_path = self._save_profile(span, profiler)
+            self.logger.warning(
+                f"Slow attempt {span.attempt} of agent {self.config.name}: "
+                f"{span.run_time:.2f}s (queue wait {span.queue_wait:.3f}s)"
+            )
+            self._record_metric('increment_counter', 'slow_attempts_total', 1)
+            self._trigger_callbacks('on_slow_attempt', span, profiler)
+    
+    def _start_profiler(self) -> Optional[SamplingProfiler]:
+        """Start a sampling profiler for the next attempt if profiling is enabled"""
+        if not self.profiling_config.get('enabled', False):
+            return None
+        
+        profiler = SamplingProfiler(
+            interval=self.profiling_config.get('interval', 0.005),
+            max_depth=self.profiling_config.get('max_depth', 64)
+        )
+        profiler.start()
+        return profiler
+    
+    def _save_profile(self, span: AttemptSpan, profiler: SamplingProfiler) -> Optional[str]:
+        """Write a slow attempt's collapsed stacks to the profiling output directory"""
+        output_dir = self.profiling_config.get('output_dir')
+        if not output_dir:
+            return None
+        
+        try:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            path = Path(output_dir) / f"{self.config.name}_{timestamp}_attempt{span.attempt}.collapsed"
+            return str(profiler.write(path))
+        except Exception as e:
+            self.logger.error(f"Failed to write profile for {self.config.name}: {e}")
+            return None
+    
+    def _record_execution_metrics(self, result: AgentResult):
+        """Export totals for a finished execution"""
+        self._record_metric('observe_histogram', 'duration_seconds', result.duration or 0.0)
+        self._record_metric('increment_counter', f'executions_{result.status.value}_total', 1)
+        if len(result.attempts) > 1:
+            self._record_metric('increment_counter', 'retries_total', len(result.attempts) - 1)
+    
+    def _record_metric(self, method: str, name: str, value: float):
+        """Send an agent metric (agent.<name>.<metric>) to the metrics collector, if any"""
+        collector = self.metrics_collector or get_default_metrics_collector()
+        if collector is None:
+            return
+        
+        try:
+            getattr(collector, method)(
+                f"agent.{self.config.name}.{name}",
+                value,
+                tags={'agent': self.config.name}
+            )
+        except Exception as e:
+            self.logger.debug(f"Failed to record metric {name}: {e}")
+    
     async def cancel(self):
         """Cancel the agent execution"""
         self.status = AgentStatus.CANCELLED
@@ -218,7 +351,8 @@ class BaseAgent(ABC):
                 'duration': self.result.duration if self.result else None,
                 'error': self.result.error if self.result else None,
                 'start_time': self.result.start_time.isoformat() if self.result else None,
-                'end_time': self.result.end_time.isoformat() if self.result and self.result.end_time else None
+                'end_time': self.result.end_time.isoformat() if self.result and self.result.end_time else None,
+                'attempts': [asdict(span) for span in self.result.attempts]
             } if self.result else None
         }
     
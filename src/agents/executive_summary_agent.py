@@ -14,6 +14,7 @@ from enum import Enum
 from .base_agent import BaseAgent
 from .trend_reporter_agent import TrendReporterAgent, TrendMetrics, BusinessInsight, RiskLevel
 from ..database.database import DatabaseManager
+from ..analytics.rollup_store import get_rollup_store
 from ..ai.llm_service import LLMService
 from ..monitoring.metrics_collector import MetricsCollector
 
@@ -85,6 +86,7 @@ class ExecutiveSummaryAgent(BaseAgent):
     def __init__(self, config: Dict[str, Any]):
         super().__init__("ExecutiveSummary", config)
         self.db_manager = DatabaseManager()
+        self.rollup_store = get_rollup_store()
         self.llm_service = LLMService()
         self.metrics_collector = MetricsCollector()
         self.trend_reporter = TrendReporterAgent(config)
@@ -179,31 +181,22 @@ class ExecutiveSummaryAgent(BaseAgent):
             else:  # QUARTERLY
                 start_date = end_date - timedelta(days=90)
             
-            # Query stability data
-            stability_query = """
-            SELECT 
-                AVG(CASE WHEN status = 'up' THEN 100 ELSE 0 END) as uptime_percentage,
-                AVG(recovery_time) as mean_time_to_recovery,
-                COUNT(CASE WHEN severity = 'critical' THEN 1 END) as critical_issues,
-                COUNT(CASE WHEN event_type = 'performance_degradation' THEN 1 END) as performance_events,
-                COUNT(*) as total_incidents
-            FROM system_events 
-            WHERE created_at >= %s AND created_at <= %s
-            """
-            
-            result = await self.db_manager.execute_query(
-                stability_query, (start_date, end_date)
+            # Read event counters from the daily rollups, or from the raw
+            # system_events table for events that were never recorded in them
+            data = await asyncio.to_thread(
+                self.rollup_store.get_stability_summary, start_date, end_date
             )
+            if not data:
+                data = await self._query_system_events(start_date, end_date)
             
-            if result:
-                data = result[0]
+            if data:
                 return StabilityMetrics(
-                    uptime_percentage=data.get('uptime_percentage', 99.0),
-                    mean_time_to_recovery=data.get('mean_time_to_recovery', 15.0),
+                    uptime_percentage=data.get('uptime_percentage') or 99.0,
+                    mean_time_to_recovery=data.get('mean_time_to_recovery') or 15.0,
                     incident_count=data.get('total_incidents', 0),
                     critical_issues=data.get('critical_issues', 0),
                     performance_degradation_events=data.get('performance_events', 0),
-                    availability_score=data.get('uptime_percentage', 99.0)
+                    availability_score=data.get('uptime_percentage') or 99.0
                 )
             else:
                 # Return mock data if no database results
@@ -213,6 +206,24 @@ class ExecutiveSummaryAgent(BaseAgent):
             self.logger.warning(f"Database query failed, using mock data: {str(e)}")
             return self._generate_mock_stability_metrics()
     
+    async def _query_system_events(self, start_date: datetime, end_date: datetime) -> Optional[Dict[str, Any]]:
+        """Aggregate stability data directly from the system_events table"""
+        stability_query = """
+        SELECT 
+            AVG(CASE WHEN status = 'up' THEN 100 ELSE 0 END) as uptime_percentage,
+            AVG(recovery_time) as mean_time_to_recovery,
+            COUNT(CASE WHEN severity = 'critical' THEN 1 END) as critical_issues,
+            COUNT(CASE WHEN event_type = 'performance_degradation' THEN 1 END) as performance_events,
+            COUNT(*) as total_incidents
+        FROM system_events 
+        WHERE created_at >= %s AND created_at <= %s
+        """
+        
+        result = await self.db_manager.execute_query(stability_query, (start_date, end_date))
+        if result and result[0].get('total_incidents'):
+            return result[0]
+        return None
+    
     def _generate_mock_stability_metrics(self) -> StabilityMetrics:
         """Generate mock stability metrics for demonstration"""
         import random
@@ -11,6 +11,7 @@ import json
 import smtplib
 import ssl
 import time
+import uuid
 from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -24,6 +25,14 @@ from jinja2 import Environment, Template, FileSystemLoader
 
 from .base_agent import BaseAgent, AgentConfig
 
+try:
+    from ..analytics.rollup_store import get_rollup_store
+except ImportError:
+    try:
+        from analytics.rollup_store import get_rollup_store
+    except ImportError:  # rollup store imports the database package relative to src
+        get_rollup_store = None
+
 
 class NotificationChannel:
     """Base class for notification channels"""
@@ -34,6 +43,17 @@ class NotificationChannel:
         self.enabled = config.get('enabled', True)
         self.retry_count = config.get('retry_count', 3)
         self.retry_delay = config.get('retry_delay', 1)
+        self.request_timeout = config.get('request_timeout', 30)
+        self.send_timeout = config.get('send_timeout', 60)
+        self.session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session, normally shared by the NotifierAgent"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            )
+        return self.session
     
     async def send(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """Send notification message with retry logic"""
@@ -120,13 +140,12 @@ class EmailChannel(NotificationChannel):
                 )
                 msg.attach(part)
         
-        # Send email with enhanced error handling
-        context = ssl.create_default_context()
+        # Send email with enhanced error handling; smtplib blocks, so keep it off the event loop
         try:
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls(context=context)
-                server.login(username, password)
-                server.sendmail(from_email, to_emails, msg.as_string())
+            await asyncio.to_thread(
+                self._send_smtp, smtp_server, smtp_port, username, password,
+                from_email, to_emails, msg.as_string()
+            )
             
             return {
                 'success': True,
@@ -144,6 +163,15 @@ class EmailChannel(NotificationChannel):
             return {'success': False, 'channel': 'email', 'error': f'Server disconnected: {str(e)}'}
         except Exception as e:
             return {'success': False, 'channel': 'email', 'error': str(e)}
+    
+    def _send_smtp(self, smtp_server: str, smtp_port: int, username: str, password: str,
+                   from_email: str, to_emails: List[str], message: str):
+        """Deliver an email over SMTP (blocking)"""
+        context = ssl.create_default_context()
+        with smtplib.SMTP(smtp_server, smtp_port, timeout=self.request_timeout) as server:
+            server.starttls(context=context)
+            server.login(username, password)
+            server.sendmail(from_email, to_emails, message)
 
 
 class SlackChannel(NotificationChannel):
@@ -191,59 +219,58 @@ class SlackChannel(NotificationChannel):
             slack_message['attachments'].append(attachment)
         
         # Send via webhook or API
+        session = self._get_session()
         if webhook_url:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    webhook_url, 
-                    json=slack_message,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        return {
-                            'success': True,
-                            'channel': 'slack',
-                            'method': 'webhook',
-                            'target_channel': channel,
-                            'sent_at': datetime.now().isoformat()
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {
-                            'success': False,
-                            'channel': 'slack',
-                            'error': f'HTTP {response.status}: {error_text}',
-                            'sent_at': datetime.now().isoformat()
-                        }
+            async with session.post(
+                webhook_url, 
+                json=slack_message,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            ) as response:
+                if response.status == 200:
+                    return {
+                        'success': True,
+                        'channel': 'slack',
+                        'method': 'webhook',
+                        'target_channel': channel,
+                        'sent_at': datetime.now().isoformat()
+                    }
+                else:
+                    error_text = await response.text()
+                    return {
+                        'success': False,
+                        'channel': 'slack',
+                        'error': f'HTTP {response.status}: {error_text}',
+                        'sent_at': datetime.now().isoformat()
+                    }
         else:
             # Use bot token API
             headers = {
                 'Authorization': f'Bearer {bot_token}',
                 'Content-Type': 'application/json'
             }
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    'https://slack.com/api/chat.postMessage',
-                    headers=headers,
-                    json=slack_message,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    result = await response.json()
-                    if result.get('ok'):
-                        return {
-                            'success': True,
-                            'channel': 'slack',
-                            'method': 'api',
-                            'target_channel': channel,
-                            'message_ts': result.get('ts'),
-                            'sent_at': datetime.now().isoformat()
-                        }
-                    else:
-                        return {
-                            'success': False,
-                            'channel': 'slack',
-                            'error': result.get('error', 'Unknown error'),
-                            'sent_at': datetime.now().isoformat()
-                        }
+            async with session.post(
+                'https://slack.com/api/chat.postMessage',
+                headers=headers,
+                json=slack_message,
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            ) as response:
+                result = await response.json()
+                if result.get('ok'):
+                    return {
+                        'success': True,
+                        'channel': 'slack',
+                        'method': 'api',
+                        'target_channel': channel,
+                        'message_ts': result.get('ts'),
+                        'sent_at': datetime.now().isoformat()
+                    }
+                else:
+                    return {
+                        'success': False,
+                        'channel': 'slack',
+                        'error': result.get('error', 'Unknown error'),
+                        'sent_at': datetime.now().isoformat()
+                    }
     
     def _get_color_for_status(self, status: str) -> str:
         """Get appropriate color for message status"""
@@ -303,22 +330,23 @@ class TeamsChannel(NotificationChannel):
             if actions:
                 teams_message['potentialAction'] = actions
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=teams_message) as response:
-                    if response.status == 200:
-                        return {
-                            'success': True,
-                            'channel': 'teams',
-                            'sent_at': datetime.now().isoformat()
-                        }
-                    else:
-                        return {
-                            'success': False,
-                            'channel': 'teams',
-                            'error': f'HTTP {response.status}: {await response.text()}',
-                            'sent_at': datetime.now().isoformat()
-                        }
-                        
+            session = self._get_session()
+            request_timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+            async with session.post(webhook_url, json=teams_message, timeout=request_timeout) as response:
+                if response.status == 200:
+                    return {
+                        'success': True,
+                        'channel': 'teams',
+                        'sent_at': datetime.now().isoformat()
+                    }
+                else:
+                    return {
+                        'success': False,
+                        'channel': 'teams',
+                        'error': f'HTTP {response.status}: {await response.text()}',
+                        'sent_at': datetime.now().isoformat()
+                    }
+                    
         except Exception as e:
             return {
                 'success': False,
@@ -361,22 +389,23 @@ class DiscordChannel(NotificationChannel):
                 }
                 discord_message['embeds'].append(embed)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=discord_message) as response:
-                    if response.status == 204:  # Discord returns 204 for successful webhook
-                        return {
-                            'success': True,
-                            'channel': 'discord',
-                            'sent_at': datetime.now().isoformat()
-                        }
-                    else:
-                        return {
-                            'success': False,
-                            'channel': 'discord',
-                            'error': f'HTTP {response.status}: {await response.text()}',
-                            'sent_at': datetime.now().isoformat()
-                        }
-                        
+            session = self._get_session()
+            request_timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+            async with session.post(webhook_url, json=discord_message, timeout=request_timeout) as response:
+                if response.status == 204:  # Discord returns 204 for successful webhook
+                    return {
+                        'success': True,
+                        'channel': 'discord',
+                        'sent_at': datetime.now().isoformat()
+                    }
+                else:
+                    return {
+                        'success': False,
+                        'channel': 'discord',
+                        'error': f'HTTP {response.status}: {await response.text()}',
+                        'sent_at': datetime.now().isoformat()
+                    }
+                    
         except Exception as e:
             return {
                 'success': False,
@@ -410,28 +439,29 @@ class WebhookChannel(NotificationChannel):
             custom_fields = self.config.get('custom_fields', {})
             payload.update(custom_fields)
             
-            async with aiohttp.ClientSession() as session:
-                if method == 'POST':
-                    async with session.post(url, json=payload, headers=headers) as response:
-                        success = 200 <= response.status < 300
-                        return {
-                            'success': success,
-                            'channel': 'webhook',
-                            'status_code': response.status,
-                            'response': await response.text() if not success else '',
-                            'sent_at': datetime.now().isoformat()
-                        }
-                elif method == 'GET':
-                    async with session.get(url, params=payload, headers=headers) as response:
-                        success = 200 <= response.status < 300
-                        return {
-                            'success': success,
-                            'channel': 'webhook',
-                            'status_code': response.status,
-                            'response': await response.text() if not success else '',
-                            'sent_at': datetime.now().isoformat()
-                        }
-                        
+            session = self._get_session()
+            request_timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+            if method == 'POST':
+                async with session.post(url, json=payload, headers=headers, timeout=request_timeout) as response:
+                    success = 200 <= response.status < 300
+                    return {
+                        'success': success,
+                        'channel': 'webhook',
+                        'status_code': response.status,
+                        'response': await response.text() if not success else '',
+                        'sent_at': datetime.now().isoformat()
+                    }
+            elif method == 'GET':
+                async with session.get(url, params=payload, headers=headers, timeout=request_timeout) as response:
+                    success = 200 <= response.status < 300
+                    return {
+                        'success': success,
+                        'channel': 'webhook',
+                        'status_code': response.status,
+                        'response': await response.text() if not success else '',
+                        'sent_at': datetime.now().isoformat()
+                    }
+                    
         except Exception as e:
             return {
                 'success': False,
@@ -454,6 +484,27 @@ class NotifierAgent(BaseAgent):
         self.channels = {}
         self.templates = {}
         self.template_env = None
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        self.max_connections = config.config.get('max_connections', 20)
+        
+        # Coalescing (opt-in): group non-critical notifications per (type, environment, channel) into digests
+        coalescing_config = config.config.get('coalescing', {})
+        self.coalescing_enabled = coalescing_config.get('enabled', False)
+        self.coalescing_window = coalescing_config.get('window', 60)
+        self.passthrough_severities = set(coalescing_config.get('passthrough_severities', ['critical']))
+        self.passthrough_types = set(coalescing_config.get('passthrough_types', ['test_failure']))
+        self.digest_max_items = coalescing_config.get('max_items', 10)
+        self._pending_digests: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._digest_timers: Dict[tuple, asyncio.Task] = {}
+        self.coalescing_stats = {
+            'received': 0,
+            'passed_through': 0,
+            'digests_sent': 0,
+            'suppressed': 0
+        }
+        
+        # System alerts are recorded as events in the rollups read by executive summaries
+        self.rollup_config = config.config.get('rollups', {})
         
         # Initialize notification channels
         channels_config = config.config.get('channels', {})
@@ -487,6 +538,147 @@ class NotifierAgent(BaseAgent):
             self.logger.warning(f"Unknown channel type: {channel_type}")
             return None
     
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the pooled HTTP session shared by all channels"""
+        if self.http_session is None or self.http_session.closed:
+            self.http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections)
+            )
+            for channel in self.channels.values():
+                if channel:
+                    channel.session = self.http_session
+        return self.http_session
+    
+    async def close(self):
+        """Flush pending digests and close the shared HTTP session"""
+        await self.flush_digests()
+        
+        if self.http_session is not None and not self.http_session.closed:
+            await self.http_session.close()
+        self.http_session = None
+    
+    async def _send_to_channel(self, channel_name: str, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Send to one channel, bounded by that channel's own timeout"""
+        channel = self.channels[channel_name]
+        try:
+            return await asyncio.wait_for(channel.send(message), timeout=channel.send_timeout)
+        except asyncio.TimeoutError:
+            return {
+                'success': False,
+                'channel': channel_name,
+                'error': f'Timed out after {channel.send_timeout} seconds',
+                'sent_at': datetime.now().isoformat()
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'channel': channel_name,
+                'error': str(e),
+                'sent_at': datetime.now().isoformat()
+            }
+    
+    def _should_coalesce(self, notification_type: str, severity: str, immediate: bool) -> bool:
+        """Check whether a notification goes into a digest instead of being sent now"""
+        return (
+            self.coalescing_enabled
+            and self.coalescing_window > 0
+            and not immediate
+            and notification_type not in self.passthrough_types
+            and str(severity).lower() not in self.passthrough_severities
+        )
+    
+    def _get_notification_environment(self, message_data: Dict[str, Any]) -> str:
+        """Get the environment a notification refers to"""
+        return (
+            message_data.get('environment')
+            or (message_data.get('test_run') or {}).get('environment')
+            or self.config.environment
+        )
+    
+    def _queue_for_digest(self, digest_key: tuple, message: Dict[str, Any]):
+        """Add a message to its digest, starting the coalescing window on the first one"""
+        self._pending_digests.setdefault(digest_key, []).append(message)
+        
+        if digest_key not in self._digest_timers:
+            self._digest_timers[digest_key] = asyncio.create_task(self._flush_digest_after(digest_key))
+    
+    async def _flush_digest_after(self, digest_key: tuple):
+        """Send a digest once its coalescing window has elapsed"""
+        await asyncio.sleep(self.coalescing_window)
+        self._digest_timers.pop(digest_key, None)
+        await self._send_digest(digest_key)
+    
+    async def flush_digests(self) -> Dict[str, Any]:
+        """Send all pending digests immediately"""
+        for timer in self._digest_timers.values():
+            timer.cancel()
+        self._digest_timers.clear()
+        
+        results = {}
+        for digest_key in list(self._pending_digests):
+            notification_type, environment, channel_name = digest_key
+            results[f"{notification_type}:{environment}:{channel_name}"] = await self._send_digest(digest_key)
+        return results
+    
+    async def _send_digest(self, digest_key: tuple) -> Optional[Dict[str, Any]]:
+        """Send the pending messages for a digest key as a single notification"""
+        messages = self._pending_digests.pop(digest_key, [])
+        if not messages:
+            return None
+        
+        notification_type, environment, channel_name = digest_key
+        message = messages[0] if len(messages) == 1 else self._build_digest_message(
+            notification_type, environment, messages
+        )
+        
+        self.coalescing_stats['digests_sent'] += 1
+        self.coalescing_stats['suppressed'] += len(messages) - 1
+        
+        self._get_http_session()
+        result = await self._send_to_channel(channel_name, message)
+        if not result.get('success'):
+            self.logger.warning(f"Failed to send {notification_type} digest to {channel_name}: {result.get('error')}")
+        return result
+    
+    def _build_digest_message(self, notification_type: str, environment: str,
+                              messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine several messages of the same type into one digest message"""
+        status_rank = {'info': 0, 'success': 0, 'warning': 1, 'failure': 2, 'error': 2}
+        worst_status = max((m.get('status', 'info') for m in messages), key=lambda st: status_rank.get(st, 0))
+        
+        lines = [
+            f"• {m.get('title') or m.get('text', 'Notification')}"
+            for m in messages[:self.digest_max_items]
+        ]
+        if len(messages) > self.digest_max_items:
+            lines.append(f"... and {len(messages) - self.digest_max_items} more")
+        
+        return {
+            'title': f"{len(messages)} {notification_type.replace('_', ' ')} notifications ({environment})",
+            'status': worst_status,
+            'text': f"{len(messages)} notifications were grouped in the last {self.coalescing_window}s",
+            'body': '\n'.join(lines),
+            'fields': [
+                {'title': 'Notifications', 'value': str(len(messages)), 'short': True},
+                {'title': 'Environment', 'value': environment, 'short': True},
+                {'title': 'Details', 'value': '\n'.join(lines), 'short': False}
+            ],
+            'priority': 'high' if any(m.get('priority') == 'high' for m in messages) else 'normal'
+        }
+    
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """
+        Get notification coalescing statistics, including suppressed sends.
+        
+        All counters are per channel delivery: every received delivery is
+        passed through, sent as or folded into a digest, or still pending.
+        """
+        return {
+            **self.coalescing_stats,
+            'pending_digests': len(self._pending_digests),
+            'pending_messages': sum(len(msgs) for msgs in self._pending_digests.values())
+        }
+    
     def _initialize_template(self, name: str, config: Dict[str, Any]):
         """Initialize message template"""
         template_content = config.get('content', '')
@@ -514,26 +706,37 @@ class NotifierAgent(BaseAgent):
         message = await self._prepare_message(notification_type, message_data, template_name)
         
         # Send to specified channels
-        results = {}
-        tasks = []
+        target_channels = [
+            channel_name for channel_name in channels
+            if channel_name in self.channels and self.channels[channel_name]
+        ]
+        self.coalescing_stats['received'] += len(target_channels)
         
-        for channel_name in channels:
-            if channel_name in self.channels and self.channels[channel_name]:
-                task = self.channels[channel_name].send(message)
-                tasks.append((channel_name, task))
+        # Non-critical notifications are queued into per-channel digests
+        severity = message_data.get('severity', 'info')
+        if self._should_coalesce(notification_type, severity, kwargs.get('immediate', False)):
+            environment = self._get_notification_environment(message_data)
+            for channel_name in target_channels:
+                self._queue_for_digest((notification_type, environment, channel_name), message)
+            
+            return {
+                'success': True,
+                'queued': True,
+                'total_channels': len(channels),
+                'queued_channels': target_channels,
+                'digest_window': self.coalescing_window,
+                'message_type': notification_type,
+                'sent_at': datetime.now().isoformat()
+            }
         
-        # Execute all notifications concurrently
-        for channel_name, task in tasks:
-            try:
-                result = await task
-                results[channel_name] = result
-            except Exception as e:
-                results[channel_name] = {
-                    'success': False,
-                    'channel': channel_name,
-                    'error': str(e),
-                    'sent_at': datetime.now().isoformat()
-                }
+        self.coalescing_stats['passed_through'] += len(target_channels)
+        self._get_http_session()
+        
+        # Execute all notifications concurrently; each channel retries and times out on its own
+        channel_results = await asyncio.gather(
+            *(self._send_to_channel(channel_name, message) for channel_name in target_channels)
+        )
+        results = dict(zip(target_channels, channel_results))
         
         # Calculate overall success
         successful_channels = [name for name, result in results.items() if result.get('success')]
@@ -776,20 +979,42 @@ class NotifierAgent(BaseAgent):
         )
     
     async def send_system_alert(self, alert_type: str, severity: str, 
-                              description: str, **kwargs) -> Dict[str, Any]:
-        """Send system alert notification"""
+                              description: str, immediate: bool = False, **kwargs) -> Dict[str, Any]:
+        """Send system alert notification; immediate bypasses digest coalescing"""
         alert_data = {
             'alert_type': alert_type,
             'severity': severity,
             'description': description,
             **kwargs
         }
+        await self._record_system_event(alert_type, severity, kwargs)
+        
         return await self._execute_impl(
             notification_type='system_alert',
             message_data=alert_data,
-            channels=kwargs.get('channels', list(self.channels.keys()))
+            channels=kwargs.get('channels', list(self.channels.keys())),
+            immediate=immediate
         )
     
+    async def _record_system_event(self, alert_type: str, severity: str, details: Dict[str, Any]):
+        """Fold a system alert into the event rollups behind the stability metrics"""
+        if get_rollup_store is None or not self.rollup_config.get('enabled', True):
+            return
+        
+        event_id = details.get('event_id') or details.get('execution_id') or str(uuid.uuid4())
+        try:
+            await asyncio.to_thread(
+                get_rollup_store().record_event,
+                f"{alert_type}:{event_id}",
+                alert_type,
+                severity=severity,
+                status=details.get('status', 'down' if severity == 'critical' else 'up'),
+                recovery_time=details.get('recovery_time'),
+                environment=details.get('environment') or self.rollup_config.get('environment')
+            )
+        except Exception as e:
+            self.logger.warning(f"Failed to record system event {alert_type} in rollups: {e}")
+    
     async def send_report_notification(self, report_name: str, report_types: List[str], 
                                      report_url: Optional[str] = None, 
                                      channels: Optional[List[str]] = None) -> Dict[str, Any]:
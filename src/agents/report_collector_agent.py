@@ -11,7 +11,7 @@ import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 from urllib.parse import urlparse
 
 import boto3
@@ -19,6 +19,132 @@ import aiofiles
 from botocore.exceptions import ClientError, NoCredentialsError
 
 from .base_agent import BaseAgent, AgentConfig
+try:
+    from ..storage.artifact_cache import ArtifactCache, get_artifact_cache
+except ImportError:  # agents imported as a top-level package with src/ on sys.path
+    from storage.artifact_cache import ArtifactCache, get_artifact_cache
+
+try:
+    from ..analytics.anomaly_detector import get_anomaly_detector
+except ImportError:  # agents imported as a top-level package with src/ on sys.path
+    from analytics.anomaly_detector import get_anomaly_detector
+
+try:
+    from ..analytics.rollup_store import get_rollup_store
+except ImportError:
+    try:
+        from analytics.rollup_store import get_rollup_store
+    except ImportError:  # rollup store imports the database package relative to src
+        get_rollup_store = None
+
+
+# Status aliases per result bucket
+STATUS_ALIASES = {
+    'passed_tests': ['passed', 'pass', 'success'],
+    'failed_tests': ['failed', 'fail', 'failure', 'error'],
+    'skipped_tests': ['skipped', 'skip', 'ignored'],
+}
+
+# Status string -> result bucket, precomputed so each test is classified with one lookup
+STATUS_BUCKETS: Dict[str, str] = {
+    variant: bucket
+    for bucket, statuses in STATUS_ALIASES.items()
+    for status in statuses
+    for variant in (status, status.upper(), status.capitalize())
+}
+
+
+def classify_status(status: Any) -> Optional[str]:
+    """Map a raw test status to its result bucket name, or None if unknown"""
+    if not isinstance(status, str):
+        return None
+    return STATUS_BUCKETS.get(status) or STATUS_BUCKETS.get(status.lower())
+
+
+class StreamingResultMerger:
+    """
+    Single-pass merger for collected test results.
+    
+    Classifies every test once as it is added, keeps running counters and
+    appends the test to its bucket. Buckets only hold references to the
+    collected test dicts rather than copies.
+    """
+    
+    BUCKETS = ('passed_tests', 'failed_tests', 'skipped_tests')
+    
+    def __init__(self, run_id: str = ''):
+        self.run_id = run_id
+        
+        self.total = 0
+        self.passed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.flaky = 0
+        self.duration = 0.0
+        self.test_suites: List[Dict[str, Any]] = []
+        
+        self._buckets: Dict[str, List[Dict[str, Any]]] = {name: [] for name in self.BUCKETS}
+    
+    def add_tests(self, tests: Iterable[Dict[str, Any]], count: bool = True):
+        """Classify and bucket a stream of test dicts"""
+        for test in tests:
+            bucket = classify_status(test.get('status'))
+            
+            if count:
+                self.total += 1
+                if bucket == 'passed_tests':
+                    self.passed += 1
+                elif bucket == 'failed_tests':
+                    self.failed += 1
+                elif bucket == 'skipped_tests':
+                    self.skipped += 1
+                
+                if test.get('flaky') or test.get('status') == 'flaky':
+                    self.flaky += 1
+                
+                duration = test.get('duration', 0)
+                if isinstance(duration, (int, float)):
+                    self.duration += duration
+            
+            if bucket is not None:
+                self._buckets[bucket].append(test)
+    
+    def add_suites(self, suites: List[Dict[str, Any]]):
+        """Add tests from a list of test suites"""
+        self.test_suites.extend(suites)
+        for suite in suites:
+            self.add_tests(suite.get('tests', []))
+    
+    def add_summary(self, summary: Dict[str, Any]):
+        """Add pre-aggregated counters from a summary-format results file"""
+        self.total += summary.get('total', 0)
+        self.passed += summary.get('passed', 0)
+        self.failed += summary.get('failed', 0)
+        self.skipped += summary.get('skipped', 0)
+        self.flaky += summary.get('flaky', 0)
+        self.duration += summary.get('duration', 0)
+    
+    def get_summary(self, artifacts_count: int = 0) -> Dict[str, Any]:
+        """Build the run summary from the running counters"""
+        pass_rate = (self.passed / self.total * 100) if self.total > 0 else 0
+        
+        return {
+            'run_id': self.run_id,
+            'total': self.total,
+            'passed': self.passed,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'flaky': self.flaky,
+            'pass_rate': round(pass_rate, 2),
+            'duration': round(self.duration, 2),
+            'status': 'passed' if self.failed == 0 and self.total > 0 else 'failed',
+            'artifacts_count': artifacts_count,
+            'collection_time': datetime.utcnow().isoformat()
+        }
+    
+    def get_buckets(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the categorized results"""
+        return dict(self._buckets)
 
 
 class ReportCollectorAgent(BaseAgent):
@@ -36,10 +162,17 @@ class ReportCollectorAgent(BaseAgent):
         super().__init__(config)
         self.storage_config = config.metadata.get('storage_config', {})
         self.ci_config = config.metadata.get('ci_config', {})
+        self.merge_config = config.metadata.get('merge_config', {})
+        self.rollup_config = config.metadata.get('rollup_config', {})
+        self.anomaly_config = config.metadata.get('anomaly_config', {})
+        self._callbacks.setdefault('on_anomaly', [])
         
         # Initialize S3 client
         self.s3_client = self._init_s3_client()
         
+        # Local artifact cache shared with the other collectors and StorageManager
+        self.artifact_cache = get_artifact_cache()
+        
         # Default S3 bucket and paths
         self.default_bucket = self.storage_config.get('bucket', 'my-bucket')
         self.artifacts_path_template = self.storage_config.get('artifacts_path', 's3://my-bucket/artifacts/{run_id}')
@@ -96,13 +229,90 @@ class ReportCollectorAgent(BaseAgent):
         self.logger.info(f"Collecting reports for run_id: {run_id}")
         
         if source_type == 's3':
-            return await self.collect_from_s3(run_id)
+            result = await self.collect_from_s3(run_id)
         elif source_type == 'local':
-            return await self.collect_from_local(run_id, kwargs.get('local_path'))
+            result = await self.collect_from_local(run_id, kwargs.get('local_path'))
         elif source_type == 'github':
-            return await self.collect_from_github(run_id, kwargs.get('repo'))
+            result = await self.collect_from_github(run_id, kwargs.get('repo'))
         else:
             raise ValueError(f"Unsupported source type: {source_type}")
+        
+        recorded = await self._record_rollup(run_id, result, kwargs.get('environment'), kwargs.get('scores'))
+        if recorded is not False:
+            self._detect_run_anomalies(run_id, result, kwargs.get('environment'), kwargs.get('scores'))
+        return result
+    
+    async def _record_rollup(self, run_id: str, result: Dict[str, Any],
+                             environment: Optional[str] = None,
+                             scores: Optional[Dict[str, float]] = None) -> Optional[bool]:
+        """
+        Fold a completed collection into the day/week/month rollups read by trend reports
+        
+        Returns:
+            False if the run was already recorded, None if it was not recorded
+        """
+        if get_rollup_store is None or not self.rollup_config.get('enabled', True):
+            return None
+        
+        if result.get('status') != 'success':
+            return None
+        
+        summary = result.get('summary') or {}
+        if not summary.get('total'):
+            return None
+        
+        try:
+            recorded = await asyncio.to_thread(
+                get_rollup_store().record_run,
+                run_id,
+                summary,
+                environment=environment or self.rollup_config.get('environment'),
+                scores=scores
+            )
+            if not recorded:
+                self.logger.debug(f"Run {run_id} already recorded in rollups")
+            return recorded
+        except Exception as e:
+            self.logger.warning(f"Failed to update rollups for run {run_id}: {e}")
+            return None
+    
+    def _detect_run_anomalies(self, run_id: str, result: Dict[str, Any],
+                              environment: Optional[str] = None,
+                              scores: Optional[Dict[str, float]] = None):
+        """Score the run's failure rate, flakiness and scores against their online baselines"""
+        if not self.anomaly_config.get('enabled', True) or result.get('status') != 'success':
+            return
+        
+        summary = result.get('summary') or {}
+        total = summary.get('total') or 0
+        if not total:
+            return
+        
+        values = {
+            'failure_rate': summary.get('failed', 0) / total * 100,
+            'flakiness': summary.get('flaky', 0) / total * 100
+        }
+        for name, score in (scores or {}).items():
+            if score is not None:
+                values[f'{name}_score'] = score
+        
+        detector = get_anomaly_detector()
+        environment = environment or self.rollup_config.get('environment') or 'all'
+        anomalies = []
+        
+        for metric, value in values.items():
+            anomaly = detector.observe(f"run:{environment}:{metric}", value)
+            if anomaly:
+                anomalies.append({**anomaly, 'metric': metric, 'run_id': run_id})
+        
+        if anomalies:
+            result['anomalies'] = anomalies
+            for anomaly in anomalies:
+                self.logger.warning(
+                    f"Run {run_id}: {anomaly['metric']} {anomaly['value']:.2f} deviates from "
+                    f"baseline {anomaly['expected']:.2f} (z={anomaly['z_score']:.1f})"
+                )
+            self._trigger_callbacks('on_anomaly', anomalies)
 
     async def collect_from_s3(self, run_id: str, bucket: Optional[str] = None, 
                              custom_path: Optional[str] = None) -> Dict[str, Any]:
@@ -158,10 +368,26 @@ class ReportCollectorAgent(BaseAgent):
                 # Check if this is one of our target files or directories
                 if any(target in key.lower() for target in target_files):
                     try:
-                        # Create temporary file for download
-                        with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{filename}") as tmp_file:
-                            self.s3_client.download_fileobj(bucket_name, key, tmp_file)
-                            tmp_path = tmp_file.name
+                        # Objects are cached by ETag, so unchanged artifacts are not downloaded again
+                        cache_key = ArtifactCache.make_key(
+                            's3', bucket_name, key, obj.get('ETag', '').strip('"'), obj['Size']
+                        )
+                        is_json = filename.endswith('.json')
+                        if is_json:
+                            # Results are only parsed, so they are read straight from the cache
+                            tmp_path = self.artifact_cache.get(cache_key)
+                        else:
+                            tmp_path = self._copy_from_cache(cache_key, f"_{filename}")
+                        
+                        if tmp_path is None:
+                            with tempfile.NamedTemporaryFile(delete=False, suffix=f"_{filename}") as tmp_file:
+                                self.s3_client.download_fileobj(bucket_name, key, tmp_file)
+                            cached_path = self.artifact_cache.put_file(
+                                cache_key, tmp_file.name, move=is_json, filename=filename
+                            )
+                            tmp_path = cached_path if is_json else tmp_file.name
+                        
+                        tmp_path = str(tmp_path)
                         
                         # Process the downloaded file
                         if filename.endswith('.json'):
@@ -220,6 +446,9 @@ class ReportCollectorAgent(BaseAgent):
         """
         Merge collected test results into a single JSON object with summary.
         
+        Each test is classified exactly once while streaming through the
+        collected files.
+        
         Args:
             collected_files: Dictionary of collected files and their contents
             run_id: Test run identifier
@@ -227,16 +456,7 @@ class ReportCollectorAgent(BaseAgent):
         Returns:
             Dict with merged results and summary
         """
-        # Initialize summary counters
-        total_tests = 0
-        passed_tests = 0
-        failed_tests = 0
-        skipped_tests = 0
-        total_duration = 0.0
-        
-        # Collect all test results
-        all_results = []
-        test_suites = []
+        merger = StreamingResultMerger(run_id=run_id)
         
         # Process results.json files
         for filename, content in collected_files.items():
@@ -244,84 +464,26 @@ class ReportCollectorAgent(BaseAgent):
                 # Handle different result formats
                 if 'tests' in content:
                     # Standard test results format
-                    tests = content['tests']
-                    all_results.extend(tests)
-                    
-                    # Update counters
-                    for test in tests:
-                        total_tests += 1
-                        status = test.get('status', '').lower()
-                        if status in ['passed', 'pass', 'success']:
-                            passed_tests += 1
-                        elif status in ['failed', 'fail', 'failure', 'error']:
-                            failed_tests += 1
-                        elif status in ['skipped', 'skip', 'ignored']:
-                            skipped_tests += 1
-                        
-                        # Add duration if available
-                        duration = test.get('duration', 0)
-                        if isinstance(duration, (int, float)):
-                            total_duration += duration
+                    merger.add_tests(content['tests'])
                 
                 elif 'summary' in content:
-                    # Summary format
-                    summary = content['summary']
-                    total_tests += summary.get('total', 0)
-                    passed_tests += summary.get('passed', 0)
-                    failed_tests += summary.get('failed', 0)
-                    skipped_tests += summary.get('skipped', 0)
-                    total_duration += summary.get('duration', 0)
+                    # Summary format: counters come from the summary itself
+                    merger.add_summary(content['summary'])
                     
                     if 'results' in content:
-                        all_results.extend(content['results'])
+                        merger.add_tests(content['results'], count=False)
                 
                 elif 'suites' in content:
                     # Test suite format
-                    suites = content['suites']
-                    test_suites.extend(suites)
-                    
-                    for suite in suites:
-                        suite_tests = suite.get('tests', [])
-                        all_results.extend(suite_tests)
-                        
-                        for test in suite_tests:
-                            total_tests += 1
-                            status = test.get('status', '').lower()
-                            if status in ['passed', 'pass', 'success']:
-                                passed_tests += 1
-                            elif status in ['failed', 'fail', 'failure', 'error']:
-                                failed_tests += 1
-                            elif status in ['skipped', 'skip', 'ignored']:
-                                skipped_tests += 1
-                            
-                            duration = test.get('duration', 0)
-                            if isinstance(duration, (int, float)):
-                                total_duration += duration
-        
-        # Calculate pass rate
-        pass_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
-        
-        # Create comprehensive summary
-        summary = {
-            'run_id': run_id,
-            'total': total_tests,
-            'passed': passed_tests,
-            'failed': failed_tests,
-            'skipped': skipped_tests,
-            'pass_rate': round(pass_rate, 2),
-            'duration': round(total_duration, 2),
-            'status': 'passed' if failed_tests == 0 and total_tests > 0 else 'failed',
-            'artifacts_count': len(collected_files),
-            'collection_time': datetime.utcnow().isoformat()
-        }
+                    merger.add_suites(content['suites'])
+        
+        summary = merger.get_summary(artifacts_count=len(collected_files))
         
         # Organize results by category
         results = {
             'summary': summary,
-            'passed_tests': [test for test in all_results if test.get('status', '').lower() in ['passed', 'pass', 'success']],
-            'failed_tests': [test for test in all_results if test.get('status', '').lower() in ['failed', 'fail', 'failure', 'error']],
-            'skipped_tests': [test for test in all_results if test.get('status', '').lower() in ['skipped', 'skip', 'ignored']],
-            'test_suites': test_suites,
+            **merger.get_buckets(),
+            'test_suites': merger.test_suites,
             'artifacts': {k: v for k, v in collected_files.items() if not k.endswith('.json')}
         }
         
@@ -418,52 +580,67 @@ class ReportCollectorAgent(BaseAgent):
                 
                 artifacts_data = await response.json()
                 artifacts = artifacts_data.get('artifacts', [])
+            
+            collected_files = {}
+            
+            # Download each artifact
+            for artifact in artifacts:
+                artifact_name = artifact['name']
+                download_url = artifact['archive_download_url']
                 
-                collected_files = {}
+                # Artifacts are immutable per id; digest/updated_at guard against re-uploads
+                cache_key = ArtifactCache.make_key(
+                    'github', repo, artifact.get('id', artifact_name),
+                    artifact.get('digest') or artifact.get('updated_at'),
+                    artifact['size_in_bytes']
+                )
+                local_path = self._copy_from_cache(cache_key, '.zip')
                 
-                # Download each artifact
-                for artifact in artifacts:
-                    artifact_name = artifact['name']
-                    download_url = artifact['archive_download_url']
-                    
-                    # Download artifact
+                if local_path is None:
                     async with session.get(download_url, headers=headers) as download_response:
-                        if download_response.status == 200:
-                            # Save to temporary file
-                            with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
-                                async for chunk in download_response.content.iter_chunked(8192):
-                                    tmp_file.write(chunk)
-                                
-                                collected_files[artifact_name] = {
-                                    'type': 'artifact',
-                                    'size': artifact['size_in_bytes'],
-                                    'created_at': artifact['created_at'],
-                                    'local_path': tmp_file.name
-                                }
-                
-                # For GitHub, we'll create a basic summary since we don't have parsed results
-                summary = {
-                    'run_id': run_id,
-                    'total': len(artifacts),
-                    'passed': 0,  # Would need to parse artifacts to determine
-                    'failed': 0,
-                    'skipped': 0,
-                    'pass_rate': 0,
-                    'duration': 0,
-                    'status': 'collected',
-                    'artifacts_count': len(artifacts),
-                    'collection_time': datetime.utcnow().isoformat()
-                }
+                        if download_response.status != 200:
+                            continue
+                        
+                        # Save to temporary file
+                        with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
+                            async for chunk in download_response.content.iter_chunked(8192):
+                                tmp_file.write(chunk)
+                        
+                        self.artifact_cache.put_file(
+                            cache_key, tmp_file.name, filename=f"{artifact_name}.zip"
+                        )
+                        local_path = tmp_file.name
                 
-                return {
-                    'status': 'success',
-                    'run_id': run_id,
-                    'summary': summary,
-                    'artifacts': list(collected_files.keys()),
-                    'github_artifacts': collected_files,
-                    'collection_timestamp': datetime.utcnow().isoformat(),
-                    'repository': repo
+                collected_files[artifact_name] = {
+                    'type': 'artifact',
+                    'size': artifact['size_in_bytes'],
+                    'created_at': artifact['created_at'],
+                    'local_path': local_path
                 }
+            
+            # For GitHub, we'll create a basic summary since we don't have parsed results
+            summary = {
+                'run_id': run_id,
+                'total': len(artifacts),
+                'passed': 0,  # Would need to parse artifacts to determine
+                'failed': 0,
+                'skipped': 0,
+                'pass_rate': 0,
+                'duration': 0,
+                'status': 'collected',
+                'artifacts_count': len(artifacts),
+                'collection_time': datetime.utcnow().isoformat()
+            }
+            
+            return {
+                'status': 'success',
+                'run_id': run_id,
+                'summary': summary,
+                'artifacts': list(collected_files.keys()),
+                'github_artifacts': collected_files,
+                'collection_timestamp': datetime.utcnow().isoformat(),
+                'repository': repo
+            }
 
     async def get_artifact_summary(self, run_id: str) -> Dict[str, Any]:
         """
@@ -532,20 +709,66 @@ class ReportCollectorAgent(BaseAgent):
         download_dir = Path(download_path)
         download_dir.mkdir(parents=True, exist_ok=True)
         
-        if source == 'minio':
-            return await self._download_from_minio(artifact_info, download_dir)
-        elif source == 'github':
-            return await self._download_from_github(artifact_info, download_dir)
-        elif source == 'jenkins':
-            return await self._download_from_jenkins(artifact_info, download_dir)
-        elif source == 'gitlab':
-            return await self._download_from_gitlab(artifact_info, download_dir)
-        elif source == 'azure':
-            return await self._download_from_azure(artifact_info, download_dir)
-        elif source == 'filesystem':
+        if source == 'filesystem':
             return await self._copy_from_filesystem(artifact_info, download_dir)
-        else:
+        
+        downloaders = {
+            'minio': self._download_from_minio,
+            'github': self._download_from_github,
+            'jenkins': self._download_from_jenkins,
+            'gitlab': self._download_from_gitlab,
+            'azure': self._download_from_azure
+        }
+        if source not in downloaders:
             raise ValueError(f"Unsupported artifact source: {source}")
+        
+        # Serve previously downloaded versions of this artifact from the local cache
+        cache_key = self._get_artifact_cache_key(artifact_info)
+        if cache_key is None:
+            return await downloaders[source](artifact_info, download_dir)
+        
+        cached_name = self.artifact_cache.get_filename(cache_key)
+        if cached_name:
+            local_path = download_dir / cached_name
+            if self.artifact_cache.copy_to(cache_key, local_path):
+                self.logger.debug(f"Artifact served from cache: {cached_name}")
+                return str(local_path)
+        
+        local_path = await downloaders[source](artifact_info, download_dir)
+        self.artifact_cache.put_file(cache_key, local_path)
+        
+        return local_path
+    
+    def _get_artifact_cache_key(self, artifact_info: Dict[str, Any]) -> Optional[str]:
+        """
+        Build the artifact cache key from source, location and version fields.
+        
+        Returns None for artifacts without any version field, whose location
+        alone may point to content that changes between downloads.
+        """
+        version = (
+            artifact_info.get('etag') or artifact_info.get('digest') or artifact_info.get('checksum'),
+            artifact_info.get('updated_at') or artifact_info.get('created_at'),
+            artifact_info.get('size') or artifact_info.get('size_in_bytes')
+        )
+        if not any(version):
+            return None
+        
+        return ArtifactCache.make_key(
+            artifact_info.get('source'),
+            artifact_info.get('bucket'),
+            artifact_info.get('download_url') or artifact_info.get('file_path'),
+            *version
+        )
+    
+    def _copy_from_cache(self, cache_key: str, suffix: str = '') -> Optional[str]:
+        """Copy a cached artifact to a new temporary file owned by the caller"""
+        fd, tmp_name = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        if self.artifact_cache.copy_to(cache_key, tmp_name):
+            return tmp_name
+        os.unlink(tmp_name)
+        return None
     
     async def _download_from_minio(self, artifact_info: Dict[str, Any], download_dir: Path) -> str:
         """Download artifact from MinIO"""
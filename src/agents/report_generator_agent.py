@@ -6,9 +6,15 @@ in various formats (JSON, PDF, HTML, Excel).
 """
 
 import asyncio
+import hashlib
 import json
+import multiprocessing
 import os
-import tempfile
+import queue
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -23,6 +29,7 @@ from reportlab.platypus.flowables import HRFlowable
 from reportlab.graphics.shapes import Drawing
 from reportlab.graphics.charts.piecharts import Pie
 from reportlab.graphics.charts.barcharts import VerticalBarChart
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 from io import BytesIO
@@ -32,6 +39,429 @@ from .base_agent import BaseAgent, AgentConfig
 from .report_collector_agent import ReportCollectorAgent
 
 
+def _init_render_worker():
+    """Configure matplotlib in a render worker process"""
+    matplotlib.use('Agg')
+    plt.style.use('seaborn-v0_8')
+    sns.set_palette("husl")
+
+
+def _figure_to_base64(fig) -> str:
+    """Encode a matplotlib figure as a base64 PNG and close it"""
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
+    plt.close(fig)
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
+def _render_pie_chart(data: Dict[str, Any], title: str) -> str:
+    """Render a pie chart and return base64 encoded image"""
+    fig, ax = plt.subplots(figsize=(8, 6))
+    
+    labels = list(data.keys())
+    values = list(data.values())
+    
+    wedges, texts, autotexts = ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90)
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    
+    # Improve text readability
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+    
+    fig.tight_layout()
+    return _figure_to_base64(fig)
+
+
+def _render_bar_chart(data: Dict[str, Any], title: str) -> str:
+    """Render a bar chart and return base64 encoded image"""
+    fig, ax = plt.subplots(figsize=(10, 6))
+    
+    labels = list(data.keys())
+    values = list(data.values())
+    
+    bars = ax.bar(labels, values, color=sns.color_palette("husl", len(labels)))
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.set_ylabel('Success Rate (%)')
+    
+    # Add value labels on bars
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
+               f'{height:.1f}%', ha='center', va='bottom')
+    
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    fig.tight_layout()
+    return _figure_to_base64(fig)
+
+
+def _render_line_chart(data: List[Dict[str, Any]], title: str) -> str:
+    """Render a success rate line chart and return base64 encoded image"""
+    if not data:
+        return ""
+    
+    fig, ax = plt.subplots(figsize=(12, 6))
+    
+    dates = [item['date'] for item in data]
+    success_rates = [item['success_rate'] for item in data]
+    
+    ax.plot(dates, success_rates, marker='o', linewidth=2, markersize=6)
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.set_ylabel('Success Rate (%)')
+    ax.set_xlabel('Date')
+    ax.grid(True, alpha=0.3)
+    
+    # Format x-axis
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    
+    # Set y-axis limits
+    ax.set_ylim(0, 100)
+    
+    fig.tight_layout()
+    return _figure_to_base64(fig)
+
+
+CHART_RENDERERS = {
+    'pie': _render_pie_chart,
+    'bar': _render_bar_chart,
+    'line': _render_line_chart
+}
+
+
+def _render_chart(chart_type: str, data: Any, title: str) -> str:
+    """Render a chart by type; runs inside a render worker process"""
+    return CHART_RENDERERS[chart_type](data, title)
+
+
+class RenderCancelled(Exception):
+    """Raised inside a render worker when its job has been cancelled"""
+
+
+class RenderJobReporter:
+    """
+    Progress and cancellation handle passed to render workers.
+    
+    Wraps manager proxies so it can be pickled into the worker process.
+    """
+    
+    def __init__(self, job_id: str, progress_queue, cancel_event):
+        self.job_id = job_id
+        self.progress_queue = progress_queue
+        self.cancel_event = cancel_event
+    
+    def check_cancelled(self):
+        """Abort the job if cancellation was requested"""
+        if self.cancel_event.is_set():
+            raise RenderCancelled(f"Render job {self.job_id} was cancelled")
+    
+    def update(self, stage: str, progress: float):
+        """Report progress for a stage; also a cancellation checkpoint"""
+        self.check_cancelled()
+        self.progress_queue.put((stage, min(progress, 1.0)))
+
+
+class ChartCache:
+    """LRU cache of encoded chart PNGs keyed by chart content hash"""
+    
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(chart_type: str, data: Any, title: str) -> str:
+        """Hash chart type, data and title into a cache key"""
+        payload = json.dumps([chart_type, data, title], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached chart image"""
+        with self._lock:
+            image = self._entries.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return image
+    
+    def put(self, key: str, image: str):
+        """Cache a chart image, evicting the least recently used one when full"""
+        with self._lock:
+            self._entries[key] = image
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+# Shared across agent instances so repeat reports reuse rendered charts
+_chart_cache = ChartCache()
+
+
+def _pdf_progress_callback(reporter: 'RenderJobReporter'):
+    """Map reportlab layout progress onto the second half of the job; also checks for cancellation"""
+    state = {'total': 1, 'last': 0.0}
+    
+    def on_progress(event_type: str, value: int):
+        if event_type == 'SIZE_EST':
+            state['total'] = max(value, 1)
+        elif event_type == 'PROGRESS':
+            fraction = min(value / state['total'], 1.0)
+            if fraction - state['last'] >= 0.01:
+                state['last'] = fraction
+                reporter.update('layout', 0.5 + 0.5 * fraction)
+                return
+        reporter.check_cancelled()
+    
+    return on_progress
+
+
+def _build_pdf_report(processed_data: Dict[str, Any], charts: Dict[str, str],
+                      report_path: Path, report_name: str, include_details: bool,
+                      reporter: 'RenderJobReporter') -> Path:
+    """Build a PDF report directly into report_path; runs inside a render worker process"""
+    try:
+        return _build_pdf_story(processed_data, charts, report_path, report_name, include_details, reporter)
+    except RenderCancelled:
+        report_path.unlink(missing_ok=True)
+        raise
+
+
+def _build_pdf_story(processed_data: Dict[str, Any], charts: Dict[str, str],
+                     report_path: Path, report_name: str, include_details: bool,
+                     reporter: 'RenderJobReporter') -> Path:
+    """Lay out and write the PDF report"""
+    doc = SimpleDocTemplate(str(report_path), pagesize=A4)
+    doc.setProgressCallBack(_pdf_progress_callback(reporter))
+    styles = getSampleStyleSheet()
+    story = []
+    
+    # Title
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=1  # Center alignment
+    )
+    story.append(Paragraph(f"Test Report: {report_name}", title_style))
+    story.append(Spacer(1, 20))
+    
+    reporter.update('summary', 0.0)
+    
+    # Report metadata
+    metadata = processed_data.get('summary', {})
+    story.append(Paragraph("Report Summary", styles['Heading2']))
+    
+    summary_data = [
+        ['Metric', 'Value'],
+        ['Total Test Runs', str(metadata.get('total_test_runs', 0))],
+        ['Total Test Results', str(metadata.get('total_test_results', 0))],
+        ['Total Artifacts', str(metadata.get('total_artifacts', 0))],
+        ['Sources', ', '.join(metadata.get('sources', []))],
+        ['Test Types', ', '.join(metadata.get('test_types', []))],
+        ['Date Range', f"{metadata.get('date_range', {}).get('start', 'N/A')} to {metadata.get('date_range', {}).get('end', 'N/A')}"]
+    ]
+    
+    summary_table = Table(summary_data)
+    summary_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    story.append(summary_table)
+    story.append(Spacer(1, 20))
+    
+    reporter.update('charts', 0.1)
+    
+    # Charts
+    if charts:
+        story.append(Paragraph("Visual Analysis", styles['Heading2']))
+        
+        for chart_name, chart_data in charts.items():
+            if chart_data:
+                # Decode base64 image straight into memory for reportlab
+                image_buffer = BytesIO(base64.b64decode(chart_data))
+                
+                try:
+                    img = Image(image_buffer, width=6*inch, height=4*inch)
+                    story.append(img)
+                    story.append(Spacer(1, 10))
+                except:
+                    story.append(Paragraph(f"Chart: {chart_name} (Unable to render)", styles['Normal']))
+    
+    reporter.update('analysis', 0.2)
+    
+    # Analysis
+    analysis = processed_data.get('analysis', {})
+    if analysis:
+        story.append(PageBreak())
+        story.append(Paragraph("Detailed Analysis", styles['Heading2']))
+        
+        # Status distribution
+        status_dist = analysis.get('status_distribution', {})
+        if status_dist:
+            story.append(Paragraph("Test Results Distribution", styles['Heading3']))
+            status_data = [['Status', 'Count', 'Percentage']]
+            total_results = sum(status_dist.values())
+            
+            for status, count in status_dist.items():
+                percentage = (count / total_results) * 100 if total_results > 0 else 0
+                status_data.append([status.title(), str(count), f"{percentage:.1f}%"])
+            
+            status_table = Table(status_data)
+            status_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 12),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]))
+            story.append(status_table)
+            story.append(Spacer(1, 20))
+    
+    reporter.update('recommendations', 0.3)
+    
+    # Recommendations
+    recommendations = processed_data.get('recommendations', [])
+    if recommendations:
+        story.append(Paragraph("Recommendations", styles['Heading2']))
+        
+        for i, rec in enumerate(recommendations, 1):
+            story.append(Paragraph(f"{i}. {rec['title']}", styles['Heading3']))
+            story.append(Paragraph(f"Priority: {rec['priority'].title()}", styles['Normal']))
+            story.append(Paragraph(f"Description: {rec['description']}", styles['Normal']))
+            story.append(Paragraph(f"Action: {rec['action']}", styles['Normal']))
+            story.append(Spacer(1, 10))
+    
+    reporter.update('details', 0.4)
+    
+    # Detailed data (if requested)
+    if include_details:
+        story.append(PageBreak())
+        story.append(Paragraph("Detailed Test Results", styles['Heading2']))
+        
+        test_results = processed_data.get('test_results', [])[:50]  # Limit to first 50
+        if test_results:
+            results_data = [['Test Name', 'Status', 'Duration (s)', 'Error']]
+            
+            for result in test_results:
+                error_msg = result.get('error_message', '')
+                if len(error_msg) > 50:
+                    error_msg = error_msg[:47] + '...'
+                
+                results_data.append([
+                    result.get('test_name', 'N/A'),
+                    result.get('status', 'N/A'),
+                    str(result.get('duration', 'N/A')),
+                    error_msg
+                ])
+            
+            results_table = Table(results_data)
+            results_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 10),
+                ('FONTSIZE', (0, 1), (-1, -1), 8),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]))
+            story.append(results_table)
+    
+    # Build PDF
+    reporter.update('layout', 0.5)
+    doc.build(story)
+    reporter.update('completed', 1.0)
+    return report_path
+
+
+def _build_excel_report(processed_data: Dict[str, Any], report_path: Path,
+                        include_details: bool, reporter: 'RenderJobReporter') -> Path:
+    """Build an Excel report directly into report_path; runs inside a render worker process"""
+    try:
+        return _build_excel_sheets(processed_data, report_path, include_details, reporter)
+    except RenderCancelled:
+        report_path.unlink(missing_ok=True)
+        raise
+
+
+def _build_excel_sheets(processed_data: Dict[str, Any], report_path: Path,
+                        include_details: bool, reporter: 'RenderJobReporter') -> Path:
+    """Write the Excel report sheets"""
+    with pd.ExcelWriter(report_path, engine='openpyxl') as writer:
+        # Summary sheet
+        reporter.update('summary', 0.0)
+        summary_data = processed_data.get('summary', {})
+        summary_df = pd.DataFrame([
+            ['Total Test Runs', summary_data.get('total_test_runs', 0)],
+            ['Total Test Results', summary_data.get('total_test_results', 0)],
+            ['Total Artifacts', summary_data.get('total_artifacts', 0)],
+            ['Sources', ', '.join(summary_data.get('sources', []))],
+            ['Test Types', ', '.join(summary_data.get('test_types', []))],
+            ['Start Date', summary_data.get('date_range', {}).get('start', 'N/A')],
+            ['End Date', summary_data.get('date_range', {}).get('end', 'N/A')]
+        ], columns=['Metric', 'Value'])
+        summary_df.to_excel(writer, sheet_name='Summary', index=False)
+        
+        # Analysis sheet
+        reporter.update('analysis', 0.2)
+        analysis = processed_data.get('analysis', {})
+        if analysis.get('status_distribution'):
+            status_df = pd.DataFrame([
+                [status, count] for status, count in analysis['status_distribution'].items()
+            ], columns=['Status', 'Count'])
+            status_df.to_excel(writer, sheet_name='Status Distribution', index=False)
+        
+        if analysis.get('success_rate_by_type'):
+            success_df = pd.DataFrame([
+                [test_type, rate] for test_type, rate in analysis['success_rate_by_type'].items()
+            ], columns=['Test Type', 'Success Rate (%)'])
+            success_df.to_excel(writer, sheet_name='Success Rates', index=False)
+        
+        # Recommendations sheet
+        reporter.update('recommendations', 0.4)
+        recommendations = processed_data.get('recommendations', [])
+        if recommendations:
+            rec_df = pd.DataFrame(recommendations)
+            rec_df.to_excel(writer, sheet_name='Recommendations', index=False)
+        
+        # Detailed data sheets (if requested)
+        if include_details:
+            reporter.update('test_runs', 0.5)
+            test_runs = processed_data.get('test_runs', [])
+            if test_runs:
+                runs_df = pd.DataFrame(test_runs)
+                runs_df.to_excel(writer, sheet_name='Test Runs', index=False)
+            
+            reporter.update('test_results', 0.6)
+            test_results = processed_data.get('test_results', [])
+            if test_results:
+                results_df = pd.DataFrame(test_results)
+                results_df.to_excel(writer, sheet_name='Test Results', index=False)
+            
+            reporter.update('artifacts', 0.8)
+            artifacts = processed_data.get('artifacts', [])
+            if artifacts:
+                artifacts_df = pd.DataFrame(artifacts)
+                artifacts_df.to_excel(writer, sheet_name='Artifacts', index=False)
+    
+    reporter.update('completed', 1.0)
+    return report_path
+
+
 class ReportGeneratorAgent(BaseAgent):
     """
     Agent responsible for generating comprehensive test reports from collected data.
@@ -60,6 +490,147 @@ class ReportGeneratorAgent(BaseAgent):
         # Set up matplotlib for chart generation
         plt.style.use('seaborn-v0_8')
         sns.set_palette("husl")
+        
+        # Charts are rendered in worker processes so the event loop stays free
+        self.render_workers = self.report_config.get('render_workers', min(4, os.cpu_count() or 1))
+        self._render_pool: Optional[ProcessPoolExecutor] = None
+        self._job_manager = None
+        self._job_manager_lock = threading.Lock()
+        self.progress_interval = self.report_config.get('progress_interval', 0.5)
+        self.render_jobs: Dict[str, Dict[str, Any]] = {}
+        # A configured cache size gets the agent its own cache instead of resizing the shared one
+        if 'chart_cache_size' in self.report_config:
+            self.chart_cache = ChartCache(max_entries=self.report_config['chart_cache_size'])
+        else:
+            self.chart_cache = _chart_cache
+    
+    def _get_render_pool(self) -> ProcessPoolExecutor:
+        """Get the render process pool, creating it on first use"""
+        if self._render_pool is None:
+            self._render_pool = ProcessPoolExecutor(
+                max_workers=self.render_workers,
+                initializer=_init_render_worker
+            )
+        return self._render_pool
+    
+    def _get_job_manager(self):
+        """Get the multiprocessing manager used for job progress and cancellation"""
+        with self._job_manager_lock:
+            if self._job_manager is None:
+                self._job_manager = multiprocessing.Manager()
+            return self._job_manager
+    
+    def _create_job_channels(self):
+        """Create the progress queue and cancel event of a job; blocks on the manager process"""
+        manager = self._get_job_manager()
+        return manager.Queue(), manager.Event()
+    
+    def close(self):
+        """Cancel running render jobs and shut down the render process pool and job manager"""
+        for job_id in list(self.render_jobs):
+            self.cancel_render_job(job_id)
+        
+        if self._render_pool is not None:
+            self._render_pool.shutdown(wait=False, cancel_futures=True)
+            self._render_pool = None
+        
+        with self._job_manager_lock:
+            if self._job_manager is not None:
+                self._job_manager.shutdown()
+                self._job_manager = None
+    
+    async def _run_render_job(self, job_type: str, builder, *args) -> Path:
+        """
+        Run a document builder as a job in the render process pool.
+        
+        The event loop only polls for progress while the worker writes the
+        output file. Cancelling the awaiting task, or calling
+        cancel_render_job, stops the worker at its next checkpoint.
+        
+        Args:
+            job_type: Report format being rendered (pdf, excel)
+            builder: Module-level builder function executed in the worker
+            args: Builder arguments, followed by the job reporter
+            
+        Returns:
+            Path of the written report
+        """
+        job_id = f"{job_type}_{uuid.uuid4().hex[:8]}"
+        progress_queue, cancel_event = await asyncio.to_thread(self._create_job_channels)
+        reporter = RenderJobReporter(job_id, progress_queue, cancel_event)
+        
+        job = {
+            'job_id': job_id,
+            'type': job_type,
+            'status': 'running',
+            'stage': 'queued',
+            'progress': 0.0,
+            'started_at': datetime.now().isoformat(),
+            '_cancel_event': cancel_event
+        }
+        self.render_jobs[job_id] = job
+        
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_render_pool(), builder, *args, reporter)
+        
+        try:
+            while True:
+                done, _ = await asyncio.wait({future}, timeout=self.progress_interval)
+                await self._drain_job_progress(job, progress_queue)
+                if done:
+                    break
+            
+            report_path = future.result()
+            job['status'] = 'completed'
+            return report_path
+            
+        except (asyncio.CancelledError, RenderCancelled):
+            cancel_event.set()
+            job['status'] = 'cancelled'
+            self.logger.info(f"Render job {job_id} cancelled")
+            raise
+        except Exception:
+            job['status'] = 'failed'
+            raise
+        finally:
+            job['finished_at'] = datetime.now().isoformat()
+            self._trigger_callbacks('on_progress', self.get_render_job(job_id))
+            self.render_jobs.pop(job_id, None)
+    
+    @staticmethod
+    def _read_job_progress(progress_queue) -> Optional[tuple]:
+        """Empty a job's progress queue and return the latest (stage, progress) update"""
+        latest = None
+        while True:
+            try:
+                latest = progress_queue.get_nowait()
+            except queue.Empty:
+                return latest
+    
+    async def _drain_job_progress(self, job: Dict[str, Any], progress_queue):
+        """Apply progress updates reported by a render worker"""
+        # Queue proxy calls are blocking round trips to the manager process
+        latest = await asyncio.to_thread(self._read_job_progress, progress_queue)
+        
+        if latest is not None:
+            job['stage'], job['progress'] = latest
+            self.logger.debug(f"Render job {job['job_id']}: {job['stage']} ({job['progress']:.0%})")
+            self._trigger_callbacks('on_progress', self.get_render_job(job['job_id']))
+    
+    def get_render_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get status and progress of a running render job"""
+        job = self.render_jobs.get(job_id)
+        if job is None:
+            return None
+        return {k: v for k, v in job.items() if not k.startswith('_')}
+    
+    def cancel_render_job(self, job_id: str) -> bool:
+        """Request cancellation of a running render job"""
+        job = self.render_jobs.get(job_id)
+        if job is None:
+            return False
+        job['_cancel_event'].set()
+        return True
     
     async def _execute_impl(self, **kwargs) -> Dict[str, Any]:
         """Execute report generation logic"""
@@ -367,130 +938,69 @@ class ReportGeneratorAgent(BaseAgent):
         return recommendations
     
     async def _generate_charts(self, processed_data: Dict[str, Any]) -> Dict[str, str]:
-        """Generate charts and return base64 encoded images"""
+        """Generate charts in parallel and return base64 encoded images"""
         charts = {}
+        chart_specs = []
         
-        try:
-            # Test status distribution pie chart
-            status_dist = processed_data.get('analysis', {}).get('status_distribution', {})
-            if status_dist:
-                charts['status_distribution'] = await self._create_pie_chart(
-                    status_dist, 'Test Results Distribution', 'status_distribution'
-                )
-            
-            # Success rate by test type bar chart
-            success_rates = processed_data.get('analysis', {}).get('success_rate_by_type', {})
-            if success_rates:
-                charts['success_rate_by_type'] = await self._create_bar_chart(
-                    success_rates, 'Success Rate by Test Type (%)', 'success_rate_by_type'
-                )
-            
-            # Success rate trend line chart
-            trend_data = processed_data.get('trends', {}).get('success_rate_trend', [])
-            if trend_data:
-                charts['success_rate_trend'] = await self._create_line_chart(
-                    trend_data, 'Success Rate Trend', 'success_rate_trend'
-                )
-            
-            # Failure patterns pie chart
-            failure_patterns = processed_data.get('trends', {}).get('failure_patterns', {})
-            if failure_patterns:
-                charts['failure_patterns'] = await self._create_pie_chart(
-                    failure_patterns, 'Failure Patterns', 'failure_patterns'
-                )
-        
-        except Exception as e:
-            self.logger.error(f"Error generating charts: {e}")
+        # Test status distribution pie chart
+        status_dist = processed_data.get('analysis', {}).get('status_distribution', {})
+        if status_dist:
+            chart_specs.append(('status_distribution', 'pie', status_dist, 'Test Results Distribution'))
         
-        return charts
-    
-    async def _create_pie_chart(self, data: Dict[str, Any], title: str, filename: str) -> str:
-        """Create a pie chart and return base64 encoded image"""
-        fig, ax = plt.subplots(figsize=(8, 6))
+        # Success rate by test type bar chart
+        success_rates = processed_data.get('analysis', {}).get('success_rate_by_type', {})
+        if success_rates:
+            chart_specs.append(('success_rate_by_type', 'bar', success_rates, 'Success Rate by Test Type (%)'))
         
-        labels = list(data.keys())
-        values = list(data.values())
+        # Success rate trend line chart
+        trend_data = processed_data.get('trends', {}).get('success_rate_trend', [])
+        if trend_data:
+            chart_specs.append(('success_rate_trend', 'line', trend_data, 'Success Rate Trend'))
         
-        wedges, texts, autotexts = ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90)
-        ax.set_title(title, fontsize=14, fontweight='bold')
+        # Failure patterns pie chart
+        failure_patterns = processed_data.get('trends', {}).get('failure_patterns', {})
+        if failure_patterns:
+            chart_specs.append(('failure_patterns', 'pie', failure_patterns, 'Failure Patterns'))
         
-        # Improve text readability
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
+        results = await asyncio.gather(
+            *(self._render_chart(chart_type, data, title) for _, chart_type, data, title in chart_specs),
+            return_exceptions=True
+        )
         
-        plt.tight_layout()
+        for (chart_name, _, _, _), result in zip(chart_specs, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error generating chart {chart_name}: {result}")
+                continue
+            charts[chart_name] = result
         
-        # Convert to base64
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
-        plt.close()
+        return charts
+    
+    async def _render_chart(self, chart_type: str, data: Any, title: str) -> str:
+        """Render a chart in the process pool, reusing cached output for identical charts"""
+        cache_key = self.chart_cache.make_key(chart_type, data, title)
+        image_base64 = self.chart_cache.get(cache_key)
+        if image_base64 is not None:
+            return image_base64
+        
+        loop = asyncio.get_running_loop()
+        image_base64 = await loop.run_in_executor(
+            self._get_render_pool(), _render_chart, chart_type, data, title
+        )
         
+        self.chart_cache.put(cache_key, image_base64)
         return image_base64
     
+    async def _create_pie_chart(self, data: Dict[str, Any], title: str, filename: str) -> str:
+        """Create a pie chart and return base64 encoded image"""
+        return await self._render_chart('pie', data, title)
+    
     async def _create_bar_chart(self, data: Dict[str, Any], title: str, filename: str) -> str:
         """Create a bar chart and return base64 encoded image"""
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        labels = list(data.keys())
-        values = list(data.values())
-        
-        bars = ax.bar(labels, values, color=sns.color_palette("husl", len(labels)))
-        ax.set_title(title, fontsize=14, fontweight='bold')
-        ax.set_ylabel('Success Rate (%)')
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                   f'{height:.1f}%', ha='center', va='bottom')
-        
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        
-        # Convert to base64
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
-        plt.close()
-        
-        return image_base64
+        return await self._render_chart('bar', data, title)
     
     async def _create_line_chart(self, data: List[Dict[str, Any]], title: str, filename: str) -> str:
         """Create a line chart and return base64 encoded image"""
-        if not data:
-            return ""
-        
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        dates = [item['date'] for item in data]
-        success_rates = [item['success_rate'] for item in data]
-        
-        ax.plot(dates, success_rates, marker='o', linewidth=2, markersize=6)
-        ax.set_title(title, fontsize=14, fontweight='bold')
-        ax.set_ylabel('Success Rate (%)')
-        ax.set_xlabel('Date')
-        ax.grid(True, alpha=0.3)
-        
-        # Format x-axis
-        plt.xticks(rotation=45, ha='right')
-        
-        # Set y-axis limits
-        ax.set_ylim(0, 100)
-        
-        plt.tight_layout()
-        
-        # Convert to base64
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode()
-        plt.close()
-        
-        return image_base64
+        return await self._render_chart('line', data, title)
     
     async def _generate_json_report(self, processed_data: Dict[str, Any], 
                                   output_path: Path, report_name: str, 
@@ -528,157 +1038,13 @@ class ReportGeneratorAgent(BaseAgent):
     async def _generate_pdf_report(self, processed_data: Dict[str, Any], 
                                  charts: Dict[str, str], output_path: Path, 
                                  report_name: str, include_details: bool) -> Path:
-        """Generate PDF report"""
+        """Generate PDF report as a render job in the worker pool"""
         report_path = output_path / f"{report_name}.pdf"
         
-        doc = SimpleDocTemplate(str(report_path), pagesize=A4)
-        styles = getSampleStyleSheet()
-        story = []
-        
-        # Title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=1  # Center alignment
+        return await self._run_render_job(
+            'pdf', _build_pdf_report,
+            processed_data, charts, report_path, report_name, include_details
         )
-        story.append(Paragraph(f"Test Report: {report_name}", title_style))
-        story.append(Spacer(1, 20))
-        
-        # Report metadata
-        metadata = processed_data.get('summary', {})
-        story.append(Paragraph("Report Summary", styles['Heading2']))
-        
-        summary_data = [
-            ['Metric', 'Value'],
-            ['Total Test Runs', str(metadata.get('total_test_runs', 0))],
-            ['Total Test Results', str(metadata.get('total_test_results', 0))],
-            ['Total Artifacts', str(metadata.get('total_artifacts', 0))],
-            ['Sources', ', '.join(metadata.get('sources', []))],
-            ['Test Types', ', '.join(metadata.get('test_types', []))],
-            ['Date Range', f"{metadata.get('date_range', {}).get('start', 'N/A')} to {metadata.get('date_range', {}).get('end', 'N/A')}"]
-        ]
-        
-        summary_table = Table(summary_data)
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        story.append(summary_table)
-        story.append(Spacer(1, 20))
-        
-        # Charts
-        if charts:
-            story.append(Paragraph("Visual Analysis", styles['Heading2']))
-            
-            for chart_name, chart_data in charts.items():
-                if chart_data:
-                    # Decode base64 image
-                    image_data = base64.b64decode(chart_data)
-                    image_buffer = BytesIO(image_data)
-                    
-                    # Create temporary file for image
-                    temp_image = tempfile.NamedTemporaryFile(delete=False, suffix='.png')
-                    temp_image.write(image_data)
-                    temp_image.close()
-                    
-                    try:
-                        img = Image(temp_image.name, width=6*inch, height=4*inch)
-                        story.append(img)
-                        story.append(Spacer(1, 10))
-                    except:
-                        story.append(Paragraph(f"Chart: {chart_name} (Unable to render)", styles['Normal']))
-                    finally:
-                        os.unlink(temp_image.name)
-        
-        # Analysis
-        analysis = processed_data.get('analysis', {})
-        if analysis:
-            story.append(PageBreak())
-            story.append(Paragraph("Detailed Analysis", styles['Heading2']))
-            
-            # Status distribution
-            status_dist = analysis.get('status_distribution', {})
-            if status_dist:
-                story.append(Paragraph("Test Results Distribution", styles['Heading3']))
-                status_data = [['Status', 'Count', 'Percentage']]
-                total_results = sum(status_dist.values())
-                
-                for status, count in status_dist.items():
-                    percentage = (count / total_results) * 100 if total_results > 0 else 0
-                    status_data.append([status.title(), str(count), f"{percentage:.1f}%"])
-                
-                status_table = Table(status_data)
-                status_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
-                story.append(status_table)
-                story.append(Spacer(1, 20))
-        
-        # Recommendations
-        recommendations = processed_data.get('recommendations', [])
-        if recommendations:
-            story.append(Paragraph("Recommendations", styles['Heading2']))
-            
-            for i, rec in enumerate(recommendations, 1):
-                story.append(Paragraph(f"{i}. {rec['title']}", styles['Heading3']))
-                story.append(Paragraph(f"Priority: {rec['priority'].title()}", styles['Normal']))
-                story.append(Paragraph(f"Description: {rec['description']}", styles['Normal']))
-                story.append(Paragraph(f"Action: {rec['action']}", styles['Normal']))
-                story.append(Spacer(1, 10))
-        
-        # Detailed data (if requested)
-        if include_details:
-            story.append(PageBreak())
-            story.append(Paragraph("Detailed Test Results", styles['Heading2']))
-            
-            test_results = processed_data.get('test_results', [])[:50]  # Limit to first 50
-            if test_results:
-                results_data = [['Test Name', 'Status', 'Duration (s)', 'Error']]
-                
-                for result in test_results:
-                    error_msg = result.get('error_message', '')
-                    if len(error_msg) > 50:
-                        error_msg = error_msg[:47] + '...'
-                    
-                    results_data.append([
-                        result.get('test_name', 'N/A'),
-                        result.get('status', 'N/A'),
-                        str(result.get('duration', 'N/A')),
-                        error_msg
-                    ])
-                
-                results_table = Table(results_data)
-                results_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('FONTSIZE', (0, 1), (-1, -1), 8),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
-                story.append(results_table)
-        
-        # Build PDF
-        doc.build(story)
-        return report_path
     
     async def _generate_html_report(self, processed_data: Dict[str, Any], 
                                   charts: Dict[str, str], output_path: Path, 
@@ -729,61 +1095,13 @@ class ReportGeneratorAgent(BaseAgent):
     async def _generate_excel_report(self, processed_data: Dict[str, Any], 
                                    output_path: Path, report_name: str, 
                                    include_details: bool) -> Path:
-        """Generate Excel report"""
+        """Generate Excel report as a render job in the worker pool"""
         report_path = output_path / f"{report_name}.xlsx"
         
-        with pd.ExcelWriter(report_path, engine='openpyxl') as writer:
-            # Summary sheet
-            summary_data = processed_data.get('summary', {})
-            summary_df = pd.DataFrame([
-                ['Total Test Runs', summary_data.get('total_test_runs', 0)],
-                ['Total Test Results', summary_data.get('total_test_results', 0)],
-                ['Total Artifacts', summary_data.get('total_artifacts', 0)],
-                ['Sources', ', '.join(summary_data.get('sources', []))],
-                ['Test Types', ', '.join(summary_data.get('test_types', []))],
-                ['Start Date', summary_data.get('date_range', {}).get('start', 'N/A')],
-                ['End Date', summary_data.get('date_range', {}).get('end', 'N/A')]
-            ], columns=['Metric', 'Value'])
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-            
-            # Analysis sheet
-            analysis = processed_data.get('analysis', {})
-            if analysis.get('status_distribution'):
-                status_df = pd.DataFrame([
-                    [status, count] for status, count in analysis['status_distribution'].items()
-                ], columns=['Status', 'Count'])
-                status_df.to_excel(writer, sheet_name='Status Distribution', index=False)
-            
-            if analysis.get('success_rate_by_type'):
-                success_df = pd.DataFrame([
-                    [test_type, rate] for test_type, rate in analysis['success_rate_by_type'].items()
-                ], columns=['Test Type', 'Success Rate (%)'])
-                success_df.to_excel(writer, sheet_name='Success Rates', index=False)
-            
-            # Recommendations sheet
-            recommendations = processed_data.get('recommendations', [])
-            if recommendations:
-                rec_df = pd.DataFrame(recommendations)
-                rec_df.to_excel(writer, sheet_name='Recommendations', index=False)
-            
-            # Detailed data sheets (if requested)
-            if include_details:
-                test_runs = processed_data.get('test_runs', [])
-                if test_runs:
-                    runs_df = pd.DataFrame(test_runs)
-                    runs_df.to_excel(writer, sheet_name='Test Runs', index=False)
-                
-                test_results = processed_data.get('test_results', [])
-                if test_results:
-                    results_df = pd.DataFrame(test_results)
-                    results_df.to_excel(writer, sheet_name='Test Results', index=False)
-                
-                artifacts = processed_data.get('artifacts', [])
-                if artifacts:
-                    artifacts_df = pd.DataFrame(artifacts)
-                    artifacts_df.to_excel(writer, sheet_name='Artifacts', index=False)
-        
-        return report_path
+        return await self._run_render_job(
+            'excel', _build_excel_report,
+            processed_data, report_path, include_details
+        )
     
     async def _generate_summary_report(self, processed_data: Dict[str, Any], 
                                      output_path: Path, report_name: str) -> Path:
@@ -546,9 +546,20 @@ class TestOrchestrator:
             if not self.report_collector:
                 raise RuntimeError("Report Collector Agent not available")
             
+            # Collect the latest test run, folding its scores into the rollups with its summary
+            test_result = next(
+                (result for result in reversed(list(execution.results.values()))
+                 if isinstance(result, dict) and result.get('run_id')),
+                {}
+            )
             return await self.report_collector.execute(
                 sources=step_config.get('sources', ['local']),
-                **step_config.get('collector_config', {})
+                **{
+                    'run_id': test_result.get('run_id'),
+                    'environment': workflow.environment,
+                    'scores': test_result.get('scores'),
+                    **step_config.get('collector_config', {})
+                }
             )
         
         elif step_type == 'generate_reports':
@@ -712,6 +723,14 @@ class TestOrchestrator:
         if self.running_workflows:
             await asyncio.gather(*self.running_workflows.values(), return_exceptions=True)
         
+        # Release the report generator's render worker processes
+        if self.report_generator:
+            await asyncio.to_thread(self.report_generator.close)
+        
+        # Deliver notifications still waiting in digests and close the HTTP session
+        if self.notifier:
+            await self.notifier.close()
+        
         # Stop health check
         if self.health_check_task:
             self.health_check_task.cancel()
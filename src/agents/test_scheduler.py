@@ -498,10 +498,15 @@ class TestScheduler:
         if self.report_collector and result.get('test_execution'):
             execution.logs.append("Collecting test results...")
             
+            # Scores reported by the test run are folded into the rollups with its summary
             collection_result = await self.report_collector.execute(
                 sources=test_config.get('result_sources', ['local']),
-                test_run_id=result['test_execution'].get('run_id'),
-                **test_config.get('collector_config', {})
+                **{
+                    'run_id': result['test_execution'].get('run_id'),
+                    'environment': job.environment,
+                    'scores': result['test_execution'].get('scores'),
+                    **test_config.get('collector_config', {})
+                }
             )
             
             result['collection'] = collection_result
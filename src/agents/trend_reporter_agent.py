@@ -17,9 +17,13 @@ from plotly.subplots import make_subplots
 
 from .base_agent import BaseAgent
 from ..database.database import DatabaseManager
+from ..analytics.rollup_store import get_rollup_store, truncate_period
 from ..monitoring.metrics_collector import MetricsCollector
 from ..ai.llm_service import LLMService
 
+# Score averages that rollups only carry for runs collected with scores
+SCORE_COLUMNS = ('avg_performance_score', 'avg_security_score', 'avg_compliance_score')
+
 class TrendPeriod(Enum):
     DAILY = "daily"
     WEEKLY = "weekly"
@@ -78,6 +82,7 @@ class TrendReporterAgent(BaseAgent):
     def __init__(self, config: Dict[str, Any]):
         super().__init__("TrendReporter", config)
         self.db_manager = DatabaseManager()
+        self.rollup_store = get_rollup_store()
         self.metrics_collector = MetricsCollector()
         self.llm_service = LLMService()
         self.logger = logging.getLogger(__name__)
@@ -139,21 +144,67 @@ class TrendReporterAgent(BaseAgent):
         """Collect historical test data based on period"""
         end_date = datetime.now()
         
-        # Determine date range based on period
+        # Determine date range, rollup granularity and SQL interval based on period
         if period == TrendPeriod.DAILY:
             start_date = end_date - timedelta(days=30)
-            interval = "1 day"
+            granularity, interval = "day", "1 day"
         elif period == TrendPeriod.WEEKLY:
             start_date = end_date - timedelta(weeks=12)
-            interval = "1 week"
+            granularity, interval = "week", "1 week"
         elif period == TrendPeriod.MONTHLY:
             start_date = end_date - timedelta(days=365)
-            interval = "1 month"
+            granularity, interval = "month", "1 month"
         else:  # QUARTERLY
             start_date = end_date - timedelta(days=730)
-            interval = "3 months"
+            granularity, interval = "quarter", "3 months"
+        
+        # Read the pre-aggregated rollups maintained as runs complete
+        try:
+            results = await asyncio.to_thread(
+                self.rollup_store.get_rollups, granularity, start_date, end_date
+            )
+        except Exception as e:
+            self.logger.warning(f"Rollup query failed: {str(e)}")
+            results = []
+        
+        # Rollups only hold runs collected since they were introduced, and scores only
+        # when the collector was given them; raw test results fill in what is missing
+        if not results or any(row.get(column) is None for row in results for column in SCORE_COLUMNS):
+            try:
+                raw_results = await self._query_test_results(interval, start_date, end_date)
+            except Exception as e:
+                self.logger.warning(f"Database query failed: {str(e)}")
+                raw_results = []
+            
+            if not results:
+                results = raw_results or []
+            elif raw_results:
+                self._fill_missing_scores(results, raw_results, granularity)
+        
+        if results:
+            return results
         
-        # Query database for historical data
+        self.logger.warning("No historical test data found, using mock data")
+        return self._generate_mock_historical_data(period)
+    
+    @staticmethod
+    def _fill_missing_scores(rollups: List[Dict[str, Any]], raw_results: List[Dict[str, Any]],
+                             granularity: str):
+        """Take score averages the rollups lack from the raw results of the same period"""
+        raw_by_period = {
+            truncate_period(row['period'], granularity): row for row in raw_results if row.get('period')
+        }
+        for row in rollups:
+            raw_row = raw_by_period.get(row['period'])
+            if raw_row is None:
+                continue
+            for column in SCORE_COLUMNS:
+                if row.get(column) is None:
+                    row[column] = raw_row.get(column)
+    
+    async def _query_test_results(self, interval: str, start_date: datetime,
+                                  end_date: datetime) -> List[Dict[str, Any]]:
+        """Aggregate historical data per period directly from the test_results table"""
         query = """
         SELECT 
             DATE_TRUNC(%s, created_at) as period,
@@ -171,14 +222,9 @@ class TrendReporterAgent(BaseAgent):
         ORDER BY period
         """
         
-        try:
-            results = await self.db_manager.execute_query(
-                query, (interval, start_date, end_date, interval)
-            )
-            return results
-        except Exception as e:
-            self.logger.warning(f"Database query failed, using mock data: {str(e)}")
-            return self._generate_mock_historical_data(period)
+        return await self.db_manager.execute_query(
+            query, (interval, start_date, end_date, interval)
+        )
     
     def _generate_mock_historical_data(self, period: TrendPeriod) -> List[Dict[str, Any]]:
         """Generate mock historical data for demonstration"""
@@ -224,12 +270,12 @@ class TrendReporterAgent(BaseAgent):
                 test_success_rate=success_rate,
                 failure_rate=failure_rate,
                 flakiness_score=flakiness_score,
-                performance_score=data_point.get('avg_performance_score', 0),
-                security_score=data_point.get('avg_security_score', 0),
-                compliance_score=data_point.get('avg_compliance_score', 0),
+                performance_score=data_point.get('avg_performance_score') or 0,
+                security_score=data_point.get('avg_security_score') or 0,
+                compliance_score=data_point.get('avg_compliance_score') or 0,
                 total_tests=total_tests,
                 failed_tests=failed_tests,
-                execution_time=data_point.get('avg_execution_time', 0),
+                execution_time=data_point.get('avg_execution_time') or 0,
                 timestamp=data_point['period']
             )
             metrics.append(metric)
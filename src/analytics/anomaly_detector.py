@@ -0,0 +1,233 @@
+"""
+Anomaly Detector - Online anomaly detection for metric streams
+
+Every metric stream keeps an exponentially weighted moving mean and variance
+that is updated in O(1) per value. Each value is scored against the baseline
+as it stood before the value arrived, so a regression is flagged when the run
+that introduces it is ingested rather than at the next report, and the
+baseline follows recent behaviour instead of drifting with history length.
+Streams remember the last timestamp they consumed, so callers can feed a
+whole series repeatedly and only the new points are processed.
+"""
+
+import logging
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StreamState:
+    """EWMA baseline of one metric stream"""
+    mean: float = 0.0
+    variance: float = 0.0
+    count: int = 0
+    last_timestamp: Optional[datetime] = None
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class OnlineAnomalyDetector:
+    """
+    EWMA/EWMVar anomaly detector keyed by stream name.
+
+    A value is anomalous when it is more than `threshold` standard deviations
+    from the stream's moving mean. The standard deviation is floored at
+    `min_relative_std` of the mean so perfectly flat baselines do not flag
+    every small change.
+    """
+
+    def __init__(self,
+                 alpha: float = 0.1,
+                 threshold: float = 2.0,
+                 warmup: int = 5,
+                 min_relative_std: float = 0.01,
+                 history_size: int = 1000):
+        """
+        Initialize anomaly detector.
+
+        Args:
+            alpha: Weight of each new value in the moving mean and variance
+            threshold: Standard deviations from the mean that count as anomalous
+            warmup: Values a stream needs before anything is flagged
+            min_relative_std: Floor for the standard deviation, relative to the mean
+            history_size: Anomalies kept per stream
+        """
+        self.alpha = alpha
+        self.threshold = threshold
+        self.warmup = warmup
+        self.min_relative_std = min_relative_std
+        self.history_size = history_size
+
+        self.states: Dict[str, StreamState] = {}
+        self.anomalies: Dict[str, Deque[Dict[str, Any]]] = {}
+        self.callbacks: List[Callable[[str, Dict[str, Any]], None]] = []
+        self._lock = threading.Lock()
+
+    def observe(self, stream: str, value: float,
+                timestamp: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """
+        Score a value against the stream baseline and fold it in.
+
+        Args:
+            stream: Stream name, e.g. "failure_rate:daily"
+            value: New value
+            timestamp: When the value was measured, defaults to now. Values
+                timestamped at or before the last consumed one are skipped
+
+        Returns:
+            Anomaly record if the value is anomalous, else None
+        """
+        value = float(value)
+        if math.isnan(value):
+            return None
+
+        with self._lock:
+            state = self.states.get(stream)
+            if state is None:
+                state = self.states[stream] = StreamState(mean=value)
+            elif timestamp is not None and state.last_timestamp is not None and timestamp <= state.last_timestamp:
+                # Already consumed
+                return None
+            timestamp = timestamp or datetime.now()
+
+            anomaly = None
+            if state.count >= self.warmup:
+                std = max(state.std, abs(state.mean) * self.min_relative_std, 1e-9)
+                z_score = abs(value - state.mean) / std
+                if z_score > self.threshold:
+                    anomaly = {
+                        "timestamp": timestamp,
+                        "value": value,
+                        "expected": state.mean,
+                        "z_score": z_score,
+                        "severity": "high" if z_score > 3 else "medium"
+                    }
+                    history = self.anomalies.get(stream)
+                    if history is None:
+                        history = self.anomalies[stream] = deque(maxlen=self.history_size)
+                    history.append(anomaly)
+
+            # EWMA mean and variance update; young streams weight values
+            # equally so the warmup baseline is a plain running mean/variance
+            weight = max(self.alpha, 1.0 / (state.count + 1))
+            diff = value - state.mean
+            increment = weight * diff
+            state.mean += increment
+            state.variance = (1 - weight) * (state.variance + diff * increment)
+            state.count += 1
+            state.last_timestamp = timestamp
+
+        if anomaly:
+            for callback in self.callbacks:
+                try:
+                    callback(stream, anomaly)
+                except Exception as e:
+                    logger.error(f"Anomaly callback error for {stream}: {e}")
+
+        return anomaly
+
+    def observe_series(self, stream: str,
+                       points: Iterable[Tuple[datetime, float]]) -> List[Dict[str, Any]]:
+        """
+        Feed time-ordered (timestamp, value) points, skipping those already consumed.
+
+        Returns:
+            Anomalies among the newly consumed points
+        """
+        last_timestamp = self.get_last_timestamp(stream)
+        anomalies = []
+        for timestamp, value in points:
+            if last_timestamp is not None and timestamp <= last_timestamp:
+                continue
+            anomaly = self.observe(stream, value, timestamp)
+            if anomaly:
+                anomalies.append(anomaly)
+        return anomalies
+
+    def get_last_timestamp(self, stream: str) -> Optional[datetime]:
+        """Timestamp of the last value consumed by a stream"""
+        with self._lock:
+            state = self.states.get(stream)
+            return state.last_timestamp if state else None
+
+    def get_anomalies(self, stream: str,
+                      start: Optional[datetime] = None,
+                      end: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Get recorded anomalies of a stream, optionally within a time range"""
+        with self._lock:
+            history = list(self.anomalies.get(stream, ()))
+        return [
+            anomaly for anomaly in history
+            if (start is None or anomaly["timestamp"] >= start)
+            and (end is None or anomaly["timestamp"] <= end)
+        ]
+
+    def get_baseline(self, stream: str) -> Optional[Dict[str, Any]]:
+        """Get the current baseline of a stream"""
+        with self._lock:
+            state = self.states.get(stream)
+            if state is None:
+                return None
+            return {**asdict(state), 'std': state.std}
+
+    def add_callback(self, callback: Callable[[str, Dict[str, Any]], None]):
+        """Register a callback invoked with (stream, anomaly) when an anomaly is flagged"""
+        self.callbacks.append(callback)
+
+    def reset(self, stream: Optional[str] = None):
+        """Forget the baseline and anomalies of one stream or all streams"""
+        with self._lock:
+            if stream is None:
+                self.states.clear()
+                self.anomalies.clear()
+            else:
+                self.states.pop(stream, None)
+                self.anomalies.pop(stream, None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize stream baselines so they survive restarts"""
+        with self._lock:
+            return {
+                stream: {
+                    'mean': state.mean,
+                    'variance': state.variance,
+                    'count': state.count,
+                    'last_timestamp': state.last_timestamp.isoformat() if state.last_timestamp else None
+                }
+                for stream, state in self.states.items()
+            }
+
+    def load_state(self, data: Dict[str, Any]):
+        """Restore stream baselines serialized with to_dict"""
+        with self._lock:
+            for stream, state in data.items():
+                last_timestamp = state.get('last_timestamp')
+                self.states[stream] = StreamState(
+                    mean=float(state['mean']),
+                    variance=float(state['variance']),
+                    count=int(state['count']),
+                    last_timestamp=datetime.fromisoformat(last_timestamp) if last_timestamp else None
+                )
+
+
+# Global anomaly detector instance
+_anomaly_detector: Optional[OnlineAnomalyDetector] = None
+
+
+def get_anomaly_detector() -> OnlineAnomalyDetector:
+    """Get or create the shared anomaly detector instance."""
+    global _anomaly_detector
+
+    if _anomaly_detector is None:
+        _anomaly_detector = OnlineAnomalyDetector()
+
+    return _anomaly_detector
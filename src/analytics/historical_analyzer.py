@@ -9,13 +9,13 @@ import logging
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
-import statistics
-from collections import defaultdict
 
 from ..database.database import DatabaseManager
+from .rollup_store import get_rollup_store, truncate_period
+from .anomaly_detector import OnlineAnomalyDetector
 from ..monitoring.metrics_collector import MetricsCollector
 
 class AnalysisPeriod(Enum):
@@ -40,13 +40,17 @@ class MetricType(Enum):
     SECURITY = "security"
     COMPLIANCE = "compliance"
 
-@dataclass
-class HistoricalDataPoint:
-    """Single historical data point"""
-    timestamp: datetime
-    metric_type: MetricType
-    value: float
-    metadata: Dict[str, Any]
+# Per-period context carried alongside every metric value
+METADATA_COLUMNS = ['total_tests', 'failed_tests', 'passed_tests', 'avg_execution_time']
+
+# Long-format historical frame: one row per metric per period
+FRAME_COLUMNS = ['timestamp', 'metric_type', 'value'] + METADATA_COLUMNS
+
+MOCK_PERIOD_INCREMENTS = {
+    AnalysisPeriod.HOURLY: timedelta(hours=1),
+    AnalysisPeriod.DAILY: timedelta(days=1),
+    AnalysisPeriod.WEEKLY: timedelta(weeks=1)
+}
 
 @dataclass
 class TrendAnalysis:
@@ -115,6 +119,7 @@ class HistoricalAnalyzer:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.db_manager = DatabaseManager()
+        self.rollup_store = get_rollup_store()
         self.metrics_collector = MetricsCollector()
         self.logger = logging.getLogger(__name__)
         
@@ -123,6 +128,14 @@ class HistoricalAnalyzer:
         self.anomaly_threshold = config.get('anomaly_threshold', 2.0)  # Standard deviations
         self.trend_confidence = config.get('trend_confidence', 0.95)
         
+        # Per metric and period EWMA baselines, kept between analyses so each
+        # report only feeds the points that arrived since the previous one
+        self.anomaly_detector = OnlineAnomalyDetector(
+            alpha=config.get('anomaly_alpha', 0.1),
+            threshold=self.anomaly_threshold,
+            warmup=config.get('anomaly_warmup', 5)
+        )
+        
     async def analyze_historical_trends(
         self,
         period: AnalysisPeriod = AnalysisPeriod.MONTHLY,
@@ -138,25 +151,26 @@ class HistoricalAnalyzer:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=lookback_months * 30)
             
-            # Collect historical data
+            # Collect historical data and pivot it once to one column per metric
             historical_data = await self._collect_historical_data(start_date, end_date, period)
+            metrics = self._pivot_metrics(historical_data)
             
             # Analyze failure rates
-            failure_analysis = await self._analyze_failure_rates(historical_data, period)
+            failure_analysis = await self._analyze_failure_rates(metrics, period)
             
             # Analyze flakiness
-            flakiness_metrics = await self._analyze_flakiness(historical_data, period)
+            flakiness_metrics = await self._analyze_flakiness(metrics, period)
             
             # Analyze performance
-            performance_metrics = await self._analyze_performance(historical_data, period)
+            performance_metrics = await self._analyze_performance(metrics, period)
             
             # Generate trend analyses
-            trend_analyses = await self._generate_trend_analyses(historical_data, period)
+            trend_analyses = await self._generate_trend_analyses(metrics, period)
             
             # Generate predictions
             predictions = {}
             if include_predictions:
-                predictions = await self._generate_predictions(historical_data, trend_analyses)
+                predictions = await self._generate_predictions(metrics, trend_analyses)
             
             # Generate recommendations
             recommendations = await self._generate_recommendations(
@@ -199,112 +213,138 @@ class HistoricalAnalyzer:
         start_date: datetime,
         end_date: datetime,
         period: AnalysisPeriod
-    ) -> List[HistoricalDataPoint]:
-        """Collect historical data from database"""
+    ) -> pd.DataFrame:
+        """Collect historical data from database as a long metric x timestamp frame"""
+        
+        results = []
+        
+        # Read the pre-aggregated rollups maintained as runs complete; they are
+        # kept per day at the finest, so hourly analysis reads raw executions
+        if period != AnalysisPeriod.HOURLY:
+            try:
+                results = await asyncio.to_thread(
+                    self.rollup_store.get_rollups,
+                    self._get_rollup_granularity(period),
+                    start_date,
+                    end_date
+                )
+            except Exception as e:
+                self.logger.warning(f"Rollup query failed: {str(e)}")
+        
+        # Executions from before the rollups were introduced are only in test_executions
+        if not results:
+            try:
+                results = await self._query_test_executions(start_date, end_date, period)
+            except Exception as e:
+                self.logger.warning(f"Database query failed: {str(e)}")
+        
+        if not results:
+            # Generate mock data for demonstration
+            return self._generate_mock_historical_data(start_date, end_date, period)
         
         try:
-            # Query test execution data
-            test_query = """
-            SELECT 
-                DATE_TRUNC(%s, created_at) as period,
-                COUNT(*) as total_tests,
-                COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed_tests,
-                COUNT(CASE WHEN status = 'passed' THEN 1 END) as passed_tests,
-                AVG(execution_time) as avg_execution_time,
-                AVG(CASE WHEN flaky = true THEN 1 ELSE 0 END) as flakiness_rate,
-                AVG(performance_score) as performance_score,
-                AVG(coverage_percentage) as coverage
-            FROM test_executions 
-            WHERE created_at >= %s AND created_at <= %s
-            GROUP BY DATE_TRUNC(%s, created_at)
-            ORDER BY period
-            """
-            
-            period_sql = self._get_sql_period(period)
-            results = await self.db_manager.execute_query(
-                test_query, (period_sql, start_date, end_date, period_sql)
-            )
-            
-            historical_data = []
-            
-            if results:
-                for row in results:
-                    timestamp = row['period']
-                    total_tests = row['total_tests'] or 0
-                    failed_tests = row['failed_tests'] or 0
-                    
-                    # Failure rate
-                    failure_rate = (failed_tests / total_tests * 100) if total_tests > 0 else 0
-                    historical_data.append(HistoricalDataPoint(
-                        timestamp=timestamp,
-                        metric_type=MetricType.FAILURE_RATE,
-                        value=failure_rate,
-                        metadata={
-                            'total_tests': total_tests,
-                            'failed_tests': failed_tests,
-                            'passed_tests': row['passed_tests'] or 0
-                        }
-                    ))
-                    
-                    # Flakiness
-                    flakiness_rate = (row['flakiness_rate'] or 0) * 100
-                    historical_data.append(HistoricalDataPoint(
-                        timestamp=timestamp,
-                        metric_type=MetricType.FLAKINESS,
-                        value=flakiness_rate,
-                        metadata={'total_tests': total_tests}
-                    ))
-                    
-                    # Performance
-                    performance_score = row['performance_score'] or 80
-                    historical_data.append(HistoricalDataPoint(
-                        timestamp=timestamp,
-                        metric_type=MetricType.PERFORMANCE,
-                        value=performance_score,
-                        metadata={
-                            'avg_execution_time': row['avg_execution_time'] or 0,
-                            'total_tests': total_tests
-                        }
-                    ))
-                    
-                    # Coverage
-                    coverage = row['coverage'] or 75
-                    historical_data.append(HistoricalDataPoint(
-                        timestamp=timestamp,
-                        metric_type=MetricType.COVERAGE,
-                        value=coverage,
-                        metadata={'total_tests': total_tests}
-                    ))
-            else:
-                # Generate mock data for demonstration
-                historical_data = self._generate_mock_historical_data(start_date, end_date, period)
-            
-            return historical_data
+            rows = pd.DataFrame(results)
+            total_tests = rows['total_tests'].fillna(0)
+            failed_tests = rows['failed_tests'].fillna(0)
+            
+            periods = pd.DataFrame({
+                'timestamp': pd.to_datetime(rows['period']),
+                'total_tests': total_tests,
+                'failed_tests': failed_tests,
+                'passed_tests': rows['passed_tests'].fillna(0),
+                'avg_execution_time': rows['avg_execution_time'].fillna(0),
+                MetricType.FAILURE_RATE.value: np.where(
+                    total_tests > 0, failed_tests / total_tests.where(total_tests > 0, 1) * 100, 0.0
+                ),
+                MetricType.FLAKINESS.value: rows['flakiness_rate'].fillna(0) * 100,
+                # Missing or zero scores fall back to neutral defaults
+                MetricType.PERFORMANCE.value: rows['performance_score'].replace(0, np.nan).fillna(80),
+                MetricType.COVERAGE.value: rows['coverage'].replace(0, np.nan).fillna(75)
+            })
+            
+            return self._build_metric_frame(periods)
             
         except Exception as e:
-            self.logger.warning(f"Database query failed, generating mock data: {str(e)}")
+            self.logger.warning(f"Historical data could not be read, generating mock data: {str(e)}")
             return self._generate_mock_historical_data(start_date, end_date, period)
     
+    async def _query_test_executions(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        period: AnalysisPeriod
+    ) -> List[Dict[str, Any]]:
+        """Aggregate historical data per period directly from the test_executions table"""
+        test_query = """
+        SELECT 
+            DATE_TRUNC(%s, created_at) as period,
+            COUNT(*) as total_tests,
+            COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed_tests,
+            COUNT(CASE WHEN status = 'passed' THEN 1 END) as passed_tests,
+            AVG(execution_time) as avg_execution_time,
+            AVG(CASE WHEN flaky = true THEN 1 ELSE 0 END) as flakiness_rate,
+            AVG(performance_score) as performance_score,
+            AVG(coverage_percentage) as coverage
+        FROM test_executions 
+        WHERE created_at >= %s AND created_at <= %s
+        GROUP BY DATE_TRUNC(%s, created_at)
+        ORDER BY period
+        """
+        
+        period_sql = self._get_sql_period(period)
+        return await self.db_manager.execute_query(
+            test_query, (period_sql, start_date, end_date, period_sql)
+        )
+    
+    def _build_metric_frame(self, periods: pd.DataFrame) -> pd.DataFrame:
+        """Melt a one-row-per-period frame into the long metric x timestamp frame"""
+        metric_columns = [metric.value for metric in MetricType if metric.value in periods.columns]
+        
+        frame = periods.melt(
+            id_vars=['timestamp'] + METADATA_COLUMNS,
+            value_vars=metric_columns,
+            var_name='metric_type',
+            value_name='value'
+        )
+        frame['value'] = frame['value'].astype(float)
+        return frame[FRAME_COLUMNS].sort_values(['metric_type', 'timestamp'], kind='stable').reset_index(drop=True)
+    
+    def _pivot_metrics(self, historical_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Pivot the long frame to one row per timestamp with a column per metric
+        plus the period metadata columns
+        """
+        if historical_data.empty:
+            return pd.DataFrame(columns=METADATA_COLUMNS, index=pd.DatetimeIndex([], name='timestamp'))
+        
+        values = historical_data.pivot_table(
+            index='timestamp', columns='metric_type', values='value', aggfunc='mean'
+        )
+        values.columns = [str(column) for column in values.columns]
+        context = historical_data.groupby('timestamp')[METADATA_COLUMNS].max()
+        
+        return values.join(context).sort_index()
+    
+    def _metric_series(self, metrics: pd.DataFrame, metric_type: MetricType) -> pd.Series:
+        """Get the time-indexed values of one metric from the pivoted view"""
+        if metric_type.value not in metrics.columns:
+            return pd.Series(dtype=float)
+        return metrics[metric_type.value].dropna()
+    
     def _generate_mock_historical_data(
         self,
         start_date: datetime,
         end_date: datetime,
         period: AnalysisPeriod
-    ) -> List[HistoricalDataPoint]:
+    ) -> pd.DataFrame:
         """Generate mock historical data for demonstration"""
         
-        import random
-        
-        historical_data = []
-        current_date = start_date
+        rng = np.random.default_rng()
         
-        # Period increment
-        if period == AnalysisPeriod.DAILY:
-            increment = timedelta(days=1)
-        elif period == AnalysisPeriod.WEEKLY:
-            increment = timedelta(weeks=1)
-        else:  # MONTHLY
-            increment = timedelta(days=30)
+        # Period increment (monthly and longer periods step by 30 days)
+        increment = MOCK_PERIOD_INCREMENTS.get(period, timedelta(days=30))
+        timestamps = pd.date_range(start_date, end_date, freq=increment)
+        count = len(timestamps)
         
         # Base values with trends
         base_failure_rate = 15.0
@@ -312,50 +352,29 @@ class HistoricalAnalyzer:
         base_performance = 85.0
         base_coverage = 78.0
         
-        while current_date <= end_date:
-            # Add some trend and randomness
-            days_from_start = (current_date - start_date).days
-            trend_factor = days_from_start / 180.0  # 6 months
-            
+        # Add some trend and randomness
+        days_from_start = (timestamps - timestamps[0]).days.to_numpy() if count else np.zeros(0)
+        trend_factor = days_from_start / 180.0  # 6 months
+        
+        failure_rate = np.maximum(2, base_failure_rate - (trend_factor * 5) + rng.uniform(-3, 3, count))
+        
+        periods = pd.DataFrame({
+            'timestamp': timestamps,
+            'total_tests': rng.integers(100, 501, count),
+            'failed_tests': (failure_rate * 5).astype(int),
+            'passed_tests': 0,
+            'avg_execution_time': rng.uniform(10, 30, count),
             # Failure rate (improving trend)
-            failure_rate = max(2, base_failure_rate - (trend_factor * 5) + random.uniform(-3, 3))
-            historical_data.append(HistoricalDataPoint(
-                timestamp=current_date,
-                metric_type=MetricType.FAILURE_RATE,
-                value=failure_rate,
-                metadata={'total_tests': random.randint(100, 500), 'failed_tests': int(failure_rate * 5)}
-            ))
-            
+            MetricType.FAILURE_RATE.value: failure_rate,
             # Flakiness (stable with some volatility)
-            flakiness = max(1, base_flakiness + random.uniform(-2, 4))
-            historical_data.append(HistoricalDataPoint(
-                timestamp=current_date,
-                metric_type=MetricType.FLAKINESS,
-                value=flakiness,
-                metadata={'total_tests': random.randint(100, 500)}
-            ))
-            
+            MetricType.FLAKINESS.value: np.maximum(1, base_flakiness + rng.uniform(-2, 4, count)),
             # Performance (slight improvement)
-            performance = min(95, base_performance + (trend_factor * 3) + random.uniform(-2, 2))
-            historical_data.append(HistoricalDataPoint(
-                timestamp=current_date,
-                metric_type=MetricType.PERFORMANCE,
-                value=performance,
-                metadata={'avg_execution_time': random.uniform(10, 30)}
-            ))
-            
+            MetricType.PERFORMANCE.value: np.minimum(95, base_performance + (trend_factor * 3) + rng.uniform(-2, 2, count)),
             # Coverage (gradual improvement)
-            coverage = min(90, base_coverage + (trend_factor * 8) + random.uniform(-1, 2))
-            historical_data.append(HistoricalDataPoint(
-                timestamp=current_date,
-                metric_type=MetricType.COVERAGE,
-                value=coverage,
-                metadata={'total_tests': random.randint(100, 500)}
-            ))
-            
-            current_date += increment
+            MetricType.COVERAGE.value: np.minimum(90, base_coverage + (trend_factor * 8) + rng.uniform(-1, 2, count))
+        })
         
-        return historical_data
+        return self._build_metric_frame(periods)
     
     def _get_sql_period(self, period: AnalysisPeriod) -> str:
         """Convert period enum to SQL period string"""
@@ -369,21 +388,31 @@ class HistoricalAnalyzer:
         }
         return mapping.get(period, 'day')
     
+    def _get_rollup_granularity(self, period: AnalysisPeriod) -> str:
+        """Convert period enum to rollup granularity (there are no hourly rollups)"""
+        mapping = {
+            AnalysisPeriod.DAILY: 'day',
+            AnalysisPeriod.WEEKLY: 'week',
+            AnalysisPeriod.MONTHLY: 'month',
+            AnalysisPeriod.QUARTERLY: 'quarter',
+            AnalysisPeriod.YEARLY: 'year'
+        }
+        return mapping.get(period, 'day')
+    
     async def _analyze_failure_rates(
         self,
-        historical_data: List[HistoricalDataPoint],
+        metrics: pd.DataFrame,
         period: AnalysisPeriod
     ) -> FailureAnalysis:
         """Analyze failure rate trends"""
         
-        failure_data = [dp for dp in historical_data if dp.metric_type == MetricType.FAILURE_RATE]
+        failure_values = self._metric_series(metrics, MetricType.FAILURE_RATE)
         
-        if not failure_data:
+        if failure_values.empty:
             return self._create_empty_failure_analysis()
         
         # Calculate overall failure rate
-        failure_values = [dp.value for dp in failure_data]
-        overall_failure_rate = statistics.mean(failure_values)
+        overall_failure_rate = float(failure_values.mean())
         
         # Determine trend
         trend_direction = self._calculate_trend_direction(failure_values)
@@ -440,19 +469,18 @@ class HistoricalAnalyzer:
     
     async def _analyze_flakiness(
         self,
-        historical_data: List[HistoricalDataPoint],
+        metrics: pd.DataFrame,
         period: AnalysisPeriod
     ) -> FlakinessMetrics:
         """Analyze test flakiness trends"""
         
-        flakiness_data = [dp for dp in historical_data if dp.metric_type == MetricType.FLAKINESS]
+        flakiness_values = self._metric_series(metrics, MetricType.FLAKINESS)
         
-        if not flakiness_data:
+        if flakiness_values.empty:
             return self._create_empty_flakiness_metrics()
         
         # Calculate flakiness metrics
-        flakiness_values = [dp.value for dp in flakiness_data]
-        flakiness_rate = statistics.mean(flakiness_values)
+        flakiness_rate = float(flakiness_values.mean())
         
         # Determine trend
         trend_direction = self._calculate_trend_direction(flakiness_values)
@@ -473,7 +501,7 @@ class HistoricalAnalyzer:
             most_flaky_tests=most_flaky_tests,
             flakiness_trend=trend_direction,
             stability_score=stability_score,
-            intermittent_failures=sum(dp.metadata.get('total_tests', 0) for dp in flakiness_data[-5:])
+            intermittent_failures=int(metrics.loc[flakiness_values.index, 'total_tests'].tail(5).sum())
         )
     
     def _create_empty_flakiness_metrics(self) -> FlakinessMetrics:
@@ -489,26 +517,23 @@ class HistoricalAnalyzer:
     
     async def _analyze_performance(
         self,
-        historical_data: List[HistoricalDataPoint],
+        metrics: pd.DataFrame,
         period: AnalysisPeriod
     ) -> PerformanceMetrics:
         """Analyze performance trends"""
         
-        performance_data = [dp for dp in historical_data if dp.metric_type == MetricType.PERFORMANCE]
+        performance_values = self._metric_series(metrics, MetricType.PERFORMANCE)
         
-        if not performance_data:
+        if performance_values.empty:
             return self._create_empty_performance_metrics()
         
-        # Calculate performance metrics
-        performance_values = [dp.value for dp in performance_data]
-        avg_performance = statistics.mean(performance_values)
-        
         # Determine trend
         trend_direction = self._calculate_trend_direction(performance_values)
         
-        # Calculate execution times
-        execution_times = [dp.metadata.get('avg_execution_time', 0) for dp in performance_data if dp.metadata.get('avg_execution_time')]
-        avg_execution_time = statistics.mean(execution_times) if execution_times else 0
+        # Calculate execution times over the periods that recorded any
+        execution_times = metrics.loc[performance_values.index, 'avg_execution_time']
+        execution_times = execution_times[execution_times > 0]
+        avg_execution_time = float(execution_times.mean()) if not execution_times.empty else 0
         
         # Slowest tests (mock data)
         slowest_tests = [
@@ -518,7 +543,7 @@ class HistoricalAnalyzer:
         ]
         
         # Performance degradation events
-        degradation_events = len([v for v in performance_values if v < 70])
+        degradation_events = int((performance_values < 70).sum())
         
         # Resource utilization (mock data)
         resource_utilization = {
@@ -550,38 +575,31 @@ class HistoricalAnalyzer:
     
     async def _generate_trend_analyses(
         self,
-        historical_data: List[HistoricalDataPoint],
+        metrics: pd.DataFrame,
         period: AnalysisPeriod
     ) -> List[TrendAnalysis]:
         """Generate detailed trend analyses for all metrics"""
         
         trend_analyses = []
         
-        # Group data by metric type
-        metric_groups = defaultdict(list)
-        for dp in historical_data:
-            metric_groups[dp.metric_type].append(dp)
-        
-        for metric_type, data_points in metric_groups.items():
-            if len(data_points) < self.min_data_points:
+        for metric_type in MetricType:
+            values = self._metric_series(metrics, metric_type)
+            if len(values) < self.min_data_points:
                 continue
             
-            values = [dp.value for dp in data_points]
-            timestamps = [dp.timestamp for dp in data_points]
-            
             # Calculate trend metrics
             trend_direction = self._calculate_trend_direction(values)
             slope = self._calculate_slope(values)
-            correlation = self._calculate_correlation(timestamps, values)
-            volatility = statistics.stdev(values) if len(values) > 1 else 0
+            correlation = self._calculate_correlation(values.index, values)
+            volatility = float(values.std()) if len(values) > 1 else 0
             confidence_interval = self._calculate_confidence_interval(values)
             trend_strength = abs(correlation)
             
             # Detect anomalies
-            anomalies = self._detect_anomalies(data_points)
+            anomalies = self._detect_anomalies(values, f"{metric_type.value}:{period.value}", period)
             
             # Analyze seasonal patterns
-            seasonal_patterns = self._analyze_seasonal_patterns(data_points, period)
+            seasonal_patterns = self._analyze_seasonal_patterns(values, period)
             
             trend_analysis = TrendAnalysis(
                 metric_type=metric_type,
@@ -600,18 +618,18 @@ class HistoricalAnalyzer:
         
         return trend_analyses
     
-    def _calculate_trend_direction(self, values: List[float]) -> TrendDirection:
+    def _calculate_trend_direction(self, values: Sequence[float]) -> TrendDirection:
         """Calculate trend direction from values"""
+        values = np.asarray(values, dtype=float)
         if len(values) < 2:
             return TrendDirection.STABLE
         
         # Calculate slope
-        x = list(range(len(values)))
         slope = self._calculate_slope(values)
         
         # Calculate volatility
-        volatility = statistics.stdev(values) if len(values) > 1 else 0
-        mean_value = statistics.mean(values)
+        volatility = values.std(ddof=1)
+        mean_value = values.mean()
         cv = volatility / mean_value if mean_value != 0 else 0  # Coefficient of variation
         
         # Determine trend
@@ -624,114 +642,107 @@ class HistoricalAnalyzer:
         else:
             return TrendDirection.DECLINING
     
-    def _calculate_slope(self, values: List[float]) -> float:
+    def _calculate_slope(self, values: Sequence[float]) -> float:
         """Calculate linear regression slope"""
-        if len(values) < 2:
-            return 0.0
-        
+        values = np.asarray(values, dtype=float)
         n = len(values)
-        x = list(range(n))
-        
-        # Linear regression
-        x_mean = statistics.mean(x)
-        y_mean = statistics.mean(values)
+        if n < 2:
+            return 0.0
         
-        numerator = sum((x[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
+        # Linear regression against the point index
+        x = np.arange(n) - (n - 1) / 2
+        denominator = float(np.dot(x, x))
         
-        return numerator / denominator if denominator != 0 else 0.0
+        return float(np.dot(x, values - values.mean())) / denominator if denominator != 0 else 0.0
     
-    def _calculate_correlation(self, timestamps: List[datetime], values: List[float]) -> float:
+    def _calculate_correlation(self, timestamps: Sequence[datetime], values: Sequence[float]) -> float:
         """Calculate correlation coefficient"""
+        values = np.asarray(values, dtype=float)
         if len(values) < 2:
             return 0.0
         
         # Convert timestamps to numeric values
-        base_time = timestamps[0]
-        x = [(t - base_time).total_seconds() for t in timestamps]
+        timestamps = pd.DatetimeIndex(timestamps)
+        x = (timestamps - timestamps[0]).total_seconds().to_numpy()
         
-        try:
-            correlation_matrix = np.corrcoef(x, values)
-            return correlation_matrix[0, 1] if not np.isnan(correlation_matrix[0, 1]) else 0.0
-        except:
+        if x.std() == 0 or values.std() == 0:
             return 0.0
+        
+        correlation = np.corrcoef(x, values)[0, 1]
+        return float(correlation) if not np.isnan(correlation) else 0.0
     
-    def _calculate_confidence_interval(self, values: List[float], confidence: float = 0.95) -> Tuple[float, float]:
+    def _calculate_confidence_interval(self, values: Sequence[float], confidence: float = 0.95) -> Tuple[float, float]:
         """Calculate confidence interval"""
+        values = np.asarray(values, dtype=float)
         if len(values) < 2:
-            mean_val = values[0] if values else 0
+            mean_val = float(values[0]) if len(values) else 0
             return (mean_val, mean_val)
         
-        mean_val = statistics.mean(values)
-        std_val = statistics.stdev(values)
+        mean_val = float(values.mean())
+        std_val = float(values.std(ddof=1))
         
         # Simple confidence interval (assuming normal distribution)
         margin = 1.96 * std_val / (len(values) ** 0.5)  # 95% confidence
         
         return (mean_val - margin, mean_val + margin)
     
-    def _detect_anomalies(self, data_points: List[HistoricalDataPoint]) -> List[Dict[str, Any]]:
-        """Detect anomalies in data points"""
-        if len(data_points) < 3:
+    def _detect_anomalies(self, values: pd.Series, stream: str, period: AnalysisPeriod) -> List[Dict[str, Any]]:
+        """
+        Detect anomalies in a time-indexed metric series
+        
+        Only points newer than the stream's last consumed timestamp update the
+        online baseline; anomalies already flagged in the series range are
+        returned from the detector's history. The current period is still
+        accumulating runs, so its partial value is left for a later analysis.
+        """
+        if values.empty:
             return []
         
-        values = [dp.value for dp in data_points]
-        mean_val = statistics.mean(values)
-        std_val = statistics.stdev(values)
-        
-        anomalies = []
-        for dp in data_points:
-            z_score = abs(dp.value - mean_val) / std_val if std_val > 0 else 0
-            if z_score > self.anomaly_threshold:
-                anomalies.append({
-                    "timestamp": dp.timestamp,
-                    "value": dp.value,
-                    "z_score": z_score,
-                    "severity": "high" if z_score > 3 else "medium"
-                })
-        
-        return anomalies
+        timestamps = values.index.to_pydatetime()
+        closed = values.index < self._get_period_start(datetime.now(), period)
+        self.anomaly_detector.observe_series(stream, zip(timestamps[closed], values.to_numpy()[closed]))
+        
+        return self.anomaly_detector.get_anomalies(stream, start=timestamps[0], end=timestamps[-1])
+    
+    def _get_period_start(self, timestamp: datetime, period: AnalysisPeriod) -> datetime:
+        """Get the start of the analysis period containing timestamp"""
+        if period == AnalysisPeriod.HOURLY:
+            return timestamp.replace(minute=0, second=0, microsecond=0)
+        return truncate_period(timestamp, self._get_rollup_granularity(period))
     
     def _analyze_seasonal_patterns(
         self,
-        data_points: List[HistoricalDataPoint],
+        values: pd.Series,
         period: AnalysisPeriod
     ) -> Dict[str, Any]:
-        """Analyze seasonal patterns in data"""
+        """Analyze seasonal patterns in a time-indexed metric series"""
         
         patterns = {}
         
-        if len(data_points) < 7:  # Need at least a week of data
+        if len(values) < 7:  # Need at least a week of data
             return patterns
         
-        # Group by day of week
-        day_groups = defaultdict(list)
-        for dp in data_points:
-            day_of_week = dp.timestamp.strftime('%A')
-            day_groups[day_of_week].append(dp.value)
+        # Average by day of week
+        day_averages = values.groupby(values.index.day_name()).mean()
         
-        # Calculate averages by day
-        day_averages = {}
-        for day, values in day_groups.items():
-            if values:
-                day_averages[day] = statistics.mean(values)
+        patterns['day_of_week'] = {day: float(value) for day, value in day_averages.items()}
         
-        if day_averages:
-            patterns['day_of_week'] = day_averages
-            
-            # Find peak and low days
-            max_day = max(day_averages, key=day_averages.get)
-            min_day = min(day_averages, key=day_averages.get)
-            
-            patterns['peak_day'] = max_day
-            patterns['low_day'] = min_day
-            patterns['weekly_variation'] = day_averages[max_day] - day_averages[min_day]
+        # Find peak and low days
+        patterns['peak_day'] = day_averages.idxmax()
+        patterns['low_day'] = day_averages.idxmin()
+        patterns['weekly_variation'] = float(day_averages.max() - day_averages.min())
+        
+        # Hourly data also shows time-of-day patterns
+        if period == AnalysisPeriod.HOURLY:
+            hour_averages = values.groupby(values.index.hour).mean()
+            patterns['hour_of_day'] = {int(hour): float(value) for hour, value in hour_averages.items()}
+            patterns['peak_hour'] = int(hour_averages.idxmax())
         
         return patterns
     
     async def _generate_predictions(
         self,
-        historical_data: List[HistoricalDataPoint],
+        metrics: pd.DataFrame,
         trend_analyses: List[TrendAnalysis]
     ) -> Dict[str, Any]:
         """Generate predictions based on historical trends"""
@@ -741,9 +752,10 @@ class HistoricalAnalyzer:
         for trend_analysis in trend_analyses:
             metric_name = trend_analysis.metric_type.value
             
-            # Simple linear prediction
+            # Simple linear prediction from the metric's latest value
             if trend_analysis.trend_direction != TrendDirection.VOLATILE:
-                current_value = historical_data[-1].value if historical_data else 0
+                values = self._metric_series(metrics, trend_analysis.metric_type)
+                current_value = float(values.iloc[-1]) if not values.empty else 0
                 predicted_change = trend_analysis.slope * 30  # 30 days ahead
                 predicted_value = current_value + predicted_change
                 
@@ -901,17 +913,20 @@ class HistoricalAnalyzer:
             start_date, end_date, AnalysisPeriod.DAILY
         )
         
-        metric_data = [
+        metric_rows = historical_data[historical_data['metric_type'] == metric_type.value]
+        
+        return [
             {
-                "timestamp": dp.timestamp,
-                "value": dp.value,
-                "metadata": dp.metadata
+                "timestamp": timestamp.to_pydatetime(),
+                "value": float(value),
+                "metadata": metadata
             }
-            for dp in historical_data
-            if dp.metric_type == metric_type
+            for timestamp, value, metadata in zip(
+                metric_rows['timestamp'],
+                metric_rows['value'],
+                metric_rows[METADATA_COLUMNS].to_dict('records')
+            )
         ]
-        
-        return metric_data
     
     async def compare_periods(
         self,
@@ -934,14 +949,14 @@ class HistoricalAnalyzer:
         )
         
         # Filter by metric type
-        period1_values = [dp.value for dp in period1_data if dp.metric_type == metric_type]
-        period2_values = [dp.value for dp in period2_data if dp.metric_type == metric_type]
+        period1_values = period1_data.loc[period1_data['metric_type'] == metric_type.value, 'value']
+        period2_values = period2_data.loc[period2_data['metric_type'] == metric_type.value, 'value']
         
-        if not period1_values or not period2_values:
+        if period1_values.empty or period2_values.empty:
             return {"error": "Insufficient data for comparison"}
         
-        period1_avg = statistics.mean(period1_values)
-        period2_avg = statistics.mean(period2_values)
+        period1_avg = float(period1_values.mean())
+        period2_avg = float(period2_values.mean())
         
         change_percent = ((period1_avg - period2_avg) / period2_avg * 100) if period2_avg != 0 else 0
         
@@ -0,0 +1,245 @@
+"""
+Quantile Sketch - Mergeable streaming percentile estimation
+
+A merging t-digest: values are buffered and periodically folded into a
+sorted list of weighted centroids whose size is bounded by the compression
+parameter, with small centroids near the tails so p95/p99 stay accurate.
+Digests from different runs or shards merge by folding one's centroids into
+the other, and serialize to plain dicts for storage alongside reports.
+"""
+
+import math
+from itertools import islice, repeat
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+
+DEFAULT_COMPRESSION = 100
+DEFAULT_PERCENTILES = (0.5, 0.95, 0.99)
+
+
+class TDigest:
+    """
+    Streaming quantile sketch with bounded memory.
+
+    Memory is O(compression) centroids plus an insert buffer, independent of
+    how many values are added. Quantiles are exact for the minimum and
+    maximum and within a fraction of a percent in rank elsewhere.
+    """
+
+    def __init__(self, compression: float = DEFAULT_COMPRESSION, buffer_size: Optional[int] = None):
+        """
+        Initialize t-digest.
+
+        Args:
+            compression: Accuracy/size trade-off, roughly the number of centroids kept
+            buffer_size: Values buffered before compressing, defaults to 5x compression
+        """
+        self.compression = compression
+        self.buffer_size = buffer_size or int(compression * 5)
+
+        self._means: List[float] = []
+        self._weights: List[float] = []
+        self._buffer: List[tuple] = []
+
+        self.count = 0.0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, weight: float = 1.0):
+        """Add a value"""
+        value = float(value)
+        if math.isnan(value):
+            return
+
+        self._buffer.append((value, weight))
+        self.count += weight
+        self.sum += value * weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if len(self._buffer) >= self.buffer_size:
+            self._compress()
+
+    def update(self, values: Iterable[float]):
+        """Add a stream of values with unit weight"""
+        values = iter(values)
+        while True:
+            # Take just enough values to fill the buffer, as add() would
+            chunk = [float(value) for value in islice(values, self.buffer_size - len(self._buffer))]
+            if not chunk:
+                break
+
+            chunk = [value for value in chunk if not math.isnan(value)]
+            if chunk:
+                self._buffer.extend(zip(chunk, repeat(1.0)))
+                self.count += len(chunk)
+                self.sum = sum(chunk, self.sum)
+                self.min = min(self.min, min(chunk))
+                self.max = max(self.max, max(chunk))
+
+            if len(self._buffer) >= self.buffer_size:
+                self._compress()
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        """Fold another digest into this one"""
+        other._compress()
+        if not other._means:
+            return self
+
+        self._buffer.extend(zip(other._means, other._weights))
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        # Buffered like added values, so merging many small digests
+        # compresses once per full buffer rather than once per digest
+        if len(self._buffer) >= self.buffer_size:
+            self._compress()
+        return self
+
+    @classmethod
+    def merge_all(cls, digests: Iterable['TDigest'], compression: float = DEFAULT_COMPRESSION) -> 'TDigest':
+        """Merge several digests into a new one"""
+        merged = cls(compression)
+        for digest in digests:
+            merged.merge(digest)
+        return merged
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of all added values"""
+        return self.sum / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value, or None if the digest is empty
+        """
+        self._compress()
+        if not self._means:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        means, weights = self._means, self._weights
+        if len(means) == 1:
+            return means[0]
+
+        index = q * self.count
+
+        # Between the minimum and the center of the first centroid
+        if index < weights[0] / 2:
+            if weights[0] <= 1:
+                return self.min
+            return self.min + (means[0] - self.min) * index / (weights[0] / 2)
+
+        # Between the center of the last centroid and the maximum
+        if index > self.count - weights[-1] / 2:
+            if weights[-1] <= 1:
+                return self.max
+            remaining = self.count - index
+            return self.max - (self.max - means[-1]) * remaining / (weights[-1] / 2)
+
+        # Interpolate between the centers of adjacent centroids
+        cumulative = weights[0] / 2
+        for i in range(len(means) - 1):
+            step = (weights[i] + weights[i + 1]) / 2
+            if cumulative + step >= index:
+                return means[i] + (means[i + 1] - means[i]) * (index - cumulative) / step
+            cumulative += step
+
+        return means[-1]
+
+    def percentiles(self, quantiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Optional[float]]:
+        """Estimate several quantiles, keyed 'p50', 'p95', 'p99', ..."""
+        return {f"p{q * 100:g}": self.quantile(q) for q in quantiles}
+
+    def centroid_count(self) -> int:
+        """Number of centroids currently kept"""
+        self._compress()
+        return len(self._means)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the digest"""
+        self._compress()
+        return {
+            'compression': self.compression,
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min if self.count else None,
+            'max': self.max if self.count else None,
+            'centroids': [[mean, weight] for mean, weight in zip(self._means, self._weights)]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TDigest':
+        """Restore a digest serialized with to_dict"""
+        digest = cls(data.get('compression', DEFAULT_COMPRESSION))
+        centroids = data.get('centroids', [])
+        digest._means = [float(mean) for mean, _ in centroids]
+        digest._weights = [float(weight) for _, weight in centroids]
+        digest.count = float(data.get('count', sum(digest._weights)))
+        digest.sum = float(data.get('sum', 0.0))
+        if data.get('min') is not None:
+            digest.min = float(data['min'])
+        if data.get('max') is not None:
+            digest.max = float(data['max'])
+        return digest
+
+    def _scale(self, q: float) -> float:
+        """k1 scale function, centroid size limits shrink towards the tails"""
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _inverse_scale(self, k: float) -> float:
+        """Inverse of the k1 scale function"""
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+    def _compress(self):
+        """Fold buffered values into the centroid list"""
+        if not self._buffer:
+            return
+
+        points = sorted(list(zip(self._means, self._weights)) + self._buffer)
+        self._buffer = []
+
+        total = sum(weight for _, weight in points)
+        means: List[float] = []
+        weights: List[float] = []
+
+        current_mean, current_weight = points[0]
+        weight_so_far = 0.0
+        limit = total * self._inverse_scale(self._scale(0.0) + 1)
+
+        for mean, weight in points[1:]:
+            if weight_so_far + current_weight + weight <= limit:
+                # Weighted running mean of the merged centroid
+                current_weight += weight
+                current_mean += (mean - current_mean) * weight / current_weight
+            else:
+                means.append(current_mean)
+                weights.append(current_weight)
+                weight_so_far += current_weight
+                limit = total * self._inverse_scale(self._scale(weight_so_far / total) + 1)
+                current_mean, current_weight = mean, weight
+
+        means.append(current_mean)
+        weights.append(current_weight)
+
+        self._means = means
+        self._weights = weights
+
+    def __len__(self) -> int:
+        return int(self.count)
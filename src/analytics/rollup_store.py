@@ -0,0 +1,373 @@
+"""
+Rollup Store - Incremental day/week/month aggregates of test runs and system events
+
+Completed runs and system events are folded into pre-aggregated rollup rows
+as they happen, so trend, historical and executive reports read a handful of
+rows per period instead of re-aggregating raw executions on every request.
+Rollups keep sums and sample counts; averages are derived on read, which lets
+quarterly and yearly views be folded from the monthly rows.
+"""
+
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.exc import IntegrityError
+
+from ..database.database import DatabaseManager
+from ..database.models import TestMetricRollup, RollupRecordedSource
+
+
+logger = logging.getLogger(__name__)
+
+
+# Granularities maintained on write
+GRANULARITIES = ('day', 'week', 'month')
+
+# Granularities that can be read, mapped to the stored rollup they are folded from
+READ_GRANULARITIES = {
+    'day': 'day',
+    'week': 'week',
+    'month': 'month',
+    'quarter': 'month',
+    'year': 'month',
+}
+
+# Environment key under which every run and event is aggregated
+ALL_ENVIRONMENTS = 'all'
+
+COUNTER_COLUMNS = (
+    'run_count', 'total_tests', 'passed_tests', 'failed_tests', 'skipped_tests',
+    'flaky_tests', 'execution_time_sum',
+    'performance_score_sum', 'performance_score_count',
+    'security_score_sum', 'security_score_count',
+    'compliance_score_sum', 'compliance_score_count',
+    'coverage_sum', 'coverage_count',
+    'event_count', 'critical_events', 'performance_events',
+    'uptime_sum', 'uptime_count', 'recovery_time_sum', 'recovery_time_count',
+)
+
+SCORE_COLUMNS = {
+    'performance': 'performance_score',
+    'security': 'security_score',
+    'compliance': 'compliance_score',
+    'coverage': 'coverage',
+}
+
+
+def truncate_period(timestamp: datetime, granularity: str) -> datetime:
+    """Get the start of the day, week (Monday), month, quarter or year containing timestamp"""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+
+    day = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == 'day':
+        return day
+    if granularity == 'week':
+        return day - timedelta(days=day.weekday())
+    if granularity == 'month':
+        return day.replace(day=1)
+    if granularity == 'quarter':
+        return day.replace(month=3 * ((day.month - 1) // 3) + 1, day=1)
+    if granularity == 'year':
+        return day.replace(month=1, day=1)
+    raise ValueError(f"Unsupported rollup granularity: {granularity}")
+
+
+def _average(total: float, count: int) -> Optional[float]:
+    """Average from a sum and sample count, None without samples"""
+    return total / count if count else None
+
+
+class RollupStore:
+    """
+    Maintains the test_metric_rollups table.
+
+    Each recorded run or event updates one row per granularity for its
+    environment and for the 'all' environment, in a single transaction.
+    Sources are recorded by key so replaying the same run is a no-op.
+    """
+
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+        """
+        Initialize rollup store.
+
+        Args:
+            db_manager: Database manager, defaults to the shared instance
+        """
+        if db_manager is None:
+            from ..database.database import db_manager as default_db_manager
+            db_manager = default_db_manager
+        self.db_manager = db_manager
+        self._tables_ready = False
+
+    def ensure_tables(self):
+        """Create the rollup tables if they do not exist yet"""
+        if self._tables_ready:
+            return
+        for model in (TestMetricRollup, RollupRecordedSource):
+            model.__table__.create(bind=self.db_manager.engine, checkfirst=True)
+        self._tables_ready = True
+
+    def record_run(self,
+                   run_id: str,
+                   summary: Dict[str, Any],
+                   timestamp: Optional[datetime] = None,
+                   environment: Optional[str] = None,
+                   scores: Optional[Dict[str, float]] = None) -> bool:
+        """
+        Fold a completed test run into the rollups.
+
+        Args:
+            run_id: Test run identifier, used to skip runs already recorded
+            summary: Run summary with total/passed/failed/skipped/flaky counts
+                and the summed test duration
+            timestamp: Completion time of the run, defaults to now
+            environment: Environment the run executed against
+            scores: Optional performance/security/compliance/coverage scores
+
+        Returns:
+            True if the run was recorded, False if it was already present
+        """
+        increments = {
+            'run_count': 1,
+            'total_tests': int(summary.get('total', 0) or 0),
+            'passed_tests': int(summary.get('passed', 0) or 0),
+            'failed_tests': int(summary.get('failed', 0) or 0),
+            'skipped_tests': int(summary.get('skipped', 0) or 0),
+            'flaky_tests': int(summary.get('flaky', 0) or 0),
+            'execution_time_sum': float(summary.get('duration', 0) or 0),
+        }
+
+        for name, column in SCORE_COLUMNS.items():
+            value = (scores or {}).get(name)
+            if value is not None:
+                increments[f'{column}_sum'] = float(value)
+                increments[f'{column}_count'] = 1
+
+        return self._apply(f"run:{run_id}", timestamp or datetime.now(), environment, increments)
+
+    def record_event(self,
+                     event_id: str,
+                     event_type: str,
+                     severity: str = 'info',
+                     status: str = 'up',
+                     recovery_time: Optional[float] = None,
+                     timestamp: Optional[datetime] = None,
+                     environment: Optional[str] = None) -> bool:
+        """
+        Fold a system event (incident, degradation, health check) into the rollups.
+
+        Args:
+            event_id: Event identifier, used to skip events already recorded
+            event_type: Event type, e.g. 'performance_degradation'
+            severity: Event severity
+            status: System status at the time of the event ('up' or 'down')
+            recovery_time: Minutes until the system recovered, if known
+            timestamp: Time of the event, defaults to now
+            environment: Environment the event occurred in
+
+        Returns:
+            True if the event was recorded, False if it was already present
+        """
+        increments = {
+            'event_count': 1,
+            'critical_events': 1 if severity == 'critical' else 0,
+            'performance_events': 1 if event_type == 'performance_degradation' else 0,
+            'uptime_sum': 100.0 if status == 'up' else 0.0,
+            'uptime_count': 1,
+        }
+
+        if recovery_time is not None:
+            increments['recovery_time_sum'] = float(recovery_time)
+            increments['recovery_time_count'] = 1
+
+        return self._apply(f"event:{event_id}", timestamp or datetime.now(), environment, increments)
+
+    def get_rollups(self,
+                    granularity: str,
+                    start_date: datetime,
+                    end_date: datetime,
+                    environment: str = ALL_ENVIRONMENTS) -> List[Dict[str, Any]]:
+        """
+        Read rollups for a date range.
+
+        Args:
+            granularity: day, week, month, quarter or year
+            start_date: Start of the range, widened to the start of its period
+            end_date: End of the range
+            environment: Environment to read, defaults to all environments
+
+        Returns:
+            One dict per period, ordered by period, with counters and derived
+            averages (avg_execution_time, avg_*_score, flakiness_rate, coverage)
+        """
+        if granularity not in READ_GRANULARITIES:
+            raise ValueError(f"Unsupported rollup granularity: {granularity}")
+
+        stored = READ_GRANULARITIES[granularity]
+        rows = self._query(stored, truncate_period(start_date, stored), end_date, environment)
+
+        periods: "OrderedDict[datetime, Dict[str, Any]]" = OrderedDict()
+        for row in rows:
+            period = truncate_period(row['period'], granularity)
+            if period not in periods:
+                periods[period] = {column: 0 for column in COUNTER_COLUMNS}
+            for column in COUNTER_COLUMNS:
+                periods[period][column] += row[column]
+
+        return [self._derive(period, granularity, counters) for period, counters in periods.items()]
+
+    def get_stability_summary(self,
+                              start_date: datetime,
+                              end_date: datetime,
+                              environment: str = ALL_ENVIRONMENTS) -> Optional[Dict[str, Any]]:
+        """
+        Summarize recorded system events over a date range from the daily rollups.
+
+        Returns:
+            Dict with uptime_percentage, mean_time_to_recovery, critical_issues,
+            performance_events and total_incidents, or None if no events were recorded
+        """
+        rows = self._query('day', truncate_period(start_date, 'day'), end_date, environment)
+        totals = self._sum(rows, ('event_count', 'critical_events', 'performance_events',
+                                  'uptime_sum', 'uptime_count', 'recovery_time_sum',
+                                  'recovery_time_count'))
+
+        if not totals['event_count']:
+            return None
+
+        return {
+            'uptime_percentage': _average(totals['uptime_sum'], totals['uptime_count']),
+            'mean_time_to_recovery': _average(totals['recovery_time_sum'], totals['recovery_time_count']),
+            'critical_issues': totals['critical_events'],
+            'performance_events': totals['performance_events'],
+            'total_incidents': totals['event_count']
+        }
+
+    def _apply(self, source_key: str, timestamp: datetime,
+               environment: Optional[str], increments: Dict[str, float]) -> bool:
+        """Add increments to every affected rollup row, once per source"""
+        self.ensure_tables()
+
+        environments = [ALL_ENVIRONMENTS]
+        if environment and environment != ALL_ENVIRONMENTS:
+            environments.append(str(environment))
+
+        # A concurrent writer may create the same period row or source marker
+        # first; the retry then updates that row or sees the source as recorded
+        for attempt in range(2):
+            try:
+                with self.db_manager.session_scope() as session:
+                    if session.get(RollupRecordedSource, source_key) is not None:
+                        return False
+                    session.add(RollupRecordedSource(source_key=source_key))
+
+                    for env in environments:
+                        for granularity in GRANULARITIES:
+                            row = self._get_or_create_row(
+                                session, granularity, truncate_period(timestamp, granularity), env
+                            )
+                            for column, value in increments.items():
+                                setattr(row, column, getattr(row, column) + value)
+                return True
+            except IntegrityError:
+                if attempt:
+                    raise
+                logger.debug(f"Concurrent rollup update for {source_key}, retrying")
+        return False
+
+    @staticmethod
+    def _get_or_create_row(session, granularity: str, period_start: datetime,
+                           environment: str) -> TestMetricRollup:
+        """Load a rollup row for update, creating a zeroed one if missing"""
+        row = (
+            session.query(TestMetricRollup)
+            .filter_by(granularity=granularity, period_start=period_start, environment=environment)
+            .with_for_update()
+            .one_or_none()
+        )
+        if row is None:
+            row = TestMetricRollup(
+                granularity=granularity,
+                period_start=period_start,
+                environment=environment,
+                **{column: 0 for column in COUNTER_COLUMNS}
+            )
+            session.add(row)
+            session.flush()
+        return row
+
+    def _query(self, granularity: str, start_date: datetime, end_date: datetime,
+               environment: str) -> List[Dict[str, Any]]:
+        """Fetch stored rollup rows as plain dicts"""
+        self.ensure_tables()
+
+        if end_date.tzinfo is not None:
+            end_date = end_date.astimezone(timezone.utc).replace(tzinfo=None)
+
+        with self.db_manager.session_scope() as session:
+            rows = (
+                session.query(TestMetricRollup)
+                .filter(
+                    TestMetricRollup.granularity == granularity,
+                    TestMetricRollup.environment == environment,
+                    TestMetricRollup.period_start >= start_date,
+                    TestMetricRollup.period_start <= end_date
+                )
+                .order_by(TestMetricRollup.period_start)
+                .all()
+            )
+            return [
+                {'period': row.period_start, **{column: getattr(row, column) or 0 for column in COUNTER_COLUMNS}}
+                for row in rows
+            ]
+
+    @staticmethod
+    def _sum(rows: Iterable[Dict[str, Any]], columns: Iterable[str]) -> Dict[str, float]:
+        """Sum selected counter columns over rows"""
+        columns = tuple(columns)
+        totals = {column: 0 for column in columns}
+        for row in rows:
+            for column in columns:
+                totals[column] += row[column]
+        return totals
+
+    @staticmethod
+    def _derive(period: datetime, granularity: str, counters: Dict[str, float]) -> Dict[str, Any]:
+        """Turn summed counters into the report-facing row"""
+        total_tests = counters['total_tests']
+        performance_score = _average(counters['performance_score_sum'], counters['performance_score_count'])
+
+        return {
+            'period': period,
+            'granularity': granularity,
+            'run_count': counters['run_count'],
+            'total_tests': total_tests,
+            'passed_tests': counters['passed_tests'],
+            'failed_tests': counters['failed_tests'],
+            'skipped_tests': counters['skipped_tests'],
+            'flaky_tests': counters['flaky_tests'],
+            'avg_execution_time': _average(counters['execution_time_sum'], total_tests),
+            'flakiness_rate': _average(counters['flaky_tests'], total_tests),
+            'avg_performance_score': performance_score,
+            'performance_score': performance_score,
+            'avg_security_score': _average(counters['security_score_sum'], counters['security_score_count']),
+            'avg_compliance_score': _average(counters['compliance_score_sum'], counters['compliance_score_count']),
+            'coverage': _average(counters['coverage_sum'], counters['coverage_count']),
+        }
+
+
+# Global rollup store instance
+_rollup_store: Optional[RollupStore] = None
+
+
+def get_rollup_store() -> RollupStore:
+    """Get or create the shared rollup store instance."""
+    global _rollup_store
+
+    if _rollup_store is None:
+        _rollup_store = RollupStore()
+
+    return _rollup_store
@@ -18,6 +18,11 @@ import aiofiles
 from .api_routes import APIRoutes
 from .websocket_handler import WebSocketHandler
 
+try:
+    from ..monitoring.prometheus_exporter import PrometheusExporter, CONTENT_TYPE as PROMETHEUS_CONTENT_TYPE
+except ImportError:  # dashboard imported as a top-level package with src/ on sys.path
+    from monitoring.prometheus_exporter import PrometheusExporter, CONTENT_TYPE as PROMETHEUS_CONTENT_TYPE
+
 
 class DashboardApp:
     """
@@ -29,7 +34,8 @@ class DashboardApp:
     - Real-time system monitoring
     """
     
-    def __init__(self, config: Optional[Dict[str, Any]] = None, orchestrator=None, trigger_system=None):
+    def __init__(self, config: Optional[Dict[str, Any]] = None, orchestrator=None, trigger_system=None,
+                 metrics_collector=None, agent_monitor=None):
         # Handle string config path for compatibility
         if isinstance(config, str):
             config_path = Path(config)
@@ -47,6 +53,9 @@ class DashboardApp:
         self.trigger_system = trigger_system
         self.logger = logging.getLogger(__name__)
         
+        # Prometheus scrape output, from the default collector when none is given
+        self.prometheus_exporter = PrometheusExporter(metrics_collector, agent_monitor)
+        
         # Web application
         self.app: Optional[web.Application] = None
         self.runner: Optional[web.AppRunner] = None
@@ -167,6 +176,9 @@ class DashboardApp:
         # WebSocket endpoint
         self.app.router.add_get('/ws', self.websocket_handler.handle_websocket)
         
+        # Prometheus scrape endpoint
+        self.app.router.add_get('/metrics', self._prometheus_metrics)
+        
         # API routes
         api_prefix = '/api/v1'
         
@@ -291,6 +303,13 @@ class DashboardApp:
                 'timestamp': datetime.now().isoformat()
             })
     
+    async def _prometheus_metrics(self, request):
+        """Serve in-memory metrics in the Prometheus text format"""
+        return web.Response(
+            body=self.prometheus_exporter.render(),
+            headers={'Content-Type': PROMETHEUS_CONTENT_TYPE}
+        )
+    
     # Page handlers
     @aiohttp_jinja2.template('dashboard.html')
     async def _dashboard_home(self, request):
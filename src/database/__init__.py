@@ -20,6 +20,8 @@ from .models import (
     TestArtifact,
     TestEnvironment,
     TestReport,
+    TestMetricRollup,
+    RollupRecordedSource,
     TestStatus,
     TestType,
     EnvironmentType,
@@ -51,6 +53,8 @@ __all__ = [
     "TestArtifact",
     "TestEnvironment",
     "TestReport",
+    "TestMetricRollup",
+    "RollupRecordedSource",
     
     # Enums
     "TestStatus",
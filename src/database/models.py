@@ -9,7 +9,7 @@ import uuid
 
 from sqlalchemy import (
     Column, String, Integer, DateTime, Boolean, Text, 
-    ForeignKey, DECIMAL, BIGINT, JSON, ARRAY, Enum
+    ForeignKey, DECIMAL, BIGINT, JSON, ARRAY, Enum, Float, UniqueConstraint
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.ext.declarative import declarative_base
@@ -201,6 +201,57 @@ class TestReport(Base):
     test_run = relationship("TestRun", back_populates="reports")
 
 
+class TestMetricRollup(Base):
+    """Pre-aggregated test and stability counters for one day, week or month."""
+    __tablename__ = "test_metric_rollups"
+    __table_args__ = (
+        UniqueConstraint("granularity", "period_start", "environment", name="uq_test_metric_rollup_period"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    granularity = Column(String(10), nullable=False)  # day, week, month
+    period_start = Column(DateTime, nullable=False, index=True)
+    environment = Column(String(50), nullable=False, default="all")
+
+    # Test run counters
+    run_count = Column(Integer, nullable=False, default=0)
+    total_tests = Column(Integer, nullable=False, default=0)
+    passed_tests = Column(Integer, nullable=False, default=0)
+    failed_tests = Column(Integer, nullable=False, default=0)
+    skipped_tests = Column(Integer, nullable=False, default=0)
+    flaky_tests = Column(Integer, nullable=False, default=0)
+    execution_time_sum = Column(Float, nullable=False, default=0.0)
+
+    # Score sums and sample counts, averages are derived on read
+    performance_score_sum = Column(Float, nullable=False, default=0.0)
+    performance_score_count = Column(Integer, nullable=False, default=0)
+    security_score_sum = Column(Float, nullable=False, default=0.0)
+    security_score_count = Column(Integer, nullable=False, default=0)
+    compliance_score_sum = Column(Float, nullable=False, default=0.0)
+    compliance_score_count = Column(Integer, nullable=False, default=0)
+    coverage_sum = Column(Float, nullable=False, default=0.0)
+    coverage_count = Column(Integer, nullable=False, default=0)
+
+    # System event counters
+    event_count = Column(Integer, nullable=False, default=0)
+    critical_events = Column(Integer, nullable=False, default=0)
+    performance_events = Column(Integer, nullable=False, default=0)
+    uptime_sum = Column(Float, nullable=False, default=0.0)
+    uptime_count = Column(Integer, nullable=False, default=0)
+    recovery_time_sum = Column(Float, nullable=False, default=0.0)
+    recovery_time_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+
+
+class RollupRecordedSource(Base):
+    """Runs and events already folded into the rollups, so replays are not counted twice."""
+    __tablename__ = "rollup_recorded_sources"
+
+    source_key = Column(String(255), primary_key=True)
+    recorded_at = Column(DateTime(timezone=True), default=func.now())
+
+
 # Pydantic models for API serialization
 class TestRunCreate(BaseModel):
     run_name: str
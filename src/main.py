@@ -27,7 +27,7 @@ try:
     from src.monitoring.logger_config import LoggerConfig, setup_logging
     from src.monitoring.agent_monitor import AgentMonitor
     from src.monitoring.system_monitor import SystemMonitor
-    from src.monitoring.metrics_collector import MetricsCollector
+    from src.monitoring.metrics_collector import MetricsCollector, set_default_metrics_collector
 except ImportError as e:
     print(f"Warning: Some modules could not be imported: {e}")
     print("The system will run with limited functionality.")
@@ -71,6 +71,8 @@ except ImportError as e:
         async def start(self): pass
         async def stop(self): pass
     
+    def set_default_metrics_collector(collector): pass
+    
     def get_settings_manager():
         return type('SettingsManager', (), {'save': lambda: None, 'validate': lambda: None})()
     
@@ -123,6 +125,7 @@ class OrchestratorCLI:
             self.agent_monitor = AgentMonitor()
             self.system_monitor = SystemMonitor()
             self.metrics_collector = MetricsCollector()
+            set_default_metrics_collector(self.metrics_collector)
             
             # Initialize core components
             self.orchestrator = TestOrchestrator()
@@ -494,6 +497,46 @@ def config_validate(ctx):
         click.echo(f"Configuration validation failed: {e}", err=True)
 
 
+@cli.group()
+def reports():
+    """Search generated reports."""
+    pass
+
+
+@reports.command('search')
+@click.argument('terms', nargs=-1, required=True)
+@click.option('--reports-dir', '-d', default='reports', help='Directory searched for report indexes')
+@click.option('--type', '-t', 'report_type', help='Only reports of this type (functional, security, compliance, unified)')
+@click.option('--any', 'match_any', is_flag=True, help='Match reports containing any term instead of all')
+@click.option('--limit', '-n', default=20, help='Maximum number of results')
+@click.option('--json', 'as_json', is_flag=True, help='Print results as JSON')
+def reports_search(terms, reports_dir, report_type, match_any, limit, as_json):
+    """Find reports mentioning tests, CVEs, findings or requirements."""
+    try:
+        from src.reporting.report_index import search_reports
+
+        hits = search_reports(' '.join(terms), reports_dir, report_type, match_any, limit)
+
+        if as_json:
+            click.echo(json.dumps([hit.to_dict() for hit in hits], indent=2))
+            return
+
+        if not hits:
+            click.echo("No matching reports found.")
+            return
+
+        click.echo(f"=== {len(hits)} matching reports ===")
+        for hit in hits:
+            click.echo(f"{hit.title} [{hit.report_type}] {hit.generated_at}")
+            click.echo(f"  {' '.join(hit.snippet.split())}")
+            for path in hit.paths:
+                click.echo(f"  {path}")
+            click.echo("---")
+
+    except Exception as e:
+        click.echo(f"Error searching reports: {e}", err=True)
+
+
 @cli.command()
 @click.pass_context
 def init(ctx):
@@ -7,7 +7,9 @@ Provides comprehensive monitoring, logging, and metrics collection for the test
 from .agent_monitor import AgentMonitor, AgentMetrics
 from .system_monitor import SystemMonitor, SystemMetrics
 from .logger_config import LoggerConfig, setup_logging
-from .metrics_collector import MetricsCollector, MetricType
+from .metrics_collector import MetricsCollector, MetricType, Histogram
+from .profiler import SamplingProfiler
+from .prometheus_exporter import PrometheusExporter
 
 __all__ = [
     'AgentMonitor',
@@ -17,5 +19,8 @@ __all__ = [
     'LoggerConfig',
     'setup_logging',
     'MetricsCollector',
-    'MetricType'
+    'MetricType',
+    'Histogram',
+    'SamplingProfiler',
+    'PrometheusExporter'
 ]
\ No newline at end of file
@@ -5,19 +5,31 @@ Comprehensive metrics collection and storage system for the test automation fram
 """
 
 import asyncio
+import bisect
 import json
 import logging
+import math
+import operator
+import re
 import sqlite3
 import threading
 import time
+from array import array
 from collections import defaultdict, deque
+from contextlib import closing
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable, Union
+from typing import Dict, List, Any, Optional, Callable, Sequence, Tuple, Union
 import statistics
 
+try:
+    from ..analytics.quantile_sketch import TDigest, DEFAULT_PERCENTILES
+except ImportError:  # monitoring imported as a top-level package with src/ on sys.path
+    from analytics.quantile_sketch import TDigest, DEFAULT_PERCENTILES
+
 
 class MetricType(Enum):
     """Types of metrics that can be collected"""
@@ -64,90 +76,457 @@ class MetricPoint:
 
 @dataclass
 class MetricSeries:
-    """Time series of metric points"""
+    """
+    Time series of metric values in a fixed-capacity ring buffer.
+    
+    Timestamps (epoch seconds) and values are kept in parallel array('d')
+    columns and each point's labels as an index into the series' interned
+    label sets, so a sample costs a few slot writes rather than an object.
+    The buffer grows up to `capacity` points and then overwrites the oldest
+    point, and points older than the retention period are dropped from the
+    head as new points arrive. Points are kept in timestamp order so range
+    lookups can binary-search the timestamps: a point arriving after a newer
+    one is inserted at its place, which shifts the newer points.
+    """
     name: str
     metric_type: MetricType
-    points: List[MetricPoint] = field(default_factory=list)
     tags: Dict[str, str] = field(default_factory=dict)
     retention_period: timedelta = field(default_factory=lambda: timedelta(days=7))
+    capacity: int = 10000
+    _timestamps: array = field(init=False, repr=False)
+    _values: array = field(init=False, repr=False)
+    _label_ids: array = field(init=False, repr=False)
+    _metadata: List[Optional[Dict[str, Any]]] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.capacity = max(1, self.capacity)
+        self._allocate(min(self.capacity, 16))
+        self._start = 0  # slot of the oldest point
+        self._count = 0
+        self.version = 0  # Number of points ever added
+        # Earliest timestamp of a point added out of order since the owner last cleared it
+        self.late_since: Optional[float] = None
+        
+        # Distinct label sets of the series, the first being the series tags,
+        # which points have used when _base_labels_used is set
+        self._base_labels_used = False
+        self._label_sets: List[Dict[str, str]] = [dict(self.tags)]
+        self._label_index: Dict[Tuple[Tuple[str, str], ...], int] = {
+            tuple(sorted(self.tags.items())): 0
+        }
+    
+    def _allocate(self, size: int):
+        """Replace the columns with zeroed ones of the given size"""
+        self._timestamps = array('d', bytes(8 * size))
+        self._values = array('d', bytes(8 * size))
+        self._label_ids = array('I', bytes(4 * size))
+        self._metadata = [None] * size
+    
+    def __len__(self) -> int:
+        return self._count
     
     def add_point(self, value: Union[int, float], timestamp: Optional[datetime] = None, 
                   tags: Optional[Dict[str, str]] = None, metadata: Optional[Dict[str, Any]] = None):
         """Add a new data point"""
-        point = MetricPoint(
+        now = time.time()
+        epoch = timestamp.timestamp() if timestamp else now
+        cutoff = now - self.retention_period.total_seconds()
+        if epoch <= cutoff:
+            return
+        self._expire(cutoff)
+        
+        size = len(self._values)
+        if self._count == size and size < self.capacity:
+            self._grow(min(size * 2, self.capacity))
+            size = len(self._values)
+        
+        if self._count and epoch < self._timestamps[self._slot(self._count - 1)]:
+            slot = self._insert_slot(epoch)
+            if slot is None:
+                return
+            self.late_since = epoch if self.late_since is None else min(self.late_since, epoch)
+        else:
+            slot = (self._start + self._count) % size
+            if self._count == size:
+                # Full: overwrite the oldest point
+                self._start = (self._start + 1) % size
+            else:
+                self._count += 1
+        
+        self.version += 1
+        self._timestamps[slot] = epoch
+        self._values[slot] = value
+        label_id = self._intern_labels(tags) if tags else 0
+        self._label_ids[slot] = label_id
+        if not label_id:
+            self._base_labels_used = True
+        self._metadata[slot] = metadata or None
+    
+    def _insert_slot(self, epoch: float) -> Optional[int]:
+        """
+        Make room for a point older than the newest one at its place in
+        timestamp order, after points with the same timestamp.
+        
+        A full buffer drops its oldest point to make room, and a point older
+        than all points of a full buffer is not stored (None is returned).
+        """
+        index = self._search(epoch, after=True)
+        if self._count == len(self._values):
+            if not index:
+                return None
+            self._metadata[self._start] = None
+            self._start = self._slot(1)
+            self._count -= 1
+            index -= 1
+        
+        # Shift the later points one slot towards the tail
+        columns = (self._timestamps, self._values, self._label_ids, self._metadata)
+        for position in range(self._count, index, -1):
+            target, source = self._slot(position), self._slot(position - 1)
+            for column in columns:
+                column[target] = column[source]
+        self._count += 1
+        return self._slot(index)
+    
+    def _grow(self, size: int):
+        """Move the points into larger columns, oldest first"""
+        old = (self._timestamps, self._values, self._label_ids)
+        old_metadata = self._metadata
+        segments = self._segments(0, self._count)
+        
+        # New columns rather than in-place resizing, so slices handed out
+        # by get_slices() stay valid
+        self._allocate(size)
+        offset = 0
+        for first, last in segments:
+            for new_column, old_column in zip((self._timestamps, self._values, self._label_ids), old):
+                new_column[offset:offset + last - first] = old_column[first:last]
+            self._metadata[offset:offset + last - first] = old_metadata[first:last]
+            offset += last - first
+        self._start = 0
+    
+    def _intern_labels(self, tags: Dict[str, str]) -> int:
+        """Get the id of the label set of a point with extra tags"""
+        labels = {**self.tags, **tags}
+        key = tuple(sorted(labels.items()))
+        label_id = self._label_index.get(key)
+        if label_id is None:
+            label_id = self._label_index[key] = len(self._label_sets)
+            self._label_sets.append(labels)
+        return label_id
+    
+    def _expire(self, cutoff: float):
+        """Drop points at or before cutoff from the head"""
+        size = len(self._values)
+        while self._count and self._timestamps[self._start] <= cutoff:
+            self._metadata[self._start] = None
+            self._start = (self._start + 1) % size
+            self._count -= 1
+    
+    def _cleanup_old_points(self):
+        """Remove points older than retention period"""
+        self._expire(time.time() - self.retention_period.total_seconds())
+    
+    def _slot(self, index: int) -> int:
+        """Column slot of the index-th oldest point"""
+        return (self._start + index) % len(self._values)
+    
+    def _segments(self, first: int, last: int) -> List[Tuple[int, int]]:
+        """Column slot ranges holding points first..last-1, at most two"""
+        if first >= last:
+            return []
+        size = len(self._values)
+        begin = self._slot(first)
+        end = begin + (last - first)
+        if end <= size:
+            return [(begin, end)]
+        return [(begin, size), (0, end - size)]
+    
+    def _search(self, epoch: float, after: bool = False) -> int:
+        """Index of the first point at (or with after, past) the given time"""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            timestamp = self._timestamps[self._slot(middle)]
+            if timestamp < epoch or (after and timestamp == epoch):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    def _bounds(self, start: Optional[datetime], end: Optional[datetime],
+                after_start: bool = False) -> Tuple[int, int]:
+        """Index range of the points between start and end, both inclusive"""
+        first = self._search(start.timestamp(), after=after_start) if start else 0
+        last = self._search(end.timestamp(), after=True) if end else self._count
+        return first, max(first, last)
+    
+    def _point(self, slot: int) -> MetricPoint:
+        """Build a point object for one slot"""
+        return MetricPoint(
             name=self.name,
-            value=value,
+            value=self._values[slot],
             metric_type=self.metric_type,
-            timestamp=timestamp or datetime.now(),
-            tags={**self.tags, **(tags or {})},
-            metadata=metadata or {}
+            timestamp=datetime.fromtimestamp(self._timestamps[slot]),
+            tags=dict(self._label_sets[self._label_ids[slot]]),
+            metadata=self._metadata[slot] or {}
         )
-        self.points.append(point)
-        self._cleanup_old_points()
     
-    def _cleanup_old_points(self):
-        """Remove points older than retention period"""
-        cutoff = datetime.now() - self.retention_period
-        self.points = [p for p in self.points if p.timestamp > cutoff]
+    def get_slices(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                   after_start: bool = False) -> List[Tuple[memoryview, memoryview]]:
+        """
+        Get (timestamps, values) column views of the points in a time range.
+        
+        The views share memory with the buffer instead of copying it; a range
+        that wraps around the end of the buffer comes back as two pairs.
+        Timestamps are epoch seconds. Views show later writes to the same
+        slots, so copy them if they are kept while points are being added.
+        
+        Args:
+            start: Earliest timestamp, inclusive (exclusive with after_start)
+            end: Latest timestamp, inclusive
+        """
+        timestamps = memoryview(self._timestamps)
+        values = memoryview(self._values)
+        return [
+            (timestamps[first:last], values[first:last])
+            for first, last in self._segments(*self._bounds(start, end, after_start))
+        ]
+    
+    def get_values(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                   after_start: bool = False) -> List[float]:
+        """Get the values of the points in a time range, oldest first"""
+        values: List[float] = []
+        for _, segment in self.get_slices(start, end, after_start):
+            values.extend(segment)
+        return values
+    
+    @property
+    def points(self) -> List[MetricPoint]:
+        """All points as MetricPoint objects, oldest first (builds a copy)"""
+        return [self._point(self._slot(index)) for index in range(self._count)]
+    
+    def get_rows(self, since: Optional[float] = None) -> List[Tuple[float, float, int, Optional[Dict[str, Any]]]]:
+        """
+        Get (timestamp, value, label id, metadata) rows of the points, oldest first.
+        
+        Args:
+            since: Epoch seconds of the earliest point to include, all points when None
+        """
+        first = self._search(since) if since is not None else 0
+        rows: List[Tuple[float, float, int, Optional[Dict[str, Any]]]] = []
+        for begin, end in self._segments(first, self._count):
+            rows.extend(zip(self._timestamps[begin:end], self._values[begin:end],
+                            self._label_ids[begin:end], self._metadata[begin:end]))
+        return rows
+    
+    def get_labels(self, label_id: int) -> Dict[str, str]:
+        """Get the label set of a label id from get_rows()"""
+        return self._label_sets[label_id]
     
     def get_latest(self) -> Optional[MetricPoint]:
         """Get the latest point"""
-        return self.points[-1] if self.points else None
+        return self._point(self._slot(self._count - 1)) if self._count else None
+    
+    def get_latest_value(self) -> Optional[float]:
+        """Get the latest value without building a point"""
+        return self._values[self._slot(self._count - 1)] if self._count else None
+    
+    def get_latest_by_labels(self) -> Dict[int, Tuple[float, float]]:
+        """Get the (timestamp, value) of the latest point of each label id, scanning back from the newest point"""
+        latest: Dict[int, Tuple[float, float]] = {}
+        label_count = len(self._label_sets) - (0 if self._base_labels_used else 1)
+        for index in range(self._count - 1, -1, -1):
+            slot = self._slot(index)
+            label_id = self._label_ids[slot]
+            if label_id not in latest:
+                latest[label_id] = (self._timestamps[slot], self._values[slot])
+                if len(latest) == label_count:
+                    break
+        return latest
     
     def get_range(self, start: datetime, end: datetime) -> List[MetricPoint]:
         """Get points within time range"""
-        return [p for p in self.points if start <= p.timestamp <= end]
+        first, last = self._bounds(start, end)
+        return [self._point(self._slot(index)) for index in range(first, last)]
     
     def get_statistics(self, window: Optional[timedelta] = None) -> Dict[str, float]:
         """Get statistical summary of the series"""
-        if not self.points:
+        if not self._count:
             return {}
         
         # Filter by time window if specified
-        if window:
-            cutoff = datetime.now() - window
-            values = [p.value for p in self.points if p.timestamp > cutoff]
-        else:
-            values = [p.value for p in self.points]
+        start = datetime.now() - window if window else None
+        segments = [values for _, values in self.get_slices(start, after_start=True)]
+        count = sum(len(values) for values in segments)
         
-        if not values:
+        if not count:
             return {}
         
+        total = math.fsum(chain.from_iterable(segments))
+        mean = total / count
+        variance = (
+            math.fsum((value - mean) ** 2 for value in chain.from_iterable(segments)) / (count - 1)
+            if count > 1 else 0.0
+        )
+        
         return {
-            'count': len(values),
-            'min': min(values),
-            'max': max(values),
-            'mean': statistics.mean(values),
-            'median': statistics.median(values),
-            'std_dev': statistics.stdev(values) if len(values) > 1 else 0.0,
-            'sum': sum(values),
-            'latest': values[-1]
+            'count': count,
+            'min': min(min(values) for values in segments if len(values)),
+            'max': max(max(values) for values in segments if len(values)),
+            'mean': mean,
+            'median': statistics.median(chain.from_iterable(segments)),
+            'std_dev': math.sqrt(variance),
+            'sum': total,
+            'latest': segments[-1][-1]
         }
     
     def get_rate(self, window: timedelta = timedelta(minutes=1)) -> float:
         """Calculate rate of change over time window"""
-        cutoff = datetime.now() - window
-        recent_points = [p for p in self.points if p.timestamp > cutoff]
+        first, last = self._bounds(datetime.now() - window, None, after_start=True)
         
-        if len(recent_points) < 2:
+        if last - first < 2:
             return 0.0
         
         # For counters, calculate rate as difference over time
         if self.metric_type == MetricType.COUNTER:
-            first_point = recent_points[0]
-            last_point = recent_points[-1]
-            time_diff = (last_point.timestamp - first_point.timestamp).total_seconds()
+            first_slot, last_slot = self._slot(first), self._slot(last - 1)
+            time_diff = self._timestamps[last_slot] - self._timestamps[first_slot]
             
             if time_diff > 0:
-                return (last_point.value - first_point.value) / time_diff
+                return (self._values[last_slot] - self._values[first_slot]) / time_diff
         
         # For other types, calculate average rate
         elif self.metric_type in [MetricType.GAUGE, MetricType.TIMER]:
-            return len(recent_points) / window.total_seconds()
+            return (last - first) / window.total_seconds()
         
         return 0.0
 
 
+# Rollup resolutions kept in metric_aggregates, finest first
+ROLLUP_PERIODS: Tuple[Tuple[str, timedelta], ...] = (
+    ('1m', timedelta(minutes=1)),
+    ('1h', timedelta(hours=1)),
+    ('1d', timedelta(days=1)),
+)
+
+
+def truncate_to_period(timestamp: datetime, period: str) -> datetime:
+    """Get the start of the rollup bucket of the given period containing timestamp"""
+    if period == '1m':
+        return timestamp.replace(second=0, microsecond=0)
+    if period == '1h':
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    if period == '1d':
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    raise ValueError(f"Unsupported rollup period: {period}")
+
+
+def select_rollup_period(step: timedelta) -> Optional[str]:
+    """Get the coarsest rollup period no longer than step, None if raw points are needed"""
+    selected = None
+    for period, duration in ROLLUP_PERIODS:
+        if duration <= step:
+            selected = period
+    return selected
+
+
+# Alert rule conditions
+ALERT_CONDITIONS: Dict[str, Callable[[float, float], bool]] = {
+    'gt': operator.gt,
+    'lt': operator.lt,
+    'eq': operator.eq,
+    'gte': operator.ge,
+    'lte': operator.le,
+}
+
+# Timer recording how long each alert evaluation cycle takes
+ALERT_EVALUATION_METRIC = "metrics_collector.alert_evaluation.duration"
+
+
+def _exact_metric_name(pattern: str) -> Optional[str]:
+    """Get the metric name an anchored literal pattern (^name$) matches, None for other patterns"""
+    if len(pattern) < 2 or not pattern.startswith('^') or not pattern.endswith('$'):
+        return None
+    body = pattern[1:-1]
+    name = re.sub(r'\\(.)', r'\1', body)
+    return name if re.escape(name) == body else None
+
+
+# Default latency histogram bucket upper bounds, in seconds
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+    10.0, 30.0, 60.0, 120.0, 300.0, 600.0
+)
+
+
+@dataclass
+class Histogram:
+    """Fixed-bucket histogram of observed values"""
+    name: str
+    buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    tags: Dict[str, str] = field(default_factory=dict)
+    counts: List[int] = field(init=False)
+    sum: float = 0.0
+    count: int = 0
+    
+    def __post_init__(self):
+        self.buckets = tuple(sorted(self.buckets))
+        # One count per bucket plus the +Inf overflow bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+    
+    def observe(self, value: Union[int, float]):
+        """Add an observation"""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def get_cumulative_counts(self) -> List[Tuple[float, int]]:
+        """Get (upper bound, observations <= bound) pairs, ending with +Inf"""
+        cumulative = []
+        running = 0
+        for bound, count in zip(list(self.buckets) + [float('inf')], self.counts):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by interpolating within its bucket"""
+        if self.count == 0:
+            return None
+        
+        rank = q * self.count
+        lower = 0.0
+        previous = 0
+        for bound, cumulative in self.get_cumulative_counts():
+            if cumulative >= rank:
+                if bound == float('inf'):
+                    return lower
+                in_bucket = cumulative - previous
+                fraction = (rank - previous) / in_bucket if in_bucket else 0.0
+                return lower + (bound - lower) * fraction
+            lower = bound
+            previous = cumulative
+        return lower
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'name': self.name,
+            'tags': self.tags,
+            'buckets': [
+                {'le': 'inf' if bound == float('inf') else bound, 'count': count}
+                for bound, count in self.get_cumulative_counts()
+            ],
+            'sum': self.sum,
+            'count': self.count,
+            'mean': self.sum / self.count if self.count else None,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99)
+        }
+
+
 class MetricsCollector:
     """
     Comprehensive metrics collection and storage system.
@@ -170,7 +549,17 @@ class MetricsCollector:
         
         # In-memory storage
         self.series: Dict[str, MetricSeries] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        # Mergeable percentile sketches for timer and histogram metrics
+        self.sketches: Dict[str, TDigest] = {}
         self.series_lock = threading.RLock()
+        # Epoch timestamp of the newest persisted point of each series
+        self.persist_watermarks: Dict[str, float] = {}
+        
+        # Rollups into metric_aggregates
+        self.rollup_interval = 60.0
+        self.rollup_lag = timedelta(minutes=5)  # How far back late points are still folded in
+        self.last_rollup_time = 0.0
         
         # Collection state
         self.is_collecting = False
@@ -187,11 +576,18 @@ class MetricsCollector:
         
         # Alert rules
         self.alert_rules: Dict[str, Dict[str, Any]] = {}
+        # Pending and firing alerts by (rule name, series name)
+        self.alert_states: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._alert_index: Optional[Dict[str, Any]] = None
+        self._alert_rule_cache: Dict[str, List[str]] = {}
+        # Series that received points since the last alert evaluation
+        self._alert_updated_series: set = set()
         
         # Statistics
         self.collection_stats = {
             'points_collected': 0,
             'points_persisted': 0,
+            'rollup_buckets_written': 0,
             'collection_errors': 0,
             'last_collection_time': None,
             'collection_duration_avg': 0.0
@@ -207,7 +603,8 @@ class MetricsCollector:
     def _init_database(self):
         """Initialize SQLite database for metric persistence"""
         try:
-            with sqlite3.connect(self.storage_path) as conn:
+            with closing(sqlite3.connect(self.storage_path)) as conn, conn:
+                conn.execute('PRAGMA journal_mode=WAL')
                 conn.execute('''
                     CREATE TABLE IF NOT EXISTS metrics (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -231,6 +628,22 @@ class MetricsCollector:
                     ON metrics(timestamp)
                 ''')
                 
+                # One row per sample; databases written before the constraint
+                # existed are deduplicated first
+                has_unique_index = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_metrics_unique'"
+                ).fetchone()
+                if not has_unique_index:
+                    conn.execute('''
+                        DELETE FROM metrics WHERE id NOT IN (
+                            SELECT MIN(id) FROM metrics GROUP BY name, timestamp, tags
+                        )
+                    ''')
+                    conn.execute('''
+                        CREATE UNIQUE INDEX idx_metrics_unique 
+                        ON metrics(name, timestamp, tags)
+                    ''')
+                
                 conn.execute('''
                     CREATE TABLE IF NOT EXISTS metric_aggregates (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -247,11 +660,30 @@ class MetricsCollector:
                     )
                 ''')
                 
+                # Columns added with the rollup task
+                aggregate_columns = {row[1] for row in conn.execute('PRAGMA table_info(metric_aggregates)')}
+                for column, column_type in (('type', 'TEXT'), ('p95_value', 'REAL'), ('sketch', 'TEXT')):
+                    if column not in aggregate_columns:
+                        conn.execute(f'ALTER TABLE metric_aggregates ADD COLUMN {column} {column_type}')
+                
                 conn.execute('''
                     CREATE INDEX IF NOT EXISTS idx_aggregates_name_period 
                     ON metric_aggregates(name, period, start_time)
                 ''')
                 
+                conn.execute('''
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_aggregates_unique 
+                    ON metric_aggregates(period, start_time, name)
+                ''')
+                
+                # Start of the earliest bucket of each period still to be recomputed
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS metric_rollup_state (
+                        period TEXT PRIMARY KEY,
+                        next_start TEXT NOT NULL
+                    )
+                ''')
+                
                 self.logger.info("Metrics database initialized")
                 
         except Exception as e:
@@ -281,6 +713,7 @@ class MetricsCollector:
             # Persist remaining metrics
             if self.enable_persistence:
                 self._persist_all_metrics()
+                self._update_rollups()
             
             self.logger.info("Metrics collection stopped")
             
@@ -308,6 +741,12 @@ class MetricsCollector:
                 if self.enable_persistence and self.collection_stats['points_collected'] % 100 == 0:
                     self._persist_all_metrics()
                 
+                # Fold persisted points into the rollups
+                if self.enable_persistence and start_time - self.last_rollup_time >= self.rollup_interval:
+                    self._persist_all_metrics()
+                    self._update_rollups()
+                    self.last_rollup_time = start_time
+                
                 # Update collection stats
                 collection_duration = time.time() - start_time
                 self.collection_stats['last_collection_time'] = datetime.now()
@@ -358,7 +797,8 @@ class MetricsCollector:
                 self.series[name] = MetricSeries(
                     name=name,
                     metric_type=metric_type,
-                    retention_period=timedelta(days=self.retention_days)
+                    retention_period=timedelta(days=self.retention_days),
+                    capacity=self.max_memory_points
                 )
             
             # Add point to series
@@ -369,6 +809,14 @@ class MetricsCollector:
                 metadata=metadata
             )
             
+            if metric_type in (MetricType.TIMER, MetricType.HISTOGRAM):
+                sketch = self.sketches.get(name)
+                if sketch is None:
+                    sketch = self.sketches[name] = TDigest()
+                sketch.add(value)
+            
+            self._alert_updated_series.add(name)
+            
             # Update stats
             self.collection_stats['points_collected'] += 1
             
@@ -411,14 +859,73 @@ class MetricsCollector:
         """Record a histogram metric"""
         self.record_metric(name, value, MetricType.HISTOGRAM, tags)
     
+    def observe_histogram(self, name: str, value: Union[int, float],
+                          tags: Optional[Dict[str, str]] = None,
+                          buckets: Optional[Sequence[float]] = None):
+        """Add an observation to a bucketed histogram and record it as a histogram point"""
+        with self.series_lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = Histogram(
+                    name=name,
+                    buckets=buckets or DEFAULT_LATENCY_BUCKETS,
+                    tags=dict(tags or {})
+                )
+                self.histograms[name] = histogram
+            histogram.observe(value)
+        
+        self.record_histogram(name, value, tags)
+    
+    def get_histogram(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a bucketed histogram by name"""
+        with self.series_lock:
+            histogram = self.histograms.get(name)
+            return histogram.to_dict() if histogram else None
+    
+    def get_histograms(self, pattern: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Get all bucketed histograms, optionally filtered by name pattern"""
+        with self.series_lock:
+            histograms = dict(self.histograms)
+        
+        if pattern:
+            import re
+            regex = re.compile(pattern)
+            histograms = {name: h for name, h in histograms.items() if regex.search(name)}
+        
+        return {name: histogram.to_dict() for name, histogram in sorted(histograms.items())}
+    
+    def get_quantiles(self, name: str,
+                      quantiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Optional[float]]:
+        """Get percentiles of a timer or histogram metric over all recorded values"""
+        with self.series_lock:
+            sketch = self.sketches.get(name)
+            return sketch.percentiles(quantiles) if sketch else {}
+    
+    def get_sketch(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get the serialized percentile sketch of a metric"""
+        with self.series_lock:
+            sketch = self.sketches.get(name)
+            return sketch.to_dict() if sketch else None
+    
+    def merge_sketch(self, name: str, sketch: Union[TDigest, Dict[str, Any]]):
+        """Merge a percentile sketch from another collector or shard into a metric"""
+        if isinstance(sketch, dict):
+            sketch = TDigest.from_dict(sketch)
+        
+        with self.series_lock:
+            existing = self.sketches.get(name)
+            if existing is None:
+                existing = self.sketches[name] = TDigest(sketch.compression)
+            existing.merge(sketch)
+    
     def increment_counter(self, name: str, increment: Union[int, float] = 1,
                          tags: Optional[Dict[str, str]] = None):
         """Increment a counter metric"""
         with self.series_lock:
             if name in self.series and self.series[name].metric_type == MetricType.COUNTER:
-                latest = self.series[name].get_latest()
-                if latest:
-                    new_value = latest.value + increment
+                latest = self.series[name].get_latest_value()
+                if latest is not None:
+                    new_value = latest + increment
                 else:
                     new_value = increment
             else:
@@ -434,10 +941,7 @@ class MetricsCollector:
     def get_latest_value(self, name: str) -> Optional[Union[int, float]]:
         """Get latest value for a metric"""
         series = self.get_series(name)
-        if series:
-            latest = series.get_latest()
-            return latest.value if latest else None
-        return None
+        return series.get_latest_value() if series else None
     
     def get_statistics(self, name: str, window: Optional[timedelta] = None) -> Dict[str, float]:
         """Get statistics for a metric series"""
@@ -474,10 +978,12 @@ class MetricsCollector:
                     'type': series.metric_type.value,
                     'latest_value': latest.value if latest else None,
                     'latest_timestamp': latest.timestamp.isoformat() if latest else None,
-                    'point_count': len(series.points),
+                    'point_count': len(series),
                     'statistics': stats,
                     'tags': series.tags
                 }
+                if name in self.sketches:
+                    summary[name]['quantiles'] = self.sketches[name].percentiles()
             
             return summary
     
@@ -520,9 +1026,7 @@ class MetricsCollector:
                 values = []
                 
                 for series_name in matching_series:
-                    series = self.series[series_name]
-                    recent_points = [p for p in series.points if p.timestamp > window_start]
-                    values.extend([p.value for p in recent_points])
+                    values.extend(self.series[series_name].get_values(window_start, after_start=True))
                 
                 if not values:
                     continue
@@ -553,122 +1057,392 @@ class MetricsCollector:
     
     def add_alert_rule(self, name: str, metric_pattern: str, 
                       condition: str, threshold: float, 
-                      callback: Optional[Callable] = None):
-        """Add metric alert rule"""
+                      callback: Optional[Callable] = None,
+                      for_duration: Optional[timedelta] = None,
+                      clear_threshold: Optional[float] = None):
+        """
+        Add metric alert rule.
+        
+        An alert fires once a matching series' latest value has met the
+        condition for for_duration, and resolves once the value no longer
+        meets it against clear_threshold (threshold by default), so a value
+        hovering around the threshold does not fire on every cycle.
+        Anchored literal patterns (^name$) are looked up by exact name;
+        other patterns are searched in series names.
+        """
         self.alert_rules[name] = {
             'metric_pattern': metric_pattern,
             'condition': condition,  # gt, lt, eq, gte, lte
             'threshold': threshold,
+            'clear_threshold': threshold if clear_threshold is None else clear_threshold,
+            'for_duration': for_duration or timedelta(0),
             'callback': callback,
             'last_triggered': None,
             'trigger_count': 0
         }
+        self._alert_index = None
+        self._alert_rule_cache = {}
         self.logger.info(f"Added alert rule: {name}")
     
-    def _check_alerts(self):
-        """Check alert rules"""
+    def _build_alert_index(self) -> Dict[str, Any]:
+        """
+        Compile the alert rules once for matching series names.
+        
+        Returns:
+            Exact metric name -> rule names, the compiled wildcard rules and
+            a combined regex any of the wildcard rules without groups must
+            match for a name to be checked against them one by one
+        """
+        exact: Dict[str, List[str]] = defaultdict(list)
+        wildcard: List[Tuple[str, re.Pattern]] = []
+        combinable: List[str] = []
+        
         for rule_name, rule in self.alert_rules.items():
+            pattern = rule['metric_pattern']
+            exact_name = _exact_metric_name(pattern)
+            if exact_name is not None:
+                exact[exact_name].append(rule_name)
+                continue
             try:
-                # Find matching metrics
-                import re
-                pattern = re.compile(rule['metric_pattern'])
-                matching_series = [name for name in self.series.keys() if pattern.search(name)]
-                
-                for series_name in matching_series:
-                    latest_value = self.get_latest_value(series_name)
-                    if latest_value is None:
-                        continue
-                    
-                    # Check condition
-                    condition = rule['condition']
-                    threshold = rule['threshold']
-                    triggered = False
-                    
-                    if condition == 'gt' and latest_value > threshold:
-                        triggered = True
-                    elif condition == 'lt' and latest_value < threshold:
-                        triggered = True
-                    elif condition == 'eq' and latest_value == threshold:
-                        triggered = True
-                    elif condition == 'gte' and latest_value >= threshold:
-                        triggered = True
-                    elif condition == 'lte' and latest_value <= threshold:
-                        triggered = True
-                    
-                    if triggered:
-                        alert_data = {
-                            'rule_name': rule_name,
-                            'metric_name': series_name,
-                            'value': latest_value,
-                            'threshold': threshold,
-                            'condition': condition,
-                            'timestamp': datetime.now().isoformat()
-                        }
-                        
-                        # Update rule stats
-                        rule['last_triggered'] = datetime.now()
-                        rule['trigger_count'] += 1
-                        
-                        # Call callback if provided
-                        if rule['callback']:
-                            try:
-                                rule['callback'](alert_data)
-                            except Exception as e:
-                                self.logger.error(f"Error in alert callback: {e}")
-                        
-                        # Trigger event
-                        self._trigger_event('alert_triggered', alert_data)
-                        
-                        self.logger.warning(f"Alert triggered: {rule_name} - {series_name} = {latest_value}")
-                        
+                compiled = re.compile(pattern)
+            except re.error as e:
+                self.logger.error(f"Invalid pattern in alert rule {rule_name}: {e}")
+                continue
+            wildcard.append((rule_name, compiled))
+            # Group numbers would shift inside a combined pattern
+            if not compiled.groups:
+                combinable.append(pattern)
+        
+        prefilter = None
+        if combinable:
+            try:
+                prefilter = re.compile('|'.join(f'(?:{pattern})' for pattern in combinable))
+            except re.error:
+                prefilter = None
+        
+        return {
+            'exact': dict(exact),
+            'wildcard': wildcard,
+            'prefilter': prefilter,
+            'unfiltered': [(rule_name, compiled) for rule_name, compiled in wildcard if compiled.groups]
+        }
+    
+    def _get_alert_rules_for(self, series_name: str) -> List[str]:
+        """Get the names of the alert rules matching a series, cached per series"""
+        rule_names = self._alert_rule_cache.get(series_name)
+        if rule_names is None:
+            if self._alert_index is None:
+                self._alert_index = self._build_alert_index()
+            index = self._alert_index
+            
+            matched = set(index['exact'].get(series_name, ()))
+            prefilter = index['prefilter']
+            candidates = index['wildcard'] if prefilter is None or prefilter.search(series_name) \
+                else index['unfiltered']
+            matched.update(rule_name for rule_name, compiled in candidates if compiled.search(series_name))
+            
+            rule_names = [rule_name for rule_name in self.alert_rules if rule_name in matched]
+            self._alert_rule_cache[series_name] = rule_names
+        return rule_names
+    
+    def _check_alerts(self, now: Optional[datetime] = None):
+        """
+        Check alert rules.
+        
+        Only series that received points since the last check, and series
+        with a pending or firing alert, are evaluated. The time taken is
+        recorded as a timer metric of its own.
+        """
+        if not self.alert_rules:
+            self._alert_updated_series = set()
+            return
+        
+        started = time.perf_counter()
+        now = now or datetime.now()
+        
+        with self.series_lock:
+            updated, self._alert_updated_series = self._alert_updated_series, set()
+        updated.update(series_name for _, series_name in self.alert_states)
+        
+        for series_name in updated:
+            for rule_name in self._get_alert_rules_for(series_name):
+                try:
+                    self._evaluate_alert(rule_name, series_name, now)
+                except Exception as e:
+                    self.logger.error(f"Error checking alert rule {rule_name}: {e}")
+        
+        self.record_timer(ALERT_EVALUATION_METRIC, time.perf_counter() - started)
+    
+    def _evaluate_alert(self, rule_name: str, series_name: str, now: datetime):
+        """Move the alert of one rule and series between pending, firing and resolved"""
+        latest_value = self.get_latest_value(series_name)
+        if latest_value is None:
+            return
+        
+        rule = self.alert_rules[rule_name]
+        compare = ALERT_CONDITIONS.get(rule['condition'])
+        if compare is None:
+            return
+        
+        key = (rule_name, series_name)
+        state = self.alert_states.get(key)
+        
+        if state and state['status'] == 'firing':
+            if not compare(latest_value, rule['clear_threshold']):
+                del self.alert_states[key]
+                self._trigger_event('alert_resolved', {
+                    'rule_name': rule_name,
+                    'metric_name': series_name,
+                    'value': latest_value,
+                    'clear_threshold': rule['clear_threshold'],
+                    'condition': rule['condition'],
+                    'fired_at': state['fired_at'].isoformat(),
+                    'timestamp': now.isoformat()
+                })
+                self.logger.info(f"Alert resolved: {rule_name} - {series_name} = {latest_value}")
+            return
+        
+        if not compare(latest_value, rule['threshold']):
+            self.alert_states.pop(key, None)
+            return
+        
+        if state is None:
+            state = self.alert_states[key] = {'status': 'pending', 'since': now}
+        if now - state['since'] < rule['for_duration']:
+            return
+        
+        state['status'] = 'firing'
+        state['fired_at'] = now
+        
+        alert_data = {
+            'rule_name': rule_name,
+            'metric_name': series_name,
+            'value': latest_value,
+            'threshold': rule['threshold'],
+            'condition': rule['condition'],
+            'pending_since': state['since'].isoformat(),
+            'timestamp': now.isoformat()
+        }
+        
+        # Update rule stats
+        rule['last_triggered'] = now
+        rule['trigger_count'] += 1
+        
+        # Call callback if provided
+        if rule['callback']:
+            try:
+                rule['callback'](alert_data)
             except Exception as e:
-                self.logger.error(f"Error checking alert rule {rule_name}: {e}")
+                self.logger.error(f"Error in alert callback: {e}")
+        
+        # Trigger event
+        self._trigger_event('alert_triggered', alert_data)
+        
+        self.logger.warning(f"Alert triggered: {rule_name} - {series_name} = {latest_value}")
+    
+    def get_active_alerts(self) -> List[Dict[str, Any]]:
+        """Get the firing alerts"""
+        return [
+            {
+                'rule_name': rule_name,
+                'metric_name': series_name,
+                'fired_at': state['fired_at'].isoformat()
+            }
+            for (rule_name, series_name), state in self.alert_states.items()
+            if state['status'] == 'firing'
+        ]
     
     def _persist_all_metrics(self):
-        """Persist all metrics to database"""
+        """
+        Persist the points recorded since the last persistence cycle.
+        
+        Each series keeps a watermark at the timestamp of its newest persisted
+        point, so a cycle writes only later points, in one executemany and one
+        transaction. Points at the watermark itself are written again and
+        skipped by the unique (name, timestamp, tags) index, which also keeps
+        a cycle that is retried after a failure from duplicating rows. A point
+        that arrived out of order behind the watermark moves the start of the
+        cycle back to it.
+        """
         if not self.enable_persistence:
             return
         
+        points_to_persist = []
+        watermarks: Dict[str, float] = {}
+        late: Dict[str, float] = {}
+        
+        with self.series_lock:
+            for name, series in self.series.items():
+                since = self.persist_watermarks.get(name)
+                if since is not None and series.late_since is not None:
+                    late[name] = series.late_since
+                    since = min(since, series.late_since)
+                rows = series.get_rows(since=since)
+                if not rows:
+                    continue
+                
+                metric_type = series.metric_type.value
+                label_json: Dict[int, str] = {}
+                for timestamp, value, label_id, metadata in rows:
+                    tags = label_json.get(label_id)
+                    if tags is None:
+                        tags = label_json[label_id] = json.dumps(series.get_labels(label_id), sort_keys=True)
+                    points_to_persist.append((
+                        name,
+                        value,
+                        metric_type,
+                        datetime.fromtimestamp(timestamp).isoformat(),
+                        tags,
+                        json.dumps(metadata or {})
+                    ))
+                watermarks[name] = rows[-1][0]
+        
+        if not points_to_persist:
+            return
+        
         try:
-            with sqlite3.connect(self.storage_path) as conn:
-                points_to_persist = []
-                
-                with self.series_lock:
-                    for series in self.series.values():
-                        for point in series.points:
-                            points_to_persist.append((
-                                point.name,
-                                point.value,
-                                point.metric_type.value,
-                                point.timestamp.isoformat(),
-                                json.dumps(point.tags),
-                                json.dumps(point.metadata)
-                            ))
-                
-                if points_to_persist:
-                    conn.executemany('''
-                        INSERT OR REPLACE INTO metrics 
-                        (name, value, type, timestamp, tags, metadata)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', points_to_persist)
-                    
-                    self.collection_stats['points_persisted'] += len(points_to_persist)
+            with closing(sqlite3.connect(self.storage_path)) as conn, conn:
+                changes = conn.total_changes
+                conn.executemany('''
+                    INSERT OR IGNORE INTO metrics 
+                    (name, value, type, timestamp, tags, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', points_to_persist)
+                inserted = conn.total_changes - changes
+                
+                # Clean up old data
+                cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+                conn.execute('DELETE FROM metrics WHERE timestamp < ?', (cutoff,))
+            
+            self.persist_watermarks.update(watermarks)
+            with self.series_lock:
+                for name, late_since in late.items():
+                    series = self.series.get(name)
+                    if series is not None and series.late_since == late_since:
+                        series.late_since = None
+            self.collection_stats['points_persisted'] += inserted
+            self.logger.debug(f"Persisted {inserted} metric points")
                     
-                    # Clean up old data
-                    cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat()
-                    conn.execute('DELETE FROM metrics WHERE timestamp < ?', (cutoff,))
+        except Exception as e:
+            self.logger.error(f"Error persisting metrics: {e}")
+    
+    def _update_rollups(self) -> int:
+        """
+        Fold persisted points into the 1m, 1h and 1d rollups in metric_aggregates.
+        
+        1-minute buckets are built from raw points, 1-hour buckets from the
+        1-minute rows and 1-day buckets from the 1-hour rows. Each bucket
+        stores its t-digest so the p95 of a coarser bucket is merged from the
+        finer ones rather than recomputed. A pass recomputes only the buckets
+        from each period's watermark in metric_rollup_state on, which is then
+        moved to the bucket open rollup_lag ago so late points are included.
+        1-minute rows are kept as long as raw points; coarser rows outlive them.
+        
+        Returns:
+            Number of buckets written
+        """
+        if not self.enable_persistence:
+            return 0
+        
+        now = datetime.now()
+        written = 0
+        
+        try:
+            with closing(sqlite3.connect(self.storage_path)) as conn, conn:
+                watermarks = dict(conn.execute('SELECT period, next_start FROM metric_rollup_state'))
+                source_period = None
+                
+                for period, duration in ROLLUP_PERIODS:
+                    since = watermarks.get(period)
+                    buckets = self._compute_rollup_buckets(conn, period, source_period, since)
                     
-                    self.logger.debug(f"Persisted {len(points_to_persist)} metric points")
+                    conn.executemany('''
+                        INSERT OR REPLACE INTO metric_aggregates 
+                        (name, period, start_time, end_time, type, count, min_value, max_value, 
+                         avg_value, sum_value, p95_value, sketch)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', [
+                        (name, period, start.isoformat(), (start + duration).isoformat(), metric_type,
+                         int(digest.count), digest.min, digest.max, digest.mean, digest.sum,
+                         digest.quantile(0.95), json.dumps(digest.to_dict()))
+                        for (name, start), (metric_type, digest) in buckets.items()
+                    ])
+                    written += len(buckets)
                     
+                    next_start = truncate_to_period(now - self.rollup_lag, period).isoformat()
+                    if since is None or next_start > since:
+                        conn.execute(
+                            'INSERT OR REPLACE INTO metric_rollup_state (period, next_start) VALUES (?, ?)',
+                            (period, next_start)
+                        )
+                    source_period = period
+                
+                cutoff = (now - timedelta(days=self.retention_days)).isoformat()
+                conn.execute("DELETE FROM metric_aggregates WHERE period = '1m' AND start_time < ?", (cutoff,))
+            
+            self.collection_stats['rollup_buckets_written'] += written
+            self.logger.debug(f"Updated {written} metric rollup buckets")
+            return written
+            
         except Exception as e:
-            self.logger.error(f"Error persisting metrics: {e}")
+            self.logger.error(f"Error updating metric rollups: {e}")
+            return 0
+    
+    def _compute_rollup_buckets(self, conn: sqlite3.Connection, period: str, source_period: Optional[str],
+                                since: Optional[str]) -> Dict[Tuple[str, datetime], Tuple[str, TDigest]]:
+        """
+        Aggregate raw points, or the rows of the next finer period, into buckets.
+        
+        Returns:
+            (name, bucket start) -> (metric type, digest of the bucket's values)
+        """
+        buckets: Dict[Tuple[str, datetime], Tuple[str, TDigest]] = {}
+        
+        if source_period is None:
+            sql = 'SELECT name, type, timestamp, value FROM metrics'
+            params: List[Any] = []
+            if since:
+                sql += ' WHERE timestamp >= ?'
+                params.append(since)
+        else:
+            sql = 'SELECT name, type, start_time, sketch FROM metric_aggregates WHERE period = ?'
+            params = [source_period]
+            if since:
+                sql += ' AND start_time >= ?'
+                params.append(since)
+        
+        for name, metric_type, timestamp, value in conn.execute(sql, params):
+            key = (name, truncate_to_period(datetime.fromisoformat(timestamp), period))
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = (metric_type, TDigest())
+            
+            if source_period is None:
+                bucket[1].add(value)
+            elif value:
+                bucket[1].merge(TDigest.from_dict(json.loads(value)))
+        
+        return buckets
     
     def query_metrics(self, name_pattern: str, start_time: datetime, 
-                     end_time: datetime, limit: int = 1000) -> List[MetricPoint]:
-        """Query metrics from database"""
+                     end_time: datetime, limit: int = 1000,
+                     step: Optional[timedelta] = None) -> List[MetricPoint]:
+        """
+        Query metrics from database.
+        
+        Without step, raw points are returned. With step, the coarsest rollup
+        period no longer than step is read instead (raw points when step is
+        under a minute), one point per bucket: the value is the bucket's
+        average, the timestamp its start, and the metadata holds the period,
+        count, min, max, sum and p95.
+        """
         if not self.enable_persistence:
             return []
         
+        period = select_rollup_period(step) if step else None
+        if period:
+            return self._query_rollups(name_pattern, period, start_time, end_time, limit)
+        
         try:
             with sqlite3.connect(self.storage_path) as conn:
                 cursor = conn.execute('''
@@ -697,6 +1471,42 @@ class MetricsCollector:
             self.logger.error(f"Error querying metrics: {e}")
             return []
     
+    def _query_rollups(self, name_pattern: str, period: str, start_time: datetime,
+                       end_time: datetime, limit: int) -> List[MetricPoint]:
+        """Query the rollup buckets of a period starting within a time range"""
+        try:
+            with closing(sqlite3.connect(self.storage_path)) as conn:
+                cursor = conn.execute('''
+                    SELECT name, type, start_time, count, min_value, max_value, avg_value, sum_value, p95_value
+                    FROM metric_aggregates
+                    WHERE period = ? AND start_time BETWEEN ? AND ? AND name LIKE ?
+                    ORDER BY start_time DESC
+                    LIMIT ?
+                ''', (period, truncate_to_period(start_time, period).isoformat(), end_time.isoformat(),
+                      name_pattern, limit))
+                
+                return [
+                    MetricPoint(
+                        name=row[0],
+                        value=row[6],
+                        metric_type=MetricType(row[1]),
+                        timestamp=datetime.fromisoformat(row[2]),
+                        metadata={
+                            'period': period,
+                            'count': row[3],
+                            'min': row[4],
+                            'max': row[5],
+                            'sum': row[7],
+                            'p95': row[8]
+                        }
+                    )
+                    for row in cursor.fetchall()
+                ]
+                
+        except Exception as e:
+            self.logger.error(f"Error querying metric rollups: {e}")
+            return []
+    
     def export_metrics(self, format: str = 'json', 
                       start_time: Optional[datetime] = None,
                       end_time: Optional[datetime] = None) -> str:
@@ -705,7 +1515,9 @@ class MetricsCollector:
             export_data = {
                 'export_timestamp': datetime.now().isoformat(),
                 'collection_stats': self.collection_stats,
-                'metrics_summary': self.get_metrics_summary()
+                'metrics_summary': self.get_metrics_summary(),
+                'histograms': self.get_histograms(),
+                'sketches': {name: self.get_sketch(name) for name in sorted(self.sketches)}
             }
             
             if start_time and end_time:
@@ -727,9 +1539,12 @@ class MetricsCollector:
             'is_collecting': self.is_collecting,
             'collection_interval': self.collection_interval,
             'series_count': len(self.series),
+            'histogram_count': len(self.histograms),
+            'sketch_count': len(self.sketches),
             'collection_sources': list(self.collection_sources.keys()),
             'aggregation_rules': len(self.aggregation_rules),
             'alert_rules': len(self.alert_rules),
+            'active_alerts': len(self.get_active_alerts()),
             'retention_days': self.retention_days
         }
     
@@ -763,6 +1578,21 @@ class MetricsCollector:
         self.logger.info("Metrics collector cleanup completed")
 
 
+# Process-wide collector that agents export their timing metrics to
+_default_collector: Optional[MetricsCollector] = None
+
+
+def set_default_metrics_collector(collector: Optional[MetricsCollector]):
+    """Set the collector agents report per-attempt timings and counters to"""
+    global _default_collector
+    _default_collector = collector
+
+
+def get_default_metrics_collector() -> Optional[MetricsCollector]:
+    """Get the collector agents report to, if one has been set"""
+    return _default_collector
+
+
 # Context manager for timing operations
 class TimerContext:
     """Context manager for timing operations"""
@@ -0,0 +1,123 @@
+"""
+Sampling Profiler
+
+Lightweight stack-sampling profiler used to capture where time goes in slow
+agent attempts. A background thread periodically samples the stack of the
+target thread (normally the event loop thread) and counts identical stacks,
+producing collapsed stacks that flame graph tools can render directly.
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+
+class SamplingProfiler:
+    """
+    Samples the call stack of one thread at a fixed interval.
+
+    Sampling only reads frames, so overhead is bounded by the interval
+    regardless of how much work the profiled code does. When the target is
+    an event loop thread, samples include whatever coroutine is running at
+    the time, which may belong to other concurrently scheduled tasks.
+    """
+
+    def __init__(self,
+                 thread_id: Optional[int] = None,
+                 interval: float = 0.005,
+                 max_depth: int = 64):
+        """
+        Initialize sampling profiler.
+
+        Args:
+            thread_id: Thread to sample, defaults to the calling thread
+            interval: Seconds between samples
+            max_depth: Maximum number of frames kept per sample
+        """
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.max_depth = max_depth
+
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.logger = logging.getLogger(__name__)
+
+    def start(self):
+        """Start sampling in a background thread"""
+        if self._thread is not None:
+            return
+
+        self.started_at = time.perf_counter()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Dict[str, int]:
+        """
+        Stop sampling.
+
+        Returns:
+            Collapsed stack -> sample count
+        """
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+            self.stopped_at = time.perf_counter()
+        return dict(self.samples)
+
+    def _sample_loop(self):
+        """Sample the target thread until stopped"""
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+
+            stack: List[str] = []
+            while frame is not None and len(stack) < self.max_depth:
+                code = frame.f_code
+                stack.append(f"{Path(code.co_filename).name}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            del frame
+
+            self.samples[';'.join(reversed(stack))] += 1
+            self.sample_count += 1
+
+    def get_top_stacks(self, limit: int = 10) -> List[Dict[str, Union[str, int]]]:
+        """Get the most frequently sampled stacks"""
+        return [
+            {'stack': stack, 'samples': count}
+            for stack, count in self.samples.most_common(limit)
+        ]
+
+    def to_collapsed(self) -> str:
+        """Render samples in collapsed stack format ("frame;frame;frame count")"""
+        return '\n'.join(f"{stack} {count}" for stack, count in self.samples.most_common())
+
+    def write(self, path: Union[str, Path]) -> Path:
+        """Write collapsed stacks to a file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.to_collapsed())
+        return path
+
+    def get_summary(self) -> Dict[str, Union[int, float, None]]:
+        """Get profiler statistics"""
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = (self.stopped_at or time.perf_counter()) - self.started_at
+        return {
+            'sample_count': self.sample_count,
+            'unique_stacks': len(self.samples),
+            'interval': self.interval,
+            'elapsed': elapsed
+        }
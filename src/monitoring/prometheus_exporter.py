@@ -0,0 +1,263 @@
+"""
+Prometheus Exporter
+
+Renders the in-memory metrics of a MetricsCollector and an AgentMonitor in
+the Prometheus text exposition format. Each series, histogram and the agent
+block is encoded once and kept as bytes with the version it was built from,
+so a scrape re-encodes only what changed since the previous scrape, returns
+the previous output as-is when nothing did, and never reads the database.
+"""
+
+import math
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .metrics_collector import Histogram, MetricSeries, MetricType, MetricsCollector, get_default_metrics_collector
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+PROMETHEUS_TYPES = {
+    MetricType.COUNTER: 'counter',
+    MetricType.GAUGE: 'gauge',
+    MetricType.TIMER: 'gauge',
+    MetricType.HISTOGRAM: 'gauge',
+    MetricType.RATE: 'gauge',
+}
+
+_INVALID_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_:]')
+_INVALID_LABEL_CHARS = re.compile(r'[^a-zA-Z0-9_]')
+
+
+def metric_name(name: str) -> str:
+    """Turn a metric name into a valid Prometheus metric name"""
+    name = _INVALID_NAME_CHARS.sub('_', name)
+    return f'_{name}' if not name or name[0].isdigit() else name
+
+
+def format_value(value: float) -> str:
+    """Format a sample value"""
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def format_labels(labels: Dict[str, Any]) -> str:
+    """Format a label set as {name="value",...}, empty without labels"""
+    if not labels:
+        return ''
+    pairs = []
+    for key, value in sorted(labels.items()):
+        key = _INVALID_LABEL_CHARS.sub('_', str(key))
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{key}="{value}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+def series_samples(series: MetricSeries) -> Dict[str, Tuple[float, str]]:
+    """Get the (timestamp, sample line) of the latest point of each label set, keyed by formatted labels"""
+    name = metric_name(series.name)
+    samples: Dict[str, Tuple[float, str]] = {}
+    for label_id, (timestamp, value) in series.get_latest_by_labels().items():
+        labels = format_labels(series.get_labels(label_id))
+        # Label sets that only differ in invalid label characters keep the later point
+        if labels not in samples or timestamp >= samples[labels][0]:
+            samples[labels] = (timestamp, f'{name}{labels} {format_value(value)}')
+    return samples
+
+
+def encode_family(name: str, metric_type: MetricType, samples: Dict[str, Tuple[float, str]]) -> bytes:
+    """Encode a metric family from its samples, empty without samples"""
+    if not samples:
+        return b''
+    lines = [f'# TYPE {name} {PROMETHEUS_TYPES.get(metric_type, "gauge")}']
+    lines.extend(samples[labels][1] for labels in sorted(samples))
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def encode_series(series: MetricSeries) -> bytes:
+    """Encode the latest value of each label set of a series, empty for a series without points"""
+    return encode_family(metric_name(series.name), series.metric_type, series_samples(series))
+
+
+def encode_histogram(histogram: Histogram) -> bytes:
+    """Encode a bucketed histogram with its _bucket, _sum and _count samples"""
+    name = metric_name(histogram.name)
+    lines = [f'# TYPE {name} histogram']
+    for bound, count in histogram.get_cumulative_counts():
+        labels = format_labels({**histogram.tags, 'le': format_value(bound)})
+        lines.append(f'{name}_bucket{labels} {count}')
+    labels = format_labels(histogram.tags)
+    lines.append(f'{name}_sum{labels} {format_value(histogram.sum)}')
+    lines.append(f'{name}_count{labels} {histogram.count}')
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+# Agent monitor metrics: (name, type, AgentMetrics attribute)
+AGENT_METRICS: Tuple[Tuple[str, str, str], ...] = (
+    ('agent_executions_total', 'counter', 'total_executions'),
+    ('agent_successful_executions_total', 'counter', 'successful_executions'),
+    ('agent_failed_executions_total', 'counter', 'failed_executions'),
+    ('agent_cancelled_executions_total', 'counter', 'cancelled_executions'),
+    ('agent_errors_total', 'counter', 'error_count'),
+    ('agent_execution_time_seconds_total', 'counter', 'total_execution_time'),
+    ('agent_average_execution_time_seconds', 'gauge', 'average_execution_time'),
+    ('agent_health_score', 'gauge', 'health_score'),
+    ('agent_healthy', 'gauge', 'is_healthy'),
+)
+
+
+def agent_snapshot(agent_metrics: Dict[str, Any]) -> Tuple[Tuple[Any, ...], ...]:
+    """Values exported for each agent, compared between scrapes to detect changes"""
+    snapshot = []
+    for agent_name, metrics in agent_metrics.items():
+        values = [float(getattr(metrics, attribute)) for _, _, attribute in AGENT_METRICS]
+        cpu = metrics.cpu_usage_history[-1] if metrics.cpu_usage_history else None
+        memory = metrics.memory_usage_history[-1] if metrics.memory_usage_history else None
+        snapshot.append((agent_name, metrics.current_status, *values, cpu, memory))
+    return tuple(snapshot)
+
+
+def encode_agents(snapshot: Iterable[Tuple[Any, ...]]) -> bytes:
+    """Encode agent counters and gauges, one family per metric with an agent label"""
+    snapshot = list(snapshot)
+    if not snapshot:
+        return b''
+
+    families: List[Tuple[str, str, int]] = [
+        (name, metric_type, index + 2) for index, (name, metric_type, _) in enumerate(AGENT_METRICS)
+    ]
+    families.append(('agent_cpu_percent', 'gauge', len(AGENT_METRICS) + 2))
+    families.append(('agent_memory_mb', 'gauge', len(AGENT_METRICS) + 3))
+
+    lines = []
+    for name, metric_type, index in families:
+        samples = [
+            f'{name}{format_labels({"agent": row[0]})} {format_value(row[index])}'
+            for row in snapshot if row[index] is not None
+        ]
+        if samples:
+            lines.append(f'# TYPE {name} {metric_type}')
+            lines.extend(samples)
+
+    lines.append('# TYPE agent_status gauge')
+    lines.extend(
+        f'agent_status{format_labels({"agent": row[0], "status": row[1]})} 1' for row in snapshot
+    )
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+class PrometheusExporter:
+    """
+    Prometheus text exposition of in-memory metrics.
+
+    Series are versioned by the number of points added to them and
+    histograms by their observation count; the collector's total of
+    recorded points tells whether anything changed at all since the
+    previous scrape. Series whose names are the same once made valid
+    Prometheus names are exported as one family.
+    """
+
+    def __init__(self, collector: Optional[MetricsCollector] = None, agent_monitor: Optional[Any] = None):
+        """
+        Initialize exporter.
+
+        Args:
+            collector: Metrics collector, defaults to the process-wide default collector
+            agent_monitor: Agent monitor whose per-agent metrics are exported
+        """
+        self.collector = collector
+        self.agent_monitor = agent_monitor
+
+        # Series name -> (version, encoded series, family name, samples)
+        self._series_chunks: Dict[str, Tuple[int, bytes, str, Dict[str, Tuple[float, str]]]] = {}
+        self._histogram_chunks: Dict[str, Tuple[int, bytes]] = {}
+        self._collector_key: Optional[Tuple[int, int]] = None
+        self._collector_body = b''
+        self._agent_snapshot: Optional[Tuple[Tuple[Any, ...], ...]] = None
+        self._agent_body = b''
+        self._body = b''
+        self._lock = threading.Lock()
+
+    def render(self) -> bytes:
+        """Get the current metrics in the Prometheus text format"""
+        with self._lock:
+            collector_body = self._render_collector()
+            agent_body = self._render_agents()
+            if collector_body is not self._collector_body or agent_body is not self._agent_body \
+                    or not self._body:
+                self._collector_body = collector_body
+                self._agent_body = agent_body
+                self._body = collector_body + agent_body
+            return self._body
+
+    def _render_collector(self) -> bytes:
+        """Encode the collector's series and histograms, reusing unchanged chunks"""
+        collector = self.collector or get_default_metrics_collector()
+        if collector is None:
+            return b''
+
+        with collector.series_lock:
+            key = (id(collector), collector.collection_stats['points_collected'])
+            if key == self._collector_key:
+                return self._collector_body
+
+            histograms = collector.histograms
+            histogram_families = {metric_name(name) for name in histograms}
+            families: Dict[str, List[Tuple[MetricSeries, Tuple[Any, ...]]]] = {}
+            for name, series in collector.series.items():
+                # Histograms are exported with their buckets instead
+                if name in histograms:
+                    continue
+                cached = self._series_chunks.get(name)
+                if cached is None or cached[0] != series.version:
+                    samples = series_samples(series)
+                    family = metric_name(name)
+                    cached = self._series_chunks[name] = (
+                        series.version, encode_family(family, series.metric_type, samples), family, samples
+                    )
+                # As are series that would join a histogram's family
+                if cached[2] not in histogram_families:
+                    families.setdefault(cached[2], []).append((series, cached))
+
+            chunks = []
+            for family, members in families.items():
+                if len(members) == 1:
+                    chunks.append(members[0][1][1])
+                    continue
+                # Series colliding on the family name: latest sample of each label set
+                samples: Dict[str, Tuple[float, str]] = {}
+                for _, (_, _, _, member_samples) in members:
+                    for labels, sample in member_samples.items():
+                        if labels not in samples or sample[0] >= samples[labels][0]:
+                            samples[labels] = sample
+                chunks.append(encode_family(family, members[0][0].metric_type, samples))
+
+            for name, histogram in histograms.items():
+                cached = self._histogram_chunks.get(name)
+                if cached is None or cached[0] != histogram.count:
+                    cached = self._histogram_chunks[name] = (histogram.count, encode_histogram(histogram))
+                chunks.append(cached[1])
+
+            # Drop chunks of series that no longer exist
+            if len(self._series_chunks) > len(collector.series):
+                self._series_chunks = {
+                    name: chunk for name, chunk in self._series_chunks.items() if name in collector.series
+                }
+
+            self._collector_key = key
+            return b''.join(chunks)
+
+    def _render_agents(self) -> bytes:
+        """Encode the agent monitor's metrics when they changed"""
+        if self.agent_monitor is None:
+            return b''
+
+        snapshot = agent_snapshot(dict(self.agent_monitor.agent_metrics))
+        if snapshot == self._agent_snapshot:
+            return self._agent_body
+        self._agent_snapshot = snapshot
+        return encode_agents(snapshot)
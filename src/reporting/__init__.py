@@ -59,6 +59,11 @@ from .report_generator import (
     ReportOutputFormat
 )
 
+from .columnar_results import ColumnarTestResults
+from .report_index import ReportIndex, search_reports
+from .report_writer import write_json
+from .template_engine import get_template_environment, render_template
+
 from .analytics_engine import (
     AnalyticsEngine,
     TrendAnalysis,
@@ -132,6 +137,12 @@ __all__ = [
     'ReportGenerationResult',
     'ReportGenerationMode',
     'ReportOutputFormat',
+    'ColumnarTestResults',
+    'ReportIndex',
+    'search_reports',
+    'write_json',
+    'get_template_environment',
+    'render_template',
     
     # Analytics and insights
     'AnalyticsEngine',
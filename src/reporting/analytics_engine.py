@@ -14,6 +14,18 @@ from dataclasses import dataclass, field
 from enum import Enum
 import math
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    from ..analytics.quantile_sketch import TDigest
+except ImportError:  # reporting imported as a top-level package with src/ on sys.path
+    from analytics.quantile_sketch import TDigest
+
 
 class AnalyticsType(Enum):
     """Types of analytics"""
@@ -67,6 +79,8 @@ class PerformanceMetrics:
     performance_score: float
     bottlenecks: List[str] = field(default_factory=list)
     recommendations: List[str] = field(default_factory=list)
+    p99_execution_time: float = 0.0
+    execution_time_digest: Dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
@@ -126,6 +140,37 @@ class AnalyticsResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class RegressionFit:
+    """Least-squares line fitted to a metric series against its sample index"""
+    n: int
+    slope: float
+    intercept: float
+    mean: float
+    ss_xx: float   # Sum of squared index deviations, 0 for a single point
+    ss_tot: float  # Total sum of squares of the values
+    ss_res: float  # Residual sum of squares of the fit
+    
+    @property
+    def r_squared(self) -> float:
+        """Coefficient of determination, clamped to [0, 1]"""
+        if self.ss_tot == 0:
+            return 1.0
+        return max(0.0, min(1.0, 1 - self.ss_res / self.ss_tot))
+    
+    @property
+    def prediction(self) -> float:
+        """Value predicted for the next sample index"""
+        return self.slope * self.n + self.intercept
+    
+    @property
+    def coefficient_of_variation(self) -> float:
+        """Sample standard deviation relative to the mean, 0 for a zero mean"""
+        if self.n < 2 or self.mean == 0:
+            return 0.0
+        return math.sqrt(self.ss_tot / (self.n - 1)) / self.mean
+
+
 class AnalyticsEngine:
     """
     Advanced analytics engine for test results analysis
@@ -147,29 +192,32 @@ class AnalyticsEngine:
         """
         trends = []
         
+        # Extract every metric in one pass and fit all regressions together
+        series = self._extract_metric_series(historical_data, metrics)
+        fits = self._fit_regressions({
+            metric: values for metric, values in series.items() if len(values) >= 2
+        })
+        
         for metric in metrics:
+            fit = fits.get(metric)
+            if fit is None:
+                continue
+            
             try:
-                # Extract metric values over time
-                values = []
-                timestamps = []
-                
-                for data_point in historical_data:
-                    if metric in data_point and 'timestamp' in data_point:
-                        values.append(float(data_point[metric]))
-                        timestamps.append(data_point['timestamp'])
-                
-                if len(values) < 2:
-                    continue
+                values = series[metric]
                 
                 # Calculate trend direction and change
-                direction, change_pct = self._calculate_trend_direction(values)
-                confidence = self._calculate_trend_confidence(values)
+                direction, change_pct = self._trend_direction_from_fit(values, fit)
+                confidence = self._trend_confidence_from_fit(fit)
                 
                 # Generate insights
-                insights = self._generate_trend_insights(metric, direction, change_pct, values)
+                insights = self._generate_trend_insights(
+                    metric, direction, change_pct, values,
+                    volatility=fit.coefficient_of_variation
+                )
                 
                 # Make prediction
-                prediction = self._predict_next_value(values) if len(values) >= 3 else None
+                prediction = self._prediction_from_fit(values, fit) if len(values) >= 3 else None
                 
                 trend = TrendAnalysis(
                     metric_name=metric,
@@ -197,30 +245,29 @@ class AnalyticsEngine:
         """
         Analyze performance metrics from test results
         """
-        execution_times = []
+        digest = TDigest()
         success_count = 0
         total_count = len(test_results)
         
         for result in test_results:
             if 'execution_time' in result:
-                execution_times.append(float(result['execution_time']))
+                digest.add(float(result['execution_time']))
             
             if result.get('status') == 'passed':
                 success_count += 1
         
-        if not execution_times:
-            execution_times = [0.0]
+        if not len(digest):
+            digest.add(0.0)
         
-        # Calculate performance metrics
-        avg_time = statistics.mean(execution_times)
-        median_time = statistics.median(execution_times)
-        p95_time = self._calculate_percentile(execution_times, 95)
+        # Calculate performance metrics from the mergeable sketch
+        avg_time = digest.mean
+        percentiles = digest.percentiles()
         
         success_rate = success_count / total_count if total_count > 0 else 0
         error_rate = 1 - success_rate
         
         # Calculate throughput (tests per second)
-        total_time = sum(execution_times)
+        total_time = digest.sum
         throughput = total_count / total_time if total_time > 0 else 0
         
         # Calculate performance score (0-100)
@@ -229,7 +276,7 @@ class AnalyticsEngine:
         )
         
         # Identify bottlenecks
-        bottlenecks = self._identify_bottlenecks(test_results, execution_times)
+        bottlenecks = self._identify_bottlenecks(test_results, avg_time)
         
         # Generate recommendations
         recommendations = self._generate_performance_recommendations(
@@ -238,16 +285,35 @@ class AnalyticsEngine:
         
         return PerformanceMetrics(
             average_execution_time=avg_time,
-            median_execution_time=median_time,
-            p95_execution_time=p95_time,
+            median_execution_time=percentiles['p50'],
+            p95_execution_time=percentiles['p95'],
             throughput=throughput,
             error_rate=error_rate,
             success_rate=success_rate,
             performance_score=performance_score,
             bottlenecks=bottlenecks,
-            recommendations=recommendations
+            recommendations=recommendations,
+            p99_execution_time=percentiles['p99'],
+            execution_time_digest=digest.to_dict()
         )
     
+    def merge_performance_digests(self, digests: List[Dict[str, Any]]) -> Dict[str, float]:
+        """
+        Combine execution time percentiles across runs or shards
+        
+        Args:
+            digests: Serialized digests from PerformanceMetrics.execution_time_digest
+                or the functional report performance metrics
+        """
+        merged = TDigest.merge_all(TDigest.from_dict(digest) for digest in digests if digest)
+        if not merged.count:
+            return {}
+        
+        result = {'count': merged.count, 'average_execution_time': merged.mean}
+        for key, value in merged.percentiles().items():
+            result[f'{key}_execution_time'] = value
+        return result
+    
     def assess_risk(
         self,
         functional_results: Optional[Any] = None,
@@ -354,13 +420,12 @@ class AnalyticsEngine:
         significant_correlations = []
         
         metric_names = list(metrics_data.keys())
+        matrix = self._calculate_correlation_matrix(metrics_data)
         
-        # Calculate pairwise correlations
+        # Collect pairwise correlations
         for i, metric1 in enumerate(metric_names):
             for j, metric2 in enumerate(metric_names[i+1:], i+1):
-                correlation = self._calculate_correlation(
-                    metrics_data[metric1], metrics_data[metric2]
-                )
+                correlation = matrix[i][j]
                 
                 correlation_pairs.append((metric1, metric2, correlation))
                 
@@ -513,26 +578,112 @@ class AnalyticsEngine:
     
     # Helper methods
     
-    def _calculate_trend_direction(self, values: List[float]) -> Tuple[TrendDirection, float]:
-        """Calculate trend direction and change percentage"""
-        if len(values) < 2:
-            return TrendDirection.STABLE, 0.0
+    def _extract_metric_series(
+        self,
+        historical_data: List[Dict[str, Any]],
+        metrics: List[str]
+    ) -> Dict[str, List[float]]:
+        """Extract the values of several metrics from timestamped data points in one pass"""
+        series: Dict[str, List[float]] = {metric: [] for metric in metrics}
+        invalid = set()
+        
+        for data_point in historical_data:
+            if 'timestamp' not in data_point:
+                continue
+            for metric in metrics:
+                if metric in data_point and metric not in invalid:
+                    try:
+                        series[metric].append(float(data_point[metric]))
+                    except (ValueError, TypeError):
+                        # A metric with unparseable values is not analyzed
+                        invalid.add(metric)
         
-        # Calculate linear regression slope
-        n = len(values)
-        x = list(range(n))
+        return {metric: values for metric, values in series.items() if metric not in invalid}
+    
+    def _fit_regressions(self, series: Dict[str, List[float]]) -> Dict[str, RegressionFit]:
+        """
+        Fit a least-squares line to every series.
         
-        # Simple linear regression
-        x_mean = sum(x) / n
-        y_mean = sum(values) / n
+        With NumPy the series are packed into one NaN-padded 2-D array and all
+        fits are computed with a handful of vectorized reductions.
+        """
+        if not series:
+            return {}
         
-        numerator = sum((x[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
+        if not NUMPY_AVAILABLE:
+            return {metric: self._fit_regression_python(values) for metric, values in series.items()}
         
-        if denominator == 0:
-            return TrendDirection.STABLE, 0.0
+        names = list(series.keys())
+        lengths = np.array([len(series[name]) for name in names], dtype=float)
+        width = int(lengths.max())
+        
+        y = np.full((len(names), width), np.nan)
+        for row, name in enumerate(names):
+            y[row, :len(series[name])] = series[name]
+        mask = ~np.isnan(y)
+        
+        x = np.broadcast_to(np.arange(width, dtype=float), y.shape)
+        x_mean = (lengths - 1) / 2
+        y_mean = np.nansum(y, axis=1) / lengths
         
-        slope = numerator / denominator
+        dx = np.where(mask, x - x_mean[:, None], 0.0)
+        dy = np.where(mask, y - y_mean[:, None], 0.0)
+        
+        ss_xx = np.einsum('ij,ij->i', dx, dx)
+        ss_xy = np.einsum('ij,ij->i', dx, dy)
+        ss_tot = np.einsum('ij,ij->i', dy, dy)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = np.where(ss_xx > 0, ss_xy / ss_xx, 0.0)
+        intercept = y_mean - slope * x_mean
+        ss_res = np.maximum(ss_tot - slope * ss_xy, 0.0)
+        
+        return {
+            name: RegressionFit(
+                n=int(lengths[row]),
+                slope=float(slope[row]),
+                intercept=float(intercept[row]),
+                mean=float(y_mean[row]),
+                ss_xx=float(ss_xx[row]),
+                ss_tot=float(ss_tot[row]),
+                ss_res=float(ss_res[row])
+            )
+            for row, name in enumerate(names)
+        }
+    
+    def _fit_regression_python(self, values: List[float]) -> RegressionFit:
+        """Fit a least-squares line to one series in pure Python"""
+        n = len(values)
+        x_mean = (n - 1) / 2
+        y_mean = sum(values) / n
+        
+        ss_xx = ss_xy = ss_tot = 0.0
+        for i, value in enumerate(values):
+            dx = i - x_mean
+            dy = value - y_mean
+            ss_xx += dx * dx
+            ss_xy += dx * dy
+            ss_tot += dy * dy
+        
+        slope = ss_xy / ss_xx if ss_xx > 0 else 0.0
+        return RegressionFit(
+            n=n,
+            slope=slope,
+            intercept=y_mean - slope * x_mean,
+            mean=y_mean,
+            ss_xx=ss_xx,
+            ss_tot=ss_tot,
+            ss_res=max(ss_tot - slope * ss_xy, 0.0)
+        )
+    
+    def _trend_direction_from_fit(
+        self,
+        values: List[float],
+        fit: RegressionFit
+    ) -> Tuple[TrendDirection, float]:
+        """Derive trend direction and change percentage from a fitted line"""
+        if fit.n < 2 or fit.ss_xx == 0:
+            return TrendDirection.STABLE, 0.0
         
         # Calculate change percentage
         first_value = values[0]
@@ -540,52 +691,44 @@ class AnalyticsEngine:
         change_pct = ((last_value - first_value) / first_value * 100) if first_value != 0 else 0
         
         # Determine direction
-        if abs(slope) < 0.01:  # Very small slope
+        if abs(fit.slope) < 0.01:  # Very small slope
             return TrendDirection.STABLE, change_pct
-        elif slope > 0:
+        elif fit.slope > 0:
             return TrendDirection.IMPROVING, change_pct
         else:
             return TrendDirection.DECLINING, change_pct
     
+    def _trend_confidence_from_fit(self, fit: RegressionFit) -> float:
+        """Confidence in a trend, the R-squared of its fitted line"""
+        if fit.n < 3 or fit.ss_xx == 0:
+            return 0.5
+        return fit.r_squared
+    
+    def _prediction_from_fit(self, values: List[float], fit: RegressionFit) -> float:
+        """Predict the next value from a fitted line"""
+        if fit.ss_xx == 0:
+            return values[-1]
+        return fit.prediction
+    
+    def _calculate_trend_direction(self, values: List[float]) -> Tuple[TrendDirection, float]:
+        """Calculate trend direction and change percentage"""
+        if len(values) < 2:
+            return TrendDirection.STABLE, 0.0
+        return self._trend_direction_from_fit(values, self._fit_regression_python(values))
+    
     def _calculate_trend_confidence(self, values: List[float]) -> float:
         """Calculate confidence in trend analysis"""
         if len(values) < 3:
             return 0.5
-        
-        # Calculate R-squared for linear regression
-        n = len(values)
-        x = list(range(n))
-        
-        # Linear regression
-        x_mean = sum(x) / n
-        y_mean = sum(values) / n
-        
-        numerator = sum((x[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-        
-        if denominator == 0:
-            return 0.5
-        
-        slope = numerator / denominator
-        intercept = y_mean - slope * x_mean
-        
-        # Calculate R-squared
-        predicted = [slope * x[i] + intercept for i in range(n)]
-        ss_res = sum((values[i] - predicted[i]) ** 2 for i in range(n))
-        ss_tot = sum((values[i] - y_mean) ** 2 for i in range(n))
-        
-        if ss_tot == 0:
-            return 1.0
-        
-        r_squared = 1 - (ss_res / ss_tot)
-        return max(0.0, min(1.0, r_squared))
+        return self._trend_confidence_from_fit(self._fit_regression_python(values))
     
     def _generate_trend_insights(
         self,
         metric: str,
         direction: TrendDirection,
         change_pct: float,
-        values: List[float]
+        values: List[float],
+        volatility: Optional[float] = None
     ) -> List[str]:
         """Generate insights for trend analysis"""
         insights = []
@@ -599,7 +742,8 @@ class AnalyticsEngine:
         
         # Add volatility insight
         if len(values) > 2:
-            volatility = statistics.stdev(values) / statistics.mean(values) if statistics.mean(values) != 0 else 0
+            if volatility is None:
+                volatility = statistics.stdev(values) / statistics.mean(values) if statistics.mean(values) != 0 else 0
             if volatility > 0.2:
                 insights.append(f"{metric} shows high volatility (CV: {volatility:.2f})")
         
@@ -609,42 +753,7 @@ class AnalyticsEngine:
         """Predict next value using simple linear regression"""
         if len(values) < 2:
             return values[0] if values else 0.0
-        
-        n = len(values)
-        x = list(range(n))
-        
-        # Linear regression
-        x_mean = sum(x) / n
-        y_mean = sum(values) / n
-        
-        numerator = sum((x[i] - x_mean) * (values[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-        
-        if denominator == 0:
-            return values[-1]
-        
-        slope = numerator / denominator
-        intercept = y_mean - slope * x_mean
-        
-        # Predict next value
-        return slope * n + intercept
-    
-    def _calculate_percentile(self, values: List[float], percentile: float) -> float:
-        """Calculate percentile value"""
-        if not values:
-            return 0.0
-        
-        sorted_values = sorted(values)
-        k = (len(sorted_values) - 1) * (percentile / 100)
-        f = math.floor(k)
-        c = math.ceil(k)
-        
-        if f == c:
-            return sorted_values[int(k)]
-        
-        d0 = sorted_values[int(f)] * (c - k)
-        d1 = sorted_values[int(c)] * (k - f)
-        return d0 + d1
+        return self._prediction_from_fit(values, self._fit_regression_python(values))
     
     def _calculate_performance_score(
         self,
@@ -673,32 +782,26 @@ class AnalyticsEngine:
     def _identify_bottlenecks(
         self,
         test_results: List[Dict[str, Any]],
-        execution_times: List[float]
+        avg_time: float
     ) -> List[str]:
-        """Identify performance bottlenecks"""
+        """Identify slow tests and error-prone domains in a single pass over the results"""
         bottlenecks = []
-        
-        if not execution_times:
-            return bottlenecks
-        
-        avg_time = statistics.mean(execution_times)
         threshold = avg_time * 2  # Tests taking more than 2x average
         
-        slow_tests = [
-            result for i, result in enumerate(test_results)
-            if i < len(execution_times) and execution_times[i] > threshold
-        ]
-        
-        if slow_tests:
-            bottlenecks.append(f"{len(slow_tests)} tests exceed 2x average execution time")
-        
-        # Check for high error rates in specific domains
+        slow_count = 0
         domain_errors = {}
         for result in test_results:
-            domain = result.get('domain', 'unknown')
+            if 'execution_time' in result and float(result['execution_time']) > threshold:
+                slow_count += 1
+            
             if result.get('status') != 'passed':
+                domain = result.get('domain', 'unknown')
                 domain_errors[domain] = domain_errors.get(domain, 0) + 1
         
+        if slow_count:
+            bottlenecks.append(f"{slow_count} tests exceed 2x average execution time")
+        
+        # Check for high error rates in specific domains
         for domain, error_count in domain_errors.items():
             if error_count > len(test_results) * 0.1:  # More than 10% errors
                 bottlenecks.append(f"High error rate in {domain} domain ({error_count} failures)")
@@ -973,6 +1076,29 @@ class AnalyticsEngine:
         
         return quality_score
     
+    def _calculate_correlation_matrix(self, metrics_data: Dict[str, List[float]]) -> List[List[float]]:
+        """
+        Calculate the Pearson correlation matrix of all metrics.
+        
+        Equal-length series are stacked into one array and correlated with a
+        single NumPy call; otherwise pairs are correlated individually.
+        Undefined correlations (constant series) are reported as 0.0.
+        """
+        names = list(metrics_data.keys())
+        lengths = {len(metrics_data[name]) for name in names}
+        
+        if NUMPY_AVAILABLE and len(names) > 1 and len(lengths) == 1 and lengths.pop() >= 2:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                matrix = np.corrcoef(np.array([metrics_data[name] for name in names], dtype=float))
+            return np.nan_to_num(matrix, nan=0.0).tolist()
+        
+        matrix = [[1.0] * len(names) for _ in names]
+        for i, metric1 in enumerate(names):
+            for j in range(i + 1, len(names)):
+                correlation = self._calculate_correlation(metrics_data[metric1], metrics_data[names[j]])
+                matrix[i][j] = matrix[j][i] = correlation
+        return matrix
+    
     def _calculate_correlation(self, x: List[float], y: List[float]) -> float:
         """Calculate Pearson correlation coefficient"""
         if len(x) != len(y) or len(x) < 2:
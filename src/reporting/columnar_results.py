@@ -0,0 +1,247 @@
+"""
+Columnar Test Results Module
+
+Compact in-memory store for raw test result records. Each field that the
+report analysis passes look at is held as one NumPy column (status codes,
+durations, retry counts, flags) and repeated strings (names, suites,
+categories, priorities) are interned into string tables, so the store is
+built once per report and every pass runs as a vectorized mask instead of
+another loop over the raw dicts.
+"""
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+class StringTable:
+    """Interns repeated values and hands out dense integer codes"""
+
+    def __init__(self):
+        self.values: List[Hashable] = []
+        self._codes: Dict[Hashable, int] = {}
+
+    def intern(self, value: Hashable) -> int:
+        """Get the code of a value, adding it on first sight"""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def intern_all(self, values: Iterable[Hashable], count: int = -1) -> np.ndarray:
+        """Intern a sequence of values and get their codes as an array"""
+        codes = self._codes
+        intern = codes.setdefault
+        # A new value gets the current table size as its code
+        result = np.fromiter((intern(value, len(codes)) for value in values), dtype=np.int32, count=count)
+        if len(codes) > len(self.values):
+            self.values.extend(list(codes)[len(self.values):])
+        return result
+
+    def code(self, value: Hashable) -> Optional[int]:
+        """Get the code of a value, None if it was never interned"""
+        return self._codes.get(value)
+
+    def __getitem__(self, code: int) -> Hashable:
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class ColumnarTestResults:
+    """
+    Test result records stored column by column.
+
+    Statuses are normalized once per distinct raw status and stored as
+    codes into `statuses`. Category and priority keep their raw values in
+    string tables so groupings report them exactly as they were given.
+    The raw records are kept by reference for the few rows that are turned
+    into full results (failed, slow and flaky tests).
+    """
+
+    def __init__(
+        self,
+        records: Sequence[Dict[str, Any]],
+        normalize_status: Callable[[Any], Any],
+        statuses: Iterable[Any]
+    ):
+        """
+        Build the columns from the records.
+
+        Args:
+            records: Raw test result dicts
+            normalize_status: Maps a raw status to one of `statuses`
+            statuses: All normalized statuses, in code order
+        """
+        self.records = records
+        self.statuses = list(statuses)
+        status_codes = {status: code for code, status in enumerate(self.statuses)}
+
+        self.names = StringTable()
+        self.suites = StringTable()
+        self.categories = StringTable()
+        self.priorities = StringTable()
+
+        count = len(records)
+        self.name_codes = self.names.intern_all(
+            (record.get('test_name', record.get('name', '')) for record in records), count
+        )
+        self.suite_codes = self.suites.intern_all(
+            (record.get('suite_name', record.get('suite', '')) for record in records), count
+        )
+        self.category_codes = self.categories.intern_all(
+            (record.get('category', 'unknown') for record in records), count
+        )
+        self.priority_codes = self.priorities.intern_all(
+            (record.get('priority', 'unknown') for record in records), count
+        )
+
+        # Normalize each distinct raw status once, then map the raw codes
+        raw_statuses = StringTable()
+        raw_codes = raw_statuses.intern_all((record.get('status', 'unknown') for record in records), count)
+        lookup = np.array(
+            [status_codes[normalize_status(raw)] for raw in raw_statuses.values], dtype=np.int8
+        )
+        self.status_codes = lookup[raw_codes] if count else np.empty(0, dtype=np.int8)
+
+        self.execution_time = self._column(records, 'execution_time', np.float64)
+        self.retry_count = self._column(records, 'retry_count', np.int64)
+        self.max_retries = self._column(records, 'max_retries', np.int64)
+        self.is_cross_domain = self._column(records, 'is_cross_domain', bool)
+        self.is_unified_flow = self._column(records, 'is_unified_flow', bool)
+        self.has_test_data = self._column(records, 'test_data', bool)
+        self.has_assertions = self._column(records, 'assertion_results', bool)
+
+        self._materialized: Dict[int, Any] = {}
+
+    @staticmethod
+    def _column(records: Sequence[Dict[str, Any]], key: str, dtype: Any) -> np.ndarray:
+        """One field of every record as an array, missing and empty values as zero"""
+        if dtype is bool:
+            values = (bool(record.get(key)) for record in records)
+        else:
+            values = (record.get(key) or 0 for record in records)
+        return np.fromiter(values, dtype=dtype, count=len(records))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def status_mask(self, *statuses: Any) -> np.ndarray:
+        """Boolean mask of the rows with any of the given normalized statuses"""
+        codes = [self.statuses.index(status) for status in statuses]
+        return np.isin(self.status_codes, codes)
+
+    def status_counts(self, mask: Optional[np.ndarray] = None) -> Dict[Any, int]:
+        """Row count per normalized status, optionally within a mask"""
+        codes = self.status_codes if mask is None else self.status_codes[mask]
+        counts = np.bincount(codes, minlength=len(self.statuses))
+        return {status: int(counts[code]) for code, status in enumerate(self.statuses)}
+
+    def grouped_status_counts(self, group: str) -> Dict[Hashable, np.ndarray]:
+        """
+        Row count per normalized status for each value of a grouping column.
+
+        Args:
+            group: 'category' or 'priority'
+
+        Returns:
+            Raw group value -> counts indexed by status code, in first-seen order
+        """
+        table = self.categories if group == 'category' else self.priorities
+        group_codes = self.category_codes if group == 'category' else self.priority_codes
+        width = len(self.statuses)
+
+        counts = np.bincount(
+            group_codes.astype(np.int64) * width + self.status_codes,
+            minlength=len(table) * width
+        ).reshape(len(table), width)
+        return {table[code]: counts[code] for code in range(len(table))}
+
+    def materialize(self, rows: Iterable[int], factory: Callable[[Dict[str, Any]], Any]) -> List[Any]:
+        """
+        Turn selected rows into result objects.
+
+        Objects are built from the raw records with factory and reused when
+        the same row is selected again, so passes that overlap (a slow test
+        that also failed) share one object.
+        """
+        results = []
+        for row in rows:
+            row = int(row)
+            result = self._materialized.get(row)
+            if result is None:
+                result = self._materialized[row] = factory(self.records[row])
+            results.append(result)
+        return results
+
+    def row_result(self, row: int, factory: Callable[[Dict[str, Any]], Any]) -> Any:
+        """
+        Result object of one row without keeping it.
+
+        Returns the shared object when the row was already materialized,
+        otherwise a fresh object that is not cached.
+        """
+        result = self._materialized.get(row)
+        return factory(self.records[row]) if result is None else result
+
+
+class MaterializedRows(Sequence):
+    """
+    Read-only view of a range of store rows as result objects.
+
+    Rows are turned into objects only when accessed, through
+    `ColumnarTestResults.row_result`, so a view over a large range holds
+    no objects and rows that were materialized elsewhere (failed, slow or
+    flaky tests) come back as the same object.
+    """
+
+    def __init__(self, store: ColumnarTestResults, start: int, stop: int, factory: Callable[[Dict[str, Any]], Any]):
+        self.store = store
+        self.rows = range(start, stop)
+        self.factory = factory
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.store.row_result(row, self.factory) for row in self.rows[index]]
+        return self.store.row_result(self.rows[index], self.factory)
+
+    def __iter__(self):
+        for row in self.rows:
+            yield self.store.row_result(row, self.factory)
+
+
+def rank_rows(rows: np.ndarray, scores: np.ndarray, top_n: Optional[int] = None) -> np.ndarray:
+    """
+    Order rows by descending score, keeping input order for equal scores.
+
+    With top_n only the top_n rows are returned. They are picked with a
+    partial partition rather than a full sort, so only the selected rows
+    are sorted. The result equals the first top_n rows of the full ranking.
+
+    Args:
+        rows: Row indices
+        scores: Score of each row, same length as rows
+        top_n: Number of rows to keep, all when None
+
+    Returns:
+        Ranked row indices
+    """
+    if top_n is not None and top_n < len(rows):
+        if top_n <= 0:
+            return rows[:0]
+
+        # Score of the top_n-th row; take everything above it and fill up
+        # with the first rows that tie with it
+        cutoff = np.partition(scores, len(scores) - top_n)[len(scores) - top_n]
+        above = np.flatnonzero(scores > cutoff)
+        tied = np.flatnonzero(scores == cutoff)[:top_n - len(above)]
+        chosen = np.sort(np.concatenate([above, tied]))
+        rows, scores = rows[chosen], scores[chosen]
+
+    return rows[np.argsort(-scores, kind='stable')]
@@ -5,15 +5,17 @@ Specialized reporting for compliance assessment results, regulatory analysis,
 gap identification, and compliance recommendations.
 """
 
-import json
 import logging
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 from dataclasses import dataclass, field
 import uuid
 
+from .report_writer import write_json
+from .template_engine import render_template, render_template_to_stream
+
 logger = logging.getLogger(__name__)
 
 
@@ -284,8 +286,13 @@ class ComplianceReport:
     control_matrix: Dict[str, Any] = field(default_factory=dict)
     raw_results: Dict[str, Any] = field(default_factory=dict)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
+    def to_dict(self, lazy: bool = False) -> Dict[str, Any]:
+        """
+        Convert to dictionary.
+
+        With lazy=True the detail lists are left as iterators that write_json
+        converts one at a time; such a dict can be written once.
+        """
         return {
             "report_id": self.report_id,
             "title": self.title,
@@ -298,8 +305,8 @@ class ComplianceReport:
             "executive_summary": self.executive_summary,
             "key_findings": self.key_findings,
             "metrics": self._metrics_to_dict() if self.metrics else None,
-            "gaps": [gap.to_dict() for gap in self.gaps],
-            "recommendations": [rec.to_dict() for rec in self.recommendations],
+            "gaps": iter(self.gaps) if lazy else [gap.to_dict() for gap in self.gaps],
+            "recommendations": iter(self.recommendations) if lazy else [rec.to_dict() for rec in self.recommendations],
             "overall_compliance_status": self.overall_compliance_status.value,
             "standard_compliance_status": {k: v.value for k, v in self.standard_compliance_status.items()},
             "overall_risk_level": self.overall_risk_level.value,
@@ -1210,15 +1217,13 @@ class ComplianceReporter:
         """Export as JSON"""
         
         with open(path, 'w', encoding='utf-8') as f:
-            json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
+            write_json(report.to_dict(lazy=True), f, indent=2, ensure_ascii=False)
     
     def _export_html(self, report: ComplianceReport, path: Path):
         """Export as HTML"""
         
-        html_content = self._generate_html_compliance_report(report)
-        
         with open(path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            self._write_html_compliance_report(report, f)
     
     def _export_pdf(self, report: ComplianceReport, path: Path):
         """Export as PDF (placeholder - would require PDF library)"""
@@ -1232,175 +1237,12 @@ class ComplianceReporter:
     def _generate_html_compliance_report(self, report: ComplianceReport) -> str:
         """Generate HTML compliance report"""
         
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>{report.title}</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                .header {{ background-color: #f0f0f0; padding: 20px; border-radius: 5px; }}
-                .section {{ margin: 20px 0; padding: 15px; border-left: 3px solid #007acc; }}
-                .gap {{ margin: 10px 0; padding: 10px; border-radius: 5px; }}
-                .critical {{ background-color: #ffebee; border-left: 3px solid #d32f2f; }}
-                .high {{ background-color: #fff3e0; border-left: 3px solid #f57c00; }}
-                .medium {{ background-color: #fffde7; border-left: 3px solid #fbc02d; }}
-                .low {{ background-color: #f1f8e9; border-left: 3px solid #388e3c; }}
-                .metrics {{ display: flex; justify-content: space-around; margin: 20px 0; }}
-                .metric {{ text-align: center; padding: 10px; background-color: #f9f9f9; border-radius: 5px; }}
-                .recommendation {{ margin: 10px 0; padding: 10px; background-color: #e3f2fd; border-radius: 5px; }}
-                .roadmap {{ margin: 10px 0; padding: 10px; background-color: #f3e5f5; border-radius: 5px; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>{report.title}</h1>
-                <p><strong>Generated:</strong> {report.generated_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
-                <p><strong>Target Organization:</strong> {report.target_organization}</p>
-                <p><strong>Assessment Scope:</strong> {report.assessment_scope}</p>
-                <p><strong>Standards Assessed:</strong> {', '.join(report.standards_assessed)}</p>
-                <p><strong>Overall Compliance Status:</strong> <span class="{report.overall_compliance_status.value}">{report.overall_compliance_status.value.upper()}</span></p>
-                <p><strong>Overall Risk Level:</strong> <span class="{report.overall_risk_level.value}">{report.overall_risk_level.value.upper()}</span></p>
-            </div>
-            
-            <div class="section">
-                <h2>Executive Summary</h2>
-                <pre>{report.executive_summary}</pre>
-            </div>
-        """
-        
-        # Add metrics
-        if report.metrics:
-            html += f"""
-            <div class="section">
-                <h2>Compliance Metrics</h2>
-                <div class="metrics">
-                    <div class="metric">
-                        <h3>Compliance Score</h3>
-                        <p>{report.metrics.overall_compliance_score:.1%}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>Compliance %</h3>
-                        <p>{report.metrics.compliance_percentage:.1%}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>Total Requirements</h3>
-                        <p>{report.metrics.total_requirements}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>Compliant</h3>
-                        <p class="low">{report.metrics.compliant_requirements}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>Non-Compliant</h3>
-                        <p class="critical">{report.metrics.non_compliant_requirements}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>Partial</h3>
-                        <p class="medium">{report.metrics.partially_compliant_requirements}</p>
-                    </div>
-                </div>
-            </div>
-            """
-        
-        # Add key findings
-        if report.key_findings:
-            html += """
-            <div class="section">
-                <h2>Key Findings</h2>
-                <ul>
-            """
-            for finding in report.key_findings:
-                html += f"<li>{finding}</li>"
-            html += """
-                </ul>
-            </div>
-            """
-        
-        # Add compliance gaps
-        if report.gaps:
-            html += """
-            <div class="section">
-                <h2>Compliance Gaps</h2>
-            """
-            
-            for gap in report.gaps:
-                risk_class = gap.risk_level.value if hasattr(gap.risk_level, 'value') else gap.risk_level
-                html += f"""
-                <div class="gap {risk_class}">
-                    <h3>{gap.requirement_title} <span class="{risk_class}">({gap.risk_level.value.upper() if hasattr(gap.risk_level, 'value') else gap.risk_level.upper()})</span></h3>
-                    <p><strong>Gap ID:</strong> {gap.gap_id}</p>
-                    <p><strong>Standard:</strong> {gap.standard}</p>
-                    <p><strong>Description:</strong> {gap.gap_description}</p>
-                    <p><strong>Gap Type:</strong> {gap.gap_type}</p>
-                    <p><strong>Current State:</strong> {gap.current_state}</p>
-                    <p><strong>Required State:</strong> {gap.required_state}</p>
-                    <p><strong>Business Impact:</strong> {gap.business_impact}</p>
-                    <p><strong>Remediation Priority:</strong> {gap.remediation_priority}</p>
-                </div>
-                """
-            
-            html += """
-            </div>
-            """
-        
-        # Add recommendations
-        if report.recommendations:
-            html += """
-            <div class="section">
-                <h2>Recommendations</h2>
-            """
-            
-            for rec in report.recommendations:
-                html += f"""
-                <div class="recommendation">
-                    <h3>[{rec.priority}] {rec.title}</h3>
-                    <p>{rec.description}</p>
-                    <p><strong>Standard:</strong> {rec.standard}</p>
-                    <p><strong>Estimated Effort:</strong> {rec.estimated_effort}</p>
-                    <p><strong>Timeline:</strong> {rec.timeline}</p>
-                    {f'<p><strong>Compliance Improvement:</strong> {rec.compliance_improvement}</p>' if rec.compliance_improvement != 'UNKNOWN' else ''}
-                </div>
-                """
-            
-            html += """
-            </div>
-            """
-        
-        # Add remediation roadmap
-        if report.remediation_roadmap:
-            html += """
-            <div class="section">
-                <h2>Remediation Roadmap</h2>
-            """
-            
-            for phase in report.remediation_roadmap:
-                html += f"""
-                <div class="roadmap">
-                    <h3>{phase['phase']}</h3>
-                    <p><strong>Timeline:</strong> {phase['timeline']}</p>
-                    <p><strong>Priority:</strong> {phase['priority']}</p>
-                    <p><strong>Gaps Addressed:</strong> {phase['gaps_addressed']}</p>
-                    <p><strong>Key Activities:</strong></p>
-                    <ul>
-                """
-                for activity in phase['key_activities']:
-                    html += f"<li>{activity}</li>"
-                html += """
-                    </ul>
-                </div>
-                """
-            
-            html += """
-            </div>
-            """
-        
-        html += """
-        </body>
-        </html>
-        """
+        return render_template("compliance_report.html", report=report)
+    
+    def _write_html_compliance_report(self, report: ComplianceReport, stream: TextIO):
+        """Write HTML compliance report to a text stream section by section"""
         
-        return html
+        render_template_to_stream("compliance_report.html", stream, report=report)
     
     def get_compliance_statistics(self, report_id: str) -> Optional[Dict[str, Any]]:
         """Get compliance statistics for a report"""
@@ -5,15 +5,25 @@ Specialized reporting for functional testing results, test execution analysis,
 coverage metrics, and test quality insights.
 """
 
-import json
 import logging
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple
 from dataclasses import dataclass, field
 import uuid
 
+import numpy as np
+
+from .columnar_results import ColumnarTestResults, MaterializedRows, rank_rows
+from .report_writer import write_json
+from .template_engine import render_template, render_template_to_stream
+
+try:
+    from ..analytics.quantile_sketch import TDigest
+except ImportError:  # reporting imported as a top-level package with src/ on sys.path
+    from analytics.quantile_sketch import TDigest
+
 logger = logging.getLogger(__name__)
 
 
@@ -220,7 +230,7 @@ class TestSuite:
     priority: TestPriority
     
     # Test results
-    tests: List[TestResult] = field(default_factory=list)
+    tests: Sequence[TestResult] = field(default_factory=list)
     
     # Suite metrics
     total_tests: int = 0
@@ -237,8 +247,8 @@ class TestSuite:
     environment: str = ""
     configuration: Dict[str, Any] = field(default_factory=dict)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
+    def to_dict(self, lazy: bool = False) -> Dict[str, Any]:
+        """Convert to dictionary, leaving tests unconverted for write_json if lazy"""
         return {
             "suite_id": self.suite_id,
             "suite_name": self.suite_name,
@@ -246,7 +256,7 @@ class TestSuite:
             "domain": self.domain,
             "category": self.category.value,
             "priority": self.priority.value,
-            "tests": [test.to_dict() for test in self.tests],
+            "tests": iter(self.tests) if lazy else [test.to_dict() for test in self.tests],
             "total_tests": self.total_tests,
             "passed_tests": self.passed_tests,
             "failed_tests": self.failed_tests,
@@ -353,8 +363,13 @@ class FunctionalReport:
     logs: List[str] = field(default_factory=list)
     screenshots: List[str] = field(default_factory=list)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
+    def to_dict(self, lazy: bool = False) -> Dict[str, Any]:
+        """
+        Convert to dictionary.
+
+        With lazy=True suites and test results are left as iterators that
+        write_json converts one at a time; such a dict can be written once.
+        """
         return {
             "report_id": self.report_id,
             "title": self.title,
@@ -366,13 +381,19 @@ class FunctionalReport:
             "executive_summary": self.executive_summary,
             "key_findings": self.key_findings,
             "metrics": self._metrics_to_dict() if self.metrics else None,
-            "test_suites": [suite.to_dict() for suite in self.test_suites],
-            "failed_tests": [test.to_dict() for test in self.failed_tests],
-            "coverage_details": [detail.to_dict() for detail in self.coverage_details],
+            "test_suites": (
+                (suite.to_dict(lazy=True) for suite in self.test_suites) if lazy
+                else [suite.to_dict() for suite in self.test_suites]
+            ),
+            "failed_tests": iter(self.failed_tests) if lazy else [test.to_dict() for test in self.failed_tests],
+            "coverage_details": (
+                iter(self.coverage_details) if lazy
+                else [detail.to_dict() for detail in self.coverage_details]
+            ),
             "coverage_summary": self.coverage_summary,
             "performance_metrics": self.performance_metrics,
-            "slow_tests": [test.to_dict() for test in self.slow_tests],
-            "flaky_tests": [test.to_dict() for test in self.flaky_tests],
+            "slow_tests": iter(self.slow_tests) if lazy else [test.to_dict() for test in self.slow_tests],
+            "flaky_tests": iter(self.flaky_tests) if lazy else [test.to_dict() for test in self.flaky_tests],
             "quality_issues": self.quality_issues,
             "cross_domain_results": self.cross_domain_results,
             "integration_results": self.integration_results,
@@ -459,6 +480,13 @@ class FunctionalReporter:
         self.slow_test_threshold = 30.0  # seconds
         self.coverage_threshold = 80.0  # percentage
         self.flaky_test_threshold = 0.8  # success rate
+        
+        # Tests listed per ranking in a report, None lists all of them
+        self.max_slow_tests: Optional[int] = 100
+        self.max_flaky_tests: Optional[int] = 100
+        
+        # Columnar store of the report being generated, with its source
+        self._test_store: Optional[Tuple[Any, ColumnarTestResults]] = None
     
     def generate_functional_report(
         self,
@@ -479,6 +507,22 @@ class FunctionalReporter:
             execution_context=execution_context
         )
         
+        # Build the columnar result store once for all analysis passes
+        self._test_store = (test_results, self._build_test_store(test_results))
+        try:
+            self._populate_functional_report(report, test_results)
+        finally:
+            self._test_store = None
+        
+        # Store report
+        self.reports[report.report_id] = report
+        self.report_history.append(report.report_id)
+        
+        return report
+    
+    def _populate_functional_report(self, report: FunctionalReport, test_results: Any):
+        """Run the analysis passes and fill in the report"""
+        
         # Extract test configuration
         report.test_configuration = self._extract_test_configuration(test_results)
         
@@ -497,10 +541,10 @@ class FunctionalReporter:
         
         # Extract performance metrics
         report.performance_metrics = self._extract_performance_metrics(test_results)
-        report.slow_tests = self._identify_slow_tests(test_results)
+        report.slow_tests = self._identify_slow_tests(test_results, top_n=self.max_slow_tests)
         
         # Identify quality issues
-        report.flaky_tests = self._identify_flaky_tests(test_results)
+        report.flaky_tests = self._identify_flaky_tests(test_results, top_n=self.max_flaky_tests)
         report.quality_issues = self._identify_quality_issues(test_results, report.metrics)
         
         # Extract cross-domain results
@@ -520,12 +564,6 @@ class FunctionalReporter:
         report.test_artifacts = self._extract_test_artifacts(test_results)
         report.logs = self._extract_logs(test_results)
         report.screenshots = self._extract_screenshots(test_results)
-        
-        # Store report
-        self.reports[report.report_id] = report
-        self.report_history.append(report.report_id)
-        
-        return report
     
     def _generate_report_title(self, report_type: FunctionalReportType, test_environment: str) -> str:
         """Generate report title"""
@@ -573,30 +611,11 @@ class FunctionalReporter:
         metrics = FunctionalMetrics()
         
         # Get all test results
-        all_tests = self._get_all_tests(test_results)
+        store = self._get_test_store(test_results)
         
         # Basic counts
-        metrics.total_tests = len(all_tests)
-        
-        status_counts = {
-            TestStatus.PASSED: 0,
-            TestStatus.FAILED: 0,
-            TestStatus.SKIPPED: 0,
-            TestStatus.ERROR: 0,
-            TestStatus.BLOCKED: 0
-        }
-        
-        execution_times = []
-        
-        for test in all_tests:
-            status = self._normalize_test_status(test.get('status', 'unknown'))
-            if status in status_counts:
-                status_counts[status] += 1
-            
-            # Collect execution times
-            exec_time = test.get('execution_time', 0.0)
-            if exec_time > 0:
-                execution_times.append(exec_time)
+        metrics.total_tests = len(store)
+        status_counts = store.status_counts()
         
         metrics.passed_tests = status_counts[TestStatus.PASSED]
         metrics.failed_tests = status_counts[TestStatus.FAILED]
@@ -612,11 +631,12 @@ class FunctionalReporter:
             metrics.error_rate = metrics.error_tests / metrics.total_tests
         
         # Performance metrics
-        if execution_times:
-            metrics.average_execution_time = sum(execution_times) / len(execution_times)
-            metrics.total_execution_time = sum(execution_times)
-            metrics.fastest_test = min(execution_times)
-            metrics.slowest_test = max(execution_times)
+        execution_times = store.execution_time[store.execution_time > 0]
+        if execution_times.size:
+            metrics.total_execution_time = float(execution_times.sum())
+            metrics.average_execution_time = metrics.total_execution_time / execution_times.size
+            metrics.fastest_test = float(execution_times.min())
+            metrics.slowest_test = float(execution_times.max())
         
         # Coverage metrics
         metrics.code_coverage = getattr(test_results, 'code_coverage', 0.0)
@@ -631,18 +651,18 @@ class FunctionalReporter:
         metrics.mobile_coverage = getattr(test_results, 'mobile_coverage', 0.0)
         
         # Quality metrics
-        metrics.test_stability = self._calculate_test_stability(all_tests)
-        metrics.test_reliability = self._calculate_test_reliability(all_tests)
-        metrics.defect_detection_rate = self._calculate_defect_detection_rate(all_tests)
+        metrics.test_stability = self._calculate_test_stability(store)
+        metrics.test_reliability = self._calculate_test_reliability(store)
+        metrics.defect_detection_rate = self._calculate_defect_detection_rate(store)
         
         # Cross-domain metrics
-        metrics.cross_domain_tests = len([t for t in all_tests if t.get('is_cross_domain', False)])
-        metrics.unified_test_flows = len([t for t in all_tests if t.get('is_unified_flow', False)])
+        metrics.cross_domain_tests = int(store.is_cross_domain.sum())
+        metrics.unified_test_flows = int(store.is_unified_flow.sum())
         metrics.integration_points_tested = getattr(test_results, 'integration_points_tested', 0)
         
         # Category and priority breakdown
-        metrics.category_metrics = self._calculate_category_metrics(all_tests)
-        metrics.priority_metrics = self._calculate_priority_metrics(all_tests)
+        metrics.category_metrics = self._calculate_category_metrics(store)
+        metrics.priority_metrics = self._calculate_priority_metrics(store)
         
         return metrics
     
@@ -658,10 +678,10 @@ class FunctionalReporter:
         if hasattr(test_results, 'all_tests'):
             all_tests.extend(test_results.all_tests)
         
+        # Suite tests come last so each suite is a contiguous range of rows
         if hasattr(test_results, 'suites'):
             for suite in test_results.suites:
-                if hasattr(suite, 'tests'):
-                    all_tests.extend(suite.tests)
+                all_tests.extend(self._get_suite_tests(suite))
         
         # If test_results is a list itself
         if isinstance(test_results, list):
@@ -669,6 +689,22 @@ class FunctionalReporter:
         
         return all_tests
     
+    def _get_suite_tests(self, suite: Any) -> List[Dict[str, Any]]:
+        """Get the raw tests of a suite given as a dict or an object"""
+        if isinstance(suite, dict):
+            return suite.get('tests', [])
+        return getattr(suite, 'tests', [])
+    
+    def _build_test_store(self, test_results: Any) -> ColumnarTestResults:
+        """Build the columnar store of all test results"""
+        return ColumnarTestResults(self._get_all_tests(test_results), self._normalize_test_status, TestStatus)
+    
+    def _get_test_store(self, test_results: Any) -> ColumnarTestResults:
+        """Get the columnar store of the report being generated, or build one"""
+        if self._test_store is not None and self._test_store[0] is test_results:
+            return self._test_store[1]
+        return self._build_test_store(test_results)
+    
     def _normalize_test_status(self, status: str) -> TestStatus:
         """Normalize test status"""
         
@@ -687,14 +723,14 @@ class FunctionalReporter:
         else:
             return TestStatus.NOT_RUN
     
-    def _calculate_test_stability(self, all_tests: List[Dict[str, Any]]) -> float:
+    def _calculate_test_stability(self, store: ColumnarTestResults) -> float:
         """Calculate test stability (consistency of results)"""
         
         # This would require historical data
         # For now, return a placeholder based on retry counts
         
-        total_retries = sum(test.get('retry_count', 0) for test in all_tests)
-        total_tests = len(all_tests)
+        total_retries = int(store.retry_count.sum())
+        total_tests = len(store)
         
         if total_tests == 0:
             return 1.0
@@ -703,12 +739,12 @@ class FunctionalReporter:
         stability = max(0.0, 1.0 - (total_retries / total_tests / 3.0))  # Normalize to 0-1
         return stability
     
-    def _calculate_test_reliability(self, all_tests: List[Dict[str, Any]]) -> float:
+    def _calculate_test_reliability(self, store: ColumnarTestResults) -> float:
         """Calculate test reliability (absence of flaky tests)"""
         
         # Count tests that required retries (potential flaky tests)
-        flaky_tests = len([t for t in all_tests if t.get('retry_count', 0) > 0])
-        total_tests = len(all_tests)
+        flaky_tests = int(np.count_nonzero(store.retry_count > 0))
+        total_tests = len(store)
         
         if total_tests == 0:
             return 1.0
@@ -716,112 +752,119 @@ class FunctionalReporter:
         reliability = 1.0 - (flaky_tests / total_tests)
         return reliability
     
-    def _calculate_defect_detection_rate(self, all_tests: List[Dict[str, Any]]) -> float:
+    def _calculate_defect_detection_rate(self, store: ColumnarTestResults) -> float:
         """Calculate defect detection rate"""
         
         # This would require defect tracking integration
         # For now, use failed tests as a proxy
         
-        failed_tests = len([t for t in all_tests if self._normalize_test_status(t.get('status', '')) == TestStatus.FAILED])
-        total_tests = len(all_tests)
+        failed_tests = int(np.count_nonzero(store.status_mask(TestStatus.FAILED)))
+        total_tests = len(store)
         
         if total_tests == 0:
             return 0.0
         
         return failed_tests / total_tests
     
-    def _calculate_category_metrics(self, all_tests: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    def _calculate_category_metrics(self, store: ColumnarTestResults) -> Dict[str, Dict[str, int]]:
         """Calculate metrics by test category"""
-        
-        category_metrics = {}
-        
-        for test in all_tests:
-            category = test.get('category', 'unknown')
-            status = self._normalize_test_status(test.get('status', 'unknown')).value
-            
-            if category not in category_metrics:
-                category_metrics[category] = {
-                    'total': 0,
-                    'passed': 0,
-                    'failed': 0,
-                    'skipped': 0,
-                    'error': 0,
-                    'blocked': 0
-                }
-            
-            category_metrics[category]['total'] += 1
-            category_metrics[category][status] = category_metrics[category].get(status, 0) + 1
-        
-        return category_metrics
+        return self._calculate_grouped_metrics(store, 'category')
     
-    def _calculate_priority_metrics(self, all_tests: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
+    def _calculate_priority_metrics(self, store: ColumnarTestResults) -> Dict[str, Dict[str, int]]:
         """Calculate metrics by test priority"""
+        return self._calculate_grouped_metrics(store, 'priority')
+    
+    def _calculate_grouped_metrics(self, store: ColumnarTestResults, group: str) -> Dict[str, Dict[str, int]]:
+        """Count tests per status for each value of a grouping column"""
         
-        priority_metrics = {}
+        grouped_metrics = {}
         
-        for test in all_tests:
-            priority = test.get('priority', 'unknown')
-            status = self._normalize_test_status(test.get('status', 'unknown')).value
-            
-            if priority not in priority_metrics:
-                priority_metrics[priority] = {
-                    'total': 0,
-                    'passed': 0,
-                    'failed': 0,
-                    'skipped': 0,
-                    'error': 0,
-                    'blocked': 0
-                }
-            
-            priority_metrics[priority]['total'] += 1
-            priority_metrics[priority][status] = priority_metrics[priority].get(status, 0) + 1
+        for value, counts in store.grouped_status_counts(group).items():
+            metrics = {
+                'total': int(counts.sum()),
+                'passed': 0,
+                'failed': 0,
+                'skipped': 0,
+                'error': 0,
+                'blocked': 0
+            }
+            for code, status in enumerate(store.statuses):
+                if counts[code]:
+                    metrics[status.value] = int(counts[code])
+            grouped_metrics[value] = metrics
         
-        return priority_metrics
+        return grouped_metrics
     
     def _extract_test_suites(self, test_results: Any) -> List[TestSuite]:
         """Extract test suite information"""
         
         suites = []
         
-        if hasattr(test_results, 'suites'):
-            for suite_data in test_results.suites:
-                suite = TestSuite(
-                    suite_id=suite_data.get('suite_id', str(uuid.uuid4())),
-                    suite_name=suite_data.get('suite_name', 'Unknown Suite'),
-                    description=suite_data.get('description', ''),
-                    domain=suite_data.get('domain', 'unknown'),
-                    category=self._normalize_test_category(suite_data.get('category', 'functional')),
-                    priority=self._normalize_test_priority(suite_data.get('priority', 'medium')),
-                    environment=suite_data.get('environment', ''),
-                    configuration=suite_data.get('configuration', {})
-                )
-                
-                # Extract tests
-                if 'tests' in suite_data:
-                    for test_data in suite_data['tests']:
-                        test = self._create_test_result(test_data)
-                        suite.tests.append(test)
-                
-                # Calculate suite metrics
-                suite.total_tests = len(suite.tests)
-                suite.passed_tests = len([t for t in suite.tests if t.status == TestStatus.PASSED])
-                suite.failed_tests = len([t for t in suite.tests if t.status == TestStatus.FAILED])
-                suite.skipped_tests = len([t for t in suite.tests if t.status == TestStatus.SKIPPED])
-                
-                # Calculate execution time
-                suite.execution_time = sum(t.execution_time for t in suite.tests)
-                
-                # Set start/end times
-                if suite.tests:
-                    start_times = [t.start_time for t in suite.tests if t.start_time]
-                    end_times = [t.end_time for t in suite.tests if t.end_time]
-                    
-                    if start_times:
-                        suite.start_time = min(start_times)
-                    if end_times:
-                        suite.end_time = max(end_times)
-                
-                suites.append(suite)
+        if not hasattr(test_results, 'suites'):
+            return suites
+        
+        suite_list = list(test_results.suites)
+        lengths = np.array([len(self._get_suite_tests(suite)) for suite in suite_list], dtype=np.int64)
+        
+        # Suite tests are the last rows of the store, one contiguous range per suite
+        store = self._get_test_store(test_results)
+        offset = len(store) - int(lengths.sum())
+        bounds = offset + np.concatenate([[0], np.cumsum(lengths)])
+        
+        # Status counts and execution time per suite in one pass over the rows
+        suite_index = np.repeat(np.arange(len(suite_list)), lengths)
+        width = len(store.statuses)
+        counts = np.bincount(
+            suite_index * width + store.status_codes[offset:],
+            minlength=len(suite_list) * width
+        ).reshape(len(suite_list), width)
+        times = np.bincount(suite_index, weights=store.execution_time[offset:], minlength=len(suite_list))
+        passed = store.statuses.index(TestStatus.PASSED)
+        failed = store.statuses.index(TestStatus.FAILED)
+        skipped = store.statuses.index(TestStatus.SKIPPED)
+        
+        for position, suite_data in enumerate(suite_list):
+            suite = TestSuite(
+                suite_id=suite_data.get('suite_id', str(uuid.uuid4())),
+                suite_name=suite_data.get('suite_name', 'Unknown Suite'),
+                description=suite_data.get('description', ''),
+                domain=suite_data.get('domain', 'unknown'),
+                category=self._normalize_test_category(suite_data.get('category', 'functional')),
+                priority=self._normalize_test_priority(suite_data.get('priority', 'medium')),
+                environment=suite_data.get('environment', ''),
+                configuration=suite_data.get('configuration', {})
+            )
+            
+            # Tests are turned into results only when accessed
+            start, stop = int(bounds[position]), int(bounds[position + 1])
+            suite.tests = MaterializedRows(store, start, stop, self._create_test_result)
+            
+            # Calculate suite metrics
+            suite.total_tests = stop - start
+            suite.passed_tests = int(counts[position, passed])
+            suite.failed_tests = int(counts[position, failed])
+            suite.skipped_tests = int(counts[position, skipped])
+            
+            # Calculate execution time
+            suite.execution_time = float(times[position])
+            
+            # Set start/end times
+            start_times = []
+            end_times = []
+            for test_data in store.records[start:stop]:
+                start_time = self._parse_timestamp(test_data.get('start_time'))
+                end_time = self._parse_timestamp(test_data.get('end_time'))
+                if start_time:
+                    start_times.append(start_time)
+                if end_time:
+                    end_times.append(end_time)
+            
+            if start_times:
+                suite.start_time = min(start_times)
+            if end_times:
+                suite.end_time = max(end_times)
+            
+            suites.append(suite)
         
         return suites
     
@@ -893,33 +936,25 @@ class FunctionalReporter:
         )
         
         # Parse timestamps
-        if 'start_time' in test_data:
-            try:
-                test.start_time = datetime.fromisoformat(test_data['start_time'])
-            except (ValueError, TypeError):
-                pass
-        
-        if 'end_time' in test_data:
-            try:
-                test.end_time = datetime.fromisoformat(test_data['end_time'])
-            except (ValueError, TypeError):
-                pass
+        test.start_time = self._parse_timestamp(test_data.get('start_time'))
+        test.end_time = self._parse_timestamp(test_data.get('end_time'))
         
         return test
     
+    def _parse_timestamp(self, value: Any) -> Optional[datetime]:
+        """Parse an ISO timestamp, None if missing or invalid"""
+        try:
+            return datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            return None
+    
     def _extract_failed_tests(self, test_results: Any) -> List[TestResult]:
         """Extract failed test details"""
         
-        failed_tests = []
-        all_tests = self._get_all_tests(test_results)
-        
-        for test_data in all_tests:
-            status = self._normalize_test_status(test_data.get('status', ''))
-            if status in [TestStatus.FAILED, TestStatus.ERROR]:
-                test = self._create_test_result(test_data)
-                failed_tests.append(test)
+        store = self._get_test_store(test_results)
+        failed = store.status_mask(TestStatus.FAILED, TestStatus.ERROR)
         
-        return failed_tests
+        return store.materialize(np.flatnonzero(failed), self._create_test_result)
     
     def _extract_coverage_details(self, test_results: Any) -> List[CoverageDetail]:
         """Extract detailed coverage information"""
@@ -997,59 +1032,79 @@ class FunctionalReporter:
     def _extract_performance_metrics(self, test_results: Any) -> Dict[str, Any]:
         """Extract performance metrics"""
         
-        all_tests = self._get_all_tests(test_results)
-        execution_times = [t.get('execution_time', 0.0) for t in all_tests if t.get('execution_time', 0.0) > 0]
+        store = self._get_test_store(test_results)
+        execution_times = store.execution_time[store.execution_time > 0]
         
-        if not execution_times:
+        if not execution_times.size:
             return {}
         
+        digest = TDigest()
+        digest.update(execution_times.tolist())
+        tests_over_threshold = int(np.count_nonzero(execution_times > self.slow_test_threshold))
+        fast_tests = int(np.count_nonzero(execution_times < 5.0))
+        medium_tests = int(np.count_nonzero(execution_times < 30.0)) - fast_tests
+        distribution = {
+            'fast_tests': fast_tests,
+            'medium_tests': medium_tests,
+            'slow_tests': int(execution_times.size) - fast_tests - medium_tests
+        }
+        
+        percentiles = digest.percentiles()
         return {
-            'total_execution_time': sum(execution_times),
-            'average_execution_time': sum(execution_times) / len(execution_times),
-            'median_execution_time': sorted(execution_times)[len(execution_times) // 2],
-            'fastest_test': min(execution_times),
-            'slowest_test': max(execution_times),
-            'tests_over_threshold': len([t for t in execution_times if t > self.slow_test_threshold]),
-            'performance_distribution': {
-                'fast_tests': len([t for t in execution_times if t < 5.0]),
-                'medium_tests': len([t for t in execution_times if 5.0 <= t < 30.0]),
-                'slow_tests': len([t for t in execution_times if t >= 30.0])
-            }
+            'total_execution_time': digest.sum,
+            'average_execution_time': digest.mean,
+            'median_execution_time': percentiles['p50'],
+            'p50_execution_time': percentiles['p50'],
+            'p95_execution_time': percentiles['p95'],
+            'p99_execution_time': percentiles['p99'],
+            'fastest_test': digest.min,
+            'slowest_test': digest.max,
+            'tests_over_threshold': tests_over_threshold,
+            'performance_distribution': distribution,
+            # Serialized sketch so percentiles can be merged across runs and shards
+            'execution_time_digest': digest.to_dict()
         }
     
-    def _identify_slow_tests(self, test_results: Any) -> List[TestResult]:
-        """Identify slow-running tests"""
+    def _identify_slow_tests(self, test_results: Any, top_n: Optional[int] = None) -> List[TestResult]:
+        """
+        Identify slow-running tests, slowest first.
         
-        slow_tests = []
-        all_tests = self._get_all_tests(test_results)
+        Args:
+            test_results: Raw test results
+            top_n: Return only the slowest top_n tests, all when None
+        """
         
-        for test_data in all_tests:
-            execution_time = test_data.get('execution_time', 0.0)
-            if execution_time > self.slow_test_threshold:
-                test = self._create_test_result(test_data)
-                slow_tests.append(test)
+        store = self._get_test_store(test_results)
+        slow_rows = np.flatnonzero(store.execution_time > self.slow_test_threshold)
         
-        # Sort by execution time (slowest first)
-        slow_tests.sort(key=lambda t: t.execution_time, reverse=True)
+        # Rank by execution time, keeping input order for ties
+        slow_rows = rank_rows(slow_rows, store.execution_time[slow_rows], top_n)
         
-        return slow_tests
+        return store.materialize(slow_rows, self._create_test_result)
     
-    def _identify_flaky_tests(self, test_results: Any) -> List[TestResult]:
-        """Identify potentially flaky tests"""
+    def _identify_flaky_tests(self, test_results: Any, top_n: Optional[int] = None) -> List[TestResult]:
+        """
+        Identify potentially flaky tests, most suspicious first.
         
-        flaky_tests = []
-        all_tests = self._get_all_tests(test_results)
+        A test is flaky if it needed or allowed retries. Tests are ranked by
+        their retry count plus one if they still failed, so tests that kept
+        failing after several retries come first.
         
-        for test_data in all_tests:
-            retry_count = test_data.get('retry_count', 0)
-            max_retries = test_data.get('max_retries', 0)
-            
-            # Consider a test flaky if it required retries
-            if retry_count > 0 or max_retries > 0:
-                test = self._create_test_result(test_data)
-                flaky_tests.append(test)
+        Args:
+            test_results: Raw test results
+            top_n: Return only the top_n highest ranked tests, all when None
+        """
+        
+        store = self._get_test_store(test_results)
         
-        return flaky_tests
+        # Consider a test flaky if it required retries
+        flaky_rows = np.flatnonzero((store.retry_count > 0) | (store.max_retries > 0))
+        scores = (
+            store.retry_count[flaky_rows]
+            + store.status_mask(TestStatus.FAILED, TestStatus.ERROR)[flaky_rows]
+        )
+        
+        return store.materialize(rank_rows(flaky_rows, scores, top_n), self._create_test_result)
     
     def _identify_quality_issues(self, test_results: Any, metrics: FunctionalMetrics) -> List[str]:
         """Identify test quality issues"""
@@ -1069,23 +1124,23 @@ class FunctionalReporter:
             issues.append(f"Low code coverage: {metrics.code_coverage:.1%} (target: {self.coverage_threshold}%+)")
         
         # Slow tests
-        all_tests = self._get_all_tests(test_results)
-        slow_tests = len([t for t in all_tests if t.get('execution_time', 0.0) > self.slow_test_threshold])
+        store = self._get_test_store(test_results)
+        slow_tests = int(np.count_nonzero(store.execution_time > self.slow_test_threshold))
         if slow_tests > 0:
             issues.append(f"{slow_tests} slow tests (>{self.slow_test_threshold}s)")
         
         # Flaky tests
-        flaky_tests = len([t for t in all_tests if t.get('retry_count', 0) > 0])
+        flaky_tests = int(np.count_nonzero(store.retry_count > 0))
         if flaky_tests > 0:
             issues.append(f"{flaky_tests} potentially flaky tests")
         
         # Missing test data
-        tests_without_data = len([t for t in all_tests if not t.get('test_data')])
+        tests_without_data = len(store) - int(np.count_nonzero(store.has_test_data))
         if tests_without_data > metrics.total_tests * 0.2:  # More than 20%
             issues.append(f"{tests_without_data} tests missing test data")
         
         # Missing assertions
-        tests_without_assertions = len([t for t in all_tests if not t.get('assertion_results')])
+        tests_without_assertions = len(store) - int(np.count_nonzero(store.has_assertions))
         if tests_without_assertions > 0:
             issues.append(f"{tests_without_assertions} tests without assertion results")
         
@@ -1094,47 +1149,60 @@ class FunctionalReporter:
     def _extract_cross_domain_results(self, test_results: Any) -> Dict[str, Any]:
         """Extract cross-domain test results"""
         
-        all_tests = self._get_all_tests(test_results)
-        cross_domain_tests = [t for t in all_tests if t.get('is_cross_domain', False)]
+        store = self._get_test_store(test_results)
+        cross_domain = store.is_cross_domain
+        total_cross_domain = int(np.count_nonzero(cross_domain))
         
-        if not cross_domain_tests:
+        if not total_cross_domain:
             return {}
         
         # Analyze cross-domain test results
         domains_tested = set()
         integration_points = set()
         
-        for test in cross_domain_tests:
+        for row in np.flatnonzero(cross_domain):
+            test = store.records[row]
+            
             domains = test.get('domains_involved', [])
             domains_tested.update(domains)
             
             integrations = test.get('integration_points', [])
             integration_points.update(integrations)
         
+        passed = int(np.count_nonzero(cross_domain & store.status_mask(TestStatus.PASSED)))
+        failed = int(np.count_nonzero(cross_domain & store.status_mask(TestStatus.FAILED)))
+        
         return {
-            'total_cross_domain_tests': len(cross_domain_tests),
-            'passed_cross_domain_tests': len([t for t in cross_domain_tests if self._normalize_test_status(t.get('status', '')) == TestStatus.PASSED]),
-            'failed_cross_domain_tests': len([t for t in cross_domain_tests if self._normalize_test_status(t.get('status', '')) == TestStatus.FAILED]),
+            'total_cross_domain_tests': total_cross_domain,
+            'passed_cross_domain_tests': passed,
+            'failed_cross_domain_tests': failed,
             'domains_tested': list(domains_tested),
             'integration_points_tested': list(integration_points),
-            'cross_domain_pass_rate': len([t for t in cross_domain_tests if self._normalize_test_status(t.get('status', '')) == TestStatus.PASSED]) / len(cross_domain_tests) if cross_domain_tests else 0.0
+            'cross_domain_pass_rate': passed / total_cross_domain
         }
     
     def _extract_integration_results(self, test_results: Any) -> Dict[str, Any]:
         """Extract integration test results"""
         
-        all_tests = self._get_all_tests(test_results)
-        integration_tests = [t for t in all_tests if t.get('category', '').lower() == 'integration']
+        store = self._get_test_store(test_results)
+        integration_codes = [
+            code for code, category in enumerate(store.categories.values)
+            if str(category).lower() == 'integration'
+        ]
+        integration = np.isin(store.category_codes, integration_codes)
+        total_integration = int(np.count_nonzero(integration))
         
-        if not integration_tests:
+        if not total_integration:
             return {}
         
+        passed = int(np.count_nonzero(integration & store.status_mask(TestStatus.PASSED)))
+        
         return {
-            'total_integration_tests': len(integration_tests),
-            'passed_integration_tests': len([t for t in integration_tests if self._normalize_test_status(t.get('status', '')) == TestStatus.PASSED]),
-            'failed_integration_tests': len([t for t in integration_tests if self._normalize_test_status(t.get('status', '')) == TestStatus.FAILED]),
-            'integration_pass_rate': len([t for t in integration_tests if self._normalize_test_status(t.get('status', '')) == TestStatus.PASSED]) / len(integration_tests) if integration_tests else 0.0,
-            'average_integration_time': sum(t.get('execution_time', 0.0) for t in integration_tests) / len(integration_tests) if integration_tests else 0.0
+            'total_integration_tests': total_integration,
+            'passed_integration_tests': passed,
+            'failed_integration_tests': int(np.count_nonzero(integration & store.status_mask(TestStatus.FAILED))),
+            'integration_pass_rate': passed / total_integration,
+            'average_integration_time': float(store.execution_time[integration].sum()) / total_integration
         }
     
     def _generate_executive_summary(self, metrics: FunctionalMetrics, failed_tests: List[TestResult]) -> str:
@@ -1302,8 +1370,7 @@ class FunctionalReporter:
             artifacts.extend(test_results.artifacts)
         
         # Extract from individual tests
-        all_tests = self._get_all_tests(test_results)
-        for test in all_tests:
+        for test in self._get_test_store(test_results).records:
             test_artifacts = test.get('artifacts', [])
             artifacts.extend(test_artifacts)
         
@@ -1318,8 +1385,7 @@ class FunctionalReporter:
             logs.extend(test_results.logs)
         
         # Extract from individual tests
-        all_tests = self._get_all_tests(test_results)
-        for test in all_tests:
+        for test in self._get_test_store(test_results).records:
             test_logs = test.get('logs', [])
             logs.extend(test_logs)
         
@@ -1334,8 +1400,7 @@ class FunctionalReporter:
             screenshots.extend(test_results.screenshots)
         
         # Extract from individual tests
-        all_tests = self._get_all_tests(test_results)
-        for test in all_tests:
+        for test in self._get_test_store(test_results).records:
             test_screenshots = test.get('screenshots', [])
             screenshots.extend(test_screenshots)
         
@@ -1374,15 +1439,13 @@ class FunctionalReporter:
         """Export as JSON"""
         
         with open(path, 'w', encoding='utf-8') as f:
-            json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
+            write_json(report.to_dict(lazy=True), f, indent=2, ensure_ascii=False)
     
     def _export_html(self, report: FunctionalReport, path: Path):
         """Export as HTML"""
         
-        html_content = self._generate_html_functional_report(report)
-        
         with open(path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            self._write_html_functional_report(report, f)
     
     def _export_pdf(self, report: FunctionalReport, path: Path):
         """Export as PDF (placeholder)"""
@@ -1396,169 +1459,12 @@ class FunctionalReporter:
     def _generate_html_functional_report(self, report: FunctionalReport) -> str:
         """Generate HTML functional report"""
         
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>{report.title}</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                .header {{ background-color: #f0f0f0; padding: 20px; border-radius: 5px; }}
-                .section {{ margin: 20px 0; padding: 15px; border-left: 3px solid #007acc; }}
-                .metrics {{ display: flex; justify-content: space-around; margin: 20px 0; }}
-                .metric {{ text-align: center; padding: 10px; background-color: #f9f9f9; border-radius: 5px; }}
-                .passed {{ color: #4caf50; }}
-                .failed {{ color: #f44336; }}
-                .skipped {{ color: #ff9800; }}
-                .error {{ color: #9c27b0; }}
-                .test-suite {{ margin: 10px 0; padding: 10px; border: 1px solid #ddd; border-radius: 5px; }}
-                .test-result {{ margin: 5px 0; padding: 8px; border-radius: 3px; }}
-                .test-result.passed {{ background-color: #e8f5e8; }}
-                .test-result.failed {{ background-color: #fde8e8; }}
-                .test-result.skipped {{ background-color: #fff3e0; }}
-                .test-result.error {{ background-color: #f3e5f5; }}
-                .coverage-bar {{ width: 100%; height: 20px; background-color: #f0f0f0; border-radius: 10px; overflow: hidden; }}
-                .coverage-fill {{ height: 100%; background-color: #4caf50; }}
-                .recommendations {{ background-color: #e3f2fd; padding: 15px; border-radius: 5px; }}
-                .quality-issues {{ background-color: #fff3e0; padding: 15px; border-radius: 5px; }}
-                table {{ width: 100%; border-collapse: collapse; margin: 10px 0; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                th {{ background-color: #f2f2f2; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>{report.title}</h1>
-                <p><strong>Generated:</strong> {report.generated_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
-                <p><strong>Environment:</strong> {report.test_environment}</p>
-                <p><strong>Report Type:</strong> {report.report_type.value}</p>
-            </div>
-            
-            <div class="section">
-                <h2>Executive Summary</h2>
-                <pre>{report.executive_summary}</pre>
-            </div>
-        """
-        
-        # Add metrics section
-        if report.metrics:
-            html += f"""
-            <div class="section">
-                <h2>Test Execution Metrics</h2>
-                <div class="metrics">
-                    <div class="metric">
-                        <h3 class="passed">{report.metrics.passed_tests}</h3>
-                        <p>Passed ({report.metrics.pass_rate:.1%})</p>
-                    </div>
-                    <div class="metric">
-                        <h3 class="failed">{report.metrics.failed_tests}</h3>
-                        <p>Failed ({report.metrics.fail_rate:.1%})</p>
-                    </div>
-                    <div class="metric">
-                        <h3 class="skipped">{report.metrics.skipped_tests}</h3>
-                        <p>Skipped ({report.metrics.skip_rate:.1%})</p>
-                    </div>
-                    <div class="metric">
-                        <h3>{report.metrics.total_tests}</h3>
-                        <p>Total Tests</p>
-                    </div>
-                </div>
-                
-                <h3>Coverage Summary</h3>
-                <div style="margin: 20px 0;">
-                    <p>Code Coverage: {report.metrics.code_coverage:.1%}</p>
-                    <div class="coverage-bar">
-                        <div class="coverage-fill" style="width: {report.metrics.code_coverage * 100}%;"></div>
-                    </div>
-                </div>
-                
-                <div style="margin: 20px 0;">
-                    <p>Line Coverage: {report.metrics.line_coverage:.1%}</p>
-                    <div class="coverage-bar">
-                        <div class="coverage-fill" style="width: {report.metrics.line_coverage * 100}%;"></div>
-                    </div>
-                </div>
-                
-                <div style="margin: 20px 0;">
-                    <p>Branch Coverage: {report.metrics.branch_coverage:.1%}</p>
-                    <div class="coverage-bar">
-                        <div class="coverage-fill" style="width: {report.metrics.branch_coverage * 100}%;"></div>
-                    </div>
-                </div>
-            </div>
-            """
-        
-        # Add key findings
-        if report.key_findings:
-            html += f"""
-            <div class="section">
-                <h2>Key Findings</h2>
-                <ul>
-                    {''.join(f'<li>{finding}</li>' for finding in report.key_findings)}
-                </ul>
-            </div>
-            """
-        
-        # Add failed tests
-        if report.failed_tests:
-            html += f"""
-            <div class="section">
-                <h2>Failed Tests ({len(report.failed_tests)})</h2>
-                <table>
-                    <tr>
-                        <th>Test Name</th>
-                        <th>Domain</th>
-                        <th>Priority</th>
-                        <th>Error Message</th>
-                        <th>Execution Time</th>
-                    </tr>
-            """
-            
-            for test in report.failed_tests[:20]:  # Limit to first 20
-                html += f"""
-                    <tr>
-                        <td>{test.test_name}</td>
-                        <td>{test.domain}</td>
-                        <td>{test.priority.value}</td>
-                        <td>{test.error_message or 'N/A'}</td>
-                        <td>{test.execution_time:.2f}s</td>
-                    </tr>
-                """
-            
-            html += "</table></div>"
-        
-        # Add quality issues
-        if report.quality_issues:
-            html += f"""
-            <div class="section">
-                <h2>Quality Issues</h2>
-                <div class="quality-issues">
-                    <ul>
-                        {''.join(f'<li>{issue}</li>' for issue in report.quality_issues)}
-                    </ul>
-                </div>
-            </div>
-            """
-        
-        # Add recommendations
-        if report.recommendations:
-            html += f"""
-            <div class="section">
-                <h2>Recommendations</h2>
-                <div class="recommendations">
-                    <ul>
-                        {''.join(f'<li>{rec}</li>' for rec in report.recommendations)}
-                    </ul>
-                </div>
-            </div>
-            """
-        
-        html += """
-        </body>
-        </html>
-        """
+        return render_template("functional_report.html", report=report)
+    
+    def _write_html_functional_report(self, report: FunctionalReport, stream: TextIO):
+        """Write HTML functional report to a text stream section by section"""
         
-        return html
+        render_template_to_stream("functional_report.html", stream, report=report)
 
 
 # Utility functions for generating specific functional reports
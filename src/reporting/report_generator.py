@@ -6,18 +6,27 @@ functional, security, and compliance reporting to create comprehensive
 unified reports across all testing domains.
 """
 
+import hashlib
 import json
 import os
+import pickle
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Any, TextIO, Tuple, Union
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
 from .unified_reporter import UnifiedReporter, UnifiedReport, ReportFormat, ReportScope
 from .security_reporter import SecurityReporter, SecurityReport
 from .compliance_reporter import ComplianceReporter, ComplianceReport
 from .functional_reporter import FunctionalReporter, FunctionalReport
+from .report_index import ReportIndex
+from .report_writer import write_json
+from .template_engine import preload_templates
 
 
 class ReportGenerationMode(Enum):
@@ -50,6 +59,10 @@ class ReportGenerationConfig:
     max_details_level: int = 3  # 1=summary, 2=detailed, 3=comprehensive
     custom_branding: Optional[Dict[str, str]] = None
     template_overrides: Optional[Dict[str, str]] = None
+    parallel: bool = False  # build domain reports and exports in a process pool
+    max_workers: Optional[int] = None
+    incremental: bool = False  # skip reports whose inputs and config are unchanged
+    index_reports: bool = True  # record written reports in the directory's search index
 
 
 @dataclass
@@ -64,6 +77,45 @@ class ReportGenerationResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+# Report jobs in the order their outputs are listed
+REPORT_DOMAINS = ("functional", "security", "compliance", "unified")
+
+# Manifest of report fingerprints and outputs kept in the output directory
+REPORT_MANIFEST = ".report_manifest.json"
+
+# Config fields that do not change report content
+NON_CONTENT_CONFIG_FIELDS = ("output_directory", "parallel", "max_workers", "incremental", "index_reports")
+
+# Generator reused by every job a pool worker process runs
+_worker_generator: Optional['ReportGenerator'] = None
+
+
+def _get_worker_generator(config: ReportGenerationConfig) -> 'ReportGenerator':
+    """Get the pool worker's generator, creating it for the first job"""
+    global _worker_generator
+    
+    if _worker_generator is None or _worker_generator.config != config:
+        _worker_generator = ReportGenerator(config)
+    
+    return _worker_generator
+
+
+def _build_report_job(config: ReportGenerationConfig, domain: str,
+                      inputs: Dict[str, Any]) -> Tuple[Any, float]:
+    """Pool job: build one domain report"""
+    start = time.perf_counter()
+    report = _get_worker_generator(config)._build_report(domain, inputs)
+    return report, time.perf_counter() - start
+
+
+def _export_report_job(config: ReportGenerationConfig, domain: str, report: Any,
+                       format_type: ReportOutputFormat) -> Tuple[str, float]:
+    """Pool job: write one report in one output format"""
+    start = time.perf_counter()
+    file_path = _get_worker_generator(config)._export_report(domain, report, format_type)
+    return file_path, time.perf_counter() - start
+
+
 class ReportGenerator:
     """
     Centralized report generator that coordinates all reporting components
@@ -97,26 +149,50 @@ class ReportGenerator:
         result = ReportGenerationResult(success=True)
         
         try:
-            # Generate domain-specific reports if requested
-            if self.config.generation_mode in [
-                ReportGenerationMode.DOMAIN_SPECIFIC,
-                ReportGenerationMode.COMPREHENSIVE
-            ]:
-                result = self._generate_domain_reports(
-                    result, functional_results, security_results, 
-                    compliance_results, test_environment, execution_context
-                )
+            jobs = self._collect_report_jobs(
+                functional_results, security_results, compliance_results,
+                test_environment, execution_context
+            )
+            
+            fingerprints = {domain: self._fingerprint_inputs(inputs) for domain, inputs in jobs.items()}
+            
+            # Reuse outputs whose report inputs and config are unchanged
+            reused = self._find_unchanged_outputs(fingerprints) if self.config.incremental else {}
+            exports = {
+                domain: [
+                    format_type for format_type in self._get_output_formats()
+                    if (domain, format_type) not in reused
+                ]
+                for domain in jobs
+            }
+            pending = {domain: inputs for domain, inputs in jobs.items() if exports[domain]}
+            
+            # Build each changed report and write its missing output formats
+            timings: Dict[str, Dict[str, float]] = {domain: {} for domain in pending}
+            reports: Dict[str, Any] = {}
+            if self.config.parallel and pending:
+                outputs = self._run_report_jobs_parallel(pending, exports, result, timings, reports)
+            else:
+                outputs = self._run_report_jobs(pending, exports, result, timings, reports)
+            
+            if self.config.index_reports:
+                self._index_reports(reports, outputs, result)
+            outputs.update(reused)
+            
+            for domain in jobs:
+                for format_type in self._get_output_formats():
+                    if (domain, format_type) in outputs:
+                        result.generated_reports.append(outputs[(domain, format_type)])
             
-            # Generate unified report if requested
-            if self.config.generation_mode in [
-                ReportGenerationMode.UNIFIED_ONLY,
-                ReportGenerationMode.COMPREHENSIVE,
-                ReportGenerationMode.EXECUTIVE_SUMMARY
-            ]:
-                result = self._generate_unified_report(
-                    result, functional_results, security_results,
-                    compliance_results, test_environment, execution_context
-                )
+            if self.config.incremental:
+                self._update_report_manifest(fingerprints, outputs)
+            
+            result.metadata['parallel'] = self.config.parallel
+            result.metadata['stage_timings'] = timings
+            result.metadata['fingerprints'] = fingerprints
+            result.metadata['reused_reports'] = [
+                path for path in result.generated_reports if path in reused.values()
+            ]
             
             # Calculate generation metrics
             end_time = datetime.now()
@@ -132,111 +208,325 @@ class ReportGenerator:
         
         return result
     
-    def _generate_domain_reports(
+    def _collect_report_jobs(
         self,
-        result: ReportGenerationResult,
         functional_results: Optional[Any],
         security_results: Optional[Any],
         compliance_results: Optional[Any],
         test_environment: str,
         execution_context: str
-    ) -> ReportGenerationResult:
-        """Generate domain-specific reports"""
+    ) -> Dict[str, Dict[str, Any]]:
+        """Collect the inputs of each report requested by the generation mode"""
         
-        # Generate functional report
-        if functional_results:
-            try:
-                functional_report = self.functional_reporter.generate_functional_report(
-                    test_results=functional_results,
-                    test_environment=test_environment,
-                    execution_context=execution_context
-                )
-                
-                for format_type in self.config.output_formats:
-                    if format_type != ReportOutputFormat.ALL_FORMATS:
-                        file_path = self._save_domain_report(
-                            functional_report, "functional", format_type
-                        )
-                        result.generated_reports.append(file_path)
-                        
-            except Exception as e:
-                result.errors.append(f"Functional report generation failed: {str(e)}")
+        context = {'test_environment': test_environment, 'execution_context': execution_context}
+        jobs = {}
         
-        # Generate security report
-        if security_results:
-            try:
-                security_report = self.security_reporter.generate_security_report(
-                    scan_results=security_results,
-                    test_environment=test_environment,
-                    execution_context=execution_context
-                )
-                
-                for format_type in self.config.output_formats:
-                    if format_type != ReportOutputFormat.ALL_FORMATS:
-                        file_path = self._save_domain_report(
-                            security_report, "security", format_type
-                        )
-                        result.generated_reports.append(file_path)
-                        
-            except Exception as e:
-                result.errors.append(f"Security report generation failed: {str(e)}")
+        # Domain-specific reports
+        if self.config.generation_mode in [
+            ReportGenerationMode.DOMAIN_SPECIFIC,
+            ReportGenerationMode.COMPREHENSIVE
+        ]:
+            if functional_results:
+                jobs['functional'] = {'functional_results': functional_results, **context}
+            if security_results:
+                jobs['security'] = {'security_results': security_results, **context}
+            if compliance_results:
+                jobs['compliance'] = {'compliance_results': compliance_results, **context}
         
-        # Generate compliance report
-        if compliance_results:
-            try:
-                compliance_report = self.compliance_reporter.generate_compliance_report(
-                    assessment_results=compliance_results,
-                    test_environment=test_environment,
-                    execution_context=execution_context
-                )
-                
-                for format_type in self.config.output_formats:
-                    if format_type != ReportOutputFormat.ALL_FORMATS:
-                        file_path = self._save_domain_report(
-                            compliance_report, "compliance", format_type
-                        )
-                        result.generated_reports.append(file_path)
-                        
-            except Exception as e:
-                result.errors.append(f"Compliance report generation failed: {str(e)}")
+        # Unified report
+        if self.config.generation_mode in [
+            ReportGenerationMode.UNIFIED_ONLY,
+            ReportGenerationMode.COMPREHENSIVE,
+            ReportGenerationMode.EXECUTIVE_SUMMARY
+        ]:
+            jobs['unified'] = {
+                'functional_results': functional_results,
+                'security_results': security_results,
+                'compliance_results': compliance_results,
+                **context
+            }
         
-        return result
+        return {domain: jobs[domain] for domain in REPORT_DOMAINS if domain in jobs}
     
-    def _generate_unified_report(
+    def _get_output_formats(self) -> List[ReportOutputFormat]:
+        """Get the concrete output formats to write"""
+        return [
+            format_type for format_type in self.config.output_formats
+            if format_type != ReportOutputFormat.ALL_FORMATS
+        ]
+    
+    def _build_report(self, domain: str, inputs: Dict[str, Any]) -> Any:
+        """Build one report from its inputs"""
+        
+        if domain == "functional":
+            return self.functional_reporter.generate_functional_report(
+                test_results=inputs['functional_results'],
+                test_environment=inputs['test_environment'],
+                execution_context=inputs['execution_context']
+            )
+        
+        if domain == "security":
+            return self.security_reporter.generate_security_report(
+                security_results=inputs['security_results'],
+                environment=inputs['test_environment']
+            )
+        
+        if domain == "compliance":
+            return self.compliance_reporter.generate_compliance_report(
+                compliance_results=inputs['compliance_results'],
+                assessment_scope=inputs['execution_context']
+            )
+        
+        # Determine report scope based on available data
+        scope = self._determine_report_scope(
+            inputs['functional_results'], inputs['security_results'], inputs['compliance_results']
+        )
+        
+        return self.unified_reporter.generate_unified_report(
+            unified_result=SimpleNamespace(
+                functional_results=inputs['functional_results'],
+                security_results=inputs['security_results'],
+                compliance_results=inputs['compliance_results']
+            ),
+            scope=scope
+        )
+    
+    def _export_report(self, domain: str, report: Any, format_type: ReportOutputFormat) -> str:
+        """Write one report in one output format"""
+        if domain == "unified":
+            return self._save_unified_report(report, format_type)
+        return self._save_domain_report(report, domain, format_type)
+    
+    def _run_report_jobs(
         self,
+        jobs: Dict[str, Dict[str, Any]],
+        exports: Dict[str, List[ReportOutputFormat]],
         result: ReportGenerationResult,
-        functional_results: Optional[Any],
-        security_results: Optional[Any],
-        compliance_results: Optional[Any],
-        test_environment: str,
-        execution_context: str
-    ) -> ReportGenerationResult:
-        """Generate unified report"""
+        timings: Dict[str, Dict[str, float]],
+        reports: Dict[str, Any]
+    ) -> Dict[Tuple[str, ReportOutputFormat], str]:
+        """Build and export reports one after another in this process, reusing reports already built"""
+        
+        outputs = {}
+        
+        for domain, inputs in jobs.items():
+            report = reports.get(domain)
+            if report is None:
+                start = time.perf_counter()
+                try:
+                    report = self._build_report(domain, inputs)
+                except Exception as e:
+                    result.errors.append(f"{domain.title()} report generation failed: {str(e)}")
+                    continue
+                timings[domain]['generate'] = time.perf_counter() - start
+                reports[domain] = report
+            
+            for format_type in exports[domain]:
+                start = time.perf_counter()
+                try:
+                    outputs[(domain, format_type)] = self._export_report(domain, report, format_type)
+                except Exception as e:
+                    result.errors.append(
+                        f"{domain.title()} report export to {format_type.value} failed: {str(e)}"
+                    )
+                    continue
+                timings[domain][format_type.value] = time.perf_counter() - start
+        
+        return outputs
+    
+    def _run_report_jobs_parallel(
+        self,
+        jobs: Dict[str, Dict[str, Any]],
+        exports: Dict[str, List[ReportOutputFormat]],
+        result: ReportGenerationResult,
+        timings: Dict[str, Dict[str, float]],
+        reports: Dict[str, Any]
+    ) -> Dict[Tuple[str, ReportOutputFormat], str]:
+        """
+        Build reports in a process pool, submitting each report's exports as
+        soon as it is built so the total approaches the slowest report.
+        If the pool breaks, only the reports and exports that had not
+        finished are completed in this process.
+        """
+        
+        export_count = sum(len(exports[domain]) for domain in jobs)
+        max_workers = self.config.max_workers or min(max(export_count, len(jobs)), os.cpu_count() or 1)
+        outputs = {}
+        local_jobs = {}
+        # Jobs that finished in the pool, successfully or with a recorded error
+        settled_domains = set()
+        settled_exports = set()
         
         try:
-            # Determine report scope based on available data
-            scope = self._determine_report_scope(
-                functional_results, security_results, compliance_results
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=preload_templates) as executor:
+                pending = {
+                    executor.submit(_build_report_job, self.config, domain, inputs): (domain, None)
+                    for domain, inputs in jobs.items()
+                }
+                
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        domain, format_type = pending.pop(future)
+                        try:
+                            value, elapsed = future.result()
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            if self._is_pickling_error(e):
+                                # Inputs or report cannot cross processes, build it here instead
+                                local_jobs[domain] = jobs[domain]
+                                settled_domains.add(domain)
+                            elif format_type is None:
+                                result.errors.append(f"{domain.title()} report generation failed: {str(e)}")
+                                settled_domains.add(domain)
+                            else:
+                                result.errors.append(
+                                    f"{domain.title()} report export to {format_type.value} failed: {str(e)}"
+                                )
+                                settled_exports.add((domain, format_type))
+                            continue
+                        
+                        if format_type is None:
+                            timings[domain]['generate'] = elapsed
+                            reports[domain] = value
+                            for export_format in exports[domain]:
+                                export = executor.submit(_export_report_job, self.config, domain, value, export_format)
+                                pending[export] = (domain, export_format)
+                        else:
+                            timings[domain][format_type.value] = elapsed
+                            outputs[(domain, format_type)] = value
+                            settled_exports.add((domain, format_type))
+        
+        except (BrokenProcessPool, OSError) as e:
+            # Keep what the pool completed; built reports are exported here without a rebuild
+            remaining_exports = {
+                domain: [
+                    format_type for format_type in exports[domain]
+                    if (domain, format_type) not in settled_exports
+                ]
+                for domain in jobs if domain not in settled_domains
+            }
+            remaining_jobs = {domain: jobs[domain] for domain, formats in remaining_exports.items() if formats}
+            result.warnings.append(
+                f"Parallel report generation unavailable, remaining reports generated serially: {str(e)}"
             )
-            
-            unified_report = self.unified_reporter.generate_unified_report(
-                functional_results=functional_results,
-                security_results=security_results,
-                compliance_results=compliance_results,
-                report_scope=scope,
-                test_environment=test_environment,
-                execution_context=execution_context
+            outputs.update(self._run_report_jobs(remaining_jobs, remaining_exports, result, timings, reports))
+        
+        if local_jobs:
+            result.warnings.append(
+                f"Reports generated in-process because their data could not be pickled: {', '.join(local_jobs)}"
             )
+            outputs.update(self._run_report_jobs(local_jobs, exports, result, timings, reports))
+        
+        return outputs
+    
+    def _fingerprint_inputs(self, inputs: Dict[str, Any]) -> str:
+        """
+        Content hash of a report's inputs and the content-relevant config
+        
+        Objects without a stable JSON form hash by their str(), so inputs
+        whose repr includes an address always count as changed.
+        """
+        config = {
+            config_field.name: getattr(self.config, config_field.name)
+            for config_field in fields(self.config)
+            if config_field.name not in NON_CONTENT_CONFIG_FIELDS
+        }
+        try:
+            payload = json.dumps([config, inputs], sort_keys=True, default=self._fingerprint_default)
+        except (TypeError, ValueError, RecursionError):
+            # Not serializable, never treat as unchanged
+            payload = f"{time.time_ns()}:{os.getpid()}"
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _fingerprint_default(self, value: Any) -> Any:
+        """JSON fallback for fingerprinted inputs"""
+        if isinstance(value, Enum):
+            return value.value
+        if hasattr(value, 'to_dict'):
+            return value.to_dict()
+        if hasattr(value, '__dict__'):
+            return vars(value)
+        return str(value)
+    
+    def _load_report_manifest(self) -> Dict[str, Any]:
+        """Load fingerprints and outputs recorded by previous generations"""
+        manifest_path = os.path.join(self.config.output_directory, REPORT_MANIFEST)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _find_unchanged_outputs(self, fingerprints: Dict[str, str]) -> Dict[Tuple[str, ReportOutputFormat], str]:
+        """Find existing outputs of reports whose fingerprint is unchanged"""
+        
+        manifest = self._load_report_manifest()
+        reused = {}
+        
+        for domain, fingerprint in fingerprints.items():
+            entry = manifest.get(domain)
+            if not entry or entry.get('fingerprint') != fingerprint:
+                continue
+            for format_type in self._get_output_formats():
+                file_path = entry.get('outputs', {}).get(format_type.value)
+                if file_path and os.path.exists(file_path):
+                    reused[(domain, format_type)] = file_path
+        
+        return reused
+    
+    def _update_report_manifest(
+        self,
+        fingerprints: Dict[str, str],
+        outputs: Dict[Tuple[str, ReportOutputFormat], str]
+    ):
+        """Record the fingerprint and outputs of every report written or reused"""
+        
+        manifest = self._load_report_manifest()
+        
+        for domain, fingerprint in fingerprints.items():
+            domain_outputs = {
+                format_type.value: file_path
+                for (output_domain, format_type), file_path in outputs.items()
+                if output_domain == domain
+            }
+            if not domain_outputs:
+                continue
             
-            for format_type in self.config.output_formats:
-                if format_type != ReportOutputFormat.ALL_FORMATS:
-                    file_path = self._save_unified_report(unified_report, format_type)
-                    result.generated_reports.append(file_path)
-                    
-        except Exception as e:
-            result.errors.append(f"Unified report generation failed: {str(e)}")
+            entry = manifest.get(domain)
+            if entry and entry.get('fingerprint') == fingerprint:
+                # Keep outputs of formats not requested this time
+                domain_outputs = {**entry.get('outputs', {}), **domain_outputs}
+            manifest[domain] = {'fingerprint': fingerprint, 'outputs': domain_outputs}
         
-        return result
+        manifest_path = os.path.join(self.config.output_directory, REPORT_MANIFEST)
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+    
+    def _index_reports(
+        self,
+        reports: Dict[str, Any],
+        outputs: Dict[Tuple[str, ReportOutputFormat], str],
+        result: ReportGenerationResult
+    ):
+        """Record newly written reports in the output directory's search index"""
+        
+        index = ReportIndex(self.config.output_directory)
+        
+        for domain, report in reports.items():
+            paths = [
+                file_path for (output_domain, _), file_path in outputs.items()
+                if output_domain == domain
+            ]
+            if paths and not index.index_report(report, domain, paths):
+                result.warnings.append(f"{domain.title()} report could not be added to the search index")
+    
+    def _is_pickling_error(self, error: Exception) -> bool:
+        """Check whether a pool job failed because its arguments or result could not be pickled"""
+        return isinstance(error, pickle.PicklingError) or (
+            isinstance(error, (TypeError, AttributeError)) and 'pickle' in str(error)
+        )
     
     def _save_domain_report(
         self,
@@ -250,17 +540,18 @@ class ReportGenerator:
         filename = f"{self.config.report_name}_{domain}_{timestamp}.{format_type.value}"
         file_path = os.path.join(self.config.output_directory, filename)
         
-        if format_type == ReportOutputFormat.JSON:
-            content = self._get_json_content(report)
-        elif format_type == ReportOutputFormat.HTML:
-            content = self._get_html_content(report, domain)
-        elif format_type == ReportOutputFormat.MARKDOWN:
-            content = self._get_markdown_content(report, domain)
-        else:
+        if format_type not in (ReportOutputFormat.JSON, ReportOutputFormat.HTML, ReportOutputFormat.MARKDOWN):
             raise ValueError(f"Unsupported format: {format_type}")
         
+        # JSON and HTML are streamed to the file so large reports are never
+        # held in memory as a single string
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+            if format_type == ReportOutputFormat.JSON:
+                self._write_json_content(report, f)
+            elif format_type == ReportOutputFormat.HTML:
+                self._write_html_content(report, domain, f)
+            else:
+                f.write(self._get_markdown_content(report, domain))
         
         return file_path
     
@@ -276,11 +567,11 @@ class ReportGenerator:
         file_path = os.path.join(self.config.output_directory, filename)
         
         if format_type == ReportOutputFormat.JSON:
-            content = self.unified_reporter.export_to_json(report)
+            content = self._get_json_content(report)
         elif format_type == ReportOutputFormat.HTML:
-            content = self.unified_reporter.export_to_html(report)
+            content = self.unified_reporter._generate_html_report(report)
         elif format_type == ReportOutputFormat.MARKDOWN:
-            content = self.unified_reporter.export_to_markdown(report)
+            content = self.unified_reporter._generate_markdown_report(report)
         else:
             raise ValueError(f"Unsupported format: {format_type}")
         
@@ -291,21 +582,30 @@ class ReportGenerator:
     
     def _get_json_content(self, report: Any) -> str:
         """Get JSON content for domain report"""
+        if hasattr(report, 'to_dict'):
+            return json.dumps(report.to_dict(), default=str, indent=2)
         if hasattr(report, '__dict__'):
             return json.dumps(report.__dict__, default=str, indent=2)
         return json.dumps(report, default=str, indent=2)
     
-    def _get_html_content(self, report: Any, domain: str) -> str:
-        """Get HTML content for domain report"""
-        if domain == "functional" and hasattr(self.functional_reporter, 'export_to_html'):
-            return self.functional_reporter.export_to_html(report)
-        elif domain == "security" and hasattr(self.security_reporter, 'export_to_html'):
-            return self.security_reporter.export_to_html(report)
-        elif domain == "compliance" and hasattr(self.compliance_reporter, 'export_to_html'):
-            return self.compliance_reporter.export_to_html(report)
+    def _write_json_content(self, report: Any, stream: TextIO):
+        """Stream JSON content for domain report"""
+        if hasattr(report, 'to_dict'):
+            write_json(report.to_dict(lazy=True), stream, indent=2, default=str)
+        else:
+            stream.write(self._get_json_content(report))
+    
+    def _write_html_content(self, report: Any, domain: str, stream: TextIO):
+        """Stream HTML content for domain report"""
+        if domain == "functional":
+            self.functional_reporter._write_html_functional_report(report, stream)
+        elif domain == "security":
+            self.security_reporter._write_html_security_report(report, stream)
+        elif domain == "compliance":
+            self.compliance_reporter._write_html_compliance_report(report, stream)
         else:
             # Fallback to basic HTML
-            return f"""
+            stream.write(f"""
             <html>
             <head><title>{domain.title()} Report</title></head>
             <body>
@@ -313,7 +613,7 @@ class ReportGenerator:
                 <pre>{json.dumps(report.__dict__ if hasattr(report, '__dict__') else report, default=str, indent=2)}</pre>
             </body>
             </html>
-            """
+            """)
     
     def _get_markdown_content(self, report: Any, domain: str) -> str:
         """Get Markdown content for domain report"""
@@ -349,15 +649,15 @@ class ReportGenerator:
         if has_functional and has_security and has_compliance:
             return ReportScope.COMPREHENSIVE
         elif (has_functional and has_security) or (has_functional and has_compliance) or (has_security and has_compliance):
-            return ReportScope.CROSS_DOMAIN
+            return ReportScope.DETAILED_ANALYSIS
         elif has_functional:
-            return ReportScope.FUNCTIONAL_ONLY
+            return ReportScope.FUNCTIONAL_FOCUSED
         elif has_security:
-            return ReportScope.SECURITY_ONLY
+            return ReportScope.SECURITY_FOCUSED
         elif has_compliance:
-            return ReportScope.COMPLIANCE_ONLY
+            return ReportScope.COMPLIANCE_FOCUSED
         else:
-            return ReportScope.SUMMARY_ONLY
+            return ReportScope.EXECUTIVE_SUMMARY
     
     def _calculate_total_size(self, file_paths: List[str]) -> int:
         """Calculate total size of generated reports"""
@@ -381,16 +681,20 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 """
         
+        reused_reports = set(result.metadata.get('reused_reports', []))
+        
         for report_path in result.generated_reports:
             filename = os.path.basename(report_path)
             file_size = os.path.getsize(report_path) if os.path.exists(report_path) else 0
-            index_content += f"- [{filename}](./{filename}) ({file_size:,} bytes)\n"
+            unchanged = ", unchanged" if report_path in reused_reports else ""
+            index_content += f"- [{filename}](./{filename}) ({file_size:,} bytes{unchanged})\n"
         
         index_content += f"""
 
 ## Generation Summary
 
 - **Total Reports:** {len(result.generated_reports)}
+- **Regenerated Reports:** {len(result.generated_reports) - len(reused_reports)}
 - **Total Size:** {result.total_size_bytes:,} bytes
 - **Generation Time:** {result.generation_time:.2f} seconds
 - **Success:** {'Yes' if result.success else 'No'}
@@ -422,7 +726,8 @@ def generate_comprehensive_reports(
     security_results: Optional[Any] = None,
     compliance_results: Optional[Any] = None,
     output_directory: str = "./reports",
-    report_name: str = "comprehensive_test_report"
+    report_name: str = "comprehensive_test_report",
+    parallel: bool = False
 ) -> ReportGenerationResult:
     """Generate comprehensive reports with default configuration"""
     
@@ -430,7 +735,8 @@ def generate_comprehensive_reports(
         output_directory=output_directory,
         report_name=report_name,
         generation_mode=ReportGenerationMode.COMPREHENSIVE,
-        output_formats=[ReportOutputFormat.HTML, ReportOutputFormat.JSON]
+        output_formats=[ReportOutputFormat.HTML, ReportOutputFormat.JSON],
+        parallel=parallel
     )
     
     generator = ReportGenerator(config)
@@ -0,0 +1,327 @@
+"""
+Report Index Module
+
+Full-text search across generated reports. Every report written to an
+output directory is recorded in a SQLite FTS5 index stored next to the
+report files. The index holds the report's identifiers (test names and IDs,
+vulnerability, CVE and CWE IDs, requirement IDs) and its summary text, so
+finding the reports that mention a test or a CVE is an index lookup rather
+than a scan of the HTML and JSON files.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+# Index database kept in each report output directory
+REPORT_INDEX_FILE = ".report_index.db"
+
+CVE_PATTERN = re.compile(r'\bCVE-\d{4}-\d{4,}\b', re.IGNORECASE)
+
+
+@dataclass
+class ReportSearchHit:
+    """A report matching a search"""
+    report_id: str
+    title: str
+    report_type: str
+    generated_at: str
+    paths: List[str] = field(default_factory=list)
+    snippet: str = ""
+    rank: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert hit to dictionary"""
+        return {
+            "report_id": self.report_id,
+            "title": self.title,
+            "report_type": self.report_type,
+            "generated_at": self.generated_at,
+            "paths": self.paths,
+            "snippet": self.snippet,
+            "rank": self.rank
+        }
+
+
+def extract_report_terms(report: Any) -> Tuple[List[str], str]:
+    """
+    Collect the searchable identifiers and text of a report.
+
+    Works on functional, security, compliance and unified reports by the
+    attributes they have, so the reporters need no index-specific code.
+
+    Returns:
+        Identifiers in first-seen order, and the report's summary text
+    """
+    identifiers: List[str] = []
+    seen = set()
+
+    def add(value: Any):
+        if value is None or value == "":
+            return
+        value = str(value)
+        if value not in seen:
+            seen.add(value)
+            identifiers.append(value)
+
+    # Functional reports: every test in the suites and the listed tests
+    tests = [test for suite in getattr(report, 'test_suites', []) for test in getattr(suite, 'tests', [])]
+    for attribute in ('failed_tests', 'slow_tests', 'flaky_tests'):
+        tests.extend(getattr(report, attribute, []))
+    for test in tests:
+        add(getattr(test, 'test_name', None))
+        add(getattr(test, 'test_id', None))
+    for suite in getattr(report, 'test_suites', []):
+        add(getattr(suite, 'suite_name', None))
+
+    # Security reports
+    for vulnerability in getattr(report, 'vulnerabilities', []):
+        for attribute in ('vulnerability_id', 'cve_id', 'cwe_id', 'owasp_category', 'title'):
+            add(getattr(vulnerability, attribute, None))
+
+    # Compliance reports
+    for standard in getattr(report, 'standards_assessed', []):
+        add(standard)
+    for gap in getattr(report, 'gaps', []):
+        for attribute in ('gap_id', 'requirement_id', 'requirement_title', 'standard'):
+            add(getattr(gap, attribute, None))
+
+    # Unified reports keep findings and issues as dicts
+    for item in list(getattr(report, 'critical_issues', [])) + list(getattr(report, 'key_findings', [])):
+        if isinstance(item, dict):
+            for key in ('id', 'issue_id', 'vulnerability_id', 'requirement_id', 'test_name', 'title'):
+                add(item.get(key))
+
+    text_parts = [getattr(report, 'executive_summary', '') or '']
+    for attribute in ('key_findings', 'quality_issues', 'critical_issues', 'recommendations'):
+        for item in getattr(report, attribute, []):
+            if isinstance(item, str):
+                text_parts.append(item)
+            elif isinstance(item, dict):
+                text_parts.append(' '.join(str(value) for value in item.values() if isinstance(value, str)))
+            else:
+                text_parts.append(str(getattr(item, 'title', '') or ''))
+    text = '\n'.join(part for part in text_parts if part)
+
+    # CVE IDs mentioned only in free text
+    for match in CVE_PATTERN.findall(text):
+        add(match.upper())
+
+    return identifiers, text
+
+
+class ReportIndex:
+    """SQLite FTS5 index of the reports in one output directory"""
+
+    def __init__(self, index_path: Union[str, Path]):
+        """
+        Initialize report index.
+
+        Args:
+            index_path: Index database file, or a report directory to keep
+                the index in
+        """
+        index_path = Path(index_path)
+        if index_path.is_dir():
+            index_path = index_path / REPORT_INDEX_FILE
+        self.index_path = index_path
+        self.available = True
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.index_path), timeout=30)
+
+    def _init_database(self):
+        """Create the index tables, disabling the index when FTS5 is unavailable"""
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(self._connect()) as conn, conn:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS reports (
+                        id INTEGER PRIMARY KEY,
+                        report_id TEXT NOT NULL UNIQUE,
+                        title TEXT,
+                        report_type TEXT,
+                        generated_at TEXT,
+                        paths TEXT,
+                        indexed_at TEXT
+                    )
+                ''')
+                # Rows share their rowid with the reports table
+                conn.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS report_search
+                    USING fts5(title, identifiers, content, tokenize = 'unicode61')
+                ''')
+        except sqlite3.Error as e:
+            logger.warning(f"Report search index unavailable at {self.index_path}: {e}")
+            self.available = False
+
+    def index_report(self, report: Any, report_type: str, paths: Iterable[Union[str, Path]]) -> bool:
+        """
+        Add a report to the index, replacing an earlier entry for the same report.
+
+        Output paths of an earlier entry are kept, so formats written in
+        separate runs all show up in search results.
+
+        Args:
+            report: Generated report
+            report_type: Report domain, e.g. functional or security
+            paths: Files the report was written to
+
+        Returns:
+            True if the report was indexed
+        """
+        if not self.available:
+            return False
+
+        paths = [str(path) for path in paths]
+        identifiers, text = extract_report_terms(report)
+        report_id = str(getattr(report, 'report_id', '') or (paths[0] if paths else ''))
+        title = getattr(report, 'title', '') or ''
+        generated_at = getattr(report, 'generated_at', None)
+        generated_at = generated_at.isoformat() if isinstance(generated_at, datetime) else str(generated_at or '')
+
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    'SELECT id, paths FROM reports WHERE report_id = ?', (report_id,)
+                ).fetchone()
+                all_paths = json.loads(row[1]) if row else []
+                all_paths += [path for path in paths if path not in all_paths]
+
+                if row:
+                    rowid = row[0]
+                    conn.execute('DELETE FROM report_search WHERE rowid = ?', (rowid,))
+                    conn.execute('''
+                        UPDATE reports SET title = ?, report_type = ?, generated_at = ?, paths = ?, indexed_at = ?
+                        WHERE id = ?
+                    ''', (title, report_type, generated_at, json.dumps(all_paths), datetime.now().isoformat(), rowid))
+                else:
+                    rowid = conn.execute('''
+                        INSERT INTO reports (report_id, title, report_type, generated_at, paths, indexed_at)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    ''', (report_id, title, report_type, generated_at, json.dumps(all_paths),
+                          datetime.now().isoformat())).lastrowid
+
+                conn.execute(
+                    'INSERT INTO report_search (rowid, title, identifiers, content) VALUES (?, ?, ?, ?)',
+                    (rowid, title, '\n'.join(identifiers), text)
+                )
+            return True
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to index report {report_id}: {e}")
+            return False
+
+    def search(
+        self,
+        query: str,
+        report_type: Optional[str] = None,
+        match_any: bool = False,
+        limit: int = 20
+    ) -> List[ReportSearchHit]:
+        """
+        Find the reports mentioning the query terms, best matches first.
+
+        Each whitespace-separated term is matched as a phrase, so IDs such
+        as CVE-2024-1234 or checkout_flow match as written.
+
+        Args:
+            query: Search terms
+            report_type: Only return reports of this domain
+            match_any: Match reports containing any term instead of all
+            limit: Maximum number of hits
+        """
+        match = build_match_query(query, match_any)
+        if not self.available or not match or not self.index_path.exists():
+            return []
+
+        sql = '''
+            SELECT r.report_id, r.title, r.report_type, r.generated_at, r.paths,
+                   snippet(report_search, -1, '[', ']', '...', 12), bm25(report_search)
+            FROM report_search JOIN reports r ON r.id = report_search.rowid
+            WHERE report_search MATCH ?
+        '''
+        params: List[Any] = [match]
+        if report_type:
+            sql += ' AND r.report_type = ?'
+            params.append(report_type)
+        sql += ' ORDER BY bm25(report_search) LIMIT ?'
+        params.append(limit)
+
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Report search failed in {self.index_path}: {e}")
+            return []
+
+        return [
+            ReportSearchHit(
+                report_id=row[0], title=row[1], report_type=row[2], generated_at=row[3],
+                paths=json.loads(row[4]) if row[4] else [], snippet=row[5], rank=row[6]
+            )
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        """Number of indexed reports"""
+        if not self.available:
+            return 0
+        with closing(self._connect()) as conn:
+            return conn.execute('SELECT COUNT(*) FROM reports').fetchone()[0]
+
+
+def build_match_query(query: str, match_any: bool = False) -> str:
+    """Turn search terms into an FTS5 query of quoted phrases"""
+    phrases = ['"' + term.replace('"', '""') + '"' for term in query.split()]
+    return (' OR ' if match_any else ' ').join(phrases)
+
+
+def index_report_outputs(report: Any, report_type: str, paths: Iterable[Union[str, Path]]) -> bool:
+    """Index a report in the index of the directory its first output was written to"""
+    paths = [Path(path) for path in paths]
+    if not paths:
+        return False
+    return ReportIndex(paths[0].parent).index_report(report, report_type, paths)
+
+
+def search_reports(
+    query: str,
+    reports_dir: Union[str, Path] = "reports",
+    report_type: Optional[str] = None,
+    match_any: bool = False,
+    limit: int = 20
+) -> List[ReportSearchHit]:
+    """
+    Search every report index under a reports directory.
+
+    Args:
+        query: Search terms
+        reports_dir: Directory searched recursively for report indexes
+        report_type: Only return reports of this domain
+        match_any: Match reports containing any term instead of all
+        limit: Maximum number of hits
+
+    Returns:
+        Matching reports, best matches first
+    """
+    reports_dir = Path(reports_dir)
+    if not reports_dir.is_dir():
+        return []
+
+    hits: List[ReportSearchHit] = []
+    for index_path in sorted(reports_dir.rglob(REPORT_INDEX_FILE)):
+        hits.extend(ReportIndex(index_path).search(query, report_type, match_any, limit))
+
+    hits.sort(key=lambda hit: hit.rank)
+    return hits[:limit]
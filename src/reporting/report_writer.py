@@ -0,0 +1,127 @@
+"""
+Report Writer Module
+
+Streaming JSON output for reports. Reports expose their nested results
+lazily (`to_dict(lazy=True)`), and the writer encodes them one element at
+a time straight to the output file, so peak memory depends on the size of
+the largest single result rather than on the number of results.
+"""
+
+import json
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TextIO
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _ChunkedStream:
+    """Collects small encoded fragments and writes them in larger chunks"""
+
+    def __init__(self, stream: TextIO, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self._parts: List[str] = []
+        self._size = 0
+
+    def write(self, text: str):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self._parts:
+            self.stream.write(''.join(self._parts))
+            self._parts = []
+            self._size = 0
+
+
+def write_json(
+    obj: Any,
+    stream: TextIO,
+    indent: Optional[int] = 2,
+    ensure_ascii: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+):
+    """
+    Write obj as JSON to a text stream without building the whole document.
+
+    Dicts are written key by key. Lists, tuples and any other iterators
+    (generators, map objects) are written as JSON arrays element by element.
+    Objects with a `to_dict` method are converted only when they are reached,
+    so a list of results is never held in converted form all at once. Other
+    values are encoded with json.dumps and the given options. With the same
+    options the output parses to the same value as json.dump of the
+    materialized object.
+
+    Args:
+        obj: Value to write
+        stream: Text stream to write to
+        indent: Indentation per level, None for compact output
+        ensure_ascii: Escape non-ASCII characters
+        default: Fallback encoder for otherwise unserializable values
+        chunk_size: Characters collected before each write to the stream
+    """
+    out = _ChunkedStream(stream, chunk_size)
+    _write_value(obj, out, indent, 0, ensure_ascii, default)
+    out.flush()
+
+
+def _write_value(value: Any, out: _ChunkedStream, indent: Optional[int], level: int,
+                 ensure_ascii: bool, default: Optional[Callable[[Any], Any]]):
+    """Write one value at the given nesting level"""
+    if hasattr(value, 'to_dict') and not isinstance(value, type):
+        value = value.to_dict()
+
+    if isinstance(value, dict):
+        _write_container(
+            iter(value.items()), '{', '}', out, indent, level, ensure_ascii, default, keyed=True
+        )
+    elif isinstance(value, (list, tuple)) or isinstance(value, Iterator):
+        _write_container(
+            iter(value), '[', ']', out, indent, level, ensure_ascii, default, keyed=False
+        )
+    else:
+        out.write(json.dumps(value, ensure_ascii=ensure_ascii, default=default))
+
+
+def _write_container(items: Iterable[Any], opening: str, closing: str, out: _ChunkedStream,
+                     indent: Optional[int], level: int, ensure_ascii: bool,
+                     default: Optional[Callable[[Any], Any]], keyed: bool):
+    """Write a JSON object or array, one member at a time"""
+    if indent is None:
+        separator, newline, inner, outer = ', ', '', '', ''
+    else:
+        separator, newline = ',', '\n'
+        inner = ' ' * (indent * (level + 1))
+        outer = ' ' * (indent * level)
+
+    empty = True
+    for item in items:
+        out.write((opening if empty else separator) + newline + inner)
+        empty = False
+        if keyed:
+            key, item = item
+            out.write(json.dumps(_json_key(key), ensure_ascii=ensure_ascii) + ': ')
+        _write_value(item, out, indent, level + 1, ensure_ascii, default)
+
+    if empty:
+        out.write(opening + closing)
+    else:
+        out.write(newline + outer + closing)
+
+
+def _json_key(key: Any) -> str:
+    """Coerce a dict key the way json.dumps does"""
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return 'true'
+    if key is False:
+        return 'false'
+    if key is None:
+        return 'null'
+    if isinstance(key, (int, float)):
+        return json.dumps(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
@@ -5,15 +5,17 @@ Specialized reporting for security assessment results, vulnerability analysis,
 threat assessment, and security recommendations.
 """
 
-import json
 import logging
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, TextIO, Tuple
 from dataclasses import dataclass, field
 import uuid
 
+from .report_writer import write_json
+from .template_engine import render_template, render_template_to_stream
+
 logger = logging.getLogger(__name__)
 
 
@@ -255,8 +257,13 @@ class SecurityReport:
     tool_configurations: Dict[str, Any] = field(default_factory=dict)
     raw_results: Dict[str, Any] = field(default_factory=dict)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
+    def to_dict(self, lazy: bool = False) -> Dict[str, Any]:
+        """
+        Convert to dictionary.
+
+        With lazy=True the detail lists are left as iterators that write_json
+        converts one at a time; such a dict can be written once.
+        """
         return {
             "report_id": self.report_id,
             "title": self.title,
@@ -269,8 +276,8 @@ class SecurityReport:
             "executive_summary": self.executive_summary,
             "key_findings": self.key_findings,
             "metrics": self._metrics_to_dict() if self.metrics else None,
-            "vulnerabilities": [vuln.to_dict() for vuln in self.vulnerabilities],
-            "recommendations": [rec.to_dict() for rec in self.recommendations],
+            "vulnerabilities": iter(self.vulnerabilities) if lazy else [vuln.to_dict() for vuln in self.vulnerabilities],
+            "recommendations": iter(self.recommendations) if lazy else [rec.to_dict() for rec in self.recommendations],
             "overall_risk_rating": self.overall_risk_rating,
             "business_impact": self.business_impact,
             "technical_impact": self.technical_impact,
@@ -972,15 +979,13 @@ class SecurityReporter:
         """Export as JSON"""
         
         with open(path, 'w', encoding='utf-8') as f:
-            json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
+            write_json(report.to_dict(lazy=True), f, indent=2, ensure_ascii=False)
     
     def _export_html(self, report: SecurityReport, path: Path):
         """Export as HTML"""
         
-        html_content = self._generate_html_security_report(report)
-        
         with open(path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            self._write_html_security_report(report, f)
     
     def _export_pdf(self, report: SecurityReport, path: Path):
         """Export as PDF (placeholder - would require PDF library)"""
@@ -994,142 +999,12 @@ class SecurityReporter:
     def _generate_html_security_report(self, report: SecurityReport) -> str:
         """Generate HTML security report"""
         
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>{report.title}</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                .header {{ background-color: #f0f0f0; padding: 20px; border-radius: 5px; }}
-                .section {{ margin: 20px 0; padding: 15px; border-left: 3px solid #007acc; }}
-                .vulnerability {{ margin: 10px 0; padding: 10px; border-radius: 5px; }}
-                .critical {{ background-color: #ffebee; border-left: 3px solid #d32f2f; }}
-                .high {{ background-color: #fff3e0; border-left: 3px solid #f57c00; }}
-                .medium {{ background-color: #fffde7; border-left: 3px solid #fbc02d; }}
-                .low {{ background-color: #f1f8e9; border-left: 3px solid #388e3c; }}
-                .metrics {{ display: flex; justify-content: space-around; margin: 20px 0; }}
-                .metric {{ text-align: center; padding: 10px; background-color: #f9f9f9; border-radius: 5px; }}
-                .recommendation {{ margin: 10px 0; padding: 10px; background-color: #e3f2fd; border-radius: 5px; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>{report.title}</h1>
-                <p><strong>Generated:</strong> {report.generated_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
-                <p><strong>Target System:</strong> {report.target_system}</p>
-                <p><strong>Environment:</strong> {report.environment}</p>
-                <p><strong>Overall Risk Rating:</strong> <span class="{report.overall_risk_rating.lower()}">{report.overall_risk_rating}</span></p>
-            </div>
-            
-            <div class="section">
-                <h2>Executive Summary</h2>
-                <pre>{report.executive_summary}</pre>
-            </div>
-        """
-        
-        # Add metrics
-        if report.metrics:
-            html += f"""
-            <div class="section">
-                <h2>Security Metrics</h2>
-                <div class="metrics">
-                    <div class="metric">
-                        <h3>Security Score</h3>
-                        <p>{report.metrics.security_score:.1%}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>Total Vulnerabilities</h3>
-                        <p>{report.metrics.total_vulnerabilities}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>Critical</h3>
-                        <p class="critical">{report.metrics.critical_vulnerabilities}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>High</h3>
-                        <p class="high">{report.metrics.high_vulnerabilities}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>Medium</h3>
-                        <p class="medium">{report.metrics.medium_vulnerabilities}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>Low</h3>
-                        <p class="low">{report.metrics.low_vulnerabilities}</p>
-                    </div>
-                </div>
-            </div>
-            """
-        
-        # Add key findings
-        if report.key_findings:
-            html += """
-            <div class="section">
-                <h2>Key Findings</h2>
-                <ul>
-            """
-            for finding in report.key_findings:
-                html += f"<li>{finding}</li>"
-            html += """
-                </ul>
-            </div>
-            """
-        
-        # Add vulnerabilities
-        if report.vulnerabilities:
-            html += """
-            <div class="section">
-                <h2>Vulnerabilities</h2>
-            """
-            
-            for vuln in report.vulnerabilities:
-                severity_class = vuln.severity.lower()
-                html += f"""
-                <div class="vulnerability {severity_class}">
-                    <h3>{vuln.title} <span class="{severity_class}">({vuln.severity.upper()})</span></h3>
-                    <p><strong>ID:</strong> {vuln.vulnerability_id}</p>
-                    <p><strong>Description:</strong> {vuln.description}</p>
-                    <p><strong>Category:</strong> {vuln.category.value if hasattr(vuln.category, 'value') else vuln.category}</p>
-                    {f'<p><strong>URL:</strong> {vuln.url}</p>' if vuln.url else ''}
-                    {f'<p><strong>CWE:</strong> {vuln.cwe_id}</p>' if vuln.cwe_id else ''}
-                    {f'<p><strong>CVE:</strong> {vuln.cve_id}</p>' if vuln.cve_id else ''}
-                    {f'<p><strong>Remediation:</strong> {vuln.remediation}</p>' if vuln.remediation else ''}
-                </div>
-                """
-            
-            html += """
-            </div>
-            """
-        
-        # Add recommendations
-        if report.recommendations:
-            html += """
-            <div class="section">
-                <h2>Recommendations</h2>
-            """
-            
-            for rec in report.recommendations:
-                html += f"""
-                <div class="recommendation">
-                    <h3>[{rec.priority}] {rec.title}</h3>
-                    <p>{rec.description}</p>
-                    <p><strong>Estimated Effort:</strong> {rec.estimated_effort}</p>
-                    <p><strong>Timeline:</strong> {rec.timeline}</p>
-                    {f'<p><strong>Risk Reduction:</strong> {rec.risk_reduction}</p>' if rec.risk_reduction != 'UNKNOWN' else ''}
-                </div>
-                """
-            
-            html += """
-            </div>
-            """
-        
-        html += """
-        </body>
-        </html>
-        """
+        return render_template("security_report.html", report=report)
+    
+    def _write_html_security_report(self, report: SecurityReport, stream: TextIO):
+        """Write HTML security report to a text stream section by section"""
         
-        return html
+        render_template_to_stream("security_report.html", stream, report=report)
     
     def get_vulnerability_statistics(self, report_id: str) -> Optional[Dict[str, Any]]:
         """Get vulnerability statistics for a report"""
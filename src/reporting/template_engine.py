@@ -0,0 +1,91 @@
+"""
+Template Engine Module
+
+One Jinja2 environment per process for all reporters. Templates are parsed
+and compiled on first use and kept in the environment, and compiled bytecode
+is cached on local disk so new processes (report workers, CLI runs) skip
+parsing as well. Template files are only re-checked for changes when
+auto-reload is enabled, which is meant for template development.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+
+def _percent(value: Any, precision: int = 1) -> str:
+    """Format a ratio as a percentage, e.g. 0.953 -> 95.3%"""
+    return f"{value or 0:.{precision}%}"
+
+
+def create_template_environment(
+    auto_reload: Optional[bool] = None,
+    cache_dir: Optional[str] = None
+) -> Environment:
+    """
+    Create a report template environment.
+
+    Args:
+        auto_reload: Re-check template files for changes on every lookup,
+            defaults to the REPORT_TEMPLATES_AUTO_RELOAD environment variable
+        cache_dir: Directory of the bytecode cache, defaults to the
+            REPORT_TEMPLATE_CACHE_DIR environment variable or a per-user
+            directory under the system temp directory
+
+    Returns:
+        Configured Jinja2 environment
+    """
+    if auto_reload is None:
+        auto_reload = os.getenv("REPORT_TEMPLATES_AUTO_RELOAD", "false").lower() == "true"
+    cache_dir = cache_dir or os.getenv("REPORT_TEMPLATE_CACHE_DIR")
+    if cache_dir:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        autoescape=select_autoescape(['html']),
+        bytecode_cache=FileSystemBytecodeCache(cache_dir),
+        auto_reload=auto_reload,
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+    env.filters['percent'] = _percent
+    return env
+
+
+def render_template(template_name: str, **context: Any) -> str:
+    """Render a report template to a string"""
+    return get_template_environment().get_template(template_name).render(**context)
+
+
+def render_template_to_stream(template_name: str, stream: TextIO, **context: Any):
+    """Render a report template chunk by chunk into a text stream"""
+    template = get_template_environment().get_template(template_name)
+    for chunk in template.generate(**context):
+        stream.write(chunk)
+
+
+def preload_templates():
+    """Compile every report template into the shared environment up front"""
+    env = get_template_environment()
+    for template_name in env.list_templates(extensions=['html']):
+        env.get_template(template_name)
+
+
+# Global template environment instance
+_template_environment: Optional[Environment] = None
+
+
+def get_template_environment() -> Environment:
+    """Get or create the shared report template environment."""
+    global _template_environment
+
+    if _template_environment is None:
+        _template_environment = create_template_environment()
+
+    return _template_environment
@@ -14,6 +14,9 @@ from typing import Any, Dict, List, Optional, Union
 from dataclasses import dataclass, field
 import uuid
 
+from .report_index import index_report_outputs
+from .template_engine import render_template, render_template_to_stream
+
 logger = logging.getLogger(__name__)
 
 
@@ -279,6 +282,7 @@ class UnifiedReporter:
         # Output configuration
         self.output_directory = Path("reports")
         self.output_directory.mkdir(exist_ok=True)
+        self.index_reports = True  # record exports in the output directory's search index
         
         # Template configurations
         self.template_configs = self._initialize_template_configs()
@@ -946,6 +950,9 @@ class UnifiedReporter:
             # Default to JSON
             self._export_json(report, full_path)
         
+        if self.index_reports:
+            index_report_outputs(report, "unified", [full_path])
+        
         logger.info(f"Report exported to: {full_path}")
         return full_path
     
@@ -958,10 +965,8 @@ class UnifiedReporter:
     def _export_html(self, report: UnifiedReport, path: Path):
         """Export report as HTML"""
         
-        html_content = self._generate_html_report(report)
-        
         with open(path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            render_template_to_stream("unified_report.html", f, report=report)
     
     def _export_markdown(self, report: UnifiedReport, path: Path):
         """Export report as Markdown"""
@@ -974,100 +979,7 @@ class UnifiedReporter:
     def _generate_html_report(self, report: UnifiedReport) -> str:
         """Generate HTML report content"""
         
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>{report.title}</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                .header {{ background-color: #f0f0f0; padding: 20px; border-radius: 5px; }}
-                .section {{ margin: 20px 0; padding: 15px; border-left: 3px solid #007acc; }}
-                .metrics {{ display: flex; justify-content: space-around; margin: 20px 0; }}
-                .metric {{ text-align: center; padding: 10px; background-color: #f9f9f9; border-radius: 5px; }}
-                .critical {{ color: #d32f2f; }}
-                .high {{ color: #f57c00; }}
-                .medium {{ color: #fbc02d; }}
-                .low {{ color: #388e3c; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>{report.title}</h1>
-                <p>Generated: {report.generated_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
-                <p>Execution ID: {report.execution_id}</p>
-                <p>Target System: {report.target_system}</p>
-            </div>
-            
-            <div class="section">
-                <h2>Executive Summary</h2>
-                <pre>{report.executive_summary}</pre>
-            </div>
-        """
-        
-        # Add metrics if available
-        if report.metrics:
-            html += f"""
-            <div class="section">
-                <h2>Key Metrics</h2>
-                <div class="metrics">
-                    <div class="metric">
-                        <h3>Overall Quality</h3>
-                        <p>{report.metrics.overall_quality_score:.2f}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>Functional Pass Rate</h3>
-                        <p>{report.metrics.functional_pass_rate:.1%}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>Security Score</h3>
-                        <p>{report.metrics.security_score:.1%}</p>
-                    </div>
-                    <div class="metric">
-                        <h3>Compliance Score</h3>
-                        <p>{report.metrics.compliance_score:.1%}</p>
-                    </div>
-                </div>
-            </div>
-            """
-        
-        # Add sections
-        for section in report.sections:
-            html += f"""
-            <div class="section">
-                <h2>{section.title}</h2>
-                <pre>{section.content}</pre>
-            </div>
-            """
-        
-        # Add recommendations
-        if report.recommendations:
-            html += """
-            <div class="section">
-                <h2>Recommendations</h2>
-                <ul>
-            """
-            
-            for rec in report.recommendations:
-                priority_class = rec.get('priority', 'medium').lower()
-                html += f"""
-                <li class="{priority_class}">
-                    <strong>[{rec.get('priority', 'MEDIUM').upper()}]</strong> 
-                    {rec.get('title', 'No title')} - {rec.get('description', 'No description')}
-                </li>
-                """
-            
-            html += """
-                </ul>
-            </div>
-            """
-        
-        html += """
-        </body>
-        </html>
-        """
-        
-        return html
+        return render_template("unified_report.html", report=report)
     
     def _generate_markdown_report(self, report: UnifiedReport) -> str:
         """Generate Markdown report content"""
@@ -8,12 +8,23 @@ It generates charts, graphs, and interactive visualizations.
 
 import json
 import base64
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Union
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Sequence, Tuple, Union
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 import math
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 
 class ChartType(Enum):
     """Types of charts"""
@@ -60,6 +71,7 @@ class ChartConfig:
     colors: Optional[List[str]] = None
     font_size: int = 12
     margin: Dict[str, int] = field(default_factory=lambda: {"top": 20, "right": 20, "bottom": 40, "left": 40})
+    max_points: Optional[int] = None  # points drawn per line series, defaults to one per pixel of plot width
 
 
 @dataclass
@@ -83,6 +95,165 @@ class Visualization:
     generated_at: datetime = field(default_factory=datetime.now)
 
 
+def lttb_downsample(x: Sequence[float], y: Sequence[float], threshold: int) -> List[int]:
+    """
+    Select points with Largest-Triangle-Three-Buckets downsampling.
+    
+    The first and last points are always kept. The points in between are
+    split into threshold - 2 buckets, and from each bucket the point forming
+    the largest triangle with the previously kept point and the average of
+    the next bucket is kept, which preserves peaks and the visual shape.
+    
+    Args:
+        x: Point x values, increasing
+        y: Point y values
+        threshold: Number of points to keep
+    
+    Returns:
+        Indices of the kept points in increasing order
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    
+    if not NUMPY_AVAILABLE:
+        return _lttb_downsample_python(x, y, threshold)
+    
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    
+    # Bucket b spans [edges[b], edges[b + 1]); the last one ends before the final point
+    edges = (np.arange(threshold - 1) * (n - 2) // (threshold - 2)) + 1
+    counts = np.diff(edges)
+    bucket_x = np.add.reduceat(x[:n - 1], edges[:-1]) / counts
+    bucket_y = np.add.reduceat(y[:n - 1], edges[:-1]) / counts
+    
+    # Each bucket is scored against the average of the next one, the last against the final point
+    next_x = np.append(bucket_x[1:], x[-1])
+    next_y = np.append(bucket_y[1:], y[-1])
+    
+    kept = np.empty(threshold, dtype=int)
+    kept[0] = 0
+    kept[-1] = n - 1
+    a = 0
+    for b in range(threshold - 2):
+        start, stop = edges[b], edges[b + 1]
+        areas = np.abs(
+            (x[a] - next_x[b]) * (y[start:stop] - y[a])
+            - (x[a] - x[start:stop]) * (next_y[b] - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        kept[b + 1] = a
+    
+    return kept.tolist()
+
+
+def _lttb_downsample_python(x: Sequence[float], y: Sequence[float], threshold: int) -> List[int]:
+    """Pure Python Largest-Triangle-Three-Buckets, used without NumPy"""
+    n = len(x)
+    edges = [i * (n - 2) // (threshold - 2) + 1 for i in range(threshold - 1)]
+    
+    kept = [0]
+    a = 0
+    for b in range(threshold - 2):
+        start, stop = edges[b], edges[b + 1]
+        if b + 2 < len(edges):
+            next_start, next_stop = stop, edges[b + 2]
+            next_x = sum(x[next_start:next_stop]) / (next_stop - next_start)
+            next_y = sum(y[next_start:next_stop]) / (next_stop - next_start)
+        else:
+            next_x, next_y = x[-1], y[-1]
+        
+        best_area, best = -1.0, start
+        for i in range(start, stop):
+            area = abs((x[a] - next_x) * (y[i] - y[a]) - (x[a] - x[i]) * (next_y - y[a]))
+            if area > best_area:
+                best_area, best = area, i
+        a = best
+        kept.append(a)
+    
+    kept.append(n - 1)
+    return kept
+
+
+class SvgCache:
+    """Process-wide LRU cache of generated SVGs keyed by chart data and config hash"""
+    
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(generator: str, data: 'ChartData', config: 'ChartConfig') -> str:
+        """Hash the generator name, chart data and chart config into a cache key"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps(
+            [generator, asdict(config), data.metadata], sort_keys=True, default=str
+        ).encode('utf-8'))
+        digest.update('\x1f'.join(map(str, data.labels)).encode('utf-8'))
+        
+        for dataset in data.datasets:
+            for key in sorted(dataset):
+                value = dataset[key]
+                digest.update(f"\x1e{key}\x1f".encode('utf-8'))
+                if NUMPY_AVAILABLE and isinstance(value, (list, tuple)):
+                    # Numeric series hash as one buffer instead of one JSON token per value
+                    try:
+                        digest.update(np.asarray(value, dtype=float).tobytes())
+                        continue
+                    except (TypeError, ValueError):
+                        pass
+                digest.update(json.dumps(value, sort_keys=True, default=str).encode('utf-8'))
+        
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached SVG"""
+        with self._lock:
+            svg = self._entries.get(key)
+            if svg is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return svg
+    
+    def put(self, key: str, svg: str):
+        """Cache an SVG, evicting the least recently used one when full"""
+        with self._lock:
+            self._entries[key] = svg
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached SVGs"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared across engine instances so redrawing an unchanged chart is a lookup
+_svg_cache = SvgCache()
+
+
+def _memoize_svg(generate):
+    """Serve an SVG generator's output from the SVG cache when data and config are unchanged"""
+    
+    @functools.wraps(generate)
+    def wrapper(self: 'VisualizationEngine', data: 'ChartData', config: 'ChartConfig') -> str:
+        key = SvgCache.make_key(generate.__name__, data, config)
+        svg = self.svg_cache.get(key)
+        if svg is None:
+            svg = generate(self, data, config)
+            self.svg_cache.put(key, svg)
+        return svg
+    
+    return wrapper
+
+
 class VisualizationEngine:
     """
     Comprehensive visualization engine for test results
@@ -93,6 +264,7 @@ class VisualizationEngine:
         self.theme = theme
         self.color_palettes = self._initialize_color_palettes()
         self.chart_counter = 0
+        self.svg_cache = _svg_cache
     
     def create_trend_chart(
         self,
@@ -694,6 +866,7 @@ class VisualizationEngine:
     
     # Helper methods for SVG generation
     
+    @_memoize_svg
     def _generate_line_chart_svg(self, data: ChartData, config: ChartConfig) -> str:
         """Generate SVG for line chart"""
         
@@ -742,14 +915,15 @@ class VisualizationEngine:
         svg_parts.append(f'<line x1="{chart_left}" y1="{chart_top}" x2="{chart_left}" y2="{chart_top + chart_height}" stroke="black" stroke-width="2"/>')
         svg_parts.append(f'<line x1="{chart_left}" y1="{chart_top + chart_height}" x2="{chart_left + chart_width}" y2="{chart_top + chart_height}" stroke="black" stroke-width="2"/>')
         
-        # Draw data lines
+        # Draw data lines, downsampled to the point budget so long series
+        # do not produce more points than the chart has pixels
+        max_points = config.max_points or max(int(chart_width), 3)
         for dataset in data.datasets:
             points = []
-            for i, value in enumerate(dataset["data"]):
-                if value is not None:
-                    x = chart_left + (i * chart_width / (len(data.labels) - 1)) if len(data.labels) > 1 else chart_left + chart_width / 2
-                    y = chart_top + chart_height - ((value - min_val) / val_range * chart_height)
-                    points.append(f"{x},{y}")
+            for i, value in self._downsample_series(dataset["data"], max_points):
+                x = chart_left + (i * chart_width / (len(data.labels) - 1)) if len(data.labels) > 1 else chart_left + chart_width / 2
+                y = chart_top + chart_height - ((value - min_val) / val_range * chart_height)
+                points.append(f"{x},{y}")
             
             if len(points) > 1:
                 path = f'M {" L ".join(points)}'
@@ -773,6 +947,22 @@ class VisualizationEngine:
         svg_parts.append('</svg>')
         return '\n'.join(svg_parts)
     
+    def _downsample_series(self, values: Sequence[Optional[float]], max_points: int) -> List[Tuple[int, float]]:
+        """Get (index, value) pairs of a series' non-missing values, LTTB-downsampled to max_points"""
+        
+        if NUMPY_AVAILABLE and len(values) > max_points:
+            array = np.asarray(values, dtype=float)
+            indices = np.flatnonzero(~np.isnan(array))
+            kept = indices[lttb_downsample(indices, array[indices], max_points)]
+            return list(zip(kept.tolist(), array[kept].tolist()))
+        
+        points = [(i, value) for i, value in enumerate(values) if value is not None]
+        if len(points) <= max_points:
+            return points
+        kept = lttb_downsample([i for i, _ in points], [value for _, value in points], max_points)
+        return [points[i] for i in kept]
+    
+    @_memoize_svg
     def _generate_pie_chart_svg(self, data: ChartData, config: ChartConfig) -> str:
         """Generate SVG for pie chart"""
         
@@ -839,6 +1029,7 @@ class VisualizationEngine:
         svg_parts.append('</svg>')
         return '\n'.join(svg_parts)
     
+    @_memoize_svg
     def _generate_bar_chart_svg(self, data: ChartData, config: ChartConfig) -> str:
         """Generate SVG for bar chart"""
         
@@ -898,6 +1089,7 @@ class VisualizationEngine:
         svg_parts.append('</svg>')
         return '\n'.join(svg_parts)
     
+    @_memoize_svg
     def _generate_gauge_chart_svg(self, data: ChartData, config: ChartConfig) -> str:
         """Generate SVG for gauge chart"""
         
@@ -963,6 +1155,7 @@ class VisualizationEngine:
         svg_parts.append('</svg>')
         return '\n'.join(svg_parts)
     
+    @_memoize_svg
     def _generate_radar_chart_svg(self, data: ChartData, config: ChartConfig) -> str:
         """Generate SVG for radar chart"""
         
@@ -1049,6 +1242,7 @@ class VisualizationEngine:
         svg_parts.append('</svg>')
         return '\n'.join(svg_parts)
     
+    @_memoize_svg
     def _generate_heatmap_svg(self, data: ChartData, config: ChartConfig) -> str:
         """Generate SVG for heatmap"""
         
@@ -4,10 +4,13 @@ Storage package for handling test artifacts and file management.
 
 from .minio_client import MinIOClient, get_minio_client
 from .storage_manager import StorageManager, get_storage_manager
+from .artifact_cache import ArtifactCache, get_artifact_cache
 
 __all__ = [
     'MinIOClient',
     'get_minio_client',
     'StorageManager',
-    'get_storage_manager'
+    'get_storage_manager',
+    'ArtifactCache',
+    'get_artifact_cache'
 ]
\ No newline at end of file
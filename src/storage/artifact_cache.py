@@ -0,0 +1,312 @@
+"""
+Content-addressed local cache for downloaded test artifacts.
+
+Artifacts fetched from S3/MinIO, GitHub Actions or other CI systems are
+stored once on disk under their SHA-256 content hash and looked up by a
+source key that includes the remote version (ETag, digest, timestamp).
+Repeated collections of the same run are served from disk, and the total
+cache size is bounded with least-recently-used eviction.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "test-artifact-cache")
+DEFAULT_MAX_SIZE_BYTES = 2 * 1024 * 1024 * 1024  # 2GB
+
+
+class ArtifactCache:
+    """On-disk, content-addressed artifact cache with size-bounded LRU eviction."""
+
+    INDEX_FILE = "index.json"
+    BLOB_DIR = "blobs"
+
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES):
+        """
+        Initialize artifact cache.
+
+        Args:
+            cache_dir: Directory holding the index and content blobs
+            max_size_bytes: Upper bound for the total size of cached blobs
+        """
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.max_size_bytes = max_size_bytes
+
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        # Keys referencing each blob and the running size of distinct blobs
+        self._blob_refs: Dict[str, int] = {}
+        self._size_bytes = 0
+
+        (self.cache_dir / self.BLOB_DIR).mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a cache key from the parts identifying a remote artifact version.
+
+        Args:
+            parts: Source, location and version components (e.g. bucket, key, ETag)
+
+        Returns:
+            Cache key string
+        """
+        return "|".join(str(part) for part in parts if part not in (None, ""))
+
+    @staticmethod
+    def hash_file(file_path: Union[str, Path]) -> str:
+        """Compute the SHA-256 content hash of a file."""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Path]:
+        """
+        Look up a cached artifact.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Path to the cached blob, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+
+            blob_path = self._blob_path(entry['digest'])
+            if not blob_path.exists():
+                # Blob removed behind our back, drop the stale entry
+                self._remove_entry(key)
+                self._stats['misses'] += 1
+                self._save_index()
+                return None
+
+            entry['last_access'] = time.time()
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return blob_path
+
+    def put_file(self, key: str, file_path: Union[str, Path], move: bool = False,
+                 filename: Optional[str] = None) -> Path:
+        """
+        Add a downloaded file to the cache.
+
+        Args:
+            key: Cache key
+            file_path: Path of the downloaded file
+            move: Move the file into the cache instead of copying it
+            filename: Original file name, defaults to the name of file_path
+
+        Returns:
+            Path to the cached blob
+        """
+        file_path = Path(file_path)
+        digest = self.hash_file(file_path)
+        size = file_path.stat().st_size
+
+        with self._lock:
+            blob_path = self._blob_path(digest)
+            if blob_path.exists():
+                if move:
+                    file_path.unlink()
+            else:
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = blob_path.with_suffix('.tmp')
+                if move:
+                    shutil.move(str(file_path), tmp_path)
+                else:
+                    shutil.copyfile(file_path, tmp_path)
+                os.replace(tmp_path, blob_path)
+
+            self._add_entry(key, {
+                'digest': digest,
+                'size': size,
+                'filename': filename or file_path.name,
+                'last_access': time.time()
+            })
+            self._enforce_size_limit()
+            self._save_index()
+            return blob_path
+
+    def put_bytes(self, key: str, data: bytes, filename: str = "") -> Path:
+        """
+        Add in-memory artifact data to the cache.
+
+        Args:
+            key: Cache key
+            data: Artifact content
+            filename: Original file name, kept for reference
+
+        Returns:
+            Path to the cached blob
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        return self.put_file(key, tmp_name, move=True, filename=filename)
+
+    def get_filename(self, key: str) -> Optional[str]:
+        """Get the original file name recorded for a cached artifact."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry['filename'] if entry else None
+
+    def copy_to(self, key: str, destination: Union[str, Path]) -> bool:
+        """
+        Copy a cached artifact to a destination path.
+
+        Args:
+            key: Cache key
+            destination: Target file path
+
+        Returns:
+            True if the artifact was cached and copied
+        """
+        blob_path = self.get(key)
+        if blob_path is None:
+            return False
+
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(blob_path, destination)
+        return True
+
+    def invalidate(self, key: str):
+        """Remove a single key from the cache."""
+        with self._lock:
+            if self._remove_entry(key) is not None:
+                self._save_index()
+
+    def clear(self):
+        """Remove every cached artifact."""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove_entry(key)
+            self._save_index()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                **self._stats,
+                'entries': len(self._entries),
+                'size_bytes': self._size_bytes,
+                'max_size_bytes': self.max_size_bytes,
+                'cache_dir': str(self.cache_dir)
+            }
+
+    def _blob_path(self, digest: str) -> Path:
+        """Get the on-disk location of a content blob."""
+        return self.cache_dir / self.BLOB_DIR / digest[:2] / digest
+
+    def _add_entry(self, key: str, entry: Dict[str, Any]):
+        """Index an entry as most recently used, replacing any previous entry of the key."""
+        previous = self._entries.pop(key, None)
+        self._entries[key] = entry
+        refs = self._blob_refs.get(entry['digest'], 0)
+        if refs == 0:
+            self._size_bytes += entry['size']
+        self._blob_refs[entry['digest']] = refs + 1
+        if previous is not None:
+            self._release_blob(previous)
+
+    def _remove_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Drop an entry from the index."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._release_blob(entry)
+        return entry
+
+    def _release_blob(self, entry: Dict[str, Any]):
+        """Delete the blob of a dropped entry once no key references it any more."""
+        digest = entry['digest']
+        refs = self._blob_refs.get(digest, 0) - 1
+        if refs > 0:
+            self._blob_refs[digest] = refs
+            return
+
+        self._blob_refs.pop(digest, None)
+        self._size_bytes -= entry['size']
+        try:
+            self._blob_path(digest).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _enforce_size_limit(self):
+        """Evict least recently used entries until the cache fits its size bound."""
+        while self._size_bytes > self.max_size_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            self._remove_entry(key)
+            self._stats['evictions'] += 1
+            logger.debug(f"Evicted cached artifact {key}")
+
+    def _load_index(self):
+        """Load the persisted index, ordered from least to most recently used."""
+        index_path = self.cache_dir / self.INDEX_FILE
+        if not index_path.exists():
+            return
+
+        try:
+            with open(index_path, 'r') as f:
+                entries = json.load(f)
+            for key, entry in sorted(entries.items(), key=lambda item: item[1].get('last_access', 0)):
+                if self._blob_path(entry['digest']).exists():
+                    self._add_entry(key, entry)
+        except Exception as e:
+            logger.warning(f"Failed to load artifact cache index, starting empty: {e}")
+            self._entries.clear()
+            self._blob_refs.clear()
+            self._size_bytes = 0
+
+    def _save_index(self):
+        """Atomically persist the index."""
+        index_path = self.cache_dir / self.INDEX_FILE
+        tmp_path = index_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, index_path)
+        except Exception as e:
+            logger.warning(f"Failed to save artifact cache index: {e}")
+
+
+# Global artifact cache instance
+_artifact_cache: Optional[ArtifactCache] = None
+
+
+def get_artifact_cache() -> ArtifactCache:
+    """Get or create the shared artifact cache instance."""
+    global _artifact_cache
+
+    if _artifact_cache is None:
+        cache_dir = os.getenv("ARTIFACT_CACHE_DIR", DEFAULT_CACHE_DIR)
+        max_size_bytes = int(os.getenv("ARTIFACT_CACHE_MAX_BYTES", DEFAULT_MAX_SIZE_BYTES))
+
+        _artifact_cache = ArtifactCache(
+            cache_dir=cache_dir,
+            max_size_bytes=max_size_bytes
+        )
+
+    return _artifact_cache
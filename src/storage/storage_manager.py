@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 
 from .minio_client import MinIOClient, get_minio_client
+from .artifact_cache import ArtifactCache, get_artifact_cache
 from ..database import DatabaseManager, TestArtifact, get_db
 
 
@@ -20,16 +21,19 @@ class StorageManager:
     
     def __init__(self, 
                  minio_client: Optional[MinIOClient] = None,
-                 db_manager: Optional[DatabaseManager] = None):
+                 db_manager: Optional[DatabaseManager] = None,
+                 artifact_cache: Optional[ArtifactCache] = None):
         """
         Initialize storage manager.
         
         Args:
             minio_client: MinIO client instance
             db_manager: Database manager instance
+            artifact_cache: Local artifact cache instance
         """
         self.minio_client = minio_client or get_minio_client()
         self.db_manager = db_manager
+        self.artifact_cache = artifact_cache or get_artifact_cache()
     
     def store_test_artifact(self,
                            test_run_id: int,
@@ -248,15 +252,26 @@ class StorageManager:
             return False
         
         try:
+            # Serve repeated downloads of the same artifact from the local cache
+            cache_key = self._get_cache_key(artifact)
+            if self.artifact_cache.copy_to(cache_key, local_path):
+                logger.debug(f"Artifact {artifact_id} served from cache")
+                return True
+            
             # Extract bucket type and object name from URL
             bucket_type, object_name = self._parse_artifact_url(artifact.file_path)
             
-            return self.minio_client.download_file(
+            downloaded = self.minio_client.download_file(
                 bucket_type=bucket_type,
                 object_name=object_name,
                 file_path=local_path
             )
             
+            if downloaded:
+                self.artifact_cache.put_file(cache_key, local_path, filename=artifact.file_name)
+            
+            return downloaded
+            
         except Exception as e:
             logger.error(f"Error downloading artifact {artifact_id}: {e}")
             return False
@@ -277,14 +292,24 @@ class StorageManager:
             return None
         
         try:
+            cache_key = self._get_cache_key(artifact)
+            cached_path = self.artifact_cache.get(cache_key)
+            if cached_path is not None:
+                return cached_path.read_bytes()
+            
             # Extract bucket type and object name from URL
             bucket_type, object_name = self._parse_artifact_url(artifact.file_path)
             
-            return self.minio_client.get_object_data(
+            data = self.minio_client.get_object_data(
                 bucket_type=bucket_type,
                 object_name=object_name
             )
             
+            if data is not None:
+                self.artifact_cache.put_bytes(cache_key, data, filename=artifact.file_name)
+            
+            return data
+            
         except Exception as e:
             logger.error(f"Error getting artifact data {artifact_id}: {e}")
             return None
@@ -340,6 +365,8 @@ class StorageManager:
             # Extract bucket type and object name from URL
             bucket_type, object_name = self._parse_artifact_url(artifact.file_path)
             
+            self.artifact_cache.invalidate(self._get_cache_key(artifact))
+            
             # Delete from MinIO
             minio_success = self.minio_client.delete_object(
                 bucket_type=bucket_type,
@@ -442,6 +469,23 @@ class StorageManager:
         
         return type_mapping.get(artifact_type.lower(), 'artifacts')
     
+    def _get_cache_key(self, artifact: TestArtifact) -> str:
+        """
+        Build the artifact cache key for a stored artifact.
+        
+        Args:
+            artifact: TestArtifact record
+            
+        Returns:
+            Cache key identifying this version of the artifact
+        """
+        return ArtifactCache.make_key(
+            'minio',
+            artifact.file_path,
+            artifact.file_size,
+            artifact.created_at.isoformat() if artifact.created_at else None
+        )
+    
     def _parse_artifact_url(self, url: str) -> tuple[str, str]:
         """
         Parse artifact URL to extract bucket type and object name.
@@ -0,0 +1,97 @@
+"""
+Integration tests for agent attempt instrumentation.
+Tests per-attempt spans, exported histograms and counters, and slow attempt profiling.
+"""
+
+import pytest
+import asyncio
+import tempfile
+from pathlib import Path
+
+base_agent = pytest.importorskip("src.agents.base_agent")
+metrics_collector = pytest.importorskip("src.monitoring.metrics_collector")
+
+BaseAgent = base_agent.BaseAgent
+AgentConfig = base_agent.AgentConfig
+AgentStatus = base_agent.AgentStatus
+MetricsCollector = metrics_collector.MetricsCollector
+Histogram = metrics_collector.Histogram
+
+
+class FlakyAgent(BaseAgent):
+    """Agent that fails its first attempt and succeeds afterwards."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = 0
+
+    async def _execute_impl(self, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            raise RuntimeError("first attempt fails")
+        await asyncio.sleep(0.05)
+        return {"calls": self.calls}
+
+
+class TestAgentInstrumentationIntegration:
+    """Integration tests for agent instrumentation."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+
+    @pytest.mark.asyncio
+    async def test_attempt_spans_and_metrics(self, temp_dir):
+        """Test that every attempt is recorded and exported to the collector."""
+        collector = MetricsCollector(storage_path=str(temp_dir / "metrics.db"))
+        agent = FlakyAgent(AgentConfig(name="flaky", retry_count=2, retry_delay=0))
+        agent.metrics_collector = collector
+
+        result = await agent.execute()
+
+        assert result.status == AgentStatus.COMPLETED
+        assert [span.outcome for span in result.attempts] == ["error", "success"]
+        assert result.attempts[0].error == "first attempt fails"
+        assert result.attempts[1].run_time >= 0.05
+
+        run_histogram = collector.get_histogram("agent.flaky.run_seconds")
+        assert run_histogram["count"] == 2
+        assert collector.get_latest_value("agent.flaky.attempts_total") == 2
+        assert collector.get_latest_value("agent.flaky.attempts_error_total") == 1
+        assert collector.get_latest_value("agent.flaky.retries_total") == 1
+        assert collector.get_histogram("agent.flaky.duration_seconds")["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_attempts_are_profiled(self, temp_dir):
+        """Test that slow attempts keep their sampled profile."""
+        agent = FlakyAgent(AgentConfig(
+            name="slow",
+            retry_count=1,
+            retry_delay=0,
+            metadata={"profiling": {
+                "enabled": True,
+                "slow_threshold": 0.01,
+                "interval": 0.001,
+                "output_dir": str(temp_dir)
+            }}
+        ))
+        slow_attempts = []
+        agent.add_callback("on_slow_attempt", lambda _, span, profiler: slow_attempts.append(span))
+
+        result = await agent.execute()
+
+        assert [span.attempt for span in slow_attempts] == [2]
+        assert result.attempts[1].profile_path is not None
+        assert Path(result.attempts[1].profile_path).read_text()
+
+    def test_histogram_quantiles(self):
+        """Test bucket counts and interpolated quantiles."""
+        histogram = Histogram(name="latency", buckets=(1.0, 2.0, 4.0))
+        for value in (0.5, 1.5, 1.5, 3.0, 10.0):
+            histogram.observe(value)
+
+        assert histogram.get_cumulative_counts() == [(1.0, 1), (2.0, 3), (4.0, 4), (float("inf"), 5)]
+        assert histogram.quantile(0.5) == pytest.approx(1.75)
+        assert histogram.to_dict()["count"] == 5
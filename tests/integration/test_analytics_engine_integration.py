@@ -0,0 +1,86 @@
+"""
+Integration tests for the analytics engine.
+Tests that the vectorized regression and correlation paths match the pure-Python ones.
+"""
+
+import pytest
+import random
+
+analytics_engine = pytest.importorskip("src.reporting.analytics_engine")
+AnalyticsEngine = analytics_engine.AnalyticsEngine
+TrendDirection = analytics_engine.TrendDirection
+
+
+class TestAnalyticsEngineIntegration:
+    """Integration tests for the analytics engine."""
+
+    @pytest.fixture
+    def historical_data(self):
+        """Generate timestamped data points for several metrics."""
+        rng = random.Random(42)
+        data = []
+        for index in range(200):
+            data_point = {
+                'timestamp': index,
+                'test_pass_rate': 80 + 0.05 * index + rng.gauss(0, 1),
+                'security_score': 90 - 0.05 * index + rng.gauss(0, 1),
+                'compliance_score': 95.0
+            }
+            # One metric is missing from some data points
+            if index % 4:
+                data_point['performance_score'] = 70 + rng.gauss(0, 5)
+            data.append(data_point)
+        return data
+
+    def test_trends_match_pure_python_fit(self, historical_data, monkeypatch):
+        """Test that all metrics fitted together give the per-metric results."""
+        metrics = ['test_pass_rate', 'security_score', 'compliance_score', 'performance_score']
+        engine = AnalyticsEngine()
+
+        trends = engine.analyze_trends(historical_data, metrics)
+        monkeypatch.setattr(analytics_engine, 'NUMPY_AVAILABLE', False)
+        expected = engine.analyze_trends(historical_data, metrics)
+
+        assert [t.metric_name for t in trends] == metrics
+        for trend, reference in zip(trends, expected):
+            assert trend.direction == reference.direction
+            assert trend.confidence_score == pytest.approx(reference.confidence_score)
+            assert trend.prediction == pytest.approx(reference.prediction)
+            assert trend.insights == reference.insights
+
+        assert trends[0].direction == TrendDirection.IMPROVING
+        assert trends[1].direction == TrendDirection.DECLINING
+        assert trends[2].direction == TrendDirection.STABLE
+        assert trends[2].confidence_score == 1.0
+
+    def test_correlation_matrix_matches_pairwise(self, historical_data):
+        """Test that the correlation matrix agrees with pairwise correlations."""
+        engine = AnalyticsEngine()
+        metrics_data = {
+            metric: [data_point[metric] for data_point in historical_data]
+            for metric in ('test_pass_rate', 'security_score', 'compliance_score')
+        }
+
+        analysis = engine.analyze_correlations(metrics_data)
+
+        for metric1, metric2, correlation in analysis.correlation_pairs:
+            expected = engine._calculate_correlation(metrics_data[metric1], metrics_data[metric2])
+            assert correlation == pytest.approx(expected, abs=1e-9)
+        assert analysis.significant_correlations[0]['direction'] == 'negative'
+
+    def test_performance_bottlenecks(self):
+        """Test that slow tests are counted against the sketch mean, skipping results without timings."""
+        test_results = [{'status': 'passed', 'execution_time': 1.0, 'domain': 'api'} for _ in range(18)]
+        test_results.append({'status': 'failed', 'domain': 'ui'})
+        test_results.append({'status': 'failed', 'domain': 'ui'})
+        test_results.append({'status': 'failed', 'domain': 'ui'})
+        test_results.append({'status': 'passed', 'execution_time': 30.0, 'domain': 'api'})
+
+        performance = AnalyticsEngine().analyze_performance(test_results)
+
+        assert performance.average_execution_time == pytest.approx(48 / 19)
+        assert performance.bottlenecks == [
+            "1 tests exceed 2x average execution time",
+            "High error rate in ui domain (3 failures)"
+        ]
+        assert AnalyticsEngine().analyze_performance([]).bottlenecks == []
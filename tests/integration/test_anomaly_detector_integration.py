@@ -0,0 +1,75 @@
+"""
+Integration tests for online anomaly detection.
+Tests EWMA baselines, incremental series feeding, state persistence and
+anomalies flagged by the report collector as runs are ingested.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+anomaly_detector = pytest.importorskip("src.analytics.anomaly_detector")
+OnlineAnomalyDetector = anomaly_detector.OnlineAnomalyDetector
+
+
+class TestAnomalyDetectorIntegration:
+    """Integration tests for the online anomaly detector."""
+
+    @pytest.fixture
+    def series(self):
+        """Generate a stable daily series followed by a regression."""
+        start = datetime(2026, 1, 1)
+        values = [5.0 + (0.5 if day % 2 else -0.5) for day in range(30)] + [15.0]
+        return [(start + timedelta(days=day), value) for day, value in enumerate(values)]
+
+    def test_regression_flagged_when_ingested(self, series):
+        """Test that the first regressing point is flagged and replays are skipped."""
+        detector = OnlineAnomalyDetector(threshold=3.0)
+        flagged = []
+        detector.add_callback(lambda stream, anomaly: flagged.append((stream, anomaly)))
+
+        assert detector.observe_series("failure_rate", series[:-1]) == []
+        anomaly = detector.observe("failure_rate", series[-1][1], series[-1][0])
+
+        assert anomaly["severity"] == "high"
+        assert anomaly["expected"] == pytest.approx(5.0, abs=0.5)
+        assert flagged == [("failure_rate", anomaly)]
+
+        # Feeding the full series again consumes nothing new
+        assert detector.observe_series("failure_rate", series) == []
+        assert detector.get_baseline("failure_rate")["count"] == len(series)
+        assert detector.get_anomalies("failure_rate", start=series[0][0]) == [anomaly]
+        assert detector.get_anomalies("failure_rate", end=series[-2][0]) == []
+
+    def test_state_survives_serialization(self, series):
+        """Test that restored baselines continue where they left off."""
+        detector = OnlineAnomalyDetector()
+        detector.observe_series("coverage", series[:-1])
+
+        restored = OnlineAnomalyDetector()
+        restored.load_state(detector.to_dict())
+
+        assert restored.get_baseline("coverage") == detector.get_baseline("coverage")
+        assert restored.observe_series("coverage", series) == detector.observe_series("coverage", series)
+
+    def test_collector_flags_regressing_run(self, monkeypatch):
+        """Test that the report collector flags a regressing run as it is collected."""
+        report_collector_agent = pytest.importorskip("src.agents.report_collector_agent")
+        base_agent = pytest.importorskip("src.agents.base_agent")
+
+        detector = OnlineAnomalyDetector()
+        monkeypatch.setattr(report_collector_agent, "get_anomaly_detector", lambda: detector)
+        agent = report_collector_agent.ReportCollectorAgent(base_agent.AgentConfig(name="collector"))
+        callbacks = []
+        agent.add_callback("on_anomaly", lambda _, anomalies: callbacks.append(anomalies))
+
+        for index in range(5):
+            result = {'status': 'success', 'summary': {'total': 100, 'failed': 2 + index % 2}}
+            agent._detect_run_anomalies(f"run-{index}", result, scores={'performance': 90})
+            assert 'anomalies' not in result
+
+        result = {'status': 'success', 'summary': {'total': 100, 'failed': 30}}
+        agent._detect_run_anomalies("run-bad", result, scores={'performance': 90})
+
+        assert [anomaly['metric'] for anomaly in result['anomalies']] == ['failure_rate']
+        assert result['anomalies'][0]['run_id'] == "run-bad"
+        assert callbacks == [result['anomalies']]
@@ -0,0 +1,211 @@
+"""
+Integration tests for the local artifact cache.
+Tests content-addressed storage, LRU eviction and persistence of the index.
+"""
+
+import pytest
+import tempfile
+from pathlib import Path
+
+artifact_cache = pytest.importorskip("src.storage.artifact_cache")
+ArtifactCache = artifact_cache.ArtifactCache
+
+
+class TestArtifactCacheIntegration:
+    """Integration tests for the artifact cache."""
+
+    @pytest.fixture
+    def cache_dir(self):
+        """Create a temporary cache directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yield Path(temp_dir)
+
+    def test_put_and_get(self, cache_dir):
+        """Test that cached artifacts are served from disk."""
+        cache = ArtifactCache(str(cache_dir))
+        key = ArtifactCache.make_key('s3', 'bucket', 'artifacts/run-1/results.json', 'etag-1')
+
+        assert cache.get(key) is None
+
+        cache.put_bytes(key, b'{"tests": []}', filename='results.json')
+        cached_path = cache.get(key)
+
+        assert cached_path is not None
+        assert cached_path.read_bytes() == b'{"tests": []}'
+        assert cache.get_filename(key) == 'results.json'
+        assert cache.get_stats()['hits'] == 1
+
+    def test_identical_content_is_stored_once(self, cache_dir):
+        """Test that keys with the same content share one blob."""
+        cache = ArtifactCache(str(cache_dir))
+
+        first = cache.put_bytes('run-1', b'same content')
+        second = cache.put_bytes('run-2', b'same content')
+
+        assert first == second
+        assert cache.get_stats()['size_bytes'] == len(b'same content')
+
+    def test_lru_eviction(self, cache_dir):
+        """Test that the least recently used artifact is evicted first."""
+        cache = ArtifactCache(str(cache_dir), max_size_bytes=25)
+
+        cache.put_bytes('a', b'a' * 10)
+        cache.put_bytes('b', b'b' * 10)
+        cache.get('a')
+        cache.put_bytes('c', b'c' * 10)
+
+        assert cache.get('a') is not None
+        assert cache.get('b') is None
+        assert cache.get('c') is not None
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_index_survives_restart(self, cache_dir):
+        """Test that a new cache instance sees previously cached artifacts."""
+        ArtifactCache(str(cache_dir)).put_bytes('key', b'data', filename='log.txt')
+
+        reopened = ArtifactCache(str(cache_dir))
+
+        assert reopened.get('key').read_bytes() == b'data'
+        assert reopened.get_filename('key') == 'log.txt'
+
+    def test_shared_blob_released_with_last_key(self, cache_dir):
+        """Test that a blob shared by several keys is kept until its last key goes."""
+        cache = ArtifactCache(str(cache_dir))
+        blob = cache.put_bytes('run-1', b'same content')
+        cache.put_bytes('run-2', b'same content')
+        cache.put_bytes('run-2', b'same content')
+
+        cache.invalidate('run-1')
+        assert blob.exists()
+        assert cache.get_stats()['size_bytes'] == len(b'same content')
+
+        cache.put_bytes('run-2', b'new content')
+        assert not blob.exists()
+        assert cache.get_stats()['size_bytes'] == len(b'new content')
+
+        cache.clear()
+        assert cache.get_stats()['size_bytes'] == 0
+
+    def test_eviction_keeps_running_size(self, cache_dir):
+        """Test that evicting many entries keeps the size total in step with the index."""
+        cache = ArtifactCache(str(cache_dir), max_size_bytes=100)
+        for index in range(50):
+            cache.put_bytes(f'key-{index}', str(index).encode() * 10)
+
+        stats = cache.get_stats()
+        sizes = {entry['digest']: entry['size'] for entry in cache._entries.values()}
+        assert stats['size_bytes'] == sum(sizes.values()) <= 100
+        assert stats['evictions'] == 50 - stats['entries']
+
+    @pytest.fixture
+    def collector(self, cache_dir, monkeypatch):
+        """Create a report collector using a cache in the temporary directory."""
+        report_collector_agent = pytest.importorskip("src.agents.report_collector_agent")
+        base_agent = pytest.importorskip("src.agents.base_agent")
+        cache = ArtifactCache(str(cache_dir / "cache"))
+        monkeypatch.setattr(report_collector_agent, "get_artifact_cache", lambda: cache)
+        return report_collector_agent.ReportCollectorAgent(base_agent.AgentConfig(name="collector"))
+
+    @pytest.mark.asyncio
+    async def test_unversioned_artifacts_are_not_cached(self, collector, cache_dir):
+        """Test that artifacts without a version field are downloaded every time."""
+        downloads = []
+
+        async def download(artifact_info, download_dir):
+            downloads.append(artifact_info['download_url'])
+            path = download_dir / "report.html"
+            path.write_text(f"version {len(downloads)}")
+            return str(path)
+
+        collector._download_from_jenkins = download
+        unversioned = {'source': 'jenkins', 'download_url': 'https://ci/report.html'}
+        versioned = {**unversioned, 'etag': 'abc'}
+
+        for _ in range(2):
+            path = await collector.download_artifact(unversioned, str(cache_dir / "out"))
+        assert open(path).read() == "version 2"
+        assert collector._get_artifact_cache_key(unversioned) is None
+
+        await collector.download_artifact(versioned, str(cache_dir / "out"))
+        path = await collector.download_artifact(versioned, str(cache_dir / "out"))
+        assert open(path).read() == "version 3"
+        assert len(downloads) == 3
+
+    def test_cached_artifacts_are_copied(self, collector, cache_dir):
+        """Test that collected artifacts point to a copy rather than the cache blob."""
+        source = cache_dir / "artifact.zip"
+        source.write_bytes(b"zip")
+        blob = collector.artifact_cache.put_file('github|run', source)
+
+        local_path = collector._copy_from_cache('github|run', '.zip')
+        assert local_path != str(blob) and local_path.endswith('.zip')
+        with open(local_path, 'ab') as f:
+            f.write(b"modified")
+        assert blob.read_bytes() == b"zip"
+        assert collector._copy_from_cache('missing', '.zip') is None
+        Path(local_path).unlink()
+
+    def test_storage_manager_caches_downloads(self, cache_dir):
+        """Test that stored artifacts are downloaded once and then served from the cache."""
+        storage_manager = pytest.importorskip("src.storage.storage_manager")
+        models = pytest.importorskip("src.database.models")
+        fetches = []
+
+        class MinIO:
+            buckets = {'artifacts': 'test-artifacts'}
+
+            def download_file(self, bucket_type, object_name, file_path):
+                fetches.append(object_name)
+                Path(file_path).write_bytes(b"trace")
+                return True
+
+            def get_object_data(self, bucket_type, object_name):
+                fetches.append(object_name)
+                return b"trace"
+
+        artifact = models.TestArtifact(
+            file_name="trace.zip", file_size=5, artifact_type="trace",
+            file_path="http://minio:9000/test-artifacts/run-1/trace.zip"
+        )
+        manager = storage_manager.StorageManager(
+            minio_client=MinIO(), db_manager=object(), artifact_cache=ArtifactCache(str(cache_dir / "cache"))
+        )
+        manager.get_artifact = lambda artifact_id: artifact
+
+        assert manager.download_artifact(1, str(cache_dir / "first.zip"))
+        assert manager.download_artifact(1, str(cache_dir / "second.zip"))
+        assert (cache_dir / "second.zip").read_bytes() == b"trace"
+        assert manager.get_artifact_data(1) == b"trace"
+        assert fetches == ["run-1/trace.zip"]
+        assert manager.artifact_cache.get_filename(manager._get_cache_key(artifact)) == "trace.zip"
+
+    @pytest.mark.asyncio
+    async def test_s3_listing_is_not_cached(self, collector):
+        """Test that every collection lists the run while unchanged objects come from the cache."""
+        from datetime import datetime
+
+        objects = {'artifacts/run-1/results.json': b'{"tests": [{"name": "a", "status": "passed"}]}'}
+        downloads = []
+
+        class S3:
+            def list_objects_v2(self, Bucket, Prefix):
+                return {'Contents': [
+                    {'Key': key, 'ETag': f'"{hash(body)}"', 'Size': len(body), 'LastModified': datetime.now()}
+                    for key, body in objects.items()
+                ]}
+
+            def download_fileobj(self, bucket, key, fileobj):
+                downloads.append(key)
+                fileobj.write(objects[key])
+
+            def generate_presigned_url(self, operation, Params, ExpiresIn):
+                return f"https://s3/{Params['Key']}"
+
+        collector.s3_client = S3()
+        first = await collector.collect_from_s3("run-1", bucket="reports")
+        objects['artifacts/run-1/logs/run.log'] = b'log'
+        second = await collector.collect_from_s3("run-1", bucket="reports")
+
+        assert 'run.log' not in first['download_links'] and 'run.log' in second['download_links']
+        assert downloads == ['artifacts/run-1/results.json', 'artifacts/run-1/logs/run.log']
+        Path(second['detailed_results']['artifacts']['run.log']['local_path']).unlink()
@@ -0,0 +1,153 @@
+"""
+Integration tests for the columnar test result store.
+Tests interning, status normalization, grouped counts and the functional
+reporter passes that run as masks over the store.
+"""
+
+import pytest
+from types import SimpleNamespace
+
+columnar_results = pytest.importorskip("src.reporting.columnar_results")
+functional_reporter = pytest.importorskip("src.reporting.functional_reporter")
+Status = functional_reporter.TestStatus
+
+
+class TestColumnarResultsIntegration:
+    """Integration tests for the columnar test result store."""
+
+    @pytest.fixture
+    def records(self):
+        """Generate raw test results with mixed status spellings."""
+        return [
+            {'name': 'test_login', 'suite': 'auth', 'status': 'PASS', 'execution_time': 1.5,
+             'category': 'integration', 'priority': 'high', 'test_data': {'user': 'a'}, 'assertion_results': [True]},
+            {'name': 'test_logout', 'suite': 'auth', 'status': 'failure', 'execution_time': 45.0,
+             'category': 'integration', 'priority': 'high', 'retry_count': 2, 'is_cross_domain': True,
+             'domains_involved': ['web', 'api']},
+            {'name': 'test_cart', 'suite': 'shop', 'status': 'exception', 'execution_time': 31.0,
+             'category': 'ui', 'priority': 'low', 'max_retries': 1},
+            {'name': 'test_login', 'suite': 'auth', 'status': 'weird', 'execution_time': None,
+             'category': 'ui', 'priority': 'low'},
+            {'name': 'test_pay', 'suite': 'shop', 'status': 'passed', 'execution_time': 45.0,
+             'category': 'Integration', 'priority': 'high', 'is_cross_domain': True, 'domains_involved': ['api']}
+        ]
+
+    def test_store_columns(self, records):
+        """Test that values are interned and statuses normalized once per spelling."""
+        reporter = functional_reporter.FunctionalReporter()
+        store = columnar_results.ColumnarTestResults(records, reporter._normalize_test_status, Status)
+
+        assert len(store) == 5
+        assert store.names.values == ['test_login', 'test_logout', 'test_cart', 'test_pay']
+        assert store.name_codes.tolist() == [0, 1, 2, 0, 3]
+        assert store.suites.values == ['auth', 'shop']
+        assert store.execution_time.tolist() == [1.5, 45.0, 31.0, 0.0, 45.0]
+        assert store.status_counts() == {
+            Status.PASSED: 2, Status.FAILED: 1, Status.SKIPPED: 0,
+            Status.ERROR: 1, Status.BLOCKED: 0, Status.NOT_RUN: 1
+        }
+        assert store.status_mask(Status.FAILED, Status.ERROR).tolist() == [False, True, True, False, False]
+        assert store.grouped_status_counts('priority')['low'].tolist() == [0, 0, 0, 1, 0, 1]
+
+    def test_reporter_passes(self, records):
+        """Test that the report passes give the per-record results."""
+        reporter = functional_reporter.FunctionalReporter()
+        report = reporter.generate_functional_report(SimpleNamespace(test_results=records))
+
+        assert report.metrics.total_tests == 5
+        assert report.metrics.passed_tests == 2
+        assert report.metrics.total_execution_time == pytest.approx(122.5)
+        assert report.metrics.category_metrics == {
+            'integration': {'total': 2, 'passed': 1, 'failed': 1, 'skipped': 0, 'error': 0, 'blocked': 0},
+            'ui': {'total': 2, 'passed': 0, 'failed': 0, 'skipped': 0, 'error': 1, 'blocked': 0, 'not_run': 1},
+            'Integration': {'total': 1, 'passed': 1, 'failed': 0, 'skipped': 0, 'error': 0, 'blocked': 0}
+        }
+
+        assert [test.test_name for test in report.failed_tests] == ['test_logout', 'test_cart']
+        # Slowest first, ties in input order
+        assert [test.test_name for test in report.slow_tests] == ['test_logout', 'test_pay', 'test_cart']
+        assert [test.test_name for test in report.flaky_tests] == ['test_logout', 'test_cart']
+        # Rows selected by several passes share one result
+        assert report.slow_tests[0] is report.failed_tests[0]
+
+        assert "3 slow tests (>30.0s)" in report.quality_issues
+        assert "1 potentially flaky tests" in report.quality_issues
+        assert "4 tests without assertion results" in report.quality_issues
+        assert report.cross_domain_results['passed_cross_domain_tests'] == 1
+        assert sorted(report.cross_domain_results['domains_tested']) == ['api', 'web']
+        assert report.integration_results['total_integration_tests'] == 3
+        assert report.integration_results['average_integration_time'] == pytest.approx(91.5 / 3)
+
+    def test_passes_without_report_store(self, records):
+        """Test that passes called on their own build a store for their input."""
+        reporter = functional_reporter.FunctionalReporter()
+
+        assert [test.test_name for test in reporter._identify_slow_tests(records)] == \
+            ['test_logout', 'test_pay', 'test_cart']
+        assert reporter._extract_performance_metrics(records)['tests_over_threshold'] == 3
+        assert reporter._extract_functional_metrics([]).total_tests == 0
+
+    def test_top_n_matches_full_ranking(self):
+        """Test that partial selection returns the head of the full stable ranking."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(7)
+        scores = rng.integers(0, 20, size=5000).astype(float)
+        rows = np.arange(5000) * 3
+        full = columnar_results.rank_rows(rows, scores)
+
+        assert full.tolist() == [rows[index] for index in sorted(range(5000), key=lambda index: -scores[index])]
+        for top_n in (0, 1, 17, 250, 4999, 5000, 6000):
+            assert columnar_results.rank_rows(rows, scores, top_n).tolist() == full[:top_n].tolist()
+
+    def test_reporter_limits_ranked_tests(self, records):
+        """Test that reports list the top slow and flaky tests only."""
+        reporter = functional_reporter.FunctionalReporter()
+        reporter.max_slow_tests = 2
+        reporter.max_flaky_tests = 1
+        records.append({'name': 'test_search', 'status': 'passed', 'retry_count': 5, 'execution_time': 2.0})
+        report = reporter.generate_functional_report(records)
+
+        assert [test.test_name for test in report.slow_tests] == ['test_logout', 'test_pay']
+        assert [test.test_name for test in report.flaky_tests] == ['test_search']
+        # Issue counts still cover every test
+        assert "3 slow tests (>30.0s)" in report.quality_issues
+        assert "2 potentially flaky tests" in report.quality_issues
+
+    def test_suite_tests_share_the_store(self):
+        """Test that suite metrics come from the store and suite tests stay lazy."""
+        reporter = functional_reporter.FunctionalReporter()
+        suites = [
+            {'suite_name': 'auth', 'tests': [
+                {'name': 'test_login', 'status': 'pass', 'execution_time': 1.5,
+                 'start_time': '2024-01-01T10:00:00', 'end_time': '2024-01-01T10:00:02'},
+                {'name': 'test_logout', 'status': 'failed', 'execution_time': 2.5,
+                 'start_time': '2024-01-01T09:59:00', 'end_time': 'not a time'},
+                {'name': 'test_reset', 'status': 'skip'}
+            ]},
+            {'suite_name': 'empty'},
+            {'suite_name': 'shop', 'tests': [
+                {'name': 'test_cart', 'status': 'failure', 'execution_time': 40.0},
+                {'name': 'test_pay', 'status': 'passed', 'execution_time': 4.0}
+            ]}
+        ]
+        test_results = SimpleNamespace(test_results=[{'name': 'test_ping', 'status': 'passed'}], suites=suites)
+        report = reporter.generate_functional_report(test_results)
+
+        auth, empty, shop = report.test_suites
+        assert (auth.total_tests, auth.passed_tests, auth.failed_tests, auth.skipped_tests) == (3, 1, 1, 1)
+        assert auth.execution_time == pytest.approx(4.0)
+        assert auth.start_time.isoformat() == '2024-01-01T09:59:00'
+        assert auth.end_time.isoformat() == '2024-01-01T10:00:02'
+        assert (empty.total_tests, empty.execution_time, list(empty.tests)) == (0, 0.0, [])
+        assert (shop.total_tests, shop.passed_tests, shop.failed_tests) == (2, 1, 1)
+        assert report.metrics.total_tests == 6
+
+        # Failed suite tests are the report's failed test objects
+        assert [test.test_name for test in report.failed_tests] == ['test_logout', 'test_cart']
+        assert auth.tests[1] is report.failed_tests[0]
+        assert shop.tests[0] is report.failed_tests[1]
+        assert [test.test_name for test in shop.tests] == ['test_cart', 'test_pay']
+        assert [test['status'] for test in auth.to_dict()['tests']] == ['passed', 'failed', 'skipped']
+        # Passing suite tests are built on access and never kept
+        assert auth.tests[0] is not auth.tests[0]
+        assert all(test.status != Status.PASSED for test in auth.tests.store._materialized.values())
@@ -0,0 +1,180 @@
+"""
+Integration tests for the historical analyzer.
+Tests the columnar metric frame built from rollups and the vectorized
+trend, anomaly and seasonal analyses over it.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+
+historical_analyzer = pytest.importorskip("src.analytics.historical_analyzer")
+rollup_store = pytest.importorskip("src.analytics.rollup_store")
+database = pytest.importorskip("src.database.database")
+pd = pytest.importorskip("pandas")
+
+HistoricalAnalyzer = historical_analyzer.HistoricalAnalyzer
+AnalysisPeriod = historical_analyzer.AnalysisPeriod
+MetricType = historical_analyzer.MetricType
+TrendDirection = historical_analyzer.TrendDirection
+
+
+class TestHistoricalAnalyzerIntegration:
+    """Integration tests for the historical analyzer."""
+
+    @pytest.fixture
+    def analyzer(self, tmp_path, monkeypatch):
+        """Create an analyzer reading rollups from SQLite."""
+        monkeypatch.chdir(tmp_path)
+        analyzer = HistoricalAnalyzer({'min_data_points': 5})
+        analyzer.rollup_store = rollup_store.RollupStore(database.DatabaseManager("sqlite:///:memory:"))
+        return analyzer
+
+    @pytest.mark.asyncio
+    async def test_rollups_become_metric_frame(self, analyzer):
+        """Test that daily rollups are collected into one long frame and pivoted per metric."""
+        start = datetime(2026, 3, 1)
+        for day in range(14):
+            analyzer.rollup_store.record_run(
+                f'run-{day}',
+                {'total': 100, 'passed': 100 - day, 'failed': day, 'duration': 200.0},
+                timestamp=start + timedelta(days=day, hours=12),
+                scores={'performance': 90 - day}
+            )
+
+        frame = await analyzer._collect_historical_data(start, start + timedelta(days=14), AnalysisPeriod.DAILY)
+        metrics = analyzer._pivot_metrics(frame)
+
+        assert list(frame.columns) == historical_analyzer.FRAME_COLUMNS
+        assert len(frame) == 14 * 4
+        assert len(metrics) == 14
+        assert metrics[MetricType.FAILURE_RATE.value].tolist() == pytest.approx([float(day) for day in range(14)])
+        assert metrics[MetricType.COVERAGE.value].eq(75).all()
+        assert metrics['avg_execution_time'].eq(2.0).all()
+
+        trends = await analyzer._generate_trend_analyses(metrics, AnalysisPeriod.DAILY)
+        by_metric = {trend.metric_type: trend for trend in trends}
+
+        assert by_metric[MetricType.FAILURE_RATE].slope == pytest.approx(1.0)
+        assert by_metric[MetricType.FAILURE_RATE].correlation == pytest.approx(1.0)
+        assert by_metric[MetricType.PERFORMANCE].trend_direction == TrendDirection.DECLINING
+        assert set(by_metric[MetricType.PERFORMANCE].seasonal_patterns['day_of_week']) == {
+            'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'
+        }
+
+        history = await analyzer.get_metric_history(MetricType.FAILURE_RATE, days=(datetime.now() - start).days + 1)
+        assert len(history) == 14
+        assert history[3]['value'] == pytest.approx(3.0)
+        assert history[3]['metadata']['failed_tests'] == 3
+
+    @pytest.mark.asyncio
+    async def test_raw_executions_without_rollups(self, analyzer):
+        """Test that history comes from test_executions when rollups are empty and for hourly analysis."""
+        start = datetime(2026, 3, 1)
+        queries = []
+
+        class Database:
+            async def execute_query(self, query, params):
+                queries.append(params[0])
+                return [
+                    {'period': start + timedelta(hours=hour), 'total_tests': 10, 'failed_tests': hour % 3,
+                     'passed_tests': 10 - hour % 3, 'avg_execution_time': None, 'flakiness_rate': 0.1,
+                     'performance_score': None, 'coverage': 70.0}
+                    for hour in range(12)
+                ]
+
+        analyzer.db_manager = Database()
+        metrics = analyzer._pivot_metrics(
+            await analyzer._collect_historical_data(start, start + timedelta(days=1), AnalysisPeriod.DAILY)
+        )
+        assert queries == ['day']
+        assert metrics[MetricType.FAILURE_RATE.value].tolist() == pytest.approx([(hour % 3) * 10.0 for hour in range(12)])
+        assert metrics[MetricType.PERFORMANCE.value].eq(80).all()
+        assert metrics[MetricType.COVERAGE.value].eq(70).all()
+
+        # Daily rollups cannot serve hourly analysis
+        analyzer.rollup_store.record_run('run-1', {'total': 5, 'passed': 5}, timestamp=start)
+        frame = await analyzer._collect_historical_data(start, start + timedelta(days=1), AnalysisPeriod.HOURLY)
+        assert queries == ['day', 'hour']
+        assert frame['timestamp'].dt.hour.nunique() == 12
+
+    @pytest.mark.asyncio
+    async def test_hourly_analysis_over_long_ranges(self, analyzer):
+        """Test that hourly data over a long range is analyzed with anomalies and hour-of-day patterns."""
+        timestamps = pd.date_range(datetime(2024, 1, 1), periods=24 * 365, freq='h')
+        failure_rate = [5.0 + (3.0 if timestamp.hour == 3 else 0.0) for timestamp in timestamps]
+        failure_rate[1000] = 60.0
+
+        frame = analyzer._build_metric_frame(pd.DataFrame({
+            'timestamp': timestamps,
+            'total_tests': 100,
+            'failed_tests': 5,
+            'passed_tests': 95,
+            'avg_execution_time': 1.5,
+            MetricType.FAILURE_RATE.value: failure_rate
+        }))
+        metrics = analyzer._pivot_metrics(frame)
+
+        trends = await analyzer._generate_trend_analyses(metrics, AnalysisPeriod.HOURLY)
+        failure_trend = trends[0]
+
+        assert failure_trend.seasonal_patterns['peak_hour'] == 3
+        assert any(
+            anomaly['timestamp'] == timestamps[1000].to_pydatetime() and anomaly['severity'] == 'high'
+            for anomaly in failure_trend.anomalies
+        )
+
+        failure_analysis = await analyzer._analyze_failure_rates(metrics, AnalysisPeriod.HOURLY)
+        assert failure_analysis.overall_failure_rate == pytest.approx(sum(failure_rate) / len(failure_rate))
+
+        predictions = await analyzer._generate_predictions(metrics, trends)
+        assert predictions[MetricType.FAILURE_RATE.value]['predicted_value'] == pytest.approx(5.0, abs=0.5)
+
+    @pytest.mark.asyncio
+    async def test_anomaly_baselines_are_incremental(self, analyzer):
+        """Test that repeated analyses only feed new points to the anomaly baselines."""
+        timestamps = pd.date_range(datetime(2026, 1, 1), periods=60, freq='D')
+        coverage = [80.0 + (0.5 if day % 2 else -0.5) for day in range(60)]
+        coverage[-1] = 60.0
+
+        def metrics_until(days):
+            return analyzer._pivot_metrics(analyzer._build_metric_frame(pd.DataFrame({
+                'timestamp': timestamps[:days],
+                'total_tests': 100,
+                'failed_tests': 0,
+                'passed_tests': 100,
+                'avg_execution_time': 1.0,
+                MetricType.COVERAGE.value: coverage[:days]
+            })))
+
+        trends = await analyzer._generate_trend_analyses(metrics_until(59), AnalysisPeriod.DAILY)
+        assert trends[0].anomalies == []
+
+        trends = await analyzer._generate_trend_analyses(metrics_until(60), AnalysisPeriod.DAILY)
+        baseline = analyzer.anomaly_detector.get_baseline(f"{MetricType.COVERAGE.value}:{AnalysisPeriod.DAILY.value}")
+
+        assert baseline['count'] == 60
+        assert [anomaly['value'] for anomaly in trends[0].anomalies] == [60.0]
+        assert trends[0].anomalies[0]['severity'] == 'high'
+
+    @pytest.mark.asyncio
+    async def test_open_period_is_not_consumed(self, analyzer):
+        """Test that the still accumulating current period is scored only once it has closed."""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        timestamps = pd.date_range(today - timedelta(days=29), periods=30, freq='D')
+        stream = f"{MetricType.FAILURE_RATE.value}:{AnalysisPeriod.DAILY.value}"
+
+        def failure_rates(latest):
+            return pd.Series([5.0 + (0.5 if day % 2 else -0.5) for day in range(29)] + [latest], index=timestamps)
+
+        # A partial day with few runs so far looks normal and must not be consumed
+        assert analyzer._detect_anomalies(failure_rates(5.0), stream, AnalysisPeriod.DAILY) == []
+        assert analyzer.anomaly_detector.get_last_timestamp(stream) == timestamps[-2].to_pydatetime()
+        assert analyzer.anomaly_detector.get_baseline(stream)['count'] == 29
+
+        analyzer._detect_anomalies(failure_rates(40.0), stream, AnalysisPeriod.DAILY)
+        assert analyzer.anomaly_detector.get_baseline(stream)['count'] == 29
+
+        # Once the day has closed, its completed value is scored
+        analyzer._get_period_start = lambda timestamp, period: today + timedelta(days=1)
+        anomalies = analyzer._detect_anomalies(failure_rates(40.0), stream, AnalysisPeriod.DAILY)
+        assert [anomaly['value'] for anomaly in anomalies] == [40.0]
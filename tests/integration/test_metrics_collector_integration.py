@@ -0,0 +1,319 @@
+"""
+Integration tests for the metrics collector series storage.
+Tests the ring buffer series (capacity, retention, range lookups, label
+interning and column views), the collector paths that read it,
+incremental persistence, multi-resolution rollups and alert evaluation.
+"""
+
+import pytest
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+metrics_collector = pytest.importorskip("src.monitoring.metrics_collector")
+MetricSeries = metrics_collector.MetricSeries
+MetricType = metrics_collector.MetricType
+
+
+class TestMetricsCollectorIntegration:
+    """Integration tests for the metrics collector series storage."""
+
+    @pytest.fixture
+    def start(self):
+        """Timestamp of the first point, within retention."""
+        return datetime.now().replace(microsecond=0) - timedelta(hours=2)
+
+    def test_ring_buffer_keeps_newest_points(self, start):
+        """Test that a full series overwrites its oldest points in order."""
+        series = MetricSeries("requests", MetricType.GAUGE, capacity=50)
+        for index in range(120):
+            series.add_point(index, start + timedelta(seconds=index))
+
+        assert len(series) == 50
+        assert [point.value for point in series.points] == list(range(70, 120))
+        assert series.get_latest().timestamp == start + timedelta(seconds=119)
+        assert series.get_latest_value() == 119
+
+        # Range lookups are inclusive at both ends, across the wrap point
+        points = series.get_range(start + timedelta(seconds=60), start + timedelta(seconds=100))
+        assert [point.value for point in points] == list(range(70, 101))
+
+        slices = series.get_slices(start + timedelta(seconds=75), start + timedelta(seconds=110))
+        assert all(isinstance(view, memoryview) for pair in slices for view in pair)
+        assert [value for _, values in slices for value in values] == list(range(75, 111))
+
+    def test_out_of_order_points_kept_sorted(self, start):
+        """Test that late points are inserted in timestamp order."""
+        series = MetricSeries("requests", MetricType.GAUGE)
+        for value, offset in enumerate([0, -30, 10, -20, 20]):
+            series.add_point(value, start + timedelta(seconds=offset))
+
+        assert [point.value for point in series.points] == [1, 3, 0, 2, 4]
+        points = series.get_range(start - timedelta(seconds=25), start + timedelta(seconds=15))
+        assert [point.value for point in points] == [3, 0, 2]
+        assert [row[1] for row in series.get_rows(since=start.timestamp())] == [0, 2, 4]
+        assert series.get_latest_value() == 4
+        assert series.late_since == (start - timedelta(seconds=30)).timestamp()
+
+        # A full series drops its oldest point to make room for a late one
+        series = MetricSeries("requests", MetricType.GAUGE, capacity=4)
+        for value, offset in enumerate([0, 10, 20, 30, 15, -5]):
+            series.add_point(value, start + timedelta(seconds=offset))
+        assert [point.value for point in series.points] == [1, 4, 2, 3]
+
+    def test_retention_drops_expired_points(self, start):
+        """Test that points past retention are dropped as new points arrive."""
+        series = MetricSeries("latency", MetricType.TIMER, retention_period=timedelta(hours=1))
+        series.add_point(1.0, datetime.now() - timedelta(hours=3))
+        assert len(series) == 0
+
+        series.add_point(2.0, start + timedelta(minutes=90))
+        series.add_point(3.0)
+        assert [point.value for point in series.points] == [2.0, 3.0]
+
+    def test_labels_interned_per_series(self, start):
+        """Test that points share label sets and keep their own metadata."""
+        series = MetricSeries("errors", MetricType.COUNTER, tags={"service": "api"})
+        for index in range(10):
+            series.add_point(index, start + timedelta(seconds=index), tags={"region": "eu" if index % 2 else "us"})
+        series.add_point(10, start + timedelta(seconds=10), metadata={"source": "probe"})
+
+        points = series.points
+        assert points[1].tags == {"service": "api", "region": "eu"}
+        assert points[2].tags == {"service": "api", "region": "us"}
+        assert points[10].tags == {"service": "api"}
+        assert points[10].metadata == {"source": "probe"}
+        assert len(series._label_sets) == 3
+
+    def test_statistics_and_rate(self):
+        """Test window statistics and counter rates from the columns."""
+        now = datetime.now()
+        series = MetricSeries("jobs", MetricType.COUNTER)
+        series.add_point(100, now - timedelta(hours=3))
+        for index, value in enumerate([10, 20, 30, 40]):
+            series.add_point(value, now - timedelta(seconds=40 - index * 10))
+
+        stats = series.get_statistics(timedelta(minutes=5))
+        assert stats['count'] == 4
+        assert stats['min'] == 10 and stats['max'] == 40
+        assert stats['mean'] == pytest.approx(25.0)
+        assert stats['median'] == pytest.approx(25.0)
+        assert stats['std_dev'] == pytest.approx(12.909944, rel=1e-6)
+        assert stats['latest'] == 40
+        assert series.get_statistics()['count'] == 5
+        assert series.get_rate(timedelta(minutes=1)) == pytest.approx(1.0)
+
+    def test_collector_uses_series_buffers(self, tmp_path):
+        """Test that collector summaries, counters and aggregations read the series."""
+        collector = metrics_collector.MetricsCollector(
+            storage_path=str(Path(tmp_path) / "metrics.db"), enable_persistence=False, max_memory_points=100
+        )
+        for _ in range(250):
+            collector.increment_counter("tests.run")
+        collector.record_gauge("queue.depth", 4)
+        collector.record_gauge("queue.depth", 6)
+        collector.add_aggregation_rule("queue", "queue\\..*", "avg", timedelta(minutes=5))
+        collector._process_aggregations()
+
+        assert collector.get_latest_value("tests.run") == 250
+        summary = collector.get_metrics_summary()
+        assert summary["tests.run"]["point_count"] == 100
+        assert collector.get_latest_value("aggregated.queue") == 5
+
+    def test_persistence_writes_only_new_points(self, tmp_path):
+        """Test that persistence cycles add each sample once."""
+        storage_path = Path(tmp_path) / "metrics.db"
+        collector = metrics_collector.MetricsCollector(storage_path=str(storage_path))
+        start = datetime.now() - timedelta(minutes=10)
+
+        def row_count():
+            with sqlite3.connect(storage_path) as conn:
+                return conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0]
+
+        for index in range(30):
+            collector.record_metric("cpu", index, MetricType.GAUGE, tags={"host": "a"},
+                                    timestamp=start + timedelta(seconds=index))
+        for _ in range(3):
+            collector._persist_all_metrics()
+        assert row_count() == 30
+        assert collector.collection_stats['points_persisted'] == 30
+
+        for index in range(30, 40):
+            collector.record_metric("cpu", index, MetricType.GAUGE, tags={"host": "a"},
+                                    timestamp=start + timedelta(seconds=index))
+        collector._persist_all_metrics()
+        assert row_count() == 40
+        assert collector.collection_stats['points_persisted'] == 40
+
+        # A late point behind the watermark is still written
+        collector.record_metric("cpu", -1, MetricType.GAUGE, tags={"host": "a"},
+                                timestamp=start + timedelta(seconds=5.5))
+        collector._persist_all_metrics()
+        assert row_count() == 41
+        assert collector.series["cpu"].late_since is None
+        collector.record_metric("cpu", 40, MetricType.GAUGE, tags={"host": "a"},
+                                timestamp=start + timedelta(seconds=40))
+        collector._persist_all_metrics()
+        assert row_count() == 42
+        assert collector.collection_stats['points_persisted'] == 42
+
+        # A restarted collector holding the same samples adds no duplicates
+        restarted = metrics_collector.MetricsCollector(storage_path=str(storage_path))
+        restarted.series["cpu"] = collector.series["cpu"]
+        restarted._persist_all_metrics()
+        assert row_count() == 42
+
+        with sqlite3.connect(storage_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        points = collector.query_metrics("cpu", start, datetime.now(), limit=5)
+        assert [point.value for point in points] == [40, 39, 38, 37, 36]
+        assert points[0].tags == {"host": "a"}
+
+    def test_existing_duplicates_removed_on_open(self, tmp_path):
+        """Test that a database written by repeated full persistence is deduplicated."""
+        storage_path = Path(tmp_path) / "metrics.db"
+        with sqlite3.connect(storage_path) as conn:
+            conn.execute("""
+                CREATE TABLE metrics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, value REAL NOT NULL,
+                    type TEXT NOT NULL, timestamp TEXT NOT NULL, tags TEXT, metadata TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            row = ("cpu", 1.0, "gauge", datetime.now().isoformat(), "{}", "{}")
+            conn.executemany("INSERT INTO metrics (name, value, type, timestamp, tags, metadata) "
+                             "VALUES (?, ?, ?, ?, ?, ?)", [row] * 3)
+
+        metrics_collector.MetricsCollector(storage_path=str(storage_path))
+        with sqlite3.connect(storage_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0] == 1
+
+    def test_rollups_pick_coarsest_resolution(self, tmp_path):
+        """Test that rollups are built per period and queried by step."""
+        storage_path = Path(tmp_path) / "metrics.db"
+        collector = metrics_collector.MetricsCollector(storage_path=str(storage_path))
+        day = (datetime.now() - timedelta(days=3)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+        # One point every 30 seconds for two days, value = minute of the hour
+        for index in range(2 * 24 * 120):
+            timestamp = day + timedelta(seconds=30 * index)
+            collector.record_metric("api.latency", timestamp.minute, MetricType.TIMER, timestamp=timestamp)
+        collector._persist_all_metrics()
+        assert collector._update_rollups() == 2 * 24 * 60 + 2 * 24 + 2
+
+        minutes = collector.query_metrics("api.latency", day, day + timedelta(minutes=9), step=timedelta(minutes=5))
+        assert len(minutes) == 10
+        assert minutes[0].metadata['period'] == '1m'
+        assert minutes[0].metadata['count'] == 2
+
+        hours = collector.query_metrics("api.%", day, day + timedelta(days=1), step=timedelta(hours=6))
+        assert len(hours) == 25
+        hour = hours[-1]
+        assert hour.timestamp == day and hour.metric_type == MetricType.TIMER
+        assert hour.value == pytest.approx(29.5)
+        assert (hour.metadata['count'], hour.metadata['min'], hour.metadata['max']) == (120, 0, 59)
+        assert hour.metadata['p95'] == pytest.approx(56.5, abs=1.0)
+
+        days = collector.query_metrics("api.latency", day - timedelta(days=30), datetime.now(),
+                                       step=timedelta(days=7))
+        assert [(point.timestamp, point.metadata['count']) for point in days] == \
+            [(day + timedelta(days=1), 2880), (day, 2880)]
+
+        # Steps under a minute read raw points
+        raw = collector.query_metrics("api.latency", day, day + timedelta(minutes=1), step=timedelta(seconds=10))
+        assert len(raw) == 3 and 'period' not in raw[0].metadata
+
+        # Coarse rollups outlive raw points
+        with sqlite3.connect(storage_path) as conn:
+            conn.execute("DELETE FROM metrics")
+        days = collector.query_metrics("api.latency", day - timedelta(days=30), datetime.now(),
+                                       step=timedelta(days=1))
+        assert len(days) == 2
+
+    def test_rollups_are_incremental(self, tmp_path):
+        """Test that later passes recompute only buckets from the watermark on."""
+        collector = metrics_collector.MetricsCollector(storage_path=str(Path(tmp_path) / "metrics.db"))
+        now = datetime.now()
+        old = now - timedelta(hours=3)
+        collector.record_metric("jobs", 1, MetricType.GAUGE, timestamp=old)
+        collector.record_metric("jobs", 3, MetricType.GAUGE, timestamp=now - timedelta(seconds=1))
+        collector._persist_all_metrics()
+        assert collector._update_rollups() >= 4
+
+        collector.record_metric("jobs", 5, MetricType.GAUGE)
+        collector._persist_all_metrics()
+        # Only buckets from the watermarks on are recomputed
+        assert collector._update_rollups() <= 6
+
+        days = collector.query_metrics("jobs", now - timedelta(days=2), datetime.now(), step=timedelta(days=1))
+        assert sum(point.metadata['count'] for point in days) == 3
+        assert max(point.metadata['max'] for point in days) == 5
+
+    def test_alert_rules_index(self, tmp_path):
+        """Test that rules are matched by exact name or combined pattern, once per series."""
+        collector = metrics_collector.MetricsCollector(storage_path=str(Path(tmp_path) / "metrics.db"),
+                                                       enable_persistence=False)
+        collector.add_alert_rule("cpu", "^system\\.cpu$", "gt", 90)
+        collector.add_alert_rule("latency", "latency", "gt", 1.0)
+        collector.add_alert_rule("grouped", "(queue)\\.depth", "gt", 100)
+
+        index = collector._build_alert_index()
+        assert index['exact'] == {"system.cpu": ["cpu"]}
+        assert [rule_name for rule_name, _ in index['unfiltered']] == ["grouped"]
+
+        assert collector._get_alert_rules_for("system.cpu") == ["cpu"]
+        assert collector._get_alert_rules_for("system.cpu.user") == []
+        assert collector._get_alert_rules_for("api.latency.p95") == ["latency"]
+        assert collector._get_alert_rules_for("jobs.queue.depth") == ["grouped"]
+        assert "api.latency.p95" in collector._alert_rule_cache
+
+        collector.add_alert_rule("user", "cpu\\.user", "gt", 50)
+        assert collector._get_alert_rules_for("system.cpu.user") == ["user"]
+
+    def test_alert_hysteresis(self, tmp_path):
+        """Test for-durations, clear thresholds and evaluation of updated series only."""
+        collector = metrics_collector.MetricsCollector(storage_path=str(Path(tmp_path) / "metrics.db"),
+                                                       enable_persistence=False)
+        fired, resolved = [], []
+        collector.add_event_callback("alert_triggered", lambda event, data: fired.append(data))
+        collector.add_event_callback("alert_resolved", lambda event, data: resolved.append(data))
+        collector.add_alert_rule("cpu_high", "^system\\.cpu$", "gt", 90, clear_threshold=80,
+                                 for_duration=timedelta(seconds=30))
+        now = datetime.now()
+
+        def cycle(value, seconds):
+            if value is not None:
+                collector.record_gauge("system.cpu", value)
+            collector._check_alerts(now + timedelta(seconds=seconds))
+
+        cycle(95, 0)
+        cycle(96, 10)
+        assert fired == []
+        cycle(85, 20)  # Drops below the threshold before the for-duration: pending resets
+        cycle(95, 30)
+        cycle(None, 60)  # Still breaching without new points
+        assert [alert['value'] for alert in fired] == [95]
+
+        # Flapping between the clear threshold and the threshold does not fire again
+        for seconds, value in ((70, 85), (80, 95), (90, 82), (100, 97)):
+            cycle(value, seconds)
+        assert len(fired) == 1
+        assert collector.get_active_alerts()[0]['metric_name'] == "system.cpu"
+
+        cycle(75, 110)
+        assert [alert['value'] for alert in resolved] == [75]
+        assert collector.get_active_alerts() == []
+
+        # Only series with new points or open alerts are evaluated
+        evaluated = []
+        evaluate = collector._evaluate_alert
+        collector._evaluate_alert = lambda rule_name, series_name, at: \
+            evaluated.append(series_name) or evaluate(rule_name, series_name, at)
+        cycle(None, 120)
+        assert evaluated == []
+        cycle(99, 130)
+        assert evaluated == ["system.cpu"]
+
+        evaluation_times = collector.get_series(metrics_collector.ALERT_EVALUATION_METRIC)
+        assert evaluation_times.metric_type == MetricType.TIMER
+        assert len(evaluation_times) == 12
@@ -0,0 +1,205 @@
+"""
+Integration tests for the notifier agent.
+Tests concurrent per-channel delivery with per-channel timeouts, isolation
+of slow and failing channels, the HTTP session shared by all channels,
+digest coalescing and recording of system alerts in the event rollups.
+"""
+
+import asyncio
+import pytest
+import time
+from datetime import datetime, timedelta
+
+notifier_agent = pytest.importorskip("src.agents.notifier_agent")
+base_agent = pytest.importorskip("src.agents.base_agent")
+
+
+class ScriptedChannel(notifier_agent.NotificationChannel):
+    """Channel that waits, fails or succeeds as configured and records its sends."""
+
+    def __init__(self, name, delay=0.0, error=None, **config):
+        super().__init__(name, {'retry_count': 1, 'retry_delay': 0, **config})
+        self.delay = delay
+        self.error = error
+        self.sent = []
+
+    async def _send_impl(self, message):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise RuntimeError(self.error)
+        self.sent.append((time.perf_counter(), message))
+        return {'success': True, 'channel': self.name}
+
+
+class TestNotifierIntegration:
+    """Integration tests for the notifier agent."""
+
+    def _agent(self, *channels, **notifier_config):
+        config = base_agent.AgentConfig(name="notifier")
+        # NotifierAgent reads its settings from config.config
+        config.config = {'coalescing': {'enabled': False}, 'rollups': {'enabled': False}, **notifier_config}
+        agent = notifier_agent.NotifierAgent(config)
+        agent.channels = {channel.name: channel for channel in channels}
+        return agent
+
+    @pytest.mark.asyncio
+    async def test_slow_channel_does_not_delay_others(self):
+        """Test that a channel exceeding its send timeout only fails itself."""
+        slow = ScriptedChannel('slow', delay=5, send_timeout=0.3)
+        fast = ScriptedChannel('fast', delay=0.05)
+        other = ScriptedChannel('other', delay=0.05)
+        agent = self._agent(slow, fast, other)
+
+        start = time.perf_counter()
+        try:
+            result = await agent.send_system_alert('disk', 'warning', 'Disk almost full')
+        finally:
+            await agent.close()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1
+        assert result['success'] and result['successful_channels'] == 2
+        assert 'Timed out after 0.3 seconds' in result['results']['slow']['error']
+        # Fast channels were sent concurrently, well before the slow channel timed out
+        assert all(sent_at - start < 0.2 for sent_at, _ in fast.sent + other.sent)
+
+    @pytest.mark.asyncio
+    async def test_failing_channel_does_not_fail_others(self):
+        """Test that a channel raising on every attempt leaves the other results intact."""
+        broken = ScriptedChannel('broken', error='connection refused', retry_count=3)
+        working = ScriptedChannel('working')
+        agent = self._agent(broken, working)
+
+        try:
+            result = await agent.send_system_alert('queue', 'warning', 'Queue backing up')
+        finally:
+            await agent.close()
+
+        assert result['success']
+        assert result['results']['working'] == {'success': True, 'channel': 'working'}
+        assert 'Failed after 3 attempts: connection refused' in result['results']['broken']['error']
+        assert len(working.sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_channels_share_one_session(self):
+        """Test that all channels send through the agent's pooled session until close."""
+        first, second = ScriptedChannel('first'), ScriptedChannel('second')
+        agent = self._agent(first, second, max_connections=5)
+
+        await agent.send_system_alert('cpu', 'warning', 'CPU high')
+        session = agent.http_session
+        assert session is not None and first.session is session and second.session is session
+        assert session.connector.limit == 5
+
+        await agent.send_system_alert('cpu', 'warning', 'CPU high again')
+        assert agent.http_session is session
+
+        await agent.close()
+        assert session.closed and agent.http_session is None
+
+    def _coalescing_agent(self, *channels, **coalescing):
+        return self._agent(*channels, coalescing={'enabled': True, 'window': 60, **coalescing})
+
+    def test_coalescing_is_opt_in(self):
+        """Test that notifications are sent right away unless coalescing is configured."""
+        config = base_agent.AgentConfig(name="notifier")
+        config.config = {}
+        agent = notifier_agent.NotifierAgent(config)
+        assert not agent._should_coalesce('test_result', 'info', False)
+
+    @pytest.mark.asyncio
+    async def test_failures_and_immediate_alerts_bypass_digests(self):
+        """Test that failure notifications and immediate alerts are not held for the window."""
+        channel = ScriptedChannel('chat')
+        agent = self._coalescing_agent(channel)
+
+        try:
+            failure = await agent.send_test_failure_notification({'name': 'nightly'}, [])
+            alert = await agent.send_system_alert('workflow_failure', 'high', 'Workflow failed', immediate=True)
+            queued = await agent.send_system_alert('cpu', 'warning', 'CPU high')
+
+            assert failure['successful_channels'] == 1 and alert['successful_channels'] == 1
+            assert queued['queued']
+            assert len(channel.sent) == 2
+            assert not any('immediate' in str(message) for _, message in channel.sent)
+        finally:
+            await agent.close()
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_workflow_failures_are_coalesced(self, tmp_path):
+        """Test that per-workflow failure alerts share a digest unless their severity passes through."""
+        test_orchestrator = pytest.importorskip("src.agents.test_orchestrator")
+        orchestrator = test_orchestrator.TestOrchestrator({
+            'workflows_file': str(tmp_path / "workflows.json"),
+            'workflow_executions.json': str(tmp_path / "executions.json")
+        })
+
+        async def fail_workflows(severities):
+            channel = ScriptedChannel('chat')
+            orchestrator.notifier = self._coalescing_agent(channel, passthrough_severities=severities)
+            for index in range(3):
+                # Without a test runner the run_tests step fails
+                workflow_id = orchestrator.create_workflow(
+                    f'nightly-{index}', [{'type': 'run_tests'}], notification_config={'channels': ['chat']}
+                )
+                execution = test_orchestrator.WorkflowExecution(
+                    id=f'execution-{index}', workflow_id=workflow_id, total_steps=1
+                )
+                orchestrator.workflow_executions[execution.id] = execution
+                await orchestrator._execute_workflow_logic(execution)
+                assert execution.status == 'failed'
+            sent = len(channel.sent)
+            await orchestrator.notifier.close()
+            return sent, len(channel.sent)
+
+        assert await fail_workflows(['critical']) == (0, 1)
+        assert await fail_workflows(['critical', 'high']) == (3, 3)
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_shutdown_flushes_digests(self, tmp_path):
+        """Test that digests still inside their window are sent when the orchestrator shuts down."""
+        test_orchestrator = pytest.importorskip("src.agents.test_orchestrator")
+        orchestrator = test_orchestrator.TestOrchestrator({
+            'workflows_file': str(tmp_path / "workflows.json"),
+            'workflow_executions.json': str(tmp_path / "executions.json")
+        })
+        first, second = ScriptedChannel('first'), ScriptedChannel('second')
+        agent = orchestrator.notifier = self._coalescing_agent(first, second)
+
+        for index in range(3):
+            await agent.send_system_alert('cpu', 'warning', f'CPU high ({index})')
+        assert first.sent == [] and second.sent == []
+
+        await orchestrator.shutdown()
+
+        assert len(first.sent) == 1 and len(second.sent) == 1
+        assert first.sent[0][1]['title'].startswith('3 system alert notifications')
+        assert agent.http_session is None
+        stats = agent.get_coalescing_stats()
+        assert stats['received'] == 6
+        assert stats['digests_sent'] + stats['suppressed'] + stats['passed_through'] == stats['received']
+
+    @pytest.mark.asyncio
+    async def test_system_alerts_are_recorded_as_events(self, monkeypatch):
+        """Test that system alerts feed the event rollups behind the stability summary."""
+        rollup_store = pytest.importorskip("src.analytics.rollup_store")
+        database = pytest.importorskip("src.database.database")
+        store = rollup_store.RollupStore(database.DatabaseManager("sqlite:///:memory:"))
+        monkeypatch.setattr(notifier_agent, "get_rollup_store", lambda: store)
+        agent = self._agent(ScriptedChannel('chat'), rollups={'enabled': True})
+
+        try:
+            await agent.send_system_alert('performance_degradation', 'critical', 'Latency doubled',
+                                          recovery_time=30, environment='staging')
+            await agent.send_system_alert('workflow_failure', 'high', 'Workflow failed', execution_id='exec-1')
+            await agent.send_system_alert('workflow_failure', 'high', 'Workflow failed', execution_id='exec-1')
+        finally:
+            await agent.close()
+
+        now = datetime.now()
+        summary = store.get_stability_summary(now - timedelta(days=1), now)
+        assert summary['total_incidents'] == 2
+        assert summary['critical_issues'] == 1 and summary['performance_events'] == 1
+        assert summary['uptime_percentage'] == pytest.approx(50.0)
+        assert summary['mean_time_to_recovery'] == pytest.approx(30.0)
+        assert store.get_stability_summary(now - timedelta(days=1), now, environment='staging')['total_incidents'] == 1
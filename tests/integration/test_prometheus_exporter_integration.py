@@ -0,0 +1,109 @@
+"""
+Integration tests for the Prometheus exporter.
+Tests the text exposition of collector series, histograms and agent metrics,
+per-series reuse of encoded output and the dashboard scrape endpoint.
+"""
+
+import pytest
+import time
+from pathlib import Path
+
+metrics_collector = pytest.importorskip("src.monitoring.metrics_collector")
+prometheus_exporter = pytest.importorskip("src.monitoring.prometheus_exporter")
+PrometheusExporter = prometheus_exporter.PrometheusExporter
+
+
+class TestPrometheusExporterIntegration:
+    """Integration tests for the Prometheus exporter."""
+
+    @pytest.fixture
+    def collector(self, tmp_path):
+        """Create a collector without persistence."""
+        return metrics_collector.MetricsCollector(storage_path=str(Path(tmp_path) / "metrics.db"),
+                                                  enable_persistence=False)
+
+    def test_text_exposition(self, collector):
+        """Test the rendered series, histograms and agent metrics."""
+        agent_monitor = pytest.importorskip("src.monitoring.agent_monitor")
+        collector.increment_counter("tests.run", 3)
+        collector.record_gauge("queue.depth", 2.5, tags={"queue": 'high "prio"'})
+        collector.observe_histogram("api.latency", 0.2, buckets=[0.1, 0.5])
+        collector.observe_histogram("api.latency", 0.7, buckets=[0.1, 0.5])
+
+        agents = agent_monitor.AgentMetrics(agent_name="functional")
+        agents.update_execution(2.0, True)
+        monitor = type("Monitor", (), {"agent_metrics": {"functional": agents}})()
+
+        text = PrometheusExporter(collector, monitor).render().decode()
+        assert "# TYPE tests_run counter\ntests_run 3\n" in text
+        assert 'queue_depth{queue="high \\"prio\\""} 2.5\n' in text
+        assert "# TYPE api_latency histogram\n" in text
+        assert 'api_latency_bucket{le="0.1"} 0\napi_latency_bucket{le="0.5"} 1\n' \
+               'api_latency_bucket{le="+Inf"} 2\n' in text
+        assert "api_latency_sum 0.8999999999999999\napi_latency_count 2\n" in text
+        assert text.count("# TYPE api_latency ") == 1
+        assert 'agent_executions_total{agent="functional"} 1\n' in text
+        assert 'agent_status{agent="functional",status="idle"} 1\n' in text
+
+    def test_colliding_names_and_label_sets(self, collector):
+        """Test that sanitized name collisions form one family with every label set."""
+        collector.record_gauge("api.latency", 1)
+        collector.record_gauge("api_latency", 2)
+        collector.record_gauge("req", 1, tags={"route": "a"})
+        collector.record_gauge("req", 2, tags={"route": "b"})
+        collector.record_gauge("req", 3, tags={"route": "a"})
+        collector.record_gauge("api-latency", 5, tags={"route": "a"})
+        exporter = PrometheusExporter(collector)
+
+        text = exporter.render().decode()
+        assert text.count("# TYPE api_latency ") == 1
+        assert "api_latency 2\n" in text and "api_latency 1\n" not in text
+        assert 'api_latency{route="a"} 5\n' in text
+        assert text.count("# TYPE req ") == 1
+        assert 'req{route="a"} 3\nreq{route="b"} 2\n' in text
+
+        collector.record_gauge("api.latency", 7)
+        text = exporter.render().decode()
+        assert "api_latency 7\n" in text and "api_latency 2\n" not in text
+
+    def test_unchanged_output_is_reused(self, collector):
+        """Test that scrapes only re-encode series that received points."""
+        for index in range(500):
+            collector.record_gauge(f"series.{index}", index)
+        exporter = PrometheusExporter(collector)
+
+        first = exporter.render()
+        assert exporter.render() is first
+        chunk = exporter._series_chunks["series.1"][1]
+
+        collector.record_gauge("series.0", -1)
+        second = exporter.render()
+        assert second is not first
+        assert b"series_0 -1\n" in second and b"series_0 0\n" not in second
+        assert exporter._series_chunks["series.1"][1] is chunk
+
+        start = time.perf_counter()
+        for _ in range(100):
+            collector.record_gauge("series.7", 1)
+            exporter.render()
+        assert (time.perf_counter() - start) / 100 < 0.005
+
+    def test_default_collector_is_used(self, collector):
+        """Test that an exporter without a collector reads the default collector."""
+        metrics_collector.set_default_metrics_collector(collector)
+        try:
+            collector.record_gauge("default.gauge", 1)
+            assert b"default_gauge 1\n" in PrometheusExporter().render()
+        finally:
+            metrics_collector.set_default_metrics_collector(None)
+
+    @pytest.mark.asyncio
+    async def test_dashboard_metrics_endpoint(self, collector):
+        """Test that the dashboard serves the exporter output."""
+        dashboard_app = pytest.importorskip("src.dashboard.dashboard_app")
+        collector.record_gauge("queue.depth", 4)
+        app = dashboard_app.DashboardApp(metrics_collector=collector)
+
+        response = await app._prometheus_metrics(None)
+        assert response.headers['Content-Type'].startswith("text/plain; version=0.0.4")
+        assert b"queue_depth 4\n" in response.body
@@ -0,0 +1,115 @@
+"""
+Integration tests for the quantile sketch.
+Tests percentile accuracy, merging across shards, serialization and the
+percentiles reported by the analytics engine, functional reporter and
+metrics collector.
+"""
+
+import pytest
+import random
+import tempfile
+from pathlib import Path
+
+quantile_sketch = pytest.importorskip("src.analytics.quantile_sketch")
+TDigest = quantile_sketch.TDigest
+
+
+def exact_rank(sorted_values, value):
+    """Fraction of values less than or equal to value."""
+    return sum(1 for v in sorted_values if v <= value) / len(sorted_values)
+
+
+class TestQuantileSketchIntegration:
+    """Integration tests for the quantile sketch."""
+
+    @pytest.fixture
+    def execution_times(self):
+        """Generate skewed execution times."""
+        rng = random.Random(7)
+        return [rng.lognormvariate(0, 1.2) for _ in range(20000)]
+
+    def test_percentiles_are_accurate(self, execution_times):
+        """Test that estimated percentiles are close in rank to the exact ones."""
+        digest = TDigest()
+        digest.update(execution_times)
+        sorted_values = sorted(execution_times)
+
+        for q in (0.5, 0.95, 0.99):
+            assert exact_rank(sorted_values, digest.quantile(q)) == pytest.approx(q, abs=0.005)
+        assert digest.quantile(0) == sorted_values[0]
+        assert digest.quantile(1) == sorted_values[-1]
+        assert digest.centroid_count() <= 2 * digest.compression
+
+    def test_small_inputs_interpolate(self):
+        """Test that small inputs give the usual interpolated percentiles."""
+        digest = TDigest()
+        digest.update(range(1, 11))
+
+        assert digest.quantile(0.5) == pytest.approx(5.5)
+        assert digest.percentiles()['p99'] == 10
+        assert TDigest().quantile(0.5) is None
+
+    def test_shards_merge_and_roundtrip(self, execution_times):
+        """Test that merged shard digests match a single digest over all values."""
+        shards = []
+        for index in range(8):
+            shard = TDigest()
+            shard.update(execution_times[index::8])
+            shards.append(TDigest.from_dict(shard.to_dict()))
+
+        merged = TDigest.merge_all(shards)
+        sorted_values = sorted(execution_times)
+
+        assert merged.count == len(execution_times)
+        assert merged.mean == pytest.approx(sum(execution_times) / len(execution_times))
+        for q in (0.5, 0.95, 0.99):
+            assert exact_rank(sorted_values, merged.quantile(q)) == pytest.approx(q, abs=0.01)
+
+    def test_reporters_share_the_sketch(self, execution_times):
+        """Test that the analytics engine and functional reporter expose mergeable digests."""
+        analytics_engine = pytest.importorskip("src.reporting.analytics_engine")
+        functional_reporter = pytest.importorskip("src.reporting.functional_reporter")
+
+        engine = analytics_engine.AnalyticsEngine()
+        first = engine.analyze_performance(
+            [{'execution_time': t, 'status': 'passed'} for t in execution_times[:10000]]
+        )
+        second = engine.analyze_performance(
+            [{'execution_time': t, 'status': 'passed'} for t in execution_times[10000:]]
+        )
+        merged = engine.merge_performance_digests(
+            [first.execution_time_digest, second.execution_time_digest]
+        )
+
+        assert first.median_execution_time <= first.p95_execution_time <= first.p99_execution_time
+        assert merged['count'] == len(execution_times)
+        assert exact_rank(sorted(execution_times), merged['p95_execution_time']) == pytest.approx(0.95, abs=0.01)
+
+        reporter = functional_reporter.FunctionalReporter()
+        tests = [{'name': f'test_{i}', 'execution_time': t} for i, t in enumerate([0.5, 1.0, 2.0, 40.0])]
+        metrics = reporter._extract_performance_metrics(tests)
+
+        assert metrics['total_execution_time'] == pytest.approx(43.5)
+        assert metrics['median_execution_time'] == pytest.approx(1.5)
+        assert metrics['slowest_test'] == 40.0
+        assert metrics['performance_distribution'] == {'fast_tests': 3, 'medium_tests': 0, 'slow_tests': 1}
+        assert TDigest.from_dict(metrics['execution_time_digest']).count == 4
+
+    def test_metrics_collector_quantiles(self, execution_times):
+        """Test that timers keep percentiles and shard sketches merge into the collector."""
+        metrics_collector = pytest.importorskip("src.monitoring.metrics_collector")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            collector = metrics_collector.MetricsCollector(storage_path=str(Path(temp_dir) / "metrics.db"))
+            for value in execution_times[:10000]:
+                collector.record_timer("test.duration", value)
+
+            shard = TDigest()
+            shard.update(execution_times[10000:])
+            collector.merge_sketch("test.duration", shard.to_dict())
+
+            quantiles = collector.get_quantiles("test.duration")
+            assert exact_rank(sorted(execution_times), quantiles['p99']) == pytest.approx(0.99, abs=0.005)
+            assert collector.get_sketch("test.duration")['count'] == len(execution_times)
+            assert collector.get_quantiles("missing") == {}
+            assert 'quantiles' in collector.get_metrics_summary()["test.duration"]
@@ -0,0 +1,55 @@
+"""
+Integration tests for merging collected test results.
+Tests single-pass classification across the result formats and merging
+collected files into complete buckets.
+"""
+
+import pytest
+
+report_collector_agent = pytest.importorskip("src.agents.report_collector_agent")
+base_agent = pytest.importorskip("src.agents.base_agent")
+StreamingResultMerger = report_collector_agent.StreamingResultMerger
+
+
+class TestReportCollectorIntegration:
+    """Integration tests for the streaming result merger."""
+
+    @pytest.fixture
+    def collector(self, tmp_path):
+        """Create a report collector."""
+        config = base_agent.AgentConfig(name="collector")
+        return report_collector_agent.ReportCollectorAgent(config)
+
+    def test_results_are_classified_once(self):
+        """Test counters and buckets across the supported result formats."""
+        merger = StreamingResultMerger(run_id="run-1")
+        merger.add_tests([
+            {'name': 'a', 'status': 'PASSED', 'duration': 1.5},
+            {'name': 'b', 'status': 'failure', 'duration': 2},
+            {'name': 'c', 'status': 'flaky'},
+        ])
+        merger.add_suites([{'name': 'suite', 'tests': [{'name': 'd', 'status': 'Skip'}]}])
+        merger.add_summary({'total': 10, 'passed': 10, 'duration': 4})
+
+        summary = merger.get_summary(artifacts_count=2)
+        assert (summary['total'], summary['passed'], summary['failed'], summary['skipped']) == (14, 11, 1, 1)
+        assert summary['flaky'] == 1
+        assert summary['duration'] == 7.5
+        buckets = merger.get_buckets()
+        assert [test['name'] for test in buckets['passed_tests']] == ['a']
+        assert [test['name'] for test in buckets['skipped_tests']] == ['d']
+
+    @pytest.mark.asyncio
+    async def test_merged_buckets_hold_every_test(self, collector):
+        """Test that merging keeps every collected test in its bucket."""
+        tests = [{'name': f'test_{index}', 'status': 'failed' if index % 4 else 'passed'}
+                 for index in range(2000)]
+        collected = {'results.json': {'tests': tests}, 'run.log': 'log'}
+        merged = await collector._merge_test_results(collected, "run-2")
+
+        results = merged['results']
+        assert merged['summary']['failed'] == 1500
+        assert len(results['failed_tests']) == 1500
+        assert len(results['passed_tests']) == 500
+        assert results['failed_tests'][0] is tests[1]
+        assert results['artifacts'] == {'run.log': 'log'}
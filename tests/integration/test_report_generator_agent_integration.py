@@ -0,0 +1,105 @@
+"""
+Integration tests for the report generator agent.
+Tests chart rendering in the process pool, chart cache reuse and the
+per-agent chart cache used when a cache size is configured.
+"""
+
+import base64
+import pytest
+
+report_generator_agent = pytest.importorskip("src.agents.report_generator_agent")
+base_agent = pytest.importorskip("src.agents.base_agent")
+ReportGeneratorAgent = report_generator_agent.ReportGeneratorAgent
+
+
+class TestReportGeneratorAgentIntegration:
+    """Integration tests for the report generator agent."""
+
+    def _agent(self, **report_config):
+        config = base_agent.AgentConfig(
+            name="report_generator",
+            metadata={'report_config': {'render_workers': 2, **report_config}}
+        )
+        return ReportGeneratorAgent(config)
+
+    @pytest.mark.asyncio
+    async def test_charts_rendered_in_process_pool(self):
+        """Test that charts are rendered by pool workers and reused from the cache."""
+        agent = self._agent(chart_cache_size=8)
+        processed_data = {
+            'analysis': {
+                'status_distribution': {'passed': 8, 'failed': 2},
+                'success_rate_by_type': {'unit': 90.0, 'api': 75.0}
+            },
+            'trends': {
+                'success_rate_trend': [{'date': '2026-01-01', 'success_rate': 80.0},
+                                       {'date': '2026-01-02', 'success_rate': 85.0}]
+            }
+        }
+        try:
+            charts = await agent._generate_charts(processed_data)
+            assert set(charts) == {'status_distribution', 'success_rate_by_type', 'success_rate_trend'}
+            for image in charts.values():
+                assert base64.b64decode(image).startswith(b'\x89PNG')
+            assert agent._render_pool is not None
+            assert agent.chart_cache.misses == 3
+
+            assert await agent._generate_charts(processed_data) == charts
+            assert agent.chart_cache.hits == 3
+        finally:
+            agent.close()
+        assert agent._render_pool is None
+
+    def test_configured_cache_size_is_per_agent(self):
+        """Test that a configured cache size does not resize the shared chart cache."""
+        shared = report_generator_agent._chart_cache
+        max_entries = shared.max_entries
+
+        sized = self._agent(chart_cache_size=1)
+        default = self._agent()
+
+        assert sized.chart_cache is not shared and sized.chart_cache.max_entries == 1
+        assert default.chart_cache is shared and shared.max_entries == max_entries
+
+        sized.chart_cache.put('a', 'image-a')
+        sized.chart_cache.put('b', 'image-b')
+        assert sized.chart_cache.get('a') is None
+        assert sized.chart_cache.get('b') == 'image-b'
+
+    @pytest.mark.asyncio
+    async def test_render_job_reports_progress(self, tmp_path):
+        """Test that a pool render job writes its report and reports progress."""
+        agent = self._agent(progress_interval=0.01)
+        updates = []
+        agent.add_callback('on_progress', lambda _, job: updates.append((job['stage'], job['status'])))
+        processed_data = {
+            'summary': {'total_test_runs': 1, 'sources': ['ci']},
+            'test_results': [{'name': 'test_a', 'status': 'passed'}]
+        }
+        try:
+            report_path = await agent._generate_excel_report(processed_data, tmp_path, "report", True)
+        finally:
+            agent.close()
+
+        assert report_path.exists()
+        assert updates[-1] == ('completed', 'completed')
+        assert agent.render_jobs == {}
+        assert agent._job_manager is None and agent._render_pool is None
+
+    @pytest.mark.asyncio
+    async def test_orchestrator_shutdown_closes_agent(self, tmp_path):
+        """Test that orchestrator shutdown stops the render pool and job manager."""
+        test_orchestrator = pytest.importorskip("src.agents.test_orchestrator")
+        orchestrator = test_orchestrator.TestOrchestrator({
+            'workflows_file': str(tmp_path / "workflows.json"),
+            'workflow_executions.json': str(tmp_path / "executions.json")
+        })
+        agent = orchestrator.report_generator = self._agent()
+        await agent._generate_excel_report({}, tmp_path, "report", False)
+        manager = agent._job_manager
+        assert manager is not None and agent._render_pool is not None
+
+        await orchestrator.shutdown()
+
+        assert agent._job_manager is None and agent._render_pool is None
+        assert manager._process is None or not manager._process.is_alive()
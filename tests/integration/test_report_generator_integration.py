@@ -0,0 +1,162 @@
+"""
+Integration tests for the report generator.
+Tests serial and process-pool generation of domain and unified reports,
+per-stage timings and the in-process fallback for unpicklable inputs.
+"""
+
+import os
+import pytest
+import threading
+from pathlib import Path
+
+report_generator = pytest.importorskip("src.reporting.report_generator")
+ReportGenerator = report_generator.ReportGenerator
+ReportGenerationConfig = report_generator.ReportGenerationConfig
+ReportOutputFormat = report_generator.ReportOutputFormat
+
+
+def _crashing_export_job(config, domain, report, format_type):
+    """Pool export job whose worker dies while writing the security JSON report"""
+    if domain == 'security' and format_type == ReportOutputFormat.JSON:
+        os._exit(1)
+    return _export_report_job(config, domain, report, format_type)
+
+
+_export_report_job = report_generator._export_report_job
+
+
+class TestReportGeneratorIntegration:
+    """Integration tests for the report generator."""
+
+    @pytest.fixture
+    def functional_results(self):
+        """Generate functional test results."""
+        return [
+            {'name': f'test_{index}', 'status': 'passed' if index % 5 else 'failed',
+             'execution_time': 0.5 + index % 7}
+            for index in range(500)
+        ]
+
+    @pytest.fixture
+    def security_results(self):
+        """Generate security scan results."""
+        return {'vulnerabilities': [{'id': 'VULN-1', 'severity': 'high', 'title': 'Example'}]}
+
+    def _generate(self, tmp_path, functional_results, security_results, parallel):
+        config = ReportGenerationConfig(
+            output_directory=str(tmp_path / ('parallel' if parallel else 'serial')),
+            output_formats=[ReportOutputFormat.HTML, ReportOutputFormat.JSON],
+            parallel=parallel,
+            max_workers=2
+        )
+        return ReportGenerator(config).generate_comprehensive_report(
+            functional_results=functional_results,
+            security_results=security_results
+        )
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_reports_and_stage_timings(self, tmp_path, functional_results, security_results, parallel):
+        """Test that every domain and format is written with its stage timings."""
+        result = self._generate(tmp_path, functional_results, security_results, parallel)
+
+        assert result.success
+        assert result.errors == []
+        names = [Path(path).name for path in result.generated_reports]
+        assert [name.split('_')[3] for name in names[:-1]] == [
+            'functional', 'functional', 'security', 'security', 'unified', 'unified'
+        ]
+        assert names[-1] == 'index.md'
+        assert all(Path(path).stat().st_size > 0 for path in result.generated_reports)
+
+        assert result.metadata['parallel'] is parallel
+        timings = result.metadata['stage_timings']
+        assert list(timings) == ['functional', 'security', 'unified']
+        assert set(timings['functional']) == {'generate', 'html', 'json'}
+
+    def test_unpicklable_inputs_fall_back_in_process(self, tmp_path, functional_results, security_results):
+        """Test that inputs which cannot cross processes are generated in-process."""
+        functional_results[0]['lock'] = threading.Lock()
+
+        result = self._generate(tmp_path, functional_results, security_results, parallel=True)
+
+        assert result.success
+        assert len(result.generated_reports) == 7
+        assert any('functional' in warning for warning in result.warnings)
+
+    def test_incremental_regeneration_skips_unchanged_reports(self, tmp_path, functional_results, security_results):
+        """Test that only reports whose inputs changed are rebuilt and the index lists all of them."""
+        config = ReportGenerationConfig(
+            output_directory=str(tmp_path),
+            output_formats=[ReportOutputFormat.HTML, ReportOutputFormat.JSON],
+            incremental=True
+        )
+
+        first = ReportGenerator(config).generate_comprehensive_report(
+            functional_results=functional_results, security_results=security_results
+        )
+        second = ReportGenerator(config).generate_comprehensive_report(
+            functional_results=functional_results, security_results=security_results
+        )
+
+        assert first.metadata['reused_reports'] == []
+        assert second.metadata['stage_timings'] == {}
+        assert second.generated_reports == first.generated_reports
+        assert second.metadata['reused_reports'] == first.generated_reports[:-1]
+
+        security_results['vulnerabilities'].append({'id': 'VULN-2', 'severity': 'low', 'title': 'New'})
+        third = ReportGenerator(config).generate_comprehensive_report(
+            functional_results=functional_results, security_results=security_results
+        )
+
+        assert list(third.metadata['stage_timings']) == ['security', 'unified']
+        assert third.metadata['reused_reports'] == first.generated_reports[:2]
+        assert third.metadata['fingerprints']['functional'] == first.metadata['fingerprints']['functional']
+        assert third.metadata['fingerprints']['security'] != first.metadata['fingerprints']['security']
+
+        index = (tmp_path / "index.md").read_text()
+        assert index.count("](./") == 6
+        assert index.count("unchanged") == 2
+
+    def test_broken_pool_finishes_only_remaining_jobs(self, tmp_path, functional_results,
+                                                      security_results, monkeypatch):
+        """Test that a crashed worker leaves finished outputs alone and completes the rest in-process."""
+        monkeypatch.setattr(report_generator, '_export_report_job', _crashing_export_job)
+        builds, exported = [], []
+        build_report = ReportGenerator._build_report
+        export_report = ReportGenerator._export_report
+
+        # Record only what runs in this process; the pool workers run the original methods
+        def record_build(generator, domain, inputs):
+            builds.append(domain)
+            return build_report(generator, domain, inputs)
+
+        def record_export(generator, domain, report, format_type):
+            exported.append((domain, format_type.value))
+            return export_report(generator, domain, report, format_type)
+
+        config = ReportGenerationConfig(
+            output_directory=str(tmp_path),
+            output_formats=[ReportOutputFormat.HTML, ReportOutputFormat.JSON],
+            parallel=True,
+            max_workers=1
+        )
+        generator = ReportGenerator(config)
+        monkeypatch.setattr(ReportGenerator, '_build_report', record_build)
+        monkeypatch.setattr(ReportGenerator, '_export_report', record_export)
+
+        result = generator.generate_comprehensive_report(
+            functional_results=functional_results, security_results=security_results
+        )
+
+        assert result.success and result.errors == []
+        assert any('remaining reports generated serially' in warning for warning in result.warnings)
+        # Builds are submitted before any export, so every report was built by the single worker;
+        # only the crashed export and those queued behind it are redone here
+        assert builds == []
+        assert ('security', 'json') in exported
+        assert len(set(exported)) == len(exported) < 6
+        assert len(result.generated_reports) == 7
+        written = [name for name in os.listdir(tmp_path) if not name.startswith('.')]
+        assert sorted(written) == sorted(Path(path).name for path in result.generated_reports)
+        timings = result.metadata['stage_timings']
+        assert all(set(stages) == {'generate', 'html', 'json'} for stages in timings.values())
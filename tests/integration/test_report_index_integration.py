@@ -0,0 +1,104 @@
+"""
+Integration tests for the report search index.
+Tests indexing by the report generator and unified reporter, phrase
+matching of test names and CVE IDs, filters and search across many reports.
+"""
+
+import pytest
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+report_index = pytest.importorskip("src.reporting.report_index")
+report_generator = pytest.importorskip("src.reporting.report_generator")
+security_reporter = pytest.importorskip("src.reporting.security_reporter")
+ReportIndex = report_index.ReportIndex
+
+
+def make_security_report(index, cve_id):
+    """Build a security report with one vulnerability."""
+    return security_reporter.SecurityReport(
+        report_id=f"security-{index}",
+        title=f"Security Assessment {index}",
+        report_type=security_reporter.SecurityReportType.VULNERABILITY_ASSESSMENT,
+        generated_at=datetime(2026, 5, 1, 12, 0),
+        executive_summary=f"Scan {index} of the payment service",
+        vulnerabilities=[
+            security_reporter.VulnerabilityDetail(
+                vulnerability_id=f"VULN-{index}", title="SQL injection in search", description="Example",
+                severity="high", category=security_reporter.VulnerabilityCategory.INJECTION, cve_id=cve_id
+            )
+        ]
+    )
+
+
+class TestReportIndexIntegration:
+    """Integration tests for the report search index."""
+
+    def test_generator_indexes_written_reports(self, tmp_path):
+        """Test that generated reports are found by test name with their output files."""
+        config = report_generator.ReportGenerationConfig(
+            output_directory=str(tmp_path / "run"),
+            output_formats=[report_generator.ReportOutputFormat.HTML, report_generator.ReportOutputFormat.JSON]
+        )
+        functional_results = [
+            {'name': 'test_checkout_flow', 'status': 'failed', 'execution_time': 1.0},
+            {'name': 'test_login', 'status': 'passed', 'execution_time': 1.0}
+        ]
+        result = report_generator.ReportGenerator(config).generate_comprehensive_report(
+            functional_results=functional_results
+        )
+        assert result.success
+
+        hits = report_index.search_reports("test_checkout_flow", tmp_path)
+        assert [hit.report_type for hit in hits] == ["functional"]
+        assert len(hits[0].paths) == 2
+        assert all(Path(path).exists() for path in hits[0].paths)
+        assert "[test_checkout_flow]" in hits[0].snippet
+        assert report_index.search_reports("test_checkout_flow", tmp_path, report_type="security") == []
+
+    def test_cve_search_and_reindex(self, tmp_path):
+        """Test CVE phrase matching, any-term search and replacing an entry."""
+        index = ReportIndex(tmp_path)
+        assert index.index_report(make_security_report(1, "CVE-2024-12345"), "security", ["a.html"])
+        assert index.index_report(make_security_report(2, "CVE-2024-99999"), "security", ["b.html"])
+
+        assert [hit.report_id for hit in index.search("CVE-2024-12345")] == ["security-1"]
+        assert index.search("CVE-2024-12345 CVE-2024-99999") == []
+        assert {hit.report_id for hit in index.search("CVE-2024-12345 CVE-2024-99999", match_any=True)} == \
+            {"security-1", "security-2"}
+        assert index.search('payment "service') != []
+
+        # Indexing the same report again replaces its terms and keeps its outputs
+        assert index.index_report(make_security_report(1, "CVE-2025-00001"), "security", ["a.json"])
+        assert index.search("CVE-2024-12345") == []
+        assert index.search("CVE-2025-00001")[0].paths == ["a.html", "a.json"]
+        assert index.count() == 2
+
+    def test_unified_export_is_indexed(self, tmp_path):
+        """Test that unified report exports are recorded where they are written."""
+        unified_reporter = pytest.importorskip("src.reporting.unified_reporter")
+        reporter = unified_reporter.UnifiedReporter()
+        report = reporter.generate_unified_report(SimpleNamespace(
+            critical_issues=[{'id': 'ISSUE-42', 'title': 'Checkout outage'}]
+        ))
+
+        path = reporter.export_report(report, output_path=tmp_path)
+
+        hits = report_index.search_reports("ISSUE-42", tmp_path)
+        assert [(hit.report_type, hit.paths) for hit in hits] == [("unified", [str(path)])]
+
+    def test_search_across_many_reports(self, tmp_path):
+        """Test that a lookup among thousands of indexed reports stays fast."""
+        index = ReportIndex(tmp_path)
+        for number in range(2000):
+            index.index_report(make_security_report(number, f"CVE-2024-{10000 + number}"), "security",
+                               [f"report-{number}.html"])
+
+        start = time.perf_counter()
+        hits = report_index.search_reports("CVE-2024-11234", tmp_path)
+        elapsed = time.perf_counter() - start
+
+        assert [hit.report_id for hit in hits] == ["security-1234"]
+        assert elapsed < 0.5
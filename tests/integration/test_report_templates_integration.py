@@ -0,0 +1,85 @@
+"""
+Integration tests for report templates.
+Tests the shared compiled template environment, the on-disk bytecode cache
+and the HTML rendered for each reporter.
+"""
+
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+
+template_engine = pytest.importorskip("src.reporting.template_engine")
+security_reporter = pytest.importorskip("src.reporting.security_reporter")
+compliance_reporter = pytest.importorskip("src.reporting.compliance_reporter")
+
+
+class TestReportTemplatesIntegration:
+    """Integration tests for report templates."""
+
+    @pytest.fixture
+    def security_report(self):
+        """Build a security report with findings that need escaping."""
+        return security_reporter.SecurityReport(
+            report_id="security-1",
+            title="Security Assessment",
+            report_type=security_reporter.SecurityReportType.VULNERABILITY_ASSESSMENT,
+            generated_at=datetime(2026, 5, 1, 12, 0),
+            overall_risk_rating="CRITICAL",
+            vulnerabilities=[
+                security_reporter.VulnerabilityDetail(
+                    vulnerability_id="VULN-1", title="Stored XSS",
+                    description="Comment body renders <script>alert(1)</script>", severity="critical",
+                    category=security_reporter.VulnerabilityCategory.CROSS_SITE_SCRIPTING, cwe_id="CWE-79"
+                ),
+                security_reporter.VulnerabilityDetail(
+                    vulnerability_id="VULN-2", title="Verbose errors", description="Stack traces in responses",
+                    severity="low", category="misconfiguration"
+                )
+            ]
+        )
+
+    def test_templates_compile_once_per_process(self, security_report):
+        """Test that every reporter renders from the same compiled templates."""
+        env = template_engine.get_template_environment()
+        template_engine.preload_templates()
+
+        assert template_engine.get_template_environment() is env
+        assert not env.auto_reload
+        template = env.get_template("security_report.html")
+
+        reporter = security_reporter.SecurityReporter()
+        assert reporter._generate_html_security_report(security_report) == template.render(report=security_report)
+        assert env.get_template("security_report.html") is template
+
+    def test_bytecode_cache_is_written_and_reused(self, tmp_path, security_report):
+        """Test that a fresh environment loads compiled templates from the disk cache."""
+        first = template_engine.create_template_environment(cache_dir=str(tmp_path))
+        html = first.get_template("security_report.html").render(report=security_report)
+        cached = sorted(tmp_path.iterdir())
+
+        assert cached
+        second = template_engine.create_template_environment(cache_dir=str(tmp_path))
+        assert second.get_template("security_report.html").render(report=security_report) == html
+        assert sorted(tmp_path.iterdir()) == cached
+
+    def test_rendered_reports(self, security_report):
+        """Test the sections rendered for security and compliance reports."""
+        html = security_reporter.SecurityReporter()._generate_html_security_report(security_report)
+
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+        assert "<script>" not in html
+        assert '<div class="vulnerability critical">' in html
+        assert "<p><strong>CWE:</strong> CWE-79</p>" in html
+        assert "<p><strong>Category:</strong> misconfiguration</p>" in html
+        assert html.count("<strong>CWE:</strong>") == 1
+
+        reporter = compliance_reporter.ComplianceReporter()
+        report = reporter.generate_compliance_report(SimpleNamespace(all_results=[
+            {'requirement_id': 'REQ-1', 'title': 'Data retention', 'standard': 'GDPR', 'status': 'non_compliant'},
+            {'requirement_id': 'REQ-2', 'title': 'Consent', 'standard': 'GDPR', 'status': 'compliant'}
+        ]))
+        html = reporter._generate_html_compliance_report(report)
+
+        assert html.count('<div class="gap ') == len(report.gaps) == 1
+        assert "<h3>Data retention" in html
+        assert f"{report.metrics.overall_compliance_score:.1%}" in html
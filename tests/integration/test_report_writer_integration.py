@@ -0,0 +1,139 @@
+"""
+Integration tests for streaming report output.
+Tests the chunked JSON writer and the streamed JSON and HTML exports of the
+functional and security reporters.
+"""
+
+import io
+import json
+import pytest
+import tracemalloc
+from datetime import datetime
+
+report_writer = pytest.importorskip("src.reporting.report_writer")
+functional_reporter = pytest.importorskip("src.reporting.functional_reporter")
+write_json = report_writer.write_json
+
+
+class TestReportWriterIntegration:
+    """Integration tests for streaming report output."""
+
+    @pytest.fixture
+    def report(self):
+        """Build a functional report with many test results."""
+        def make_test(index):
+            return functional_reporter.TestResult(
+                test_id=f"test-{index}",
+                test_name=f"test_checkout_{index}",
+                test_description="Checkout flow step ✓",
+                status=functional_reporter.TestStatus.FAILED if index % 10 == 0 else functional_reporter.TestStatus.PASSED,
+                category=functional_reporter.TestCategory.FUNCTIONAL,
+                priority=functional_reporter.TestPriority.HIGH,
+                domain="web",
+                execution_time=index / 100,
+                error_message="Timeout" if index % 10 == 0 else None,
+                logs=[f"step {step}" for step in range(5)]
+            )
+
+        tests = [make_test(index) for index in range(20000)]
+        suite = functional_reporter.TestSuite(
+            suite_id="suite-1",
+            suite_name="Checkout",
+            description="Checkout suite",
+            domain="web",
+            category=functional_reporter.TestCategory.FUNCTIONAL,
+            priority=functional_reporter.TestPriority.HIGH,
+            tests=tests,
+            total_tests=len(tests)
+        )
+        return functional_reporter.FunctionalReport(
+            report_id="report-1",
+            title="Checkout Report",
+            report_type=functional_reporter.FunctionalReportType.TEST_EXECUTION,
+            generated_at=datetime(2026, 5, 1, 12, 0),
+            test_suites=[suite],
+            failed_tests=[test for test in tests if test.status == functional_reporter.TestStatus.FAILED],
+            key_findings=["Checkout is slow"],
+            recommendations=["Cache the cart"]
+        )
+
+    def test_matches_json_dump(self):
+        """Test that plain values are written exactly as json.dumps writes them."""
+        value = {
+            'name': 'Bericht ü',
+            'empty': {}, 'none': [], 'flags': [True, False, None],
+            'nested': {'values': [1, 2.5, {'a': [[]]}], 1: 'int key'},
+            'tuple': (1, 2)
+        }
+
+        for indent in (2, None):
+            stream = io.StringIO()
+            write_json(value, stream, indent=indent, chunk_size=8)
+            assert stream.getvalue() == json.dumps(value, indent=indent, ensure_ascii=False)
+
+    def test_lazy_values_are_converted_while_writing(self, report):
+        """Test that generators and to_dict objects are written as they are reached."""
+        stream = io.StringIO()
+        write_json({'tests': (test for test in report.failed_tests[:3]), 'suite': report.test_suites[0]},
+                   stream, indent=None)
+
+        written = json.loads(stream.getvalue())
+        assert written['tests'] == [test.to_dict() for test in report.failed_tests[:3]]
+        assert written['suite'] == report.test_suites[0].to_dict()
+
+    def test_streamed_exports_match_in_memory_reports(self, report, tmp_path):
+        """Test that streamed exports equal the in-memory documents."""
+        reporter = functional_reporter.FunctionalReporter()
+
+        json_path = tmp_path / "report.json"
+        reporter._export_json(report, json_path)
+        assert json.loads(json_path.read_text(encoding='utf-8')) == report.to_dict()
+
+        html_path = tmp_path / "report.html"
+        reporter._export_html(report, html_path)
+        assert html_path.read_text(encoding='utf-8') == reporter._generate_html_functional_report(report)
+        assert "Failed Tests (2000)" in html_path.read_text(encoding='utf-8')
+
+    def test_json_export_memory_is_bounded(self, report, tmp_path):
+        """Test that the streamed export needs far less memory than dumping to_dict."""
+        reporter = functional_reporter.FunctionalReporter()
+
+        tracemalloc.start()
+        try:
+            reporter._export_json(report, tmp_path / "streamed.json")
+            _, streamed_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+            with open(tmp_path / "dumped.json", 'w', encoding='utf-8') as f:
+                json.dump(report.to_dict(), f, indent=2, ensure_ascii=False)
+            _, dumped_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert streamed_peak * 10 < dumped_peak
+
+    def test_security_export_streams(self, tmp_path):
+        """Test that security reports stream their vulnerabilities."""
+        security_reporter = pytest.importorskip("src.reporting.security_reporter")
+        reporter = security_reporter.SecurityReporter()
+        report = security_reporter.SecurityReport(
+            report_id="security-1",
+            title="Security Assessment",
+            report_type=security_reporter.SecurityReportType.VULNERABILITY_ASSESSMENT,
+            generated_at=datetime(2026, 5, 1, 12, 0),
+            vulnerabilities=[
+                security_reporter.VulnerabilityDetail(
+                    vulnerability_id=f"VULN-{index}", title=f"Issue {index}", description="Example",
+                    severity="high", category=security_reporter.VulnerabilityCategory.INJECTION
+                )
+                for index in range(50)
+            ]
+        )
+
+        json_path = tmp_path / "security.json"
+        reporter._export_json(report, json_path)
+        assert json.loads(json_path.read_text(encoding='utf-8')) == json.loads(json.dumps(report.to_dict()))
+
+        html_path = tmp_path / "security.html"
+        reporter._export_html(report, html_path)
+        assert html_path.read_text(encoding='utf-8') == reporter._generate_html_security_report(report)
@@ -0,0 +1,94 @@
+"""
+Integration tests for the visualization engine.
+Tests LTTB downsampling of long line series and the shared SVG cache.
+"""
+
+import math
+import random
+import re
+import pytest
+
+visualization_engine = pytest.importorskip("src.reporting.visualization_engine")
+VisualizationEngine = visualization_engine.VisualizationEngine
+ChartConfig = visualization_engine.ChartConfig
+ChartData = visualization_engine.ChartData
+ChartType = visualization_engine.ChartType
+
+
+def path_points(svg):
+    """Number of points in each line path of an SVG."""
+    return [len(path.split(" L ")) for path in re.findall(r'<path d="M ([^"]+)"', svg)]
+
+
+class TestVisualizationEngineIntegration:
+    """Integration tests for the visualization engine."""
+
+    @pytest.fixture
+    def minute_series(self):
+        """Generate 90 days of minute-resolution response times with one spike."""
+        rng = random.Random(3)
+        values = [200 + 50 * math.sin(i / 1440 * 2 * math.pi) + rng.gauss(0, 5) for i in range(90 * 1440)]
+        values[50000] = 2000.0
+        values[70000] = None
+        return values
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start every test with an empty SVG cache."""
+        visualization_engine._svg_cache.clear()
+
+    def test_lttb_keeps_shape(self):
+        """Test that LTTB keeps the end points and peaks, with and without NumPy."""
+        rng = random.Random(11)
+        x = list(range(5000))
+        y = [rng.random() for _ in x]
+        y[1234] = 50.0
+        y[4321] = -50.0
+
+        kept = visualization_engine.lttb_downsample(x, y, 100)
+
+        assert len(kept) == 100
+        assert kept[0] == 0 and kept[-1] == 4999
+        assert kept == sorted(set(kept))
+        assert {1234, 4321} <= set(kept)
+        assert visualization_engine._lttb_downsample_python(x, y, 100) == kept
+        assert visualization_engine.lttb_downsample(x[:50], y[:50], 100) == list(range(50))
+
+    def test_long_series_fit_the_point_budget(self, minute_series):
+        """Test that a 90-day minute series is drawn with about one point per pixel."""
+        engine = VisualizationEngine()
+        chart = engine.create_trend_chart({'response_time': minute_series}, title="Response Time")
+        plot_width = chart.config.width - chart.config.margin["left"] - chart.config.margin["right"]
+
+        assert path_points(chart.svg_content) == [plot_width]
+        assert len(chart.svg_content) < 200_000
+
+        # The spike is still drawn at the top of the plot area
+        assert 'cy="50.0"' in chart.svg_content
+
+        config = ChartConfig(chart_type=ChartType.LINE, title="Budget", max_points=200)
+        svg = engine._generate_line_chart_svg(chart.data, config)
+        assert path_points(svg) == [200]
+
+        short = engine.create_trend_chart({'pass_rate': [90.0, None, 92.5, 95.0]})
+        assert path_points(short.svg_content) == [3]
+
+    def test_unchanged_charts_are_served_from_cache(self, minute_series):
+        """Test that redrawing unchanged charts hits the shared SVG cache."""
+        cache = visualization_engine._svg_cache
+        first = VisualizationEngine().create_trend_chart({'response_time': minute_series})
+        misses = cache.misses
+
+        second = VisualizationEngine().create_trend_chart({'response_time': minute_series})
+        assert second.svg_content == first.svg_content
+        assert cache.hits == 1 and cache.misses == misses
+
+        changed = list(minute_series)
+        changed[10] = 999.0
+        VisualizationEngine().create_trend_chart({'response_time': changed})
+        assert cache.misses == misses + 1
+
+        engine = VisualizationEngine()
+        engine.create_pie_chart({'passed': 90, 'failed': 10})
+        engine.create_pie_chart({'passed': 90, 'failed': 10})
+        assert cache.hits == 2